@@ -0,0 +1,551 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Columnar snapshots of the time series in a logdir.
+
+A snapshot holds the sampled time series of every run as column arrays
+in NumPy `.npy` files, so that offline analysis can memory-map them
+rather than parse event files again. `Export` writes a snapshot of a
+logdir. `SnapshotMultiplexer` serves one through the methods of
+`plugin_event_multiplexer.EventMultiplexer` that
+`data_provider.MultiplexerDataProvider` uses, and `ReadColumns` returns
+the columns of one run and plugin, for example to build a
+`pandas.DataFrame`.
+
+A snapshot directory holds a `SNAPSHOT.json` manifest that lists the
+runs, and one subdirectory per run and plugin with these files:
+
+    index.json          The tags, each with its summary metadata and
+                        its range of rows; rows are grouped by tag.
+    step.npy            int64 steps.
+    wall_time.npy       float64 wall times, in seconds.
+    value.npy           float64 values of scalar tags; NaN for the
+                        rows of other tags.
+    tensor_offsets.npy  int64 offsets into `tensors.npy`, with one more
+                        entry than there are rows.
+    tensors.npy         uint8 concatenated serialized `TensorProto`s
+                        for the rows of non-scalar tags.
+"""
+
+
+import base64
+import json
+import os
+import threading
+
+import numpy as np
+
+from tensorboard.backend.event_processing import io_wrapper
+from tensorboard.backend.event_processing import (
+    plugin_event_accumulator as event_accumulator,
+)
+from tensorboard.backend.event_processing import (
+    plugin_event_multiplexer as event_multiplexer,
+)
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.compat.tensorflow_stub import dtypes
+from tensorboard.util import tb_logging
+from tensorboard.util import tensor_util
+
+
+logger = tb_logging.get_logger()
+
+MANIFEST_NAME = "SNAPSHOT.json"
+# Bump this whenever the layout of snapshots changes incompatibly.
+_FORMAT_VERSION = 1
+_INDEX_NAME = "index.json"
+_COLUMNS = ("step", "wall_time", "value", "tensor_offsets", "tensors")
+
+
+def IsSnapshot(path):
+    """Returns whether `path` is a directory holding a snapshot."""
+    return os.path.isfile(os.path.join(path, MANIFEST_NAME))
+
+
+def Export(logdir, output_dir, size_guidance=None, tensor_size_guidance=None):
+    """Loads a logdir and writes a snapshot of it.
+
+    Runs are loaded and written one at a time, so that only one run's
+    data is held in memory at once.
+
+    Args:
+      logdir: The log directory to load, as for `tensorboard --logdir`.
+      output_dir: The directory to write the snapshot to. It is created
+        if needed, and must otherwise be empty.
+      size_guidance: Optional size guidance for the runs, as for
+        `event_accumulator.EventAccumulator`. Defaults to keeping every
+        value.
+      tensor_size_guidance: Optional per-plugin size guidance, as for
+        `event_accumulator.EventAccumulator`.
+
+    Raises:
+      ValueError: If `output_dir` is not empty.
+    """
+    _CheckEmpty(output_dir)  # Before loading, which may take a while.
+    os.makedirs(output_dir, exist_ok=True)
+    logdir = os.path.expanduser(logdir)
+    # Named as by `EventMultiplexer.AddRunsFromDirectory`.
+    run_paths = {
+        os.path.relpath(subdir, logdir): subdir
+        for subdir in io_wrapper.GetLogdirSubdirectories(logdir)
+    }
+    runs = []
+    for run_index, run in enumerate(sorted(run_paths)):
+        logger.info("Exporting run %s", run)
+        multiplexer = event_multiplexer.EventMultiplexer(
+            size_guidance=(
+                size_guidance
+                or event_accumulator.STORE_EVERYTHING_SIZE_GUIDANCE
+            ),
+            tensor_size_guidance=tensor_size_guidance,
+        )
+        multiplexer.AddRun(run_paths[run], name=run)
+        multiplexer.Reload()
+        runs.append(_WriteRun(multiplexer, run, run_index, output_dir))
+    _WriteManifest(output_dir, runs)
+
+
+def Write(multiplexer, output_dir):
+    """Writes a snapshot of the data loaded by a multiplexer.
+
+    Tags with summary metadata but no values are left out.
+
+    Args:
+      multiplexer: A loaded `plugin_event_multiplexer.EventMultiplexer`.
+      output_dir: The directory to write the snapshot to. It is created
+        if needed, and must otherwise be empty.
+
+    Raises:
+      ValueError: If `output_dir` is not empty.
+    """
+    _CheckEmpty(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    runs = [
+        _WriteRun(multiplexer, run, run_index, output_dir)
+        for run_index, run in enumerate(sorted(multiplexer.Runs()))
+    ]
+    _WriteManifest(output_dir, runs)
+
+
+def _WriteRun(multiplexer, run, run_index, output_dir):
+    """Writes the columns of one run, returning its manifest entry."""
+    accumulator = multiplexer.GetAccumulator(run)
+    try:
+        first_event_timestamp = accumulator.FirstEventTimestamp()
+    except ValueError:
+        first_event_timestamp = None
+    series_by_plugin = {}
+    for tag in sorted(accumulator.tensors_by_tag):
+        try:
+            metadata = accumulator.SummaryMetadata(tag)
+        except KeyError:
+            metadata = summary_pb2.SummaryMetadata()
+        try:
+            series = _ReadSeries(accumulator, tag)
+        except KeyError:
+            continue  # Every value was dropped.
+        plugin_name = metadata.plugin_data.plugin_name
+        series_by_plugin.setdefault(plugin_name, []).append(
+            (tag, metadata) + series
+        )
+    plugins = []
+    for plugin_index, plugin_name in enumerate(sorted(series_by_plugin)):
+        directory = "%d/%d" % (run_index, plugin_index)
+        _WriteColumns(
+            os.path.join(output_dir, directory),
+            series_by_plugin[plugin_name],
+        )
+        plugins.append({"name": plugin_name, "directory": directory})
+    return {
+        "name": run,
+        "first_event_timestamp": first_event_timestamp,
+        "source_writer": accumulator.GetSourceWriter(),
+        "plugins": plugins,
+    }
+
+
+def _WriteManifest(output_dir, runs):
+    # Write the manifest last, so that a partial snapshot is never read.
+    _WriteJson(
+        os.path.join(output_dir, MANIFEST_NAME),
+        {"format_version": _FORMAT_VERSION, "runs": runs},
+    )
+
+
+def _CheckEmpty(output_dir):
+    if os.path.isdir(output_dir) and os.listdir(output_dir):
+        raise ValueError("output directory is not empty: %s" % output_dir)
+
+
+def _ReadSeries(accumulator, tag):
+    """Returns a tag's `(scalar_dtype, (steps, wall_times, values), tensors)`.
+
+    For a tag in a `ScalarReservoir`, `scalar_dtype` is the `DataType`
+    enum value of its tensors and `tensors` is `None`; the float64
+    `values` hold every value of that dtype exactly. Otherwise, as for
+    64-bit integer scalars, `scalar_dtype` and `values` are `None`, and
+    `tensors` lists the serialized `TensorProto`s.
+    """
+    dtype = accumulator.ScalarDtype(tag)
+    if dtype is not None:
+        (steps, wall_times, values) = accumulator.ScalarColumns(tag)
+        return (dtype, (steps, wall_times, values), None)
+    events = accumulator.Tensors(tag)
+    steps = np.array([e.step for e in events], dtype=np.int64)
+    wall_times = np.array([e.wall_time for e in events], dtype=np.float64)
+    tensors = [
+        getattr(e, "serialized_tensor", None)
+        or e.tensor_proto.SerializeToString()
+        for e in events
+    ]
+    return (None, (steps, wall_times, None), tensors)
+
+
+def _WriteColumns(directory, series):
+    """Writes the columns of the time series of one run and plugin."""
+    os.makedirs(directory)
+    tags = []
+    (steps, wall_times, values, tensor_lengths, tensors) = ([], [], [], [], [])
+    start = 0
+    for tag, metadata, dtype, tag_columns, blobs in series:
+        (tag_steps, tag_wall_times, tag_values) = tag_columns
+        num_rows = len(tag_steps)
+        tags.append(
+            {
+                "tag": tag,
+                "metadata": base64.b64encode(
+                    metadata.SerializeToString()
+                ).decode("ascii"),
+                "scalar_dtype": dtype,
+                "start": start,
+                "stop": start + num_rows,
+            }
+        )
+        start += num_rows
+        steps.append(tag_steps)
+        wall_times.append(tag_wall_times)
+        if blobs is None:
+            values.append(tag_values)
+            tensor_lengths.append(np.zeros(num_rows, dtype=np.int64))
+        else:
+            values.append(np.full(num_rows, np.nan))
+            tensor_lengths.append(np.array([len(b) for b in blobs], np.int64))
+            tensors.extend(blobs)
+    tensor_offsets = np.zeros(start + 1, dtype=np.int64)
+    np.cumsum(np.concatenate(tensor_lengths), out=tensor_offsets[1:])
+    columns = {
+        "step": np.concatenate(steps).astype(np.int64),
+        "wall_time": np.concatenate(wall_times).astype(np.float64),
+        "value": np.concatenate(values).astype(np.float64),
+        "tensor_offsets": tensor_offsets,
+        "tensors": np.frombuffer(b"".join(tensors), dtype=np.uint8),
+    }
+    for name, column in columns.items():
+        np.save(os.path.join(directory, name + ".npy"), column)
+    _WriteJson(os.path.join(directory, _INDEX_NAME), {"tags": tags})
+
+
+def _WriteJson(path, value):
+    with open(path, "w") as f:
+        json.dump(value, f)
+
+
+def _ReadJson(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def ReadColumns(path, run, plugin_name):
+    """Returns the columns of one run and plugin of a snapshot.
+
+    See `SnapshotMultiplexer.PluginColumns`.
+
+    Args:
+      path: The snapshot directory.
+      run: The name of the run.
+      plugin_name: The name of the plugin.
+    """
+    return SnapshotMultiplexer(path).PluginColumns(run, plugin_name)
+
+
+class _Series:
+    """The location and metadata of one tag's rows in a snapshot."""
+
+    def __init__(self, directory, entry, version):
+        self.directory = directory
+        self.tag = entry["tag"]
+        self.metadata = summary_pb2.SummaryMetadata.FromString(
+            base64.b64decode(entry["metadata"])
+        )
+        self.scalar_dtype = entry["scalar_dtype"]
+        self.start = entry["start"]
+        self.stop = entry["stop"]
+        self.version = version
+
+
+class SnapshotMultiplexer:
+    """Serves a snapshot as a read-only `EventMultiplexer`.
+
+    Implements the methods of `plugin_event_multiplexer.EventMultiplexer`
+    that `data_provider.MultiplexerDataProvider` uses, so that a snapshot
+    can be served in place of the logdir it was taken from. Column files
+    are memory-mapped when a run and plugin are first read.
+    """
+
+    def __init__(self, path):
+        """Opens a snapshot.
+
+        Args:
+          path: The snapshot directory.
+
+        Raises:
+          ValueError: If `path` does not hold a snapshot of a supported
+            format version.
+        """
+        manifest_path = os.path.join(path, MANIFEST_NAME)
+        try:
+            manifest = _ReadJson(manifest_path)
+        except FileNotFoundError:
+            raise ValueError("not a snapshot: %s" % path)
+        if manifest.get("format_version") != _FORMAT_VERSION:
+            raise ValueError(
+                "unsupported snapshot format version: %r"
+                % manifest.get("format_version")
+            )
+        self._path = path
+        self._runs = {}
+        # Run -> tag -> `_Series`.
+        self._series = {}
+        # Run -> plugin name -> directory.
+        self._plugin_directories = {}
+        # Directory -> list of `_Series`.
+        self._plugin_tags = {}
+        version = 0
+        for run in manifest["runs"]:
+            name = run["name"]
+            self._runs[name] = run
+            self._series[name] = {}
+            self._plugin_directories[name] = {}
+            for plugin in run["plugins"]:
+                directory = plugin["directory"]
+                self._plugin_directories[name][plugin["name"]] = directory
+                index = _ReadJson(os.path.join(path, directory, _INDEX_NAME))
+                tags = []
+                for entry in index["tags"]:
+                    series = _Series(directory, entry, version)
+                    version += 1
+                    self._series[name][series.tag] = series
+                    tags.append(series)
+                self._plugin_tags[directory] = tags
+        self._columns = {}
+        self._columns_lock = threading.Lock()
+
+    def AddRunsFromDirectory(self, path, name=None):
+        """Does nothing: a snapshot's runs are fixed."""
+        return self
+
+    def Reload(self):
+        """Does nothing: a snapshot's data is fixed."""
+        return self
+
+    def Close(self):
+        """Does nothing: a snapshot has no reload workers."""
+
+    def Runs(self):
+        """Returns a dict mapping each run name to its tags.
+
+        As `EventMultiplexer.Runs`, except that snapshots hold no graphs
+        or run metadata.
+        """
+        return {
+            run: {
+                event_accumulator.TENSORS: list(series),
+                event_accumulator.GRAPH: False,
+                event_accumulator.META_GRAPH: False,
+                event_accumulator.RUN_METADATA: [],
+            }
+            for run, series in self._series.items()
+        }
+
+    def RunPaths(self):
+        """Returns a dict mapping run names to the snapshot's path."""
+        return {run: self._path for run in self._runs}
+
+    def FirstEventTimestamp(self, run):
+        """As `EventMultiplexer.FirstEventTimestamp`."""
+        timestamp = self._runs[run]["first_event_timestamp"]
+        if timestamp is None:
+            raise ValueError("No event timestamp could be found")
+        return timestamp
+
+    def GetSourceWriter(self, run):
+        """As `EventMultiplexer.GetSourceWriter`."""
+        return self._runs[run]["source_writer"]
+
+    def ActivePlugins(self):
+        """As `EventMultiplexer.ActivePlugins`."""
+        return frozenset().union(
+            *(plugins for plugins in self._plugin_directories.values())
+        )
+
+    def PluginRunToTagToContent(self, plugin_name):
+        """As `EventMultiplexer.PluginRunToTagToContent`."""
+        mapping = {}
+        for run, plugins in self._plugin_directories.items():
+            directory = plugins.get(plugin_name)
+            if directory is not None:
+                mapping[run] = {
+                    s.tag: s.metadata.plugin_data.content
+                    for s in self._plugin_tags[directory]
+                }
+        return mapping
+
+    def PluginRunToTagToMetadata(self, plugin_name, data_class):
+        """As `EventMultiplexer.PluginRunToTagToMetadata`."""
+        mapping = {}
+        for run, plugins in self._plugin_directories.items():
+            directory = plugins.get(plugin_name)
+            if directory is None:
+                continue
+            tag_to_metadata = {
+                s.tag: s.metadata
+                for s in self._plugin_tags[directory]
+                if s.metadata.data_class == data_class
+            }
+            if tag_to_metadata:
+                mapping[run] = tag_to_metadata
+        return mapping
+
+    def SummaryMetadata(self, run, tag):
+        """As `EventMultiplexer.SummaryMetadata`."""
+        return self._series[run][tag].metadata
+
+    def AllSummaryMetadata(self):
+        """As `EventMultiplexer.AllSummaryMetadata`."""
+        return {
+            run: {tag: s.metadata for (tag, s) in series.items()}
+            for run, series in self._series.items()
+        }
+
+    def TensorsVersion(self, run, tag):
+        """As `EventMultiplexer.TensorsVersion`; fixed for each tag."""
+        return self._series[run][tag].version
+
+    def Tensors(self, run, tag):
+        """As `EventMultiplexer.Tensors`."""
+        series = self._series[run][tag]
+        columns = self._Columns(series.directory)
+        steps = columns["step"][series.start : series.stop].tolist()
+        wall_times = columns["wall_time"][series.start : series.stop].tolist()
+        if series.scalar_dtype is not None:
+            np_dtype = dtypes.as_dtype(series.scalar_dtype).as_numpy_dtype
+            values = columns["value"][series.start : series.stop]
+            return [
+                event_accumulator.TensorEvent(
+                    wall_time=wall_time,
+                    step=step,
+                    tensor_proto=tensor_util.make_tensor_proto(
+                        np.asarray(value).astype(np_dtype)
+                    ),
+                )
+                for (step, wall_time, value) in zip(steps, wall_times, values)
+            ]
+        offsets = columns["tensor_offsets"][
+            series.start : series.stop + 1
+        ].tolist()
+        tensors = columns["tensors"]
+        return [
+            event_accumulator._SerializedTensorEvent(
+                wall_time, step, tensors[offsets[i] : offsets[i + 1]].tobytes()
+            )
+            for (i, (step, wall_time)) in enumerate(zip(steps, wall_times))
+        ]
+
+    def PeekTensors(self, run, tag):
+        """As `EventMultiplexer.PeekTensors`."""
+        return self.Tensors(run, tag)
+
+    def ScalarColumns(self, run, tag):
+        """As `EventMultiplexer.ScalarColumns`.
+
+        For scalar tags, the arrays are read-only views of the snapshot's
+        memory-mapped files.
+        """
+        series = self._series[run][tag]
+        if series.scalar_dtype is None:
+            return event_accumulator.ScalarColumnsFromEvents(
+                self.Tensors(run, tag)
+            )
+        columns = self._Columns(series.directory)
+        return tuple(
+            np.asarray(columns[name][series.start : series.stop])
+            for name in ("step", "wall_time", "value")
+        )
+
+    def MaxStepAndWallTime(self, run, tag):
+        """As `EventMultiplexer.MaxStepAndWallTime`."""
+        series = self._series[run][tag]
+        if series.start == series.stop:
+            return (None, None)
+        columns = self._Columns(series.directory)
+        return (
+            int(columns["step"][series.start : series.stop].max()),
+            float(columns["wall_time"][series.start : series.stop].max()),
+        )
+
+    def PluginColumns(self, run, plugin_name):
+        """Returns the columns of all tags of a run and plugin.
+
+        The result can be passed to `pandas.DataFrame`. Numeric columns
+        are memory-mapped from the snapshot's files.
+
+        Args:
+          run: The name of the run.
+          plugin_name: The name of the plugin.
+
+        Raises:
+          KeyError: If the snapshot has no data for this run and plugin.
+
+        Returns:
+          A dict with keys `"tag"`, `"step"`, `"wall_time"` and `"value"`,
+          mapping to 1-D NumPy arrays of equal length. Values of tags that
+          are not scalars are NaN.
+        """
+        directory = self._plugin_directories[run][plugin_name]
+        columns = self._Columns(directory)
+        tags = self._plugin_tags[directory]
+        return {
+            "tag": np.repeat(
+                np.array([s.tag for s in tags], dtype=object),
+                [s.stop - s.start for s in tags],
+            ),
+            "step": columns["step"],
+            "wall_time": columns["wall_time"],
+            "value": columns["value"],
+        }
+
+    def _Columns(self, directory):
+        """Returns a dict of the memory-mapped columns in `directory`."""
+        with self._columns_lock:
+            columns = self._columns.get(directory)
+            if columns is None:
+                columns = {
+                    name: np.load(
+                        os.path.join(self._path, directory, name + ".npy"),
+                        mmap_mode="r",
+                    )
+                    for name in _COLUMNS
+                }
+                self._columns[directory] = columns
+            return columns
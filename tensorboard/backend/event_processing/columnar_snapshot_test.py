@@ -0,0 +1,194 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tensorboard.backend.event_processing.columnar_snapshot`.
+
+See also `SnapshotDataProviderTest` in `data_provider_test`.
+"""
+
+
+import json
+import os
+from unittest import mock
+
+import numpy as np
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import columnar_snapshot
+from tensorboard.backend.event_processing import plugin_event_multiplexer
+from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.util import tensor_util
+from tensorboard.util import test_util
+
+
+class ColumnarSnapshotTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.logdir = os.path.join(self.get_temp_dir(), "logdir")
+        self.snapshot = os.path.join(self.get_temp_dir(), "snapshot")
+        with test_util.FileWriter(os.path.join(self.logdir, "run")) as writer:
+            for step in range(5):
+                writer.add_test_summary(
+                    "loss", simple_value=step / 2, step=step
+                )
+                writer.add_test_summary("acc", simple_value=1.0, step=step)
+                value = summary_pb2.Summary.Value(
+                    tag="weights",
+                    tensor=tensor_util.make_tensor_proto([step, step + 1]),
+                )
+                if step == 0:
+                    value.metadata.plugin_data.plugin_name = "weights_plugin"
+                writer.add_event(
+                    event_pb2.Event(
+                        step=step,
+                        wall_time=100.0 + step,
+                        summary=summary_pb2.Summary(value=[value]),
+                    )
+                )
+
+    def testExport(self):
+        self.assertFalse(columnar_snapshot.IsSnapshot(self.snapshot))
+        columnar_snapshot.Export(self.logdir, self.snapshot)
+        self.assertTrue(columnar_snapshot.IsSnapshot(self.snapshot))
+
+        snapshot = columnar_snapshot.SnapshotMultiplexer(self.snapshot)
+        self.assertEqual(
+            snapshot.ActivePlugins(), {"scalars", "weights_plugin"}
+        )
+        multiplexer = plugin_event_multiplexer.EventMultiplexer()
+        multiplexer.AddRunsFromDirectory(self.logdir)
+        multiplexer.Reload()
+        self.assertEqual(
+            snapshot.FirstEventTimestamp("run"),
+            multiplexer.FirstEventTimestamp("run"),
+        )
+        (steps, wall_times, values) = snapshot.ScalarColumns("run", "loss")
+        np.testing.assert_array_equal(steps, [0, 1, 2, 3, 4])
+        np.testing.assert_array_equal(values, [0.0, 0.5, 1.0, 1.5, 2.0])
+        self.assertEqual(
+            snapshot.MaxStepAndWallTime("run", "loss"),
+            multiplexer.MaxStepAndWallTime("run", "loss"),
+        )
+        self.assertEqual(
+            snapshot.MaxStepAndWallTime("run", "weights"),
+            multiplexer.MaxStepAndWallTime("run", "weights"),
+        )
+        events = snapshot.Tensors("run", "weights")
+        self.assertEqual([e.step for e in events], [0, 1, 2, 3, 4])
+        np.testing.assert_array_equal(
+            tensor_util.make_ndarray(events[3].tensor_proto), [3, 4]
+        )
+
+    def testExportKeepsIntegerScalarsExact(self):
+        with test_util.FileWriter(os.path.join(self.logdir, "ints")) as writer:
+            for step in range(3):
+                for tag, value in (
+                    ("count", np.int32(2**31 - 1 - step)),
+                    ("bytes", np.int64(2**60 + step)),
+                ):
+                    value = summary_pb2.Summary.Value(
+                        tag=tag, tensor=tensor_util.make_tensor_proto(value)
+                    )
+                    value.metadata.data_class = summary_pb2.DATA_CLASS_SCALAR
+                    writer.add_event(
+                        event_pb2.Event(
+                            step=step,
+                            wall_time=100.0 + step,
+                            summary=summary_pb2.Summary(value=[value]),
+                        )
+                    )
+        columnar_snapshot.Export(self.logdir, self.snapshot)
+        snapshot = columnar_snapshot.SnapshotMultiplexer(self.snapshot)
+        for tag, dtype, expected in (
+            ("count", np.int32, [2**31 - 1, 2**31 - 2, 2**31 - 3]),
+            ("bytes", np.int64, [2**60, 2**60 + 1, 2**60 + 2]),
+        ):
+            arrays = [
+                tensor_util.make_ndarray(e.tensor_proto)
+                for e in snapshot.Tensors("ints", tag)
+            ]
+            self.assertEqual([a.dtype for a in arrays], [dtype] * 3)
+            self.assertEqual([a.item() for a in arrays], expected)
+            (_, _, values) = snapshot.ScalarColumns("ints", tag)
+            self.assertEqual(values.tolist(), expected)
+
+    def testExportLoadsOneRunAtATime(self):
+        for name in ("a", "b/c"):
+            with test_util.FileWriter(
+                os.path.join(self.logdir, name)
+            ) as writer:
+                writer.add_test_summary("loss", simple_value=1.0, step=1)
+        loaded_runs = []
+        reload = plugin_event_multiplexer.EventMultiplexer.Reload
+
+        def record_reload(multiplexer, *args, **kwargs):
+            loaded_runs.append(sorted(multiplexer.Runs()))
+            return reload(multiplexer, *args, **kwargs)
+
+        with mock.patch.object(
+            plugin_event_multiplexer.EventMultiplexer,
+            "Reload",
+            autospec=True,
+            side_effect=record_reload,
+        ):
+            columnar_snapshot.Export(self.logdir, self.snapshot)
+        self.assertEqual(loaded_runs, [["a"], ["b/c"], ["run"]])
+        snapshot = columnar_snapshot.SnapshotMultiplexer(self.snapshot)
+        self.assertCountEqual(snapshot.Runs(), ["a", "b/c", "run"])
+        (steps, _, values) = snapshot.ScalarColumns("b/c", "loss")
+        np.testing.assert_array_equal(steps, [1])
+        np.testing.assert_array_equal(values, [1.0])
+
+    def testReadColumns(self):
+        columnar_snapshot.Export(self.logdir, self.snapshot)
+        columns = columnar_snapshot.ReadColumns(self.snapshot, "run", "scalars")
+        self.assertIsInstance(columns["step"], np.memmap)
+        self.assertEqual(list(columns["tag"]), ["acc"] * 5 + ["loss"] * 5)
+        np.testing.assert_array_equal(columns["step"], list(range(5)) * 2)
+        np.testing.assert_array_equal(
+            columns["value"], [1.0] * 5 + [0.0, 0.5, 1.0, 1.5, 2.0]
+        )
+
+        columns = columnar_snapshot.ReadColumns(
+            self.snapshot, "run", "weights_plugin"
+        )
+        self.assertEqual(list(columns["tag"]), ["weights"] * 5)
+        self.assertTrue(np.isnan(columns["value"]).all())
+        with self.assertRaises(KeyError):
+            columnar_snapshot.ReadColumns(self.snapshot, "run", "images")
+
+    def testRefusesNonEmptyOutputDirectory(self):
+        os.makedirs(self.snapshot)
+        with open(os.path.join(self.snapshot, "x"), "w"):
+            pass
+        with self.assertRaisesRegex(ValueError, "not empty"):
+            columnar_snapshot.Export(self.logdir, self.snapshot)
+
+    def testRejectsOtherFormatVersions(self):
+        with self.assertRaisesRegex(ValueError, "not a snapshot"):
+            columnar_snapshot.SnapshotMultiplexer(self.snapshot)
+        columnar_snapshot.Export(self.logdir, self.snapshot)
+        path = os.path.join(self.snapshot, columnar_snapshot.MANIFEST_NAME)
+        with open(path) as f:
+            manifest = json.load(f)
+        manifest["format_version"] += 1
+        with open(path, "w") as f:
+            json.dump(manifest, f)
+        with self.assertRaisesRegex(ValueError, "format version"):
+            columnar_snapshot.SnapshotMultiplexer(self.snapshot)
+
+
+if __name__ == "__main__":
+    tb_test.main()
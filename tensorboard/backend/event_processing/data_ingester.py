@@ -14,14 +14,19 @@
 # ==============================================================================
 """Provides data ingestion logic backed by local event processing."""
 
+import errno
 import os
 import re
 import threading
 import time
 
 
+from tensorboard.backend.event_processing import columnar_snapshot
 from tensorboard.backend.event_processing import data_provider
+from tensorboard.backend.event_processing import inotify
+from tensorboard.backend.event_processing import io_wrapper
 from tensorboard.backend.event_processing import plugin_event_multiplexer
+from tensorboard.backend.event_processing import reload_scheduler
 from tensorboard.backend.event_processing import tag_types
 from tensorboard.compat import tf
 from tensorboard.data import ingester
@@ -48,6 +53,10 @@ DEFAULT_TENSOR_SIZE_GUIDANCE = {
 
 logger = tb_logging.get_logger()
 
+# After a change is noticed, how long to wait for related changes (e.g.,
+# the rest of a burst of writes) before reloading.
+_CHANGE_COALESCE_SECS = 0.01
+
 
 class LocalDataIngester(ingester.DataIngester):
     """Data ingestion implementation to use when running locally."""
@@ -63,19 +72,35 @@ class LocalDataIngester(ingester.DataIngester):
         """
         tensor_size_guidance = dict(DEFAULT_TENSOR_SIZE_GUIDANCE)
         tensor_size_guidance.update(flags.samples_per_plugin)
-        self._multiplexer = plugin_event_multiplexer.EventMultiplexer(
-            size_guidance=DEFAULT_SIZE_GUIDANCE,
-            tensor_size_guidance=tensor_size_guidance,
-            purge_orphaned_data=flags.purge_orphaned_data,
-            max_reload_threads=flags.max_reload_threads,
-            event_file_active_filter=_get_event_file_active_filter(flags),
-            detect_file_replacement=flags.detect_file_replacement,
-        )
+        self._reload_interval = flags.reload_interval
+        if flags.logdir and columnar_snapshot.IsSnapshot(
+            os.path.expanduser(flags.logdir)
+        ):
+            # Snapshots never change, so there is nothing to reload.
+            logger.info("Serving columnar snapshot %s", flags.logdir)
+            self._multiplexer = columnar_snapshot.SnapshotMultiplexer(
+                os.path.expanduser(flags.logdir)
+            )
+            self._reload_interval = 0
+        else:
+            self._multiplexer = plugin_event_multiplexer.EventMultiplexer(
+                size_guidance=DEFAULT_SIZE_GUIDANCE,
+                tensor_size_guidance=tensor_size_guidance,
+                purge_orphaned_data=flags.purge_orphaned_data,
+                max_reload_threads=flags.max_reload_threads,
+                event_file_active_filter=_get_event_file_active_filter(flags),
+                detect_file_replacement=flags.detect_file_replacement,
+                mmap_event_files=flags.mmap_event_files,
+                reload_workers=flags.reload_workers,
+                reload_scheduler=_get_reload_scheduler(flags),
+                checkpoint_dir=_get_checkpoint_dir(flags),
+                memory_budget_bytes=_get_memory_budget_bytes(flags),
+            )
         self._data_provider = data_provider.MultiplexerDataProvider(
             self._multiplexer, flags.logdir or flags.logdir_spec
         )
-        self._reload_interval = flags.reload_interval
         self._reload_task = flags.reload_task
+        self._reload_trigger = flags.reload_trigger
         if flags.logdir:
             self._path_to_run = {os.path.expanduser(flags.logdir): None}
         else:
@@ -97,23 +122,19 @@ class LocalDataIngester(ingester.DataIngester):
         """Starts ingesting data based on the ingester flag configuration."""
 
         def _reload():
-            while True:
-                start = time.time()
-                logger.info("TensorBoard reload process beginning")
-                for path, name in self._path_to_run.items():
-                    self._multiplexer.AddRunsFromDirectory(path, name)
-                logger.info(
-                    "TensorBoard reload process: Reload the whole Multiplexer"
-                )
-                self._multiplexer.Reload()
-                duration = time.time() - start
-                logger.info(
-                    "TensorBoard done reloading. Load took %0.3f secs", duration
-                )
-                if self._reload_interval == 0:
-                    # Only load the multiplexer once. Do not continuously reload.
-                    break
-                time.sleep(self._reload_interval)
+            if self._reload_interval == 0:
+                # Only load the multiplexer once. Do not continuously reload.
+                self._reload_all()
+                return
+            watcher = None
+            if self._reload_trigger == "filesystem":
+                watcher = self._create_change_watcher()
+            if watcher is not None:
+                self._reload_on_change(watcher)
+            else:
+                while True:
+                    self._reload_all()
+                    time.sleep(self._reload_interval)
 
         if self._reload_task == "process":
             logger.info("Launching reload in a child process")
@@ -139,6 +160,168 @@ class LocalDataIngester(ingester.DataIngester):
         else:
             raise ValueError("unrecognized reload_task: %s" % self._reload_task)
 
+    def stop(self):
+        """Stops the worker processes that reload runs, if any.
+
+        Reloading must not continue afterward, so this is for when
+        TensorBoard exits.
+        """
+        self._multiplexer.Close()
+
+    def _reload_all(self):
+        """Adds new runs and reloads every run."""
+        start = time.time()
+        logger.info("TensorBoard reload process beginning")
+        self._add_runs()
+        logger.info("TensorBoard reload process: Reload the whole Multiplexer")
+        self._multiplexer.Reload()
+        duration = time.time() - start
+        logger.info(
+            "TensorBoard done reloading. Load took %0.3f secs", duration
+        )
+
+    def _add_runs(self):
+        for path, name in self._path_to_run.items():
+            self._multiplexer.AddRunsFromDirectory(path, name)
+
+    def _create_change_watcher(self):
+        """Returns a `_ChangeWatcher` for the logdir, or `None`."""
+        local_paths = [p for p in self._path_to_run if "://" not in p]
+        if not local_paths:
+            logger.warning(
+                "--reload_trigger=filesystem only applies to local "
+                "directories; reloading every %s secs instead",
+                self._reload_interval,
+            )
+            return None
+        if not inotify.IsSupported():
+            logger.warning(
+                "inotify is not available; reloading every %s secs instead",
+                self._reload_interval,
+            )
+            return None
+        try:
+            return _ChangeWatcher(local_paths)
+        except OSError as e:
+            logger.warning(
+                "Unable to watch logdir (%s); reloading every %s secs instead",
+                e,
+                self._reload_interval,
+            )
+            return None
+
+    def _reload_on_change(self, watcher):
+        """Reloads runs as soon as their directories change.
+
+        Runs are also all reloaded every `--reload_interval` seconds, to
+        pick up changes that inotify does not report, such as writes
+        from other hosts to a network file system.
+        """
+        self._reload_all()
+        deadline = time.time() + self._reload_interval
+        while True:
+            timeout = deadline - time.time()
+            changes = watcher.Wait(timeout) if timeout > 0 else None
+            if changes is None:
+                try:
+                    watcher.WatchNewRoots()
+                except OSError as e:
+                    logger.warning("Unable to watch logdir: %s", e)
+                self._reload_all()
+                deadline = time.time() + self._reload_interval
+                continue
+            (directories, new_runs_possible) = changes
+            if new_runs_possible:
+                self._add_runs()
+            runs = [
+                run
+                for (run, path) in list(self._multiplexer.RunPaths().items())
+                if path in directories
+            ]
+            if runs:
+                logger.info("Reloading %d changed runs", len(runs))
+                self._multiplexer.Reload(runs)
+
+
+class _ChangeWatcher:
+    """Reports which directories under some local logdirs changed."""
+
+    def __init__(self, paths):
+        """Starts watching every directory under `paths`.
+
+        Raises:
+          OSError: If inotify is unavailable or there are too many
+            directories to watch.
+        """
+        self._watcher = inotify.Watcher()
+        self._unwatched_roots = list(paths)
+        try:
+            self.WatchNewRoots()
+        except OSError:
+            self._watcher.Close()
+            raise
+        logger.info("Watching %d directories", self._watcher.NumWatches())
+
+    def WatchNewRoots(self):
+        """Starts watching logdirs that did not exist before."""
+        for root in list(self._unwatched_roots):
+            if os.path.isdir(root):
+                self._WatchTree(root)
+                self._unwatched_roots.remove(root)
+
+    def _WatchTree(self, top):
+        """Watches `top` and its subdirectories; returns their paths."""
+        directories = []
+        for dir_path, _, _ in os.walk(top):
+            try:
+                self._watcher.AddWatch(dir_path)
+            except OSError as e:
+                if e.errno not in (errno.ENOENT, errno.ENOTDIR):
+                    raise
+                # Removed since it was listed.
+                continue
+            directories.append(dir_path)
+        return directories
+
+    def Wait(self, timeout):
+        """Waits for changes.
+
+        Args:
+          timeout: The maximum number of seconds to wait.
+
+        Returns:
+          `None` if `timeout` expired or changes may have been missed, so
+          that every run should be reloaded. Otherwise, a tuple of the
+          set of changed directories and a bool for whether runs may
+          have been added or removed.
+        """
+        events = self._watcher.Read(timeout)
+        if not events:
+            return None
+        events.extend(self._watcher.Read(_CHANGE_COALESCE_SECS))
+        directories = set()
+        new_runs_possible = False
+        for event in events:
+            if event.path is None:
+                logger.warning("inotify queue overflowed; reloading all runs")
+                return None
+            directories.add(event.path)
+            if event.mask & (inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF):
+                new_runs_possible = True
+            elif event.mask & inotify.IN_ISDIR:
+                new_runs_possible = True
+                if event.mask & (inotify.IN_CREATE | inotify.IN_MOVED_TO):
+                    subdir = os.path.join(event.path, event.name)
+                    try:
+                        directories.update(self._WatchTree(subdir))
+                    except OSError as e:
+                        logger.warning("Unable to watch %s: %s", subdir, e)
+            elif event.mask & (
+                inotify.IN_CREATE | inotify.IN_MOVED_TO | inotify.IN_DELETE
+            ) and io_wrapper.IsTensorFlowEventsFile(event.name):
+                new_runs_possible = True
+        return (directories, new_runs_possible)
+
 
 def _get_event_file_active_filter(flags):
     """Returns a predicate for whether an event file load timestamp is active.
@@ -152,9 +335,48 @@ def _get_event_file_active_filter(flags):
     inactive_secs = flags.reload_multifile_inactive_secs
     if inactive_secs == 0:
         return None
-    if inactive_secs < 0:
-        return lambda timestamp: True
-    return lambda timestamp: timestamp + inactive_secs >= time.time()
+    return _EventFileActiveFilter(inactive_secs)
+
+
+def _get_reload_scheduler(flags):
+    """Returns a `ReloadScheduler` per the flags, or `None` if disabled."""
+    if not flags.reload_interval:
+        return None
+    if flags.reload_max_interval <= flags.reload_interval:
+        return None
+    return reload_scheduler.ReloadScheduler(
+        flags.reload_interval, flags.reload_max_interval
+    )
+
+
+def _get_checkpoint_dir(flags):
+    """Returns the ingestion checkpoint directory, or `None` if disabled."""
+    if not flags.ingestion_checkpoint_dir:
+        return None
+    return os.path.expanduser(flags.ingestion_checkpoint_dir)
+
+
+def _get_memory_budget_bytes(flags):
+    """Returns the multiplexer's memory budget, or `None` if disabled."""
+    if not flags.memory_budget_mb:
+        return None
+    return int(flags.memory_budget_mb * 2**20)
+
+
+class _EventFileActiveFilter:
+    """Predicate for whether an event file load timestamp is active.
+
+    This is a class rather than a closure so that it can be pickled and
+    sent to reload worker processes.
+    """
+
+    def __init__(self, inactive_secs):
+        self._inactive_secs = inactive_secs
+
+    def __call__(self, timestamp):
+        if self._inactive_secs < 0:
+            return True
+        return timestamp + self._inactive_secs >= time.time()
 
 
 def _parse_event_files_spec(logdir_spec):
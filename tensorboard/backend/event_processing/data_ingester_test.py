@@ -18,11 +18,15 @@ import ntpath
 import os
 import posixpath
 import time
+import unittest
 from unittest import mock
 
 from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import columnar_snapshot
 from tensorboard.backend.event_processing import data_ingester
+from tensorboard.backend.event_processing import inotify
 from tensorboard.compat import tf
+from tensorboard.util import test_util
 
 
 _ORIGINAL_IMPORT = __import__
@@ -34,29 +38,41 @@ class FakeFlags:
         self,
         detect_file_replacement=None,
         generic_data="auto",
+        ingestion_checkpoint_dir="",
         logdir="",
         logdir_spec="",
         max_reload_threads=1,
+        memory_budget_mb=0.0,
+        mmap_event_files=None,
         path_prefix="",
         purge_orphaned_data=True,
         reload_interval=60,
+        reload_max_interval=0,
         reload_multifile=False,
         reload_multifile_inactive_secs=4000,
         reload_task="auto",
+        reload_trigger="interval",
+        reload_workers="thread",
         samples_per_plugin=None,
         window_title="",
     ):
         self.detect_file_replacement = detect_file_replacement
         self.generic_data = generic_data
+        self.ingestion_checkpoint_dir = ingestion_checkpoint_dir
         self.logdir = logdir
         self.logdir_spec = logdir_spec
         self.max_reload_threads = max_reload_threads
+        self.memory_budget_mb = memory_budget_mb
+        self.mmap_event_files = mmap_event_files
         self.path_prefix = path_prefix
         self.purge_orphaned_data = purge_orphaned_data
         self.reload_interval = reload_interval
+        self.reload_max_interval = reload_max_interval
         self.reload_multifile = reload_multifile
         self.reload_multifile_inactive_secs = reload_multifile_inactive_secs
         self.reload_task = reload_task
+        self.reload_trigger = reload_trigger
+        self.reload_workers = reload_workers
         self.samples_per_plugin = samples_per_plugin or {}
         self.window_title = window_title
 
@@ -101,6 +117,27 @@ class GetEventFileActiveFilterTest(tb_test.TestCase):
             self.assertTrue(filter_fn(float("inf")))
 
 
+class GetReloadSchedulerTest(tb_test.TestCase):
+    def testDisabledByDefault(self):
+        flags = FakeFlags(logdir="logdir")
+        self.assertIsNone(data_ingester._get_reload_scheduler(flags))
+
+    def testDisabledWhenNotReloading(self):
+        flags = FakeFlags(
+            logdir="logdir", reload_interval=0, reload_max_interval=60
+        )
+        self.assertIsNone(data_ingester._get_reload_scheduler(flags))
+
+    def testEnabled(self):
+        flags = FakeFlags(
+            logdir="logdir", reload_interval=5, reload_max_interval=300
+        )
+        scheduler = data_ingester._get_reload_scheduler(flags)
+        self.assertIsNotNone(scheduler)
+        scheduler.Update("run", 0, now=0)
+        self.assertEqual(10, scheduler.Schedule()["run"]["interval"])
+
+
 class ParseEventFilesSpecTest(tb_test.TestCase):
     def assertPlatformSpecificLogdirParsing(self, pathObj, logdir, expected):
         """A custom assertion to test :func:`parse_event_files_spec` under
@@ -413,5 +450,106 @@ class FileSystemSupportTest(tb_test.TestCase):
         mock_check_filesystem_support.assert_not_called()
 
 
+class ReloadTriggerTest(tb_test.TestCase):
+    def testFilesystemTriggerIgnoresRemotePaths(self):
+        flags = FakeFlags(logdir="gs://foo/bar", reload_trigger="filesystem")
+        with mock.patch.object(data_ingester, "_check_filesystem_support"):
+            ingester = data_ingester.LocalDataIngester(flags)
+        self.assertIsNone(ingester._create_change_watcher())
+
+    def testFilesystemTriggerWithoutInotify(self):
+        flags = FakeFlags(
+            logdir=self.get_temp_dir(), reload_trigger="filesystem"
+        )
+        ingester = data_ingester.LocalDataIngester(flags)
+        with mock.patch.object(inotify, "IsSupported", return_value=False):
+            self.assertIsNone(ingester._create_change_watcher())
+
+
+class StopTest(tb_test.TestCase):
+    def testStopsReloadWorkers(self):
+        logdir = self.get_temp_dir()
+        with test_util.FileWriter(os.path.join(logdir, "run")) as writer:
+            writer.add_test_summary("loss", simple_value=1.0, step=3)
+        flags = FakeFlags(
+            logdir=logdir,
+            reload_interval=0,
+            reload_task="blocking",
+            reload_workers="process",
+        )
+        ingester = data_ingester.LocalDataIngester(flags)
+        ingester.start()
+        workers = ingester.deprecated_multiplexer._reload_pool._workers
+        processes = [worker[0] for worker in workers if worker is not None]
+        self.assertNotEmpty(processes)
+        ingester.stop()
+        for process in processes:
+            self.assertFalse(process.is_alive())
+
+
+class SnapshotTest(tb_test.TestCase):
+    def testServesSnapshotWithoutReloading(self):
+        logdir = os.path.join(self.get_temp_dir(), "logdir")
+        snapshot = os.path.join(self.get_temp_dir(), "snapshot")
+        with test_util.FileWriter(os.path.join(logdir, "run")) as writer:
+            writer.add_test_summary("loss", simple_value=1.0, step=3)
+        columnar_snapshot.Export(logdir, snapshot)
+
+        flags = FakeFlags(logdir=snapshot, reload_task="blocking")
+        ingester = data_ingester.LocalDataIngester(flags)
+        self.assertIsInstance(
+            ingester.deprecated_multiplexer,
+            columnar_snapshot.SnapshotMultiplexer,
+        )
+        # Would raise if a blocking reload were set to run forever.
+        ingester.start()
+        self.assertEqual(ingester.deprecated_multiplexer.Runs().keys(), {"run"})
+
+
+@unittest.skipUnless(inotify.IsSupported(), "inotify not supported")
+class ChangeWatcherTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.logdir = self.get_temp_dir()
+        self.run_dir = os.path.join(self.logdir, "run")
+        os.mkdir(self.run_dir)
+        self.watcher = data_ingester._ChangeWatcher([self.logdir])
+        self.addCleanup(self.watcher._watcher.Close)
+
+    def _write(self, path):
+        with open(path, "ab") as f:
+            f.write(b"event")
+
+    def testTimeout(self):
+        self.assertIsNone(self.watcher.Wait(0.01))
+
+    def testEventFileGrows(self):
+        path = os.path.join(self.run_dir, "events.out.tfevents.1")
+        self._write(path)
+        self.assertEqual(({self.run_dir}, True), self.watcher.Wait(1))
+        self._write(path)
+        self.assertEqual(({self.run_dir}, False), self.watcher.Wait(1))
+
+    def testNewRunDirectory(self):
+        new_dir = os.path.join(self.logdir, "new", "run")
+        os.makedirs(new_dir)
+        (directories, new_runs_possible) = self.watcher.Wait(1)
+        self.assertTrue(new_runs_possible)
+        self.assertIn(new_dir, directories)
+        # The new directories are watched too.
+        self._write(os.path.join(new_dir, "events.out.tfevents.1"))
+        (directories, _) = self.watcher.Wait(1)
+        self.assertIn(new_dir, directories)
+
+    def testLogdirCreatedLater(self):
+        missing = os.path.join(self.logdir, "later")
+        watcher = data_ingester._ChangeWatcher([missing])
+        self.addCleanup(watcher._watcher.Close)
+        os.mkdir(missing)
+        watcher.WatchNewRoots()
+        self._write(os.path.join(missing, "events.out.tfevents.1"))
+        self.assertEqual(({missing}, True), watcher.Wait(1))
+
+
 if __name__ == "__main__":
     tb_test.main()
@@ -17,8 +17,11 @@
 
 import base64
 import collections
+import functools
 import json
-import random
+import uuid
+
+import numpy as np
 
 from tensorboard import errors
 from tensorboard.compat.proto import summary_pb2
@@ -41,6 +44,9 @@ class MultiplexerDataProvider(provider.DataProvider):
         """
         self._multiplexer = multiplexer
         self._logdir = logdir
+        # Distinguishes version tokens from those of other processes,
+        # which a client may still hold after a restart.
+        self._token_prefix = uuid.uuid4().hex
 
     def __str__(self):
         return "MultiplexerDataProvider(logdir=%r)" % self._logdir
@@ -111,6 +117,34 @@ class MultiplexerDataProvider(provider.DataProvider):
             for run in self._multiplexer.Runs()
         ]
 
+    def read_version_tokens(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        run_tag_filter=None,
+    ):
+        self._validate_context(ctx)
+        self._validate_experiment_id(experiment_id)
+        if run_tag_filter is None:
+            run_tag_filter = provider.RunTagFilter(runs=None, tags=None)
+        result = {}
+        mapping = self._multiplexer.PluginRunToTagToContent(plugin_name)
+        for run, tag_to_content in mapping.items():
+            for tag in tag_to_content:
+                if not self._test_run_tag(run_tag_filter, run, tag):
+                    continue
+                try:
+                    version = self._multiplexer.TensorsVersion(run, tag)
+                except KeyError:
+                    continue  # metadata but no data
+                result.setdefault(run, {})[tag] = "%s-%d" % (
+                    self._token_prefix,
+                    version,
+                )
+        return result
+
     def list_scalars(
         self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
     ):
@@ -119,7 +153,22 @@ class MultiplexerDataProvider(provider.DataProvider):
         index = self._index(
             plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_SCALAR
         )
-        return self._list(provider.ScalarTimeSeries, index)
+        result = {}
+        for run, tag_to_metadata in index.items():
+            result_for_run = {}
+            result[run] = result_for_run
+            for tag, summary_metadata in tag_to_metadata.items():
+                (max_step, max_wall_time) = (
+                    self._multiplexer.MaxStepAndWallTime(run, tag)
+                )
+                result_for_run[tag] = provider.ScalarTimeSeries(
+                    max_step=max_step,
+                    max_wall_time=max_wall_time,
+                    plugin_content=summary_metadata.plugin_data.content,
+                    description=summary_metadata.summary_description,
+                    display_name=summary_metadata.display_name,
+                )
+        return result
 
     def read_scalars(
         self,
@@ -136,7 +185,53 @@ class MultiplexerDataProvider(provider.DataProvider):
         index = self._index(
             plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_SCALAR
         )
-        return self._read(_convert_scalar_event, index, downsample)
+        result = {}
+        for batch in self._stream_scalars(index, downsample):
+            result.setdefault(batch.run, {})[batch.tag] = [
+                provider.ScalarDatum(step=s, wall_time=w, value=v)
+                for (s, w, v) in zip(
+                    batch.step.tolist(),
+                    batch.wall_time.tolist(),
+                    batch.value.tolist(),
+                )
+            ]
+        return result
+
+    def stream_scalars(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        self._validate_context(ctx)
+        self._validate_experiment_id(experiment_id)
+        self._validate_downsample(downsample)
+        index = self._index(
+            plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_SCALAR
+        )
+        return self._stream_scalars(index, downsample)
+
+    def _stream_scalars(self, index, downsample):
+        """Yields a `provider.ScalarBatch` for each time series in `index`."""
+        for run, tags_for_run in index.items():
+            for tag in tags_for_run:
+                columns = self._multiplexer.ScalarColumns(run, tag)
+                indices = _downsample_indices(len(columns[0]), downsample)
+                # Indexing with an array copies, so the batch does not
+                # change if the reservoir does.
+                (steps, wall_times, values) = (
+                    column[indices] for column in columns
+                )
+                yield provider.ScalarBatch(
+                    run=run,
+                    tag=tag,
+                    step=steps,
+                    wall_time=wall_times,
+                    value=values,
+                )
 
     def read_last_scalars(
         self,
@@ -154,10 +249,16 @@ class MultiplexerDataProvider(provider.DataProvider):
         run_tag_to_last_scalar_datum = collections.defaultdict(dict)
         for run, tags_for_run in index.items():
             for tag, metadata in tags_for_run.items():
-                events = self._multiplexer.Tensors(run, tag)
-                if events:
+                (steps, wall_times, values) = self._multiplexer.ScalarColumns(
+                    run, tag
+                )
+                if steps.size:
                     run_tag_to_last_scalar_datum[run][tag] = (
-                        _convert_scalar_event(events[-1])
+                        provider.ScalarDatum(
+                            step=steps[-1].item(),
+                            wall_time=wall_times[-1].item(),
+                            value=values[-1].item(),
+                        )
                     )
 
         return run_tag_to_last_scalar_datum
@@ -189,6 +290,42 @@ class MultiplexerDataProvider(provider.DataProvider):
         )
         return self._read(_convert_tensor_event, index, downsample)
 
+    def stream_tensors(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        self._validate_context(ctx)
+        self._validate_experiment_id(experiment_id)
+        self._validate_downsample(downsample)
+        index = self._index(
+            plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_TENSOR
+        )
+        return self._stream_tensors(index, downsample)
+
+    def _stream_tensors(self, index, downsample):
+        """Yields a `provider.TensorBatch` for each time series in `index`."""
+        for run, tags_for_run in index.items():
+            for tag in tags_for_run:
+                events = _downsample(
+                    self._multiplexer.Tensors(run, tag), downsample
+                )
+                yield provider.TensorBatch(
+                    run=run,
+                    tag=tag,
+                    step=np.array([e.step for e in events], dtype=np.int64),
+                    wall_time=np.array(
+                        [e.wall_time for e in events], dtype=np.float64
+                    ),
+                    numpy=[
+                        tensor_util.make_ndarray(e.tensor_proto) for e in events
+                    ],
+                )
+
     def _index(self, plugin_name, run_tag_filter, data_class_filter):
         """List time series and metadata matching the given filters.
 
@@ -217,24 +354,28 @@ class MultiplexerDataProvider(provider.DataProvider):
                 metadata = self._multiplexer.SummaryMetadata(run, tag)
             except KeyError:
                 return {}
-            all_metadata = {run: {tag: metadata}}
-        else:
-            all_metadata = self._multiplexer.AllSummaryMetadata()
+            if (
+                metadata.data_class != data_class_filter
+                or metadata.plugin_data.plugin_name != plugin_name
+            ):
+                return {}
+            return {run: {tag: metadata}}
 
         result = {}
+        all_metadata = self._multiplexer.PluginRunToTagToMetadata(
+            plugin_name, data_class_filter
+        )
         for run, tag_to_metadata in all_metadata.items():
             if runs is not None and run not in runs:
                 continue
-            result_for_run = {}
-            for tag, metadata in tag_to_metadata.items():
-                if tags is not None and tag not in tags:
-                    continue
-                if metadata.data_class != data_class_filter:
-                    continue
-                if metadata.plugin_data.plugin_name != plugin_name:
-                    continue
-                result[run] = result_for_run
-                result_for_run[tag] = metadata
+            if tags is not None:
+                tag_to_metadata = {
+                    tag: metadata
+                    for (tag, metadata) in tag_to_metadata.items()
+                    if tag in tags
+                }
+            if tag_to_metadata:
+                result[run] = tag_to_metadata
 
         return result
 
@@ -254,13 +395,9 @@ class MultiplexerDataProvider(provider.DataProvider):
             result_for_run = {}
             result[run] = result_for_run
             for tag, summary_metadata in tag_to_metadata.items():
-                max_step = None
-                max_wall_time = None
-                for event in self._multiplexer.Tensors(run, tag):
-                    if max_step is None or max_step < event.step:
-                        max_step = event.step
-                    if max_wall_time is None or max_wall_time < event.wall_time:
-                        max_wall_time = event.wall_time
+                (max_step, max_wall_time) = (
+                    self._multiplexer.MaxStepAndWallTime(run, tag)
+                )
                 summary_metadata = self._multiplexer.SummaryMetadata(run, tag)
                 result_for_run[tag] = construct_time_series(
                     max_step=max_step,
@@ -291,8 +428,9 @@ class MultiplexerDataProvider(provider.DataProvider):
             result[run] = result_for_run
             for tag, metadata in tags_for_run.items():
                 events = self._multiplexer.Tensors(run, tag)
-                data = [convert_event(e) for e in events]
-                result_for_run[tag] = _downsample(data, downsample)
+                result_for_run[tag] = [
+                    convert_event(e) for e in _downsample(events, downsample)
+                ]
         return result
 
     def list_blob_sequences(
@@ -311,12 +449,12 @@ class MultiplexerDataProvider(provider.DataProvider):
                 max_step = None
                 max_wall_time = None
                 max_length = None
-                for event in self._multiplexer.Tensors(run, tag):
+                for event in self._multiplexer.PeekTensors(run, tag):
                     if max_step is None or max_step < event.step:
                         max_step = event.step
                     if max_wall_time is None or max_wall_time < event.wall_time:
                         max_wall_time = event.wall_time
-                    length = _tensor_size(event.tensor_proto)
+                    length = event.num_elements
                     if max_length is None or length > max_length:
                         max_length = length
                 result_for_run[tag] = provider.BlobSequenceTimeSeries(
@@ -444,15 +582,6 @@ def _decode_blob_key(key):
     return (experiment_id, plugin_name, run, tag, step, index)
 
 
-def _convert_scalar_event(event):
-    """Helper for `read_scalars`."""
-    return provider.ScalarDatum(
-        step=event.step,
-        wall_time=event.wall_time,
-        value=tensor_util.make_ndarray(event.tensor_proto).item(),
-    )
-
-
 def _convert_tensor_event(event):
     """Helper for `read_tensors`."""
     return provider.TensorDatum(
@@ -464,7 +593,7 @@ def _convert_tensor_event(event):
 
 def _convert_blob_sequence_event(experiment_id, plugin_name, run, tag, event):
     """Helper for `read_blob_sequences`."""
-    num_blobs = _tensor_size(event.tensor_proto)
+    num_blobs = event.num_elements
     values = tuple(
         provider.BlobReference(
             _encode_blob_key(
@@ -485,25 +614,6 @@ def _convert_blob_sequence_event(experiment_id, plugin_name, run, tag, event):
     )
 
 
-def _tensor_size(tensor_proto):
-    """Compute the number of elements in a tensor.
-
-    This does not deserialize the full tensor contents.
-
-    Args:
-      tensor_proto: A `tensorboard.compat.proto.tensor_pb2.TensorProto`.
-
-    Returns:
-      A non-negative `int`.
-    """
-    # This is the same logic that `tensor_util.make_ndarray` uses to
-    # compute the size, but without the actual buffer copies.
-    result = 1
-    for dim in tensor_proto.tensor_shape.dim:
-        result *= dim.size
-    return result
-
-
 def _downsample(xs, k):
     """Downsample `xs` to at most `k` elements.
 
@@ -515,8 +625,8 @@ def _downsample(xs, k):
     This differs from `random.sample` in that it returns a subsequence
     (i.e., order is preserved) and that it permits `k > len(xs)`.
 
-    The random number generator will always be `random.Random(0)`, so
-    this function is deterministic (within a Python process).
+    The random number generator is always seeded with `0`, so this
+    function is deterministic.
 
     Args:
       xs: A sequence (`collections.abc.Sequence`).
@@ -528,11 +638,34 @@ def _downsample(xs, k):
       element of `xs`, uniformly selected among such subsequences.
     """
 
-    if k > len(xs):
-        return list(xs)
-    if k == 0:
-        return []
-    indices = random.Random(0).sample(range(len(xs) - 1), k - 1)
-    indices.sort()
-    indices += [len(xs) - 1]
-    return [xs[i] for i in indices]
+    return [xs[i] for i in _downsample_indices(len(xs), k)]
+
+
+# Indices depend only on the series length and `k`, so they are shared
+# by all series of the same length: in particular, by every reservoir
+# that has filled up and by every re-read of an unchanged series.
+@functools.lru_cache(maxsize=128)
+def _downsample_indices(n, k):
+    """Choose the indices of a subsequence for `_downsample`.
+
+    Args:
+      n: The length of the sequence to downsample.
+      k: A non-negative integer.
+
+    Returns:
+      A sorted, read-only 1-D NumPy `int64` array of `min(k, n)`
+      indices into a sequence of length `n`, including `n - 1` unless
+      it is empty. Indexing a NumPy array with the result is O(`k`).
+    """
+    if k >= n:
+        indices = np.arange(n, dtype=np.int64)
+    elif k == 0:
+        indices = np.zeros(0, dtype=np.int64)
+    else:
+        rng = np.random.default_rng(0)
+        indices = np.empty(k, dtype=np.int64)
+        indices[:-1] = rng.choice(n - 1, size=k - 1, replace=False)
+        indices[:-1].sort()
+        indices[-1] = n - 1
+    indices.flags.writeable = False
+    return indices
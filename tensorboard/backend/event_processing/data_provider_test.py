@@ -20,6 +20,7 @@ import os
 import numpy as np
 
 from tensorboard import context
+from tensorboard.backend.event_processing import columnar_snapshot
 from tensorboard.backend.event_processing import data_provider
 from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
@@ -123,11 +124,83 @@ class MultiplexerDataProviderTest(tf.test.TestCase):
         multiplexer = self.create_multiplexer()
         return data_provider.MultiplexerDataProvider(multiplexer, self.logdir)
 
+    def test_listing_does_not_count_as_query(self):
+        # Listing time series must not change which tags are the least
+        # recently queried, and so the first to be downsampled.
+        multiplexer = event_multiplexer.EventMultiplexer(
+            memory_budget_bytes=1 << 30
+        )
+        multiplexer.AddRunsFromDirectory(self.logdir)
+        multiplexer.Reload()
+        provider = data_provider.MultiplexerDataProvider(
+            multiplexer, self.logdir
+        )
+        provider.read_scalars(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+            downsample=100,
+        )
+        query_times = dict(multiplexer._query_times)
+        self.assertNotEmpty(query_times)
+        provider.list_scalars(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+        )
+        provider.list_tensors(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name=histogram_metadata.PLUGIN_NAME,
+        )
+        provider.list_blob_sequences(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name=image_metadata.PLUGIN_NAME,
+        )
+        self.assertEqual(multiplexer._query_times, query_times)
+
     def test_experiment_metadata(self):
         provider = self.create_provider()
         result = provider.experiment_metadata(self.ctx, experiment_id="unused")
         self.assertEqual(result.data_location, self.logdir)
 
+    def test_read_version_tokens(self):
+        multiplexer = self.create_multiplexer()
+        provider = data_provider.MultiplexerDataProvider(
+            multiplexer, self.logdir
+        )
+        tokens = provider.read_version_tokens(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+            run_tag_filter=base_provider.RunTagFilter(
+                runs=["polynomials", "waves"], tags=["square", "sine"]
+            ),
+        )
+        self.assertEqual(
+            {run: list(tags) for (run, tags) in tokens.items()},
+            {"polynomials": ["square"], "waves": ["sine", "square"]},
+        )
+
+        logdir = os.path.join(self.logdir, "polynomials")
+        with tf.summary.create_file_writer(logdir).as_default():
+            scalar_summary.scalar("square", 400, step=40)
+        multiplexer.Reload()
+        new_tokens = provider.read_version_tokens(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+            run_tag_filter=base_provider.RunTagFilter(
+                runs=["polynomials", "waves"], tags=["square", "sine"]
+            ),
+        )
+        self.assertNotEqual(
+            new_tokens["polynomials"]["square"],
+            tokens["polynomials"]["square"],
+        )
+        self.assertEqual(new_tokens["waves"]["sine"], tokens["waves"]["sine"])
+
     def test_list_plugins_with_no_graph(self):
         provider = self.create_provider()
         result = provider.list_plugins(self.ctx, experiment_id="unused")
@@ -297,6 +370,44 @@ class MultiplexerDataProviderTest(tf.test.TestCase):
                         tensor_util.make_ndarray(event.tensor_proto).item(),
                     )
 
+    def test_read_scalars_keeps_large_integers_exact(self):
+        logdir = os.path.join(self.logdir, "counters")
+        metadata = summary_pb2.SummaryMetadata()
+        metadata.plugin_data.plugin_name = "counters"
+        metadata.data_class = summary_pb2.DATA_CLASS_SCALAR
+        values = [2**60 + 1, 2**60 + 2, 2**60 + 3]
+        with tf.summary.create_file_writer(logdir).as_default():
+            for i, value in enumerate(values):
+                tf.summary.write(
+                    "bytes_seen",
+                    tensor=tf.constant(value, dtype=tf.int64),
+                    step=i,
+                    metadata=metadata,
+                )
+        multiplexer = self.create_multiplexer()
+        provider = data_provider.MultiplexerDataProvider(
+            multiplexer, self.logdir
+        )
+
+        events = multiplexer.Tensors("counters", "bytes_seen")
+        self.assertEqual(
+            [tensor_util.make_ndarray(e.tensor_proto).item() for e in events],
+            values,
+        )
+        result = provider.read_scalars(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name="counters",
+            downsample=100,
+        )
+        data = result["counters"]["bytes_seen"]
+        self.assertEqual([datum.value for datum in data], values)
+        self.assertIsInstance(data[0].value, int)
+        result = provider.read_last_scalars(
+            self.ctx, experiment_id="unused", plugin_name="counters"
+        )
+        self.assertEqual(result["counters"]["bytes_seen"].value, values[-1])
+
     def test_read_scalars_downsamples(self):
         # TODO(@wchargin): Verify that this always includes the most
         # recent datum, as specified by the interface.
@@ -400,6 +511,61 @@ class MultiplexerDataProviderTest(tf.test.TestCase):
         self.assertCountEqual(result.keys(), ["lebesgue"])
         self.assertCountEqual(result["lebesgue"].keys(), ["uniform"])
 
+    def test_stream_scalars(self):
+        provider = self.create_provider()
+        kwargs = dict(
+            experiment_id="unused",
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+            downsample=3,
+        )
+        expected = provider.read_scalars(self.ctx, **kwargs)
+        batches = list(provider.stream_scalars(self.ctx, **kwargs))
+        self.assertCountEqual(
+            [(b.run, b.tag) for b in batches],
+            [(run, tag) for run in expected for tag in expected[run]],
+        )
+        for batch in batches:
+            data = expected[batch.run][batch.tag]
+            self.assertLen(batch, 3)
+            self.assertEqual(batch.step.dtype, np.int64)
+            self.assertEqual(batch.step.tolist(), [d.step for d in data])
+            self.assertEqual(
+                batch.wall_time.tolist(), [d.wall_time for d in data]
+            )
+            self.assertEqual(batch.value.tolist(), [d.value for d in data])
+
+    def test_stream_scalars_validates_before_iterating(self):
+        provider = self.create_provider()
+        with self.assertRaisesRegex(TypeError, "downsample"):
+            provider.stream_scalars(
+                self.ctx,
+                experiment_id="unused",
+                plugin_name=scalar_metadata.PLUGIN_NAME,
+            )
+
+    def test_stream_tensors(self):
+        provider = self.create_provider()
+        kwargs = dict(
+            experiment_id="unused",
+            plugin_name=histogram_metadata.PLUGIN_NAME,
+            downsample=100,
+        )
+        expected = provider.read_tensors(self.ctx, **kwargs)
+        batches = list(provider.stream_tensors(self.ctx, **kwargs))
+        self.assertCountEqual(
+            [(b.run, b.tag) for b in batches],
+            [(run, tag) for run in expected for tag in expected[run]],
+        )
+        for batch in batches:
+            data = expected[batch.run][batch.tag]
+            self.assertEqual(batch.step.tolist(), [d.step for d in data])
+            self.assertEqual(
+                batch.wall_time.tolist(), [d.wall_time for d in data]
+            )
+            self.assertLen(batch.numpy, len(data))
+            for x, d in zip(batch.numpy, data):
+                np.testing.assert_equal(x, d.numpy)
+
     def test_read_tensors(self):
         multiplexer = self.create_multiplexer()
         provider = data_provider.MultiplexerDataProvider(
@@ -539,6 +705,39 @@ class MultiplexerDataProviderTest(tf.test.TestCase):
             )
 
 
+class SnapshotDataProviderTest(MultiplexerDataProviderTest):
+    """Runs the tests above on a columnar snapshot of the same logdir."""
+
+    def create_multiplexer(self):
+        path = os.path.join(self.create_tempdir().full_path, "snapshot")
+        columnar_snapshot.Write(super().create_multiplexer(), path)
+        return columnar_snapshot.SnapshotMultiplexer(path)
+
+    def test_read_version_tokens(self):
+        # Snapshots never change, so neither do their tokens.
+        provider = self.create_provider()
+
+        def read_tokens():
+            return provider.read_version_tokens(
+                self.ctx,
+                experiment_id="unused",
+                plugin_name=scalar_metadata.PLUGIN_NAME,
+                run_tag_filter=base_provider.RunTagFilter(
+                    runs=["polynomials", "waves"], tags=["square", "sine"]
+                ),
+            )
+
+        tokens = read_tokens()
+        self.assertEqual(
+            {run: list(tags) for (run, tags) in tokens.items()},
+            {"polynomials": ["square"], "waves": ["sine", "square"]},
+        )
+        self.assertLen(
+            {token for tags in tokens.values() for token in tags.values()}, 3
+        )
+        self.assertEqual(read_tokens(), tokens)
+
+
 class DownsampleTest(tf.test.TestCase):
     """Tests for the `_downsample` private helper function."""
 
@@ -566,6 +765,16 @@ class DownsampleTest(tf.test.TestCase):
         actual = data_provider._downsample(xs, k=0)
         self.assertEqual(actual, [])
 
+    def test_indices(self):
+        indices = data_provider._downsample_indices(1000000, 1000)
+        self.assertLen(indices, 1000)
+        self.assertLen(set(indices.tolist()), 1000)
+        self.assertAllEqual(indices, np.sort(indices))
+        self.assertEqual(indices[-1], 999999)
+        self.assertFalse(indices.flags.writeable)
+        # Repeated reads of a series of the same length reuse the indices.
+        self.assertIs(data_provider._downsample_indices(1000000, 1000), indices)
+
 
 if __name__ == "__main__":
     tf.test.main()
@@ -57,7 +57,9 @@ class DirectoryLoader:
           directory: The directory to load files from.
           loader_factory: A factory for creating loaders. The factory should take a
             path and return an object that has a Load method returning an iterator
-            yielding (unix timestamp as float, value) pairs for any new data
+            yielding (unix timestamp as float, value) pairs for any new data, and
+            a BytesRead method returning the number of bytes read so far. If it
+            also has a Close method, that is called once its path is inactive.
           path_filter: If specified, only paths matching this filter are loaded.
           active_filter: If specified, any loader whose maximum load timestamp does
             not pass this filter will be marked as inactive and no longer read.
@@ -75,6 +77,8 @@ class DirectoryLoader:
         self._active_filter = active_filter
         self._loaders = {}
         self._max_timestamps = {}
+        # Bytes read by loaders for paths that have become inactive.
+        self._inactive_bytes_read = 0
 
     def Load(self):
         """Loads new values from all active files.
@@ -139,6 +143,65 @@ class DirectoryLoader:
         logger.debug("Checking active status of %s at %s", path, max_timestamp)
         if max_timestamp is not None and not self._active_filter(max_timestamp):
             self._max_timestamps[path] = _INACTIVE
-            del self._loaders[path]
+            loader = self._loaders.pop(path)
+            self._inactive_bytes_read += loader.BytesRead()
+            if hasattr(loader, "Close"):
+                loader.Close()
             return True
         return False
+
+    def BytesRead(self):
+        """Returns the number of bytes read from all paths so far."""
+        return self._inactive_bytes_read + sum(
+            loader.BytesRead() for loader in self._loaders.values()
+        )
+
+    def GetCheckpoint(self):
+        """Returns the state of all paths, for a later `RestoreCheckpoint`.
+
+        The loaders must support `GetCheckpoint` as well.
+
+        Returns:
+          A dict of plain Python values.
+        """
+        return {
+            "loaders": {
+                path: loader.GetCheckpoint()
+                for (path, loader) in self._loaders.items()
+            },
+            "max_timestamps": {
+                path: timestamp
+                for (path, timestamp) in self._max_timestamps.items()
+                if timestamp is not _INACTIVE
+            },
+            "inactive_paths": [
+                path
+                for (path, timestamp) in self._max_timestamps.items()
+                if timestamp is _INACTIVE
+            ],
+            "inactive_bytes_read": self._inactive_bytes_read,
+        }
+
+    def RestoreCheckpoint(self, checkpoint):
+        """Resumes loading at the position recorded by `GetCheckpoint`.
+
+        Must be called before `Load`, and the loaders must support
+        `RestoreCheckpoint` as well.
+
+        Args:
+          checkpoint: A value returned by `GetCheckpoint` on a loader for
+            the same directory.
+
+        Raises:
+          ValueError: If a loader could not be restored.
+        """
+        loaders = {}
+        for path, loader_checkpoint in checkpoint["loaders"].items():
+            loader = self._loader_factory(path)
+            loader.RestoreCheckpoint(loader_checkpoint)
+            loaders[path] = loader
+        self._loaders = loaders
+        self._max_timestamps = dict(checkpoint["max_timestamps"])
+        for path in checkpoint["inactive_paths"]:
+            self._max_timestamps[path] = _INACTIVE
+        self._inactive_bytes_read = checkpoint["inactive_bytes_read"]
@@ -39,6 +39,7 @@ class _TimestampedByteLoader:
         self._registry = registry if registry is not None else []
         self._registry.append(path)
         self._f = open(path)
+        self._bytes_read = 0
 
     def __del__(self):
         self._registry.remove(self._path)
@@ -48,9 +49,23 @@ class _TimestampedByteLoader:
             line = self._f.readline()
             if not line:
                 return
+            self._bytes_read += len(line)
             ts, value = line.rstrip("\n").split(":")
             yield float(ts), value
 
+    def BytesRead(self):
+        return self._bytes_read
+
+    def GetCheckpoint(self):
+        return self._f.tell()
+
+    def RestoreCheckpoint(self, checkpoint):
+        self._f.seek(checkpoint)
+        self._bytes_read = checkpoint
+
+    def Close(self):
+        self._f.close()
+
 
 class DirectoryLoaderTest(tf.test.TestCase):
     def setUp(self):
@@ -102,6 +117,45 @@ class DirectoryLoaderTest(tf.test.TestCase):
         self.assertLoaderYields(["A", "B", "c"])
         self.assertLoaderYields([])
 
+    def testBytesRead(self):
+        self.assertEqual(0, self._loader.BytesRead())
+        self._WriteToFile("a", "a", [3])
+        self._WriteToFile("b", "b", [4])
+        list(self._loader.Load())
+        line_length = len("3.000000:a\n")
+        self.assertEqual(2 * line_length, self._loader.BytesRead())
+
+    def testBytesRead_includesInactiveFiles(self):
+        self._loader = directory_loader.DirectoryLoader(
+            self._directory,
+            _TimestampedByteLoader,
+            active_filter=lambda timestamp: timestamp >= 2,
+        )
+        self._WriteToFile("a", "a", [1])
+        list(self._loader.Load())
+        line_length = len("1.000000:a\n")
+        self.assertEqual(line_length, self._loader.BytesRead())
+        # Marks "a" as inactive, dropping its loader.
+        list(self._loader.Load())
+        self.assertEqual(line_length, self._loader.BytesRead())
+
+    def testClosesLoadersOfInactiveFiles(self):
+        file_loaders = []
+
+        def loader_factory(path):
+            file_loaders.append(_TimestampedByteLoader(path))
+            return file_loaders[-1]
+
+        self._loader = directory_loader.DirectoryLoader(
+            self._directory,
+            loader_factory,
+            active_filter=lambda timestamp: timestamp >= 2,
+        )
+        self._WriteToFile("a", "a", [1])
+        self._WriteToFile("b", "b", [2])
+        self.assertLoaderYields(["a", "b"])
+        self.assertEqual([f._f.closed for f in file_loaders], [True, False])
+
     def testMultipleFileLoading_intermediateEmptyFiles(self):
         self._WriteToFile("a", "a")
         self._WriteToFile("b", "")
@@ -200,6 +254,28 @@ class DirectoryLoaderTest(tf.test.TestCase):
         self._WriteToFile("b", ["B7"], [7])
         self.assertLoaderYields([])
 
+    def testRestoreCheckpoint(self):
+        self._loader = directory_loader.DirectoryLoader(
+            self._directory,
+            _TimestampedByteLoader,
+            active_filter=lambda timestamp: timestamp >= 2,
+        )
+        self._WriteToFile("a", "a", [1])
+        self._WriteToFile("b", "bc", [2, 3])
+        self.assertLoaderYields(["a", "b", "c"])
+        checkpoint = self._loader.GetCheckpoint()
+        self._WriteToFile("a", "d", [4])
+        self._WriteToFile("b", "e", [5])
+        restored = directory_loader.DirectoryLoader(
+            self._directory,
+            _TimestampedByteLoader,
+            active_filter=lambda timestamp: timestamp >= 2,
+        )
+        restored.RestoreCheckpoint(checkpoint)
+        # File "a" was already inactive, so only "b" is read.
+        self.assertEqual(list(restored.Load()), ["e"])
+        self.assertEqual(restored.BytesRead(), self._loader.BytesRead() + 11)
+
     def testDoesntCrashWhenCurrentFileIsDeleted(self):
         # Use actual file loader so it emits the real error.
         self._loader = directory_loader.DirectoryLoader(
@@ -48,7 +48,10 @@ class DirectoryWatcher:
           directory: The directory to load files from.
           loader_factory: A factory for creating loaders. The factory should take a
             path and return an object that has a Load method returning an
-            iterator that will yield all events that have not been yielded yet.
+            iterator that will yield all events that have not been yielded yet,
+            and a BytesRead method returning the number of bytes read so far.
+            If it also has a Close method, that is called once the watcher
+            moves on to the next path.
           path_filter: If specified, only paths matching this filter are loaded.
 
         Raises:
@@ -66,6 +69,8 @@ class DirectoryWatcher:
         self._ooo_writes_detected = False
         # The file size for each file at the time it was finalized.
         self._finalized_sizes = {}
+        # Bytes read by loaders for paths that we have moved past.
+        self._finalized_bytes_read = 0
 
     def Load(self):
         """Loads new values.
@@ -94,6 +99,59 @@ class DirectoryWatcher:
                     % self._directory
                 )
 
+    def BytesRead(self):
+        """Returns the number of bytes read from all paths so far."""
+        if self._loader is None:
+            return self._finalized_bytes_read
+        return self._finalized_bytes_read + self._loader.BytesRead()
+
+    def GetCheckpoint(self):
+        """Returns the watcher's position, for a later `RestoreCheckpoint`.
+
+        The loaders must support `GetCheckpoint` as well.
+
+        Returns:
+          A dict of plain Python values.
+        """
+        return {
+            "path": self._path,
+            "loader": (
+                self._loader.GetCheckpoint()
+                if self._loader is not None
+                else None
+            ),
+            "finalized_sizes": dict(self._finalized_sizes),
+            "finalized_bytes_read": self._finalized_bytes_read,
+            "ooo_writes_detected": self._ooo_writes_detected,
+        }
+
+    def RestoreCheckpoint(self, checkpoint):
+        """Resumes loading at the position recorded by `GetCheckpoint`.
+
+        Must be called before `Load`, and the loaders must support
+        `RestoreCheckpoint` as well.
+
+        Args:
+          checkpoint: A value returned by `GetCheckpoint` on a watcher for
+            the same directory.
+
+        Raises:
+          ValueError: If a path that the watcher had moved past has
+            changed size, or the loader could not be restored.
+        """
+        for path, size in checkpoint["finalized_sizes"].items():
+            if tf.io.gfile.stat(path).length != size:
+                raise ValueError(
+                    "%s has changed since it was checkpointed" % path
+                )
+        self._finalized_sizes = dict(checkpoint["finalized_sizes"])
+        self._finalized_bytes_read = checkpoint["finalized_bytes_read"]
+        self._ooo_writes_detected = checkpoint["ooo_writes_detected"]
+        self._path = checkpoint["path"]
+        if self._path is not None:
+            self._loader = self._loader_factory(self._path)
+            self._loader.RestoreCheckpoint(checkpoint["loader"])
+
     def _LoadInternal(self):
         """Internal implementation of Load().
 
@@ -193,6 +251,10 @@ class DirectoryWatcher:
             except tf.errors.OpError as e:
                 logger.error("Unable to get size of %s: %s", old_path, e)
 
+        if self._loader is not None:
+            self._finalized_bytes_read += self._loader.BytesRead()
+            if hasattr(self._loader, "Close"):
+                self._loader.Close()
         self._path = path
         self._loader = self._loader_factory(path)
 
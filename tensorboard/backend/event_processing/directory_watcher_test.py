@@ -42,6 +42,18 @@ class _ByteLoader:
             else:
                 return
 
+    def BytesRead(self):
+        return self.bytes_read
+
+    def GetCheckpoint(self):
+        return self.bytes_read
+
+    def RestoreCheckpoint(self, checkpoint):
+        self.bytes_read = checkpoint
+
+    def Close(self):
+        self._f.close()
+
 
 class DirectoryWatcherTest(tf.test.TestCase):
     def setUp(self):
@@ -118,6 +130,24 @@ class DirectoryWatcherTest(tf.test.TestCase):
         self.assertWatcherYields(["b", "c"])
         self.assertFalse(self._watcher.OutOfOrderWritesDetected())
 
+    def testClosesLoaderWhenSwitchingToNewFile(self):
+        self._WriteToFile("a", "a")
+        self.assertWatcherYields(["a"])
+        loader = self._watcher._loader
+        self._WriteToFile("b", "b")
+        self.assertWatcherYields(["b"])
+        self.assertTrue(loader._f.closed)
+        self.assertFalse(self._watcher._loader._f.closed)
+
+    def testBytesRead(self):
+        self.assertEqual(0, self._watcher.BytesRead())
+        self._WriteToFile("a", "ab")
+        self._LoadAllEvents()
+        self.assertEqual(2, self._watcher.BytesRead())
+        self._WriteToFile("b", "cde")
+        self._LoadAllEvents()
+        self.assertEqual(5, self._watcher.BytesRead())
+
     def testIntermediateEmptyFiles(self):
         self._WriteToFile("a", "a")
         self._WriteToFile("b", "")
@@ -160,6 +190,32 @@ class DirectoryWatcherTest(tf.test.TestCase):
         self._LoadAllEvents()
         self.assertTrue(self._watcher.OutOfOrderWritesDetected())
 
+    def testRestoreCheckpoint(self):
+        self._WriteToFile("a", "a")
+        self._WriteToFile("b", "bc")
+        self._LoadAllEvents()
+        checkpoint = self._watcher.GetCheckpoint()
+        self._WriteToFile("b", "d")
+        self._WriteToFile("c", "e")
+        self._watcher = directory_watcher.DirectoryWatcher(
+            self._directory, _ByteLoader
+        )
+        self._watcher.RestoreCheckpoint(checkpoint)
+        self.assertWatcherYields(["d", "e"])
+        self.assertEqual(self._watcher.BytesRead(), 5)
+
+    def testRestoreCheckpointRejectsChangedOldFiles(self):
+        self._WriteToFile("a", "a")
+        self._WriteToFile("b", "b")
+        self._LoadAllEvents()
+        checkpoint = self._watcher.GetCheckpoint()
+        self._WriteToFile("a", "c")
+        watcher = directory_watcher.DirectoryWatcher(
+            self._directory, _ByteLoader
+        )
+        with self.assertRaises(ValueError):
+            watcher.RestoreCheckpoint(checkpoint)
+
     def testDoesntCrashWhenFileIsDeleted(self):
         self._WriteToFile("a", "a")
         self._LoadAllEvents()
@@ -16,11 +16,19 @@
 """Functionality for loading events from a record file."""
 
 import contextlib
+import io
+import mmap
+import os
+import struct
 
 from tensorboard import data_compat
 from tensorboard import dataclass_compat
+from tensorboard.backend.event_processing import io_wrapper
 from tensorboard.compat import tf
 from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.compat.tensorflow_stub import errors as stub_errors
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
 from tensorboard.util import platform_util
 from tensorboard.util import tb_logging
 
@@ -113,11 +121,189 @@ class _PyRecordReaderIterator:
 
     next = __next__  # for python2 compatibility
 
+    def close(self):
+        # Only the stub reader holds a file handle until it is closed.
+        if hasattr(self._reader, "close"):
+            self._reader.close()
+
+
+class _CompressedRecordIterator:
+    """Python iterator for TF Records in a GZIP or ZLIB compressed file.
+
+    Reads with the stub `PyRecordReader_New` even when TensorFlow is
+    installed, since it decompresses incrementally and so can keep
+    reading a compressed file that is still being written.
+    """
+
+    def __init__(self, file_path, compression_type):
+        """Constructs a _CompressedRecordIterator for the given file path.
+
+        Args:
+          file_path: file path of the compressed tfrecord file to read
+          compression_type: "GZIP" or "ZLIB"
+        """
+        self._reader = pywrap_tensorflow.PyRecordReader_New(
+            file_path, compression_type=compression_type
+        )
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            self._reader.GetNext()
+        except stub_errors.OutOfRangeError:
+            raise StopIteration
+        except stub_errors.DataLossError as e:
+            # Callers expect the errors of the TensorFlow in use.
+            raise tf.errors.DataLossError(None, None, e.message)
+        return self._reader.record()
+
+    def close(self):
+        self._reader.close()
+
+
+# TFRecord framing: a little-endian uint64 length and its masked CRC,
+# then the payload, then the masked CRC of the payload.
+_RECORD_HEADER = struct.Struct("<QI")
+_RECORD_FOOTER = struct.Struct("<I")
+_RECORD_OVERHEAD = _RECORD_HEADER.size + _RECORD_FOOTER.size
+
+
+def _is_local_path(path):
+    """Whether `path` names a file on the local filesystem."""
+    return "://" not in tf.compat.as_str_any(path)
+
+
+def _stat_file(path):
+    """Returns the size of a file and its mtime in nanoseconds.
+
+    The mtime is `None` if the filesystem does not report one.
+    """
+    if _is_local_path(path):
+        stat = os.stat(path)
+        return (stat.st_size, stat.st_mtime_ns)
+    stat = tf.io.gfile.stat(path)
+    return (stat.length, getattr(stat, "mtime_nsec", None))
+
+
+def _has_record_header_at(path, offset):
+    """Whether a local file has a valid record header at `offset`.
+
+    The end of the file, or a header that is still being written, also
+    counts as valid, since records may yet be appended there.
+    """
+    with io.open(path, "rb") as f:
+        f.seek(offset)
+        header = f.read(_RECORD_HEADER.size)
+    if len(header) < _RECORD_HEADER.size:
+        return True
+    (_, header_crc) = _RECORD_HEADER.unpack(header)
+    return pywrap_tensorflow.masked_crc32c(header[:8]) == header_crc
+
+
+class _MmapRecordIterator:
+    """Python iterator for TF Records in a memory-mapped local file.
+
+    The file stays open, and records are parsed straight out of a read-only
+    mapping of it, so reading a large file costs no per-record syscalls.
+    The mapping covers the file as of the last call to `remap()`; records
+    past its end, including any partially written trailing record, become
+    visible once the owner remaps after the file grows.
+    """
+
+    def __init__(self, file_path, offset=0):
+        """Constructs a _MmapRecordIterator for the given file path.
+
+        Args:
+          file_path: local file path of the tfrecord file to read
+          offset: offset of the first record to read
+        """
+        self._file_path = file_path
+        self._file = None
+        self._mmap = None
+        # Offset of the first byte of the next record to read.
+        self._offset = offset
+        self.reopen()
+
+    def remap(self):
+        """Maps the file at its current size, releasing any old mapping."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        size = os.fstat(self._file.fileno()).st_size
+        if not size:
+            # Empty files cannot be mapped; there is nothing to read yet.
+            return
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+
+    def reopen(self):
+        """Reopens the file by path, keeping the current read offset."""
+        self.close()
+        self._file = io.open(self._file_path, "rb")
+        self.remap()
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        mapped = self._mmap
+        start = self._offset
+        available = len(mapped) - start if mapped is not None else 0
+        if not available:
+            raise StopIteration
+        if available < _RECORD_HEADER.size:
+            raise self._truncation_error("header")
+        (length, header_crc) = _RECORD_HEADER.unpack_from(mapped, start)
+        with memoryview(mapped) as view:
+            actual_crc = pywrap_tensorflow.masked_crc32c(
+                view[start : start + 8]
+            )
+        if actual_crc != header_crc:
+            raise tf.errors.DataLossError(
+                None,
+                None,
+                "{} failed header crc32 check".format(self._file_path),
+            )
+        data_start = start + _RECORD_HEADER.size
+        data_end = data_start + length
+        if data_end + _RECORD_FOOTER.size > len(mapped):
+            raise self._truncation_error("data")
+        record = mapped[data_start:data_end]
+        (data_crc,) = _RECORD_FOOTER.unpack_from(mapped, data_end)
+        if pywrap_tensorflow.masked_crc32c(record) != data_crc:
+            raise tf.errors.DataLossError(
+                None,
+                None,
+                "{} failed event crc32 check".format(self._file_path),
+            )
+        self._offset = data_end + _RECORD_FOOTER.size
+        return record
+
+    def _truncation_error(self, section):
+        return tf.errors.DataLossError(
+            None,
+            None,
+            "{} has truncated record in {}".format(self._file_path, section),
+        )
+
 
 class RawEventFileLoader:
     """An iterator that yields Event protos as serialized bytestrings."""
 
-    def __init__(self, file_path, detect_file_replacement=False):
+    def __init__(
+        self, file_path, detect_file_replacement=False, use_mmap=False
+    ):
         """Constructs a RawEventFileLoader for the given file path.
 
         Args:
@@ -127,13 +313,47 @@ class RawEventFileLoader:
               that the file has grown, it will reopen the file entirely (while
               preserving the current offset) before attempting to read from it.
               Otherwise, Load() will simply poll at EOF for new data.
+          use_mmap: if True and the file is on the local filesystem, records
+              are read from a persistent memory mapping of the file, which
+              Load() remaps whenever a stat() call shows that the file grew.
+              Non-local files are read as usual.
+
+        Files whose names mark them as compressed (see
+        `io_wrapper.EventFileCompressionType`) are decompressed as they are
+        read. They are never memory-mapped, and need no file replacement
+        detection to see that they grew.
         """
         if file_path is None:
             raise ValueError("A file path is required")
         self._file_path = platform_util.readahead_file_path(file_path)
         self._detect_file_replacement = detect_file_replacement
         self._file_size = None
-        self._iterator = _make_tf_record_iterator(self._file_path)
+        self._bytes_read = 0
+        # Offset of the first byte after the last record yielded.
+        self._offset = 0
+        self._compression_type = io_wrapper.EventFileCompressionType(
+            self._file_path
+        )
+        self._use_mmap = (
+            use_mmap
+            and _is_local_path(self._file_path)
+            and not self._compression_type
+        )
+        if self._compression_type:
+            logger.debug(
+                "Opening a %s record reader on %s",
+                self._compression_type,
+                self._file_path,
+            )
+            self._iterator = _CompressedRecordIterator(
+                self._file_path, self._compression_type
+            )
+            self._detect_file_replacement = False
+        elif self._use_mmap:
+            logger.debug("Opening a mmap record reader on %s", self._file_path)
+            self._iterator = _MmapRecordIterator(self._file_path)
+        else:
+            self._iterator = _make_tf_record_iterator(self._file_path)
         if self._detect_file_replacement and not hasattr(
             self._iterator, "reopen"
         ):
@@ -173,9 +393,15 @@ class RawEventFileLoader:
                         self._file_size,
                     )
                     return
+            elif self._use_mmap:
+                # Without a usable size, remap in case the file grew.
+                self._iterator.remap()
+        elif self._use_mmap:
+            if self.CheckForIncreasedFileSize() is not False:
+                self._iterator.remap()
         while True:
             try:
-                yield next(self._iterator)
+                record = next(self._iterator)
             except StopIteration:
                 logger.debug("End of file in %s", self._file_path)
                 break
@@ -185,8 +411,90 @@ class RawEventFileLoader:
                 # the same point in the file since the iterator holds the offset.
                 logger.debug("Truncated record in %s (%s)", self._file_path, e)
                 break
+            self._bytes_read += len(record)
+            self._offset += len(record) + _RECORD_OVERHEAD
+            yield record
         logger.debug("No more events in %s", self._file_path)
 
+    def Close(self):
+        """Closes the file. The loader must not be used afterward."""
+        if hasattr(self._iterator, "close"):
+            self._iterator.close()
+
+    def BytesRead(self):
+        """Returns the total size of the records yielded so far.
+
+        Record framing is not counted, so this is slightly less than the
+        number of bytes of the file consumed.
+        """
+        return self._bytes_read
+
+    def GetCheckpoint(self):
+        """Returns the read position, for a later `RestoreCheckpoint`.
+
+        Returns:
+          A dict of plain Python values. It records the current size and
+          mtime of the file, so that `RestoreCheckpoint` can tell whether
+          the file has since been rewritten.
+        """
+        return {
+            "offset": self._offset,
+            "bytes_read": self._bytes_read,
+            "stat": _stat_file(self._file_path),
+        }
+
+    def RestoreCheckpoint(self, checkpoint):
+        """Resumes reading at the position recorded by `GetCheckpoint`.
+
+        Must be called before `Load`. Files read through a memory mapping
+        then resume at the checkpointed offset. Other files are read from
+        the start up to the checkpointed offset, but without parsing any
+        events.
+
+        Args:
+          checkpoint: A value returned by `GetCheckpoint` on a loader for
+            the same file.
+
+        Raises:
+          ValueError: If the file shrank, was rewritten, or no longer has
+            a record boundary at the checkpointed offset.
+        """
+        offset = checkpoint["offset"]
+        (old_size, old_mtime_ns) = checkpoint["stat"]
+        (size, mtime_ns) = _stat_file(self._file_path)
+        if size < old_size or (size == old_size and mtime_ns != old_mtime_ns):
+            raise ValueError(
+                "%s has changed since it was checkpointed" % self._file_path
+            )
+        if (
+            _is_local_path(self._file_path)
+            and not self._compression_type
+            and not _has_record_header_at(self._file_path, offset)
+        ):
+            # The file grew, but was rewritten rather than appended to.
+            raise ValueError(
+                "%s has no record at offset %d" % (self._file_path, offset)
+            )
+        if self._use_mmap:
+            self._iterator.close()
+            self._iterator = _MmapRecordIterator(self._file_path, offset)
+            self._offset = offset
+        else:
+            logger.info(
+                "Skipping %d bytes of records in %s", offset, self._file_path
+            )
+            while self._offset < offset:
+                try:
+                    record = next(self._iterator)
+                except (StopIteration, tf.errors.DataLossError):
+                    break
+                self._offset += len(record) + _RECORD_OVERHEAD
+            if self._offset != offset:
+                raise ValueError(
+                    "%s has no record at offset %d" % (self._file_path, offset)
+                )
+        self._bytes_read = checkpoint["bytes_read"]
+
     def CheckForIncreasedFileSize(self):
         """Stats the file to get its updated size, returning True if it grew.
 
@@ -251,8 +559,23 @@ class EventFileLoader(LegacyEventFileLoader):
     Specifically, this includes `data_compat` and `dataclass_compat`.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, value_sink=None, **kwargs):
+        """Constructs an `EventFileLoader`.
+
+        Takes the arguments of `RawEventFileLoader`, and:
+
+        Args:
+          value_sink: Optional callable that is offered each summary value
+            whose tag this loader has seen before, before the value is
+            migrated. It is called as `value_sink(tag, wall_time, step,
+            value, migrate)`, where `migrate(value)` returns the migrated
+            `Summary.Value`, and returns whether it took the value. Values
+            that it takes are removed from the event before the event is
+            migrated and yielded, so a consumer that would discard a value
+            can do so without paying for its migration.
+        """
         super().__init__(*args, **kwargs)
+        self._value_sink = value_sink
         # Track initial metadata for each tag, for `dataclass_compat`.
         # This is meant to be tracked per run, not per event file, so
         # there is a potential failure case when the second event file
@@ -266,8 +589,25 @@ class EventFileLoader(LegacyEventFileLoader):
         # sufficiently improbable that we don't take extra mitigations.
         self._initial_metadata = {}  # from tag name to `SummaryMetadata`
 
+    def GetCheckpoint(self):
+        checkpoint = super().GetCheckpoint()
+        checkpoint["initial_metadata"] = {
+            tag: metadata.SerializeToString()
+            for (tag, metadata) in self._initial_metadata.items()
+        }
+        return checkpoint
+
+    def RestoreCheckpoint(self, checkpoint):
+        super().RestoreCheckpoint(checkpoint)
+        self._initial_metadata = {
+            tag: summary_pb2.SummaryMetadata.FromString(metadata)
+            for (tag, metadata) in checkpoint["initial_metadata"].items()
+        }
+
     def Load(self):
         for event in super().Load():
+            if self._value_sink is not None and event.HasField("summary"):
+                self._OfferValues(event)
             event = data_compat.migrate_event(event)
             events = dataclass_compat.migrate_event(
                 event, self._initial_metadata
@@ -275,6 +615,34 @@ class EventFileLoader(LegacyEventFileLoader):
             for event in events:
                 yield event
 
+    def _OfferValues(self, event):
+        """Removes the values of `event` that the value sink takes."""
+        values = event.summary.value
+        kept = [
+            value
+            for value in values
+            if value.tag not in self._initial_metadata
+            or not self._value_sink(
+                value.tag,
+                event.wall_time,
+                event.step,
+                value,
+                self._MigrateValue,
+            )
+        ]
+        if len(kept) < len(values):
+            del values[:]
+            values.extend(kept)
+
+    def _MigrateValue(self, value):
+        # Every migration maps one value to one value. The initial
+        # metadata for the tag is already known, so this does not depend
+        # on when it is called.
+        (value,) = dataclass_compat.migrate_value(
+            data_compat.migrate_value(value), self._initial_metadata
+        )
+        return value
+
 
 class TimestampedEventFileLoader(EventFileLoader):
     """An iterator that yields (UNIX timestamp float, Event proto) pairs."""
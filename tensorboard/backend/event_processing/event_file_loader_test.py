@@ -26,6 +26,7 @@ from tensorboard import test as tb_test
 from tensorboard.backend.event_processing import event_file_loader
 from tensorboard.compat import tf
 from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.tensorflow_stub.io import gfile
 from tensorboard.summary.writer import record_writer
 
 
@@ -95,6 +96,102 @@ class EventFileLoaderTestBase(metaclass=abc.ABCMeta):
             f.write(record[-1:])
             self.assertEventWallTimes(loader.Load(), [3.0])
 
+    def testBytesRead(self):
+        first = _make_event(wall_time=1.0)
+        second = _make_event(wall_time=2.0, step=7)
+        self._append_record(first)
+        loader = self._make_loader()
+        self.assertEqual(0, loader.BytesRead())
+        list(loader.Load())
+        self.assertEqual(len(first), loader.BytesRead())
+        self._append_record(second)
+        list(loader.Load())
+        self.assertEqual(len(first) + len(second), loader.BytesRead())
+
+    def testRestoreCheckpoint_resumesAfterLastRecord(self):
+        self._append_record(_make_event(wall_time=1.0))
+        self._append_record(_make_event(wall_time=2.0))
+        loader = self._make_loader()
+        list(loader.Load())
+        checkpoint = loader.GetCheckpoint()
+        self._append_record(_make_event(wall_time=3.0))
+        restored = self._make_loader()
+        restored.RestoreCheckpoint(checkpoint)
+        self.assertEqual(restored.BytesRead(), loader.BytesRead())
+        self.assertEventWallTimes(restored.Load(), [3.0])
+        self.assertEqual(
+            restored.GetCheckpoint()["offset"],
+            os.path.getsize(self._get_filename()),
+        )
+
+    def testRestoreCheckpoint_nonLocalPathSkipsRecords(self):
+        self._append_record(_make_event(wall_time=1.0))
+        self._append_record(_make_event(wall_time=2.0))
+        loader = self._make_loader()
+        list(loader.Load())
+        checkpoint = loader.GetCheckpoint()
+        self._append_record(_make_event(wall_time=3.0))
+        with mock.patch.object(
+            event_file_loader, "_is_local_path", return_value=False
+        ):
+            restored = self._make_loader()
+            restored.RestoreCheckpoint(checkpoint)
+            self.assertEventWallTimes(restored.Load(), [3.0])
+
+    def testRestoreCheckpoint_rejectsShrunkFile(self):
+        self._append_record(_make_event(wall_time=1.0))
+        self._append_record(_make_event(wall_time=2.0))
+        loader = self._make_loader()
+        list(loader.Load())
+        checkpoint = loader.GetCheckpoint()
+        os.remove(self._get_filename())
+        self._append_record(_make_event(wall_time=1.0))
+        with self.assertRaisesRegex(ValueError, "changed"):
+            self._make_loader().RestoreCheckpoint(checkpoint)
+
+    def testRestoreCheckpoint_rejectsRewrittenFile(self):
+        self._append_record(_make_event(wall_time=1.0))
+        loader = self._make_loader()
+        list(loader.Load())
+        checkpoint = loader.GetCheckpoint()
+        os.remove(self._get_filename())
+        self._append_record(_make_event(wall_time=2.0))
+        (size, mtime_ns) = checkpoint["stat"]
+        self.assertEqual(os.path.getsize(self._get_filename()), size)
+        os.utime(self._get_filename(), ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        with self.assertRaisesRegex(ValueError, "changed"):
+            self._make_loader().RestoreCheckpoint(checkpoint)
+
+    def testRestoreCheckpoint_rejectsFileRewrittenWithMoreData(self):
+        for wall_time in range(3):
+            self._append_record(_make_event(wall_time=wall_time))
+        loader = self._make_loader()
+        list(loader.Load())
+        checkpoint = loader.GetCheckpoint()
+        os.remove(self._get_filename())
+        for step in range(10):
+            self._append_record(
+                _make_event(wall_time=100.0 + step, step=1000 + step)
+            )
+        with self.assertRaisesRegex(ValueError, "no record at offset"):
+            self._make_loader().RestoreCheckpoint(checkpoint)
+
+    def testRestoreCheckpoint_keepsReadMode(self):
+        self._append_record(_make_event(wall_time=1.0))
+        loader = self._make_loader()
+        list(loader.Load())
+        checkpoint = loader.GetCheckpoint()
+        restored = self._make_loader()
+        use_mmap = restored._use_mmap
+        restored.RestoreCheckpoint(checkpoint)
+        self.assertEqual(restored._use_mmap, use_mmap)
+        self.assertEqual(
+            isinstance(
+                restored._iterator, event_file_loader._MmapRecordIterator
+            ),
+            use_mmap,
+        )
+
     def testLoad_noIterationDoesNotConsumeEvents(self):
         self._append_record(_make_event(wall_time=1.0))
         loader = self._make_loader()
@@ -216,6 +313,31 @@ class EventFileLoaderTest(EventFileLoaderTestBase, tb_test.TestCase):
             event_wall_times_in_order,
         )
 
+    def testLoad_valueSinkTakesValuesOfKnownTags(self):
+        for step in range(3):
+            event = event_pb2.Event(wall_time=step + 0.5, step=step)
+            event.summary.value.add(tag="a", simple_value=step)
+            event.summary.value.add(tag="b", simple_value=-step)
+            self._append_record(event.SerializeToString())
+        taken = []
+
+        def sink(tag, wall_time, step, value, migrate):
+            if tag != "a":
+                return False
+            taken.append((wall_time, step, migrate(value)))
+            return True
+
+        events = list(self._make_loader(value_sink=sink).Load())
+        # The first value of each tag always goes through the loader.
+        self.assertEqual(
+            [[v.tag for v in e.summary.value] for e in events],
+            [["a", "b"], ["b"], ["b"]],
+        )
+        self.assertEqual([(w, s) for (w, s, _) in taken], [(1.5, 1), (2.5, 2)])
+        for _, step, value in taken:
+            self.assertEqual(value.tag, "a")
+            self.assertEqual(value.tensor.float_val, [step])
+
 
 class TimestampedEventFileLoaderTest(EventFileLoaderTestBase, tb_test.TestCase):
     @property
@@ -235,6 +357,149 @@ class TimestampedEventFileLoaderTest(EventFileLoaderTestBase, tb_test.TestCase):
         )
 
 
+class MmapRawEventFileLoaderTest(RawEventFileLoaderTest):
+    def _make_loader(self, **kwargs):
+        return super()._make_loader(use_mmap=True, **kwargs)
+
+    def testLoad_usesMmapIterator(self):
+        self._append_record(_make_event(wall_time=1.0))
+        loader = self._make_loader()
+        self.assertIsInstance(
+            loader._iterator, event_file_loader._MmapRecordIterator
+        )
+        self.assertEventWallTimes(loader.Load(), [1.0])
+
+    def testLoad_remapsOnlyWhenFileGrows(self):
+        self._append_record(_make_event(wall_time=1.0))
+        loader = self._make_loader()
+        with mock.patch.object(
+            loader._iterator, "remap", wraps=loader._iterator.remap
+        ) as mock_remap:
+            self.assertEventWallTimes(loader.Load(), [1.0])
+            self.assertEqual(mock_remap.call_count, 1)
+            self.assertEventWallTimes(loader.Load(), [])
+            self.assertEqual(mock_remap.call_count, 1)
+            self._append_record(_make_event(wall_time=2.0))
+            self.assertEventWallTimes(loader.Load(), [2.0])
+            self.assertEqual(mock_remap.call_count, 2)
+
+    def testLoad_corruptRecord(self):
+        with io.BytesIO() as mem_f:
+            record_writer.RecordWriter(mem_f).write(_make_event(wall_time=1.0))
+            record = bytearray(mem_f.getvalue())
+        record[-5] ^= 0xFF
+        with open(self._get_filename(), "wb") as f:
+            f.write(record)
+        loader = self._make_loader()
+        self.assertEventWallTimes(loader.Load(), [])
+
+    def testLoad_nonLocalPathDoesNotUseMmap(self):
+        with mock.patch.object(
+            event_file_loader, "_make_tf_record_iterator"
+        ) as mock_iterator:
+            event_file_loader.RawEventFileLoader(
+                "gs://bucket/events.out.tfevents.1", use_mmap=True
+            )
+        mock_iterator.assert_called_once()
+
+
+class MmapEventFileLoaderTest(EventFileLoaderTest):
+    def _make_loader(self, **kwargs):
+        return super()._make_loader(use_mmap=True, **kwargs)
+
+
+class CompressedEventFileLoaderTest(tb_test.TestCase):
+    def _get_filename(self, compression_type="GZIP"):
+        suffix = {"GZIP": ".gz", "ZLIB": ".zlib"}[compression_type]
+        return os.path.join(self.get_temp_dir(), FILENAME + suffix)
+
+    def _open_writer(self, f, compression_type="GZIP"):
+        return record_writer.CompressedWriter(f, compression_type)
+
+    def _append_records(self, records, compression_type="GZIP"):
+        # Each call writes a separate compressed stream, which the loader
+        # must read as if the streams were one.
+        filename = self._get_filename(compression_type)
+        with open(filename, "ab") as f:
+            w = self._open_writer(f, compression_type)
+            record_writer.RecordWriter(w).write_records(records)
+            w.close()
+
+    def _wall_times(self, load_result):
+        return [event.wall_time for event in load_result]
+
+    def testLoad_staticEventFile(self):
+        for compression_type in ("GZIP", "ZLIB"):
+            with self.subTest(compression_type=compression_type):
+                self._append_records(
+                    [_make_event(wall_time=1.0), _make_event(wall_time=2.0)],
+                    compression_type,
+                )
+                self._append_records(
+                    [_make_event(wall_time=3.0)], compression_type
+                )
+                loader = event_file_loader.EventFileLoader(
+                    self._get_filename(compression_type), use_mmap=True
+                )
+                self.assertIsInstance(
+                    loader._iterator,
+                    event_file_loader._CompressedRecordIterator,
+                )
+                self.assertEqual(
+                    self._wall_times(loader.Load()), [1.0, 2.0, 3.0]
+                )
+
+    def testLoad_dynamicEventFileWithTruncation(self):
+        record = _make_event(wall_time=2.0)
+        framed = io.BytesIO()
+        record_writer.RecordWriter(framed).write(record)
+        framed = framed.getvalue()
+        with open(self._get_filename(), "wb", buffering=0) as f:
+            w = self._open_writer(f)
+            record_writer.RecordWriter(w).write(_make_event(wall_time=1.0))
+            w.flush()
+            loader = event_file_loader.EventFileLoader(self._get_filename())
+            self.assertEqual(self._wall_times(loader.Load()), [1.0])
+            # A flushed partial record is retried once it is complete.
+            w.write(framed[:-1])
+            w.flush()
+            self.assertEmpty(list(loader.Load()))
+            w.write(framed[-1:])
+            w.flush()
+            self.assertEqual(self._wall_times(loader.Load()), [2.0])
+            w.close()
+        self.assertEmpty(list(loader.Load()))
+
+    def testCloseReleasesFileHandle(self):
+        self._append_records([_make_event(wall_time=1.0)])
+        pool = gfile.get_filesystem(self._get_filename())._handle_pool
+        pooled = len(pool)
+        loader = event_file_loader.EventFileLoader(self._get_filename())
+        self.assertEqual(self._wall_times(loader.Load()), [1.0])
+        self.assertEqual(len(pool), pooled + 1)
+        loader.Close()
+        self.assertEqual(len(pool), pooled)
+
+    def testRestoreCheckpoint_skipsRecords(self):
+        self._append_records(
+            [_make_event(wall_time=1.0), _make_event(wall_time=2.0)]
+        )
+        loader = event_file_loader.EventFileLoader(self._get_filename())
+        list(loader.Load())
+        checkpoint = loader.GetCheckpoint()
+        self._append_records([_make_event(wall_time=3.0)])
+        restored = event_file_loader.EventFileLoader(self._get_filename())
+        restored.RestoreCheckpoint(checkpoint)
+        self.assertEqual(restored.BytesRead(), loader.BytesRead())
+        self.assertEqual(self._wall_times(restored.Load()), [3.0])
+
+    def testLoad_corruptStream(self):
+        with open(self._get_filename(), "wb") as f:
+            f.write(b"\x1f\x8b\x08\x00not gzip data")
+        loader = event_file_loader.EventFileLoader(self._get_filename())
+        self.assertEmpty(list(loader.Load()))
+
+
 def _make_event(**kwargs):
     return event_pb2.Event(**kwargs).SerializeToString()
 
@@ -0,0 +1,120 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Storage for checkpoints of each run's ingested data.
+
+A checkpoint holds everything that an `EventAccumulator` has built from
+a run's event files (reservoirs, metadata, and how far into each file it
+has read), so that a restarted TensorBoard can resume from it and only
+read what was written since. Checkpoints live in a local directory,
+with one file per run.
+
+Each file starts with a fixed header, followed by a pickle of plain
+Python values (dicts, lists, tuples, strings, bytes and numbers).
+Protos are stored serialized. Checkpoints are read with an unpickler
+that refuses to load any other kind of object.
+"""
+
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+# Bump this whenever the layout of checkpoints changes incompatibly.
+_FORMAT_VERSION = 1
+_HEADER = b"TBCKPT%d\n" % _FORMAT_VERSION
+_SUFFIX = ".tbckpt"
+
+
+def CheckpointPath(directory, run_path):
+    """Returns the path of the checkpoint for the run at `run_path`."""
+    digest = hashlib.sha256(os.fsencode(run_path)).hexdigest()
+    return os.path.join(directory, digest + _SUFFIX)
+
+
+def Write(directory, run_path, state):
+    """Atomically writes a checkpoint for a run.
+
+    Args:
+      directory: The checkpoint directory, which is created if needed.
+      run_path: The path of the run's event files.
+      state: A dict of plain Python values.
+
+    Raises:
+      OSError: If the checkpoint could not be written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    data = pickle.dumps(
+        {"run_path": run_path, "state": state},
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    # Write to a temporary file and rename it into place, so that
+    # readers never see a partial checkpoint.
+    (fd, temp_path) = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER)
+            f.write(data)
+        os.replace(temp_path, CheckpointPath(directory, run_path))
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def Read(directory, run_path):
+    """Reads the checkpoint for a run.
+
+    Args:
+      directory: The checkpoint directory.
+      run_path: The path of the run's event files.
+
+    Returns:
+      The `state` passed to `Write`, or `None` if there is no usable
+      checkpoint for this run.
+    """
+    path = CheckpointPath(directory, run_path)
+    try:
+        with open(path, "rb") as f:
+            header = f.read(len(_HEADER))
+            if header != _HEADER:
+                logger.warning("Ignoring checkpoint %s: bad header", path)
+                return None
+            contents = _PlainUnpickler(f).load()
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError) as e:
+        logger.warning("Ignoring unreadable checkpoint %s: %s", path, e)
+        return None
+    if not isinstance(contents, dict) or contents.get("run_path") != run_path:
+        logger.warning("Ignoring checkpoint %s for a different run", path)
+        return None
+    return contents["state"]
+
+
+class _PlainUnpickler(pickle.Unpickler):
+    """An unpickler that only loads built-in containers and scalars."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(
+            "checkpoints may not contain %s.%s" % (module, name)
+        )
@@ -0,0 +1,92 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for ingestion_checkpoint."""
+
+
+import os
+import pickle
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import ingestion_checkpoint
+
+
+class IngestionCheckpointTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self._directory = os.path.join(self.get_temp_dir(), "checkpoints")
+
+    def testRoundTrip(self):
+        state = {"offset": 123, "items": [(1.5, 2, b"\x00\x01")], "x": None}
+        ingestion_checkpoint.Write(self._directory, "/logs/run", state)
+        self.assertEqual(
+            ingestion_checkpoint.Read(self._directory, "/logs/run"), state
+        )
+        # Only the checkpoint itself is left in the directory.
+        self.assertEqual(
+            os.listdir(self._directory),
+            [
+                os.path.basename(
+                    ingestion_checkpoint.CheckpointPath(
+                        self._directory, "/logs/run"
+                    )
+                )
+            ],
+        )
+
+    def testOverwrite(self):
+        ingestion_checkpoint.Write(self._directory, "/logs/run", {"a": 1})
+        ingestion_checkpoint.Write(self._directory, "/logs/run", {"a": 2})
+        self.assertEqual(
+            ingestion_checkpoint.Read(self._directory, "/logs/run"), {"a": 2}
+        )
+
+    def testMissing(self):
+        self.assertIsNone(ingestion_checkpoint.Read(self._directory, "/run"))
+
+    def testCorrupt(self):
+        ingestion_checkpoint.Write(self._directory, "/logs/run", {"a": 1})
+        path = ingestion_checkpoint.CheckpointPath(self._directory, "/logs/run")
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 3)
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(
+                ingestion_checkpoint.Read(self._directory, "/logs/run")
+            )
+
+    def testRejectsOtherRun(self):
+        ingestion_checkpoint.Write(self._directory, "/logs/run", {"a": 1})
+        os.rename(
+            ingestion_checkpoint.CheckpointPath(self._directory, "/logs/run"),
+            ingestion_checkpoint.CheckpointPath(self._directory, "/logs/other"),
+        )
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(
+                ingestion_checkpoint.Read(self._directory, "/logs/other")
+            )
+
+    def testRejectsArbitraryObjects(self):
+        os.makedirs(self._directory)
+        path = ingestion_checkpoint.CheckpointPath(self._directory, "/run")
+        with open(path, "wb") as f:
+            f.write(ingestion_checkpoint._HEADER)
+            pickle.dump({"run_path": "/run", "state": os.system}, f)
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(
+                ingestion_checkpoint.Read(self._directory, "/run")
+            )
+
+
+if __name__ == "__main__":
+    tb_test.main()
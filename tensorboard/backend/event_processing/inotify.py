@@ -0,0 +1,222 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""A minimal wrapper around the Linux inotify API, using `ctypes`.
+
+See inotify(7). Only what TensorBoard needs to notice new and growing
+event files is exposed: watching directories and reading the events
+reported for them.
+"""
+
+
+import collections
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+
+
+# Event masks, from <sys/inotify.h>.
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+# Flags for `inotify_init1`, which match the corresponding `open` flags.
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
+# Everything that can change which event files a directory holds or
+# what they contain.
+DEFAULT_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+
+# `struct inotify_event`, without the trailing name.
+_EVENT_HEADER = struct.Struct("iIII")
+
+_READ_SIZE = 64 * 1024
+
+Event = collections.namedtuple("Event", ("path", "mask", "name"))
+Event.__doc__ = """An inotify event.
+
+Attributes:
+  path: The watched directory that the event is about, or `None` if
+    the event is `IN_Q_OVERFLOW`, meaning that events were dropped.
+  mask: The `IN_*` bits describing the event.
+  name: The name of the entry within `path` that the event is about,
+    or the empty string if it is about `path` itself.
+"""
+
+_libc = None
+_libc_lock = threading.Lock()
+
+
+def _Libc():
+    """Returns the C library with inotify functions, or `None`."""
+    global _libc
+    with _libc_lock:
+        if _libc is None:
+            _libc = _LoadLibc() or False
+        return _libc or None
+
+
+def _LoadLibc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+        )
+        init1 = libc.inotify_init1
+        add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    init1.argtypes = [ctypes.c_int]
+    init1.restype = ctypes.c_int
+    add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    add_watch.restype = ctypes.c_int
+    return libc
+
+
+def IsSupported():
+    """Whether inotify can be used on this platform."""
+    return _Libc() is not None
+
+
+def _Error(path=None):
+    code = ctypes.get_errno()
+    return OSError(code, os.strerror(code), path)
+
+
+class Watcher:
+    """Reports changes to a set of directories.
+
+    Watches are not recursive: each directory of interest, including
+    ones created later, must be added with `AddWatch`. This class is
+    not thread-safe.
+    """
+
+    def __init__(self, mask=DEFAULT_MASK):
+        """Creates an inotify instance.
+
+        Args:
+          mask: The `IN_*` bits of the events to report.
+
+        Raises:
+          OSError: If inotify is unavailable, or the per-user limit on
+            inotify instances has been reached.
+        """
+        libc = _Libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not supported")
+        self._libc = libc
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise _Error()
+        self._mask = mask | IN_ONLYDIR
+        self._wd_to_path = {}
+
+    def AddWatch(self, path):
+        """Starts watching the directory `path`.
+
+        Raises:
+          OSError: If `path` is not a directory that can be watched, or
+            the per-user limit on watches has been reached (`ENOSPC`).
+        """
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(path), self._mask
+        )
+        if wd < 0:
+            raise _Error(path)
+        self._wd_to_path[wd] = path
+
+    def NumWatches(self):
+        return len(self._wd_to_path)
+
+    def Read(self, timeout=None):
+        """Waits for events and returns all that are pending.
+
+        Args:
+          timeout: The maximum number of seconds to wait, or `None` to
+            wait indefinitely. Pass 0 to only collect pending events.
+
+        Returns:
+          A list of `Event`s, which is empty if `timeout` expired.
+        """
+        (readable, _, _) = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return self._Parse(b"".join(chunks))
+
+    def _Parse(self, data):
+        events = []
+        offset = 0
+        while offset < len(data):
+            (wd, mask, _, length) = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                events.append(Event(None, mask, ""))
+                continue
+            if mask & IN_IGNORED:
+                # The watch was removed, e.g. because its directory was.
+                path = self._wd_to_path.pop(wd, None)
+            else:
+                path = self._wd_to_path.get(wd)
+            if path is not None:
+                events.append(Event(path, mask, os.fsdecode(name)))
+        return events
+
+    def Close(self):
+        """Releases the inotify instance and all of its watches."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._wd_to_path.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *unused_exc_info):
+        self.Close()
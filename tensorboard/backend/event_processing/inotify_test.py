@@ -0,0 +1,81 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tensorboard.backend.event_processing.inotify`."""
+
+
+import os
+import shutil
+import unittest
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import inotify
+
+
+@unittest.skipUnless(inotify.IsSupported(), "inotify not supported")
+class WatcherTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.logdir = self.get_temp_dir()
+        self.watcher = inotify.Watcher()
+        self.addCleanup(self.watcher.Close)
+
+    def _Masks(self, events, name):
+        return [e.mask for e in events if e.name == name]
+
+    def test_timeout(self):
+        self.watcher.AddWatch(self.logdir)
+        self.assertEqual([], self.watcher.Read(0))
+
+    def test_file_events(self):
+        self.watcher.AddWatch(self.logdir)
+        path = os.path.join(self.logdir, "events.out.tfevents.1")
+        with open(path, "wb") as f:
+            f.write(b"event")
+        events = self.watcher.Read(1)
+        self.assertTrue(all(e.path == self.logdir for e in events))
+        masks = self._Masks(events, "events.out.tfevents.1")
+        self.assertIn(inotify.IN_CREATE, masks)
+        self.assertIn(inotify.IN_MODIFY, masks)
+        self.assertIn(inotify.IN_CLOSE_WRITE, masks)
+
+    def test_directory_events(self):
+        subdir = os.path.join(self.logdir, "run")
+        os.mkdir(subdir)
+        self.watcher.AddWatch(self.logdir)
+        self.watcher.AddWatch(subdir)
+        self.assertEqual(2, self.watcher.NumWatches())
+        shutil.rmtree(subdir)
+        events = self.watcher.Read(1)
+        self.assertIn(
+            inotify.IN_DELETE | inotify.IN_ISDIR, self._Masks(events, "run")
+        )
+        self_masks = [e.mask for e in events if e.path == subdir]
+        self.assertIn(inotify.IN_DELETE_SELF, self_masks)
+        self.assertIn(inotify.IN_IGNORED, self_masks)
+        self.assertEqual(1, self.watcher.NumWatches())
+
+    def test_add_watch_nonexistent(self):
+        with self.assertRaises(FileNotFoundError):
+            self.watcher.AddWatch(os.path.join(self.logdir, "nonexistent"))
+
+    def test_add_watch_file(self):
+        path = os.path.join(self.logdir, "file")
+        open(path, "w").close()
+        with self.assertRaises(NotADirectoryError):
+            self.watcher.AddWatch(path)
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -15,11 +15,19 @@
 """IO helper functions."""
 
 import collections
+from concurrent import futures
 import os
+import queue
 import re
+import time
 
+try:
+    import fsspec
+except ImportError:
+    fsspec = None
 
 from tensorboard.compat import tf
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
 from tensorboard.util import io_util
 from tensorboard.util import tb_logging
 
@@ -28,6 +36,18 @@ logger = tb_logging.get_logger()
 
 _ESCAPE_GLOB_CHARACTERS_REGEX = re.compile("([*?[])")
 
+# Maximum number of directories listed concurrently by
+# `ListRecursivelyViaScanning`. Listing is dominated by file system
+# latency, so this may usefully exceed the number of cores.
+_MAX_SCANNING_THREADS = 16
+
+# Compression types of the records of event files, by file name suffix,
+# as `EventFileWriter` names the files that it compresses.
+_EVENT_FILE_COMPRESSION_TYPES = {
+    suffix: ctype
+    for ctype, suffix in pywrap_tensorflow.COMPRESSION_SUFFIXES.items()
+}
+
 
 def PathSeparator(path):
     return "/" if io_util.IsCloudPath(path) else os.sep
@@ -69,6 +89,24 @@ def IsSummaryEventsFile(path):
     return IsTensorFlowEventsFile(path) and not path.endswith(".profile-empty")
 
 
+def EventFileCompressionType(path):
+    """Returns the compression type of an event file, from its name.
+
+    Event files whose names end in `.gz` or `.zlib` hold a GZIP or ZLIB
+    stream of records. (Their names still contain "tfevents", so they
+    pass `IsSummaryEventsFile`.)
+
+    Args:
+      path: A path to an event file.
+
+    Returns:
+      "GZIP" or "ZLIB" for compressed files, as for `tf.io.TFRecordOptions`,
+      or "" for uncompressed files.
+    """
+    (_, extension) = os.path.splitext(tf.compat.as_str_any(path))
+    return _EVENT_FILE_COMPRESSION_TYPES.get(extension, "")
+
+
 def ListDirectoryAbsolute(directory):
     """Yields all files in the given directory.
 
@@ -176,6 +214,97 @@ def ListRecursivelyViaWalking(top):
         )
 
 
+def _ScanLocalDirectory(directory):
+    """Lists a local directory; returns (subdir_paths, file_paths).
+
+    `os.scandir` reads entry types from the directory itself on most
+    file systems, so this avoids an `isdir` call per entry.
+    """
+    subdirs = []
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Like `tf.io.gfile.walk`, follows symlinks.
+            (subdirs if entry.is_dir() else files).append(entry.path)
+    return (subdirs, files)
+
+
+def _ScanFSSpecDirectory(directory):
+    """Lists an fsspec directory; returns (subdir_paths, file_paths)."""
+    (fs, path) = fsspec.core.url_to_fs(directory)
+    prefix = directory if directory.endswith("/") else directory + "/"
+    subdirs = []
+    files = []
+    for info in fs.ls(path, detail=True):
+        child = prefix + info["name"].rstrip("/").rpartition("/")[2]
+        (subdirs if info["type"] == "directory" else files).append(child)
+    return (subdirs, files)
+
+
+def _IsFSSpecPath(path):
+    """Whether `path` is a URL for a protocol known to fsspec."""
+    if fsspec is None or "://" not in path:
+        return False
+    protocol = path.partition("::")[0].partition("://")[0]
+    try:
+        fsspec.get_filesystem_class(protocol)
+    except (ImportError, ValueError):
+        return False
+    return True
+
+
+def ListRecursivelyViaScanning(top, max_threads=_MAX_SCANNING_THREADS):
+    """Lists a directory tree on several threads, streaming the results.
+
+    Like `ListRecursivelyViaWalking`, yields a (dir_path, file_paths)
+    tuple for each of `top` and its subdirectories, but lists each
+    directory with a single call that also reports which entries are
+    directories (`os.scandir` for local paths, `ls` with details for
+    fsspec paths), and lists up to `max_threads` directories at once.
+    Tuples are yielded as soon as their directory has been listed, in
+    no particular order. Directories that cannot be listed, including
+    `top` if it does not exist, are skipped.
+
+    Args:
+      top: A local path or an fsspec URL to a directory.
+      max_threads: The maximum number of directories to list at once.
+
+    Yields:
+      A (dir_path, file_paths) tuple for each directory/subdirectory.
+    """
+    scan = _ScanFSSpecDirectory if _IsFSSpecPath(top) else _ScanLocalDirectory
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max_threads, thread_name_prefix="LogdirScanner"
+    )
+    # Workers report each listing on this queue, which avoids the cost
+    # of waiting on many futures at once.
+    results = queue.SimpleQueue()
+
+    def list_directory(dir_path):
+        try:
+            results.put((dir_path, scan(dir_path), None))
+        except OSError as e:
+            results.put((dir_path, None, e))
+
+    executor.submit(list_directory, top)
+    num_pending = 1
+    try:
+        while num_pending:
+            (dir_path, listing, error) = results.get()
+            num_pending -= 1
+            if error is not None:
+                logger.debug("Skipping directory %s: %s", dir_path, error)
+                continue
+            (subdirs, files) = listing
+            for subdir in subdirs:
+                executor.submit(list_directory, subdir)
+            num_pending += len(subdirs)
+            yield (dir_path, files)
+    finally:
+        # Don't list the rest of the tree if the caller stops early.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def GetLogdirSubdirectories(path):
     """Obtains all subdirectories with events files.
 
@@ -209,6 +338,13 @@ def GetLogdirSubdirectories(path):
             "GetLogdirSubdirectories: Starting to list directories via glob-ing."
         )
         traversal_method = ListRecursivelyViaGlobbing
+    elif "://" not in path or _IsFSSpecPath(path):
+        # Local and fsspec file systems can report entry types while
+        # listing, which saves an `isdir` call per entry.
+        logger.info(
+            "GetLogdirSubdirectories: Starting to list directories via scanning."
+        )
+        traversal_method = ListRecursivelyViaScanning
     else:
         # For other file systems, the glob-ing based method might be slower because
         # each call to glob could involve performing a recursive walk.
@@ -222,3 +358,111 @@ def GetLogdirSubdirectories(path):
         for (subdir, files) in traversal_method(path)
         if any(IsTensorFlowEventsFile(f) for f in files)
     )
+
+
+# A directory whose mtime is this close to the time at which it was
+# listed may have changed again within the same mtime tick (coarse on
+# some file systems, notably NFS), so its listing is not trusted.
+_MTIME_GRANULARITY_NS = 2 * 10**9
+
+_DirectoryListing = collections.namedtuple(
+    "_DirectoryListing", ("mtime_ns", "listed_at_ns", "subdirs", "has_events")
+)
+
+
+class IncrementalLogdirLister:
+    """Finds the subdirectories with events files, reusing past listings.
+
+    Listing a directory only tells us about its direct entries, and a
+    directory's mtime changes exactly when an entry is created, removed
+    or renamed within it. So each call still visits every directory in
+    the tree, but only with a `stat`: directories whose mtime matches
+    the cached one reuse their cached subdirectories and events-file
+    flag, and only the changed ones are listed again. On large, mostly
+    idle logdirs this replaces a `listdir` plus an `isdir` per entry
+    with one `stat` per directory.
+
+    Paths that are not on the local file system (including cloud paths)
+    are listed from scratch with `GetLogdirSubdirectories` on each call.
+    This class is not thread-safe.
+    """
+
+    def __init__(self, path):
+        """Constructs an `IncrementalLogdirLister`.
+
+        Args:
+          path: The path to a directory under which to find subdirectories.
+        """
+        self._path = path
+        self._listings = {}
+
+    def Subdirectories(self):
+        """Obtains all subdirectories with events files.
+
+        Returns:
+          A tuple of absolute paths of all subdirectories each with at
+          least 1 events file directly within the subdirectory, in
+          unspecified order.
+
+        Raises:
+          ValueError: If the path exists and is not a directory.
+        """
+        if "://" in self._path:
+            return tuple(GetLogdirSubdirectories(self._path))
+        if not os.path.exists(self._path):
+            self._listings = {}
+            return ()
+        if not os.path.isdir(self._path):
+            raise ValueError(
+                "IncrementalLogdirLister: path exists and is not a "
+                "directory, %s" % self._path
+            )
+        listings = {}
+        result = []
+        pending = [self._path]
+        while pending:
+            directory = pending.pop()
+            listing = self._List(directory)
+            if listing is None:
+                # Removed since its parent was listed.
+                continue
+            listings[directory] = listing
+            if listing.has_events:
+                result.append(directory)
+            pending.extend(
+                os.path.join(directory, name) for name in listing.subdirs
+            )
+        # Dropping directories that were not visited also forgets removed
+        # subtrees.
+        self._listings = listings
+        return tuple(result)
+
+    def _List(self, directory):
+        """Returns a `_DirectoryListing`, or `None` if it is gone."""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._listings.get(directory)
+        if (
+            cached is not None
+            and cached.mtime_ns == mtime_ns
+            and mtime_ns < cached.listed_at_ns - _MTIME_GRANULARITY_NS
+        ):
+            return cached
+        listed_at_ns = time.time_ns()
+        subdirs = []
+        has_events = False
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Like `tf.io.gfile.walk`, follows symlinks.
+                    if entry.is_dir():
+                        subdirs.append(entry.name)
+                    elif IsTensorFlowEventsFile(entry.name):
+                        has_events = True
+        except OSError:
+            return None
+        return _DirectoryListing(
+            mtime_ns, listed_at_ns, tuple(subdirs), has_events
+        )
@@ -15,10 +15,18 @@
 
 
 import os
+import shutil
 import tempfile
+import time
+import unittest
 
 import tensorflow as tf
 
+try:
+    import fsspec
+except ImportError:
+    fsspec = None
+
 from tensorboard.backend.event_processing import io_wrapper
 
 
@@ -53,6 +61,27 @@ class IoWrapperTest(tf.test.TestCase):
             )
         )
 
+    def testIsSummaryEventsFileTrueForCompressedFiles(self):
+        for suffix in (".gz", ".zlib"):
+            self.assertTrue(
+                io_wrapper.IsSummaryEventsFile(
+                    "/logdir/events.out.tfevents.1473720042.com" + suffix
+                )
+            )
+
+    def testEventFileCompressionType(self):
+        path = "/logdir/events.out.tfevents.1473720042.com"
+        self.assertEqual(io_wrapper.EventFileCompressionType(path), "")
+        self.assertEqual(
+            io_wrapper.EventFileCompressionType(path + ".gz"), "GZIP"
+        )
+        self.assertEqual(
+            io_wrapper.EventFileCompressionType(path + ".zlib"), "ZLIB"
+        )
+        self.assertEqual(
+            io_wrapper.EventFileCompressionType(path + ".profile-empty"), ""
+        )
+
     def testIsTensorFlowEventsFileFalse(self):
         self.assertFalse(
             io_wrapper.IsTensorFlowEventsFile("/logdir/model.ckpt")
@@ -302,6 +331,53 @@ class IoWrapperTest(tf.test.TestCase):
             expected, io_wrapper.ListRecursivelyViaWalking(temp_dir)
         )
 
+    def testListRecursivelyViaScanning(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        self._CompareFilesPerSubdirectory(
+            io_wrapper.ListRecursivelyViaWalking(temp_dir),
+            io_wrapper.ListRecursivelyViaScanning(temp_dir, max_threads=3),
+        )
+
+    def testListRecursivelyViaScanningNonexistentDirectory(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        nonexistent = os.path.join(temp_dir, "nonexistent")
+        self.assertEqual(
+            [], list(io_wrapper.ListRecursivelyViaScanning(nonexistent))
+        )
+
+    def testListRecursivelyViaScanningStopsEarly(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        pairs = io_wrapper.ListRecursivelyViaScanning(temp_dir)
+        (dir_path, _) = next(pairs)
+        self.assertEqual(temp_dir, dir_path)
+        pairs.close()
+
+    @unittest.skipIf(fsspec is None, "fsspec not installed")
+    def testGetLogdirSubdirectoriesFSSpec(self):
+        fs = fsspec.filesystem("memory")
+        top = "memory://io_wrapper_test_%d" % id(self)
+        for file_name in (
+            "a.tfevents.1",
+            "bar/b.tfevents.1",
+            "bar/red_herring.txt",
+            "bar/quux/some_flume_output.txt",
+            "waldo/fred/i.tfevents.1",
+        ):
+            fs.pipe(top + "/" + file_name, b"")
+        self.addCleanup(fs.rm, top, recursive=True)
+        self.assertCountEqual(
+            [top, top + "/bar", top + "/waldo/fred"],
+            [
+                subdir
+                for (subdir, files) in io_wrapper.ListRecursivelyViaScanning(
+                    top
+                )
+                if any(io_wrapper.IsTensorFlowEventsFile(f) for f in files)
+            ],
+        )
+
     def testGetLogdirSubdirectories(self):
         temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
         self._CreateDeepDirectoryStructure(temp_dir)
@@ -325,6 +401,85 @@ class IoWrapperTest(tf.test.TestCase):
             io_wrapper.GetLogdirSubdirectories(temp_dir),
         )
 
+    def testIncrementalLogdirListerMatchesGetLogdirSubdirectories(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        lister = io_wrapper.IncrementalLogdirLister(temp_dir)
+        self.assertCountEqual(
+            io_wrapper.GetLogdirSubdirectories(temp_dir),
+            lister.Subdirectories(),
+        )
+
+    def testIncrementalLogdirListerNonexistentPath(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        lister = io_wrapper.IncrementalLogdirLister(
+            os.path.join(temp_dir, "nonexistent")
+        )
+        self.assertEqual((), lister.Subdirectories())
+
+    def testIncrementalLogdirListerFilePath(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        file_path = os.path.join(temp_dir, "a.tfevents.1")
+        open(file_path, "w").close()
+        lister = io_wrapper.IncrementalLogdirLister(file_path)
+        with self.assertRaises(ValueError):
+            lister.Subdirectories()
+
+    def testIncrementalLogdirListerOnlyRelistsChangedDirectories(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        self._BackdateDirectories(temp_dir)
+        lister = io_wrapper.IncrementalLogdirLister(temp_dir)
+        lister.Subdirectories()
+
+        listed = []
+        real_scandir = os.scandir
+
+        def fake_scandir(path):
+            listed.append(path)
+            return real_scandir(path)
+
+        expected = list(io_wrapper.GetLogdirSubdirectories(temp_dir))
+        self.stubs.Set(os, "scandir", fake_scandir)
+        self.assertCountEqual(expected, lister.Subdirectories())
+        self.assertEqual([], listed)
+
+        # Changes deep in the tree are found without re-listing the
+        # ancestors of the changed directory.
+        os.makedirs(os.path.join(temp_dir, "waldo", "fred", "plugh"))
+        open(os.path.join(temp_dir, "bar/quux/j.tfevents.1"), "w").close()
+        actual = lister.Subdirectories()
+        self.stubs.UnsetAll()
+        self.assertCountEqual(
+            io_wrapper.GetLogdirSubdirectories(temp_dir), actual
+        )
+        self.assertIn(os.path.join(temp_dir, "bar", "quux"), listed)
+        self.assertIn(os.path.join(temp_dir, "waldo", "fred"), listed)
+        self.assertNotIn(temp_dir, listed)
+        self.assertNotIn(os.path.join(temp_dir, "bar"), listed)
+
+    def testIncrementalLogdirListerForgetsRemovedDirectories(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        self._BackdateDirectories(temp_dir)
+        lister = io_wrapper.IncrementalLogdirLister(temp_dir)
+        lister.Subdirectories()
+        shutil.rmtree(os.path.join(temp_dir, "quuz", "garply"))
+        self.assertCountEqual(
+            io_wrapper.GetLogdirSubdirectories(temp_dir),
+            lister.Subdirectories(),
+        )
+
+    def _BackdateDirectories(self, top_directory):
+        """Sets the mtime of each directory to an hour ago.
+
+        Listings of directories modified within the mtime granularity are
+        not cached, so tests that check caching need older directories.
+        """
+        an_hour_ago = time.time() - 3600
+        for dir_path, _, _ in os.walk(top_directory):
+            os.utime(dir_path, (an_hour_ago, an_hour_ago))
+
     def _CreateDeepDirectoryStructure(self, top_directory):
         """Creates a reasonable deep structure of subdirectories with files.
 
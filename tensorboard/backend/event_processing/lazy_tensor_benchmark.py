@@ -0,0 +1,212 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for storing tensors serialized in `EventAccumulator`.
+
+Writes a run of image summaries, several images per event, then loads
+it in a fresh process for each mode: "parsed" keeps each retained
+`TensorProto` as parsed from its event (the previous behavior), and
+"serialized" keeps its encoding and decodes it on read (the current
+one). Reports ingest throughput, the peak RSS that loading added to
+the process, and the time to decode every retained tensor once.
+
+Sample results on a cloud VM with a single core (Python 3.11, upb
+protobuf, 2000 events in which tag `i` of 4 has a 32 KB image every
+`i + 1` steps, 100 samples kept per tag):
+
+          MODE  INGEST_MB_PER_SEC  PEAK_RSS_DELTA_MB  READ_ALL_MS
+        parsed           464.3751            48.5000       2.6116
+    serialized           452.3460            31.0000       3.0793
+
+A parsed tensor keeps its whole event alive, including the images of
+tags that did not sample that event, so the parsed mode retains about
+60% more memory. Copying each retained tensor out costs a few percent
+of ingest throughput, within the noise here, and decoding on read adds
+about 1 microsecond per tensor.
+"""
+
+
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+
+from absl import app
+from absl import flags
+from absl import logging
+
+from tensorboard.backend.event_processing import (
+    plugin_event_accumulator as event_accumulator,
+)
+from tensorboard.backend.event_processing import reservoir
+from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.compat.proto import tensor_pb2
+from tensorboard.compat.proto import types_pb2
+from tensorboard.plugins.image import metadata as image_metadata
+from tensorboard.summary.writer import record_writer
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("events", 2000, "Number of events in the run.")
+flags.DEFINE_integer("tags", 4, "Number of image tags in each event.")
+flags.DEFINE_integer("image_kb", 32, "Size of each encoded image, in KB.")
+flags.DEFINE_integer("samples", 100, "Number of samples kept per tag.")
+
+
+class _ParsedTensorAccumulator(event_accumulator.EventAccumulator):
+    """Keeps parsed `TensorProto`s, as `EventAccumulator` used to."""
+
+    def _ProcessTensor(self, tag, wall_time, step, tensor):
+        with self._tensors_by_tag_lock:
+            if tag not in self.tensors_by_tag:
+                self.tensors_by_tag[tag] = reservoir.Reservoir(
+                    self._GetTensorReservoirSize(tag)
+                )
+        self.tensors_by_tag[tag].AddItem(
+            event_accumulator._TENSOR_RESERVOIR_KEY,
+            event_accumulator.TensorEvent(
+                wall_time=wall_time, step=step, tensor_proto=tensor
+            ),
+        )
+
+
+def write_run(run_dir, num_events, num_tags, image_bytes):
+    """Writes a run of image summaries; returns its size in bytes."""
+    filename = os.path.join(run_dir, "events.out.tfevents.0.benchmark")
+    metadata = image_metadata.create_summary_metadata(
+        display_name="", description=""
+    )
+    with open(filename, "wb") as f:
+        writer = record_writer.RecordWriter(f)
+        writer.write(
+            event_pb2.Event(
+                wall_time=1.6e9, file_version="brain.Event:2"
+            ).SerializeToString()
+        )
+        for step in range(num_events):
+            values = []
+            for i in range(num_tags):
+                # Log tag `i` every `i + 1` steps, as when summaries are
+                # written at different frequencies, so that each tag
+                # samples different events.
+                if step % (i + 1):
+                    continue
+                tensor = tensor_pb2.TensorProto(
+                    dtype=types_pb2.DT_STRING,
+                    string_val=[b"32", b"32", os.urandom(image_bytes)],
+                )
+                tensor.tensor_shape.dim.add(size=3)
+                values.append(
+                    summary_pb2.Summary.Value(
+                        tag="image%d" % i, metadata=metadata, tensor=tensor
+                    )
+                )
+            event = event_pb2.Event(
+                step=step,
+                wall_time=1.6e9 + step,
+                summary=summary_pb2.Summary(value=values),
+            )
+            writer.write(event.SerializeToString())
+    return os.path.getsize(filename)
+
+
+def _load(run_dir, parsed, samples):
+    """Loads `run_dir` in this process; returns its measurements."""
+    cls = (
+        _ParsedTensorAccumulator
+        if parsed
+        else event_accumulator.EventAccumulator
+    )
+    acc = cls(
+        run_dir, tensor_size_guidance={image_metadata.PLUGIN_NAME: samples}
+    )
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start_time = time.perf_counter()
+    acc.Reload()
+    ingest_secs = time.perf_counter() - start_time
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start_time = time.perf_counter()
+    for tag in acc.Tags()[event_accumulator.TENSORS]:
+        for event in acc.Tensors(tag):
+            event.tensor_proto.string_val[2]
+    read_secs = time.perf_counter() - start_time
+    # `ru_maxrss` is in kilobytes on Linux.
+    return (ingest_secs, (rss_after - rss_before) / 1024, read_secs)
+
+
+def bench(run_dir, parsed, samples):
+    """Loads `run_dir` in a fresh process, so that RSS peaks are its own."""
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        return pool.apply(_load, (run_dir, parsed, samples))
+
+
+def _format_line(headers, fields):
+    """Format a line of a table.
+
+    Arguments:
+      headers: A list of strings that are used as the table headers.
+      fields: A list of the same length as `headers` where `fields[i]` is
+        the entry for `headers[i]` in this row. Elements can be of
+        arbitrary types. Pass `headers` to print the header row.
+
+    Returns:
+      A pretty string.
+    """
+    assert len(fields) == len(headers), (fields, headers)
+    fields = [
+        "%2.4f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+
+    headers = (
+        "MODE",
+        "INGEST_MB_PER_SEC",
+        "PEAK_RSS_DELTA_MB",
+        "READ_ALL_MS",
+    )
+    with tempfile.TemporaryDirectory() as run_dir:
+        size = write_run(
+            run_dir, FLAGS.events, FLAGS.tags, FLAGS.image_kb * 1024
+        )
+        logger.info(_format_line(headers, headers))
+        for mode in ("parsed", "serialized"):
+            (ingest_secs, rss_mb, read_secs) = bench(
+                run_dir, mode == "parsed", FLAGS.samples
+            )
+            fields = (
+                mode,
+                size / 1e6 / ingest_secs,
+                rss_mb,
+                read_secs * 1000,
+            )
+            logger.info(_format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,201 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for finding the runs in a deep logdir.
+
+Builds a synthetic tree in which every leaf directory is a run with an
+events file and a few other files. Times full traversals with
+`io_wrapper.ListRecursivelyViaWalking` and
+`io_wrapper.ListRecursivelyViaScanning`, then an
+`io_wrapper.IncrementalLogdirLister` on its first call, on a call with
+nothing changed (as for most reload cycles), and on a call after a new
+run was added deep in the tree.
+
+Sample results on a cloud VM with a single core (Python 3.11, local
+ext4 disk, warm page cache, mean of 5 calls):
+
+    DEPTH  FANOUT  DIRS  RUNS  WALK_MS  SCAN_MS  FIRST_MS  UNCHANGED_MS  ADDED_MS
+        3      10  1110  1000  77.4036  78.3836   27.3647        8.3367    8.4303
+        4      10  11110  10000  894.5541  667.1997  269.0679       99.0933   90.3237
+        6       5  19530  15625  1588.9648  1033.0290  582.4199      130.4087  143.2480
+
+Calls after the first cost one `stat` per directory. On one core the
+scanning threads mostly contend for the interpreter; they pay off when
+listings wait on the network. With `--scan_latency_ms=1`, SCAN_MS for
+the 11110-directory tree is 1208 ms, where listing those directories
+one at a time would take at least 11 s in round trips alone.
+"""
+
+
+import os
+import shutil
+import tempfile
+import time
+
+from absl import app
+from absl import flags
+from absl import logging
+
+from tensorboard.backend.event_processing import io_wrapper
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("repeats", 5, "Number of timed calls per column.")
+flags.DEFINE_float(
+    "scan_latency_ms",
+    0.0,
+    "Delay added to each directory listing in the SCAN_MS column, to "
+    "simulate a network file system.",
+)
+
+
+def make_tree(top, depth, fanout):
+    """Creates a tree of `fanout ** depth` runs; returns the dir count."""
+    an_hour_ago = time.time() - 3600
+    num_dirs = 0
+    pending = [(top, 0)]
+    while pending:
+        (directory, level) = pending.pop()
+        if level == depth:
+            for name in ("events.out.tfevents.1", "ckpt.index", "ckpt.data"):
+                open(os.path.join(directory, name), "w").close()
+        else:
+            for i in range(fanout):
+                child = os.path.join(directory, "d%d" % i)
+                os.mkdir(child)
+                num_dirs += 1
+                pending.append((child, level + 1))
+    # Listings of recently modified directories are not cached.
+    for dir_path, _, _ in os.walk(top):
+        os.utime(dir_path, (an_hour_ago, an_hour_ago))
+    return num_dirs
+
+
+def add_scan_latency(latency_ms):
+    """Makes each `ListRecursivelyViaScanning` listing sleep first."""
+    scan_local_directory = io_wrapper._ScanLocalDirectory
+
+    def slow_scan_local_directory(directory):
+        time.sleep(latency_ms / 1000)
+        return scan_local_directory(directory)
+
+    io_wrapper._ScanLocalDirectory = slow_scan_local_directory
+
+
+def bench(fn, repeats, before_each=None):
+    """Returns the mean milliseconds taken by a call to `fn`."""
+    total = 0.0
+    for _ in range(repeats):
+        if before_each is not None:
+            before_each()
+        start_time = time.perf_counter()
+        fn()
+        total += time.perf_counter() - start_time
+    return total / repeats * 1000
+
+
+def _format_line(headers, fields):
+    """Format a line of a table.
+
+    Arguments:
+      headers: A list of strings that are used as the table headers.
+      fields: A list of the same length as `headers` where `fields[i]` is
+        the entry for `headers[i]` in this row. Elements can be of
+        arbitrary types. Pass `headers` to print the header row.
+
+    Returns:
+      A pretty string.
+    """
+    assert len(fields) == len(headers), (fields, headers)
+    fields = [
+        "%2.4f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+    if FLAGS.scan_latency_ms:
+        add_scan_latency(FLAGS.scan_latency_ms)
+
+    headers = (
+        "DEPTH",
+        "FANOUT",
+        "DIRS",
+        "RUNS",
+        "WALK_MS",
+        "SCAN_MS",
+        "FIRST_MS",
+        "UNCHANGED_MS",
+        "ADDED_MS",
+    )
+    logger.info(_format_line(headers, headers))
+    for depth, fanout in [(3, 10), (4, 10), (6, 5)]:
+        top = tempfile.mkdtemp()
+        try:
+            num_dirs = make_tree(top, depth, fanout)
+            runs = len(list(io_wrapper.GetLogdirSubdirectories(top)))
+            walk_ms = bench(
+                lambda: list(io_wrapper.ListRecursivelyViaWalking(top)),
+                FLAGS.repeats,
+            )
+            scan_ms = bench(
+                lambda: list(io_wrapper.ListRecursivelyViaScanning(top)),
+                FLAGS.repeats,
+            )
+            lister = None
+
+            def reset():
+                nonlocal lister
+                lister = io_wrapper.IncrementalLogdirLister(top)
+
+            first_ms = bench(lambda: lister.Subdirectories(), 1, reset)
+            unchanged_ms = bench(lambda: lister.Subdirectories(), FLAGS.repeats)
+            added = iter(range(FLAGS.repeats))
+
+            def add_run():
+                leaf = os.path.join(top, *(["d0"] * (depth - 1)))
+                run = os.path.join(leaf, "new%d" % next(added))
+                os.mkdir(run)
+                open(os.path.join(run, "events.out.tfevents.1"), "w").close()
+
+            added_ms = bench(
+                lambda: lister.Subdirectories(), FLAGS.repeats, add_run
+            )
+            fields = (
+                depth,
+                fanout,
+                num_dirs,
+                runs,
+                walk_ms,
+                scan_ms,
+                first_ms,
+                unchanged_ms,
+                added_ms,
+            )
+            logger.info(_format_line(headers, fields))
+        finally:
+            shutil.rmtree(top)
+
+
+if __name__ == "__main__":
+    app.run(main)
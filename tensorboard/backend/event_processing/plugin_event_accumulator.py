@@ -17,23 +17,33 @@
 import collections
 import dataclasses
 import threading
+import time
 
 from typing import Optional
 
+import numpy as np
+
 from tensorboard.backend.event_processing import directory_loader
 from tensorboard.backend.event_processing import directory_watcher
 from tensorboard.backend.event_processing import event_file_loader
 from tensorboard.backend.event_processing import event_util
+from tensorboard.backend.event_processing import ingestion_checkpoint
 from tensorboard.backend.event_processing import io_wrapper
 from tensorboard.backend.event_processing import plugin_asset_util
 from tensorboard.backend.event_processing import reservoir
 from tensorboard.backend.event_processing import tag_types
+from tensorboard.compat import tf
 from tensorboard.compat.proto import config_pb2
 from tensorboard.compat.proto import event_pb2
 from tensorboard.compat.proto import graph_pb2
 from tensorboard.compat.proto import meta_graph_pb2
+from tensorboard.compat.proto import summary_pb2
 from tensorboard.compat.proto import tensor_pb2
+from tensorboard.compat.proto import tensor_shape_pb2
+from tensorboard.compat.proto import types_pb2
+from tensorboard.compat.tensorflow_stub import dtypes
 from tensorboard.util import tb_logging
+from tensorboard.util import tensor_util
 
 
 logger = tb_logging.get_logger()
@@ -55,6 +65,44 @@ STORE_EVERYTHING_SIZE_GUIDANCE = {
 
 _TENSOR_RESERVOIR_KEY = "."  # arbitrary
 
+# `Summary.Value` fields that hold a tensor once migrated.
+_DEFERRABLE_VALUE_TYPES = frozenset(
+    ("tensor", "simple_value", "histo", "image", "audio")
+)
+
+# Minimum time between checkpoints of a run that is still growing.
+_CHECKPOINT_INTERVAL_SECS = 60
+
+# Approximate memory used by each item in a `ScalarReservoir`, and by
+# each `_SerializedTensorEvent` beyond the length of its tensor.
+_SCALAR_ITEM_BYTES = 24
+_TENSOR_EVENT_OVERHEAD_BYTES = 200
+
+# Field number of `TensorProto.tensor_shape`.
+_TENSOR_SHAPE_FIELD_NUMBER = tensor_pb2.TensorProto.DESCRIPTOR.fields_by_name[
+    "tensor_shape"
+].number
+
+# Integers up to this magnitude are exactly representable as float64s.
+_MAX_EXACT_FLOAT64_INT = 2**53
+
+# Dtypes of rank-0 tensors that may be stored in a `ScalarReservoir`.
+# It stores values as float64, so these are the dtypes whose values a
+# float64 holds exactly; 64-bit integers are stored as tensors instead.
+_SCALAR_RESERVOIR_DTYPES = frozenset(
+    [
+        types_pb2.DT_HALF,
+        types_pb2.DT_FLOAT,
+        types_pb2.DT_DOUBLE,
+        types_pb2.DT_INT8,
+        types_pb2.DT_INT16,
+        types_pb2.DT_INT32,
+        types_pb2.DT_UINT8,
+        types_pb2.DT_UINT16,
+        types_pb2.DT_UINT32,
+    ]
+)
+
 
 @dataclasses.dataclass(frozen=True)
 class TensorEvent:
@@ -70,6 +118,50 @@ class TensorEvent:
     step: int
     tensor_proto: tensor_pb2.TensorProto
 
+    @property
+    def num_elements(self):
+        """The number of elements of the tensor, from its shape."""
+        return _NumElements(self.tensor_proto.tensor_shape)
+
+
+class _SerializedTensorEvent(TensorEvent):
+    """A `TensorEvent` that keeps its tensor serialized until it is read.
+
+    A parsed `TensorProto` costs several times the size of its encoding,
+    and a submessage of a parsed `Event` keeps the whole event alive.
+    Reservoirs therefore store these instead: `tensor_proto` parses a
+    new `TensorProto` on each access, while `num_elements` only parses
+    the tensor's shape, once.
+
+    Attributes:
+      serialized_tensor: The `TensorProto` as serialized bytes.
+    """
+
+    def __init__(self, wall_time, step, serialized_tensor):
+        object.__setattr__(self, "wall_time", wall_time)
+        object.__setattr__(self, "step", step)
+        object.__setattr__(self, "serialized_tensor", serialized_tensor)
+        object.__setattr__(self, "_num_elements", None)
+
+    @property
+    def tensor_proto(self):
+        return tensor_pb2.TensorProto.FromString(self.serialized_tensor)
+
+    @property
+    def num_elements(self):
+        if self._num_elements is None:
+            shape = _ParseTensorShape(self.serialized_tensor)
+            object.__setattr__(self, "_num_elements", _NumElements(shape))
+        return self._num_elements
+
+    def __repr__(self):
+        return "%s(wall_time=%r, step=%r, serialized_tensor=<%d bytes>)" % (
+            type(self).__name__,
+            self.wall_time,
+            self.step,
+            len(self.serialized_tensor),
+        )
+
 
 class EventAccumulator:
     """An `EventAccumulator` takes an event generator, and accumulates the
@@ -102,8 +194,11 @@ class EventAccumulator:
       path: A file path to a directory containing tf events files, or a single
           tf events file. The accumulator will load events from this path.
       tensors_by_tag: A dictionary mapping each tag name to a
-        reservoir.Reservoir of tensor summaries. Each such reservoir will
-        only use a single key, given by `_TENSOR_RESERVOIR_KEY`.
+        reservoir.Reservoir of tensor summaries, whose tensors are kept
+        serialized until read. Each such reservoir will only use a single
+        key, given by `_TENSOR_RESERVOIR_KEY`. Tags with
+        `DATA_CLASS_SCALAR` metadata and numeric rank-0 tensors use a
+        reservoir.ScalarReservoir of `reservoir.ScalarItem`s instead.
 
     @@Tensors
     """
@@ -116,6 +211,8 @@ class EventAccumulator:
         purge_orphaned_data=True,
         event_file_active_filter=None,
         detect_file_replacement=None,
+        mmap_event_files=None,
+        checkpoint_dir=None,
     ):
         """Construct the `EventAccumulator`.
 
@@ -142,6 +239,13 @@ class EventAccumulator:
           detect_file_replacement: Optional boolean; if True, event file loading
             will try to detect when a file has been replaced with a new version
             that contains additional data, by monitoring the file size.
+          mmap_event_files: Optional boolean; if True, event files on the local
+            filesystem are read through a persistent memory mapping.
+          checkpoint_dir: Optional path of a local directory in which to keep
+            a checkpoint of everything loaded from `path`. If passed, the
+            first `Reload` resumes from the checkpoint, if there is one that
+            still matches the event files, and later reloads that read new
+            data update the checkpoint at most once a minute.
         """
         size_guidance = dict(size_guidance or DEFAULT_SIZE_GUIDANCE)
         sizes = {}
@@ -162,6 +266,11 @@ class EventAccumulator:
         self.summary_metadata = {}
         self.tensors_by_tag = {}
         self._tensors_by_tag_lock = threading.Lock()
+        # For each tag in a `ScalarReservoir`, the dtype of its tensors.
+        self._scalar_dtypes = {}
+        # For each tag, a tuple `(version, num_items, num_bytes)` caching
+        # the size of its reservoir as of that reservoir version.
+        self._memory_usage = {}
 
         # Keep a mapping from plugin name to a dict mapping from tag to plugin data
         # content obtained from the SummaryMetadata (metadata field of Value) for
@@ -170,16 +279,32 @@ class EventAccumulator:
         # first event encountered per tag, so we must store that first instance of
         # content for each tag.
         self._plugin_to_tag_to_content = collections.defaultdict(dict)
-        # Locks the dict `_plugin_to_tag_to_content` as well as the
-        # dicts `_plugin_to_tag_to_content[p]` for each `p`.
+        # Secondary index of `summary_metadata`, mapping each pair
+        # `(plugin_name, data_class)` to a dict from tag to metadata, so
+        # that listing the time series for one plugin does not need to
+        # scan every tag.
+        self._metadata_index = collections.defaultdict(dict)
+        # Locks the dicts `_plugin_to_tag_to_content` and
+        # `_metadata_index` as well as the dicts that they contain.
         self._plugin_tag_lock = threading.Lock()
 
         self.path = path
-        self._generator = _GeneratorFromPath(
-            path, event_file_active_filter, detect_file_replacement
+        self._generator_args = (
+            path,
+            event_file_active_filter,
+            detect_file_replacement,
+            mmap_event_files,
+            self._ProcessValue,
         )
+        self._generator = _GeneratorFromPath(*self._generator_args)
         self._generator_mutex = threading.Lock()
 
+        self._checkpoint_dir = checkpoint_dir
+        self._checkpoint_restore_attempted = False
+        # `BytesRead()` and the time as of the last checkpoint written.
+        self._checkpoint_bytes_read = None
+        self._checkpoint_time = None
+
         self.purge_orphaned_data = purge_orphaned_data
         self._seen_session_start = False
 
@@ -199,10 +324,178 @@ class EventAccumulator:
           The `EventAccumulator`.
         """
         with self._generator_mutex:
+            if (
+                self._checkpoint_dir is not None
+                and not self._checkpoint_restore_attempted
+            ):
+                self._checkpoint_restore_attempted = True
+                self._RestoreCheckpoint()
             for event in self._generator.Load():
                 self._ProcessEvent(event)
+            if self._checkpoint_dir is not None:
+                self._MaybeWriteCheckpoint()
         return self
 
+    def _RestoreCheckpoint(self):
+        """Resumes from the checkpoint for this run, if it is usable."""
+        state = ingestion_checkpoint.Read(self._checkpoint_dir, self.path)
+        if state is None:
+            return
+        if state["config"] != self._CheckpointConfig():
+            logger.info(
+                "Ignoring checkpoint for %s made with other settings",
+                self.path,
+            )
+            return
+        generator = _GeneratorFromPath(*self._generator_args)
+        try:
+            generator.RestoreCheckpoint(state["generator"])
+        except (ValueError, OSError, tf.errors.OpError) as e:
+            logger.info("Not resuming %s from checkpoint: %s", self.path, e)
+            return
+        self._generator = generator
+        self._RestoreCheckpointState(state)
+        self._checkpoint_bytes_read = self.BytesRead()
+        logger.info(
+            "Resumed %s from checkpoint after %d bytes",
+            self.path,
+            self._checkpoint_bytes_read,
+        )
+
+    def _MaybeWriteCheckpoint(self):
+        """Checkpoints this run if it has grown since the last checkpoint."""
+        bytes_read = self.BytesRead()
+        if bytes_read == self._checkpoint_bytes_read:
+            return
+        now = time.time()
+        if (
+            self._checkpoint_time is not None
+            and now - self._checkpoint_time < _CHECKPOINT_INTERVAL_SECS
+        ):
+            return
+        try:
+            ingestion_checkpoint.Write(
+                self._checkpoint_dir, self.path, self._CheckpointState()
+            )
+        except (OSError, tf.errors.OpError) as e:
+            logger.warning("Unable to checkpoint %s: %s", self.path, e)
+        # Also wait out the interval after a failure, rather than retrying
+        # (and logging) on every reload.
+        self._checkpoint_bytes_read = bytes_read
+        self._checkpoint_time = now
+
+    def _CheckpointConfig(self):
+        """Settings that a checkpoint is only valid for."""
+        return {
+            "accumulator": type(self).__name__,
+            "generator": type(self._generator).__name__,
+            "size_guidance": sorted(self._size_guidance.items()),
+            "tensor_size_guidance": sorted(self._tensor_size_guidance.items()),
+            "purge_orphaned_data": self.purge_orphaned_data,
+        }
+
+    def _CheckpointState(self):
+        """Returns all loaded state as plain Python values.
+
+        Must be called with `_generator_mutex` held.
+        """
+        tensors = {}
+        for tag, tag_reservoir in list(self.tensors_by_tag.items()):
+            try:
+                bucket = tag_reservoir.GetState(_TENSOR_RESERVOIR_KEY)
+            except KeyError:
+                # Every value so far was dropped; see `_ProcessTensor`.
+                bucket = None
+            if isinstance(tag_reservoir, reservoir.ScalarReservoir):
+                dtype = self._scalar_dtypes[tag]
+            else:
+                dtype = None
+                if bucket is not None:
+                    (items, num_items_seen, random_state) = bucket
+                    items = [
+                        (e.wall_time, e.step, e.serialized_tensor)
+                        for e in items
+                    ]
+                    bucket = (items, num_items_seen, random_state)
+            tensors[tag] = (tag_reservoir.size, dtype, bucket)
+        return {
+            "config": self._CheckpointConfig(),
+            "generator": self._generator.GetCheckpoint(),
+            "first_event_timestamp": self._first_event_timestamp,
+            "source_writer": self._source_writer,
+            "file_version": self.file_version,
+            "seen_session_start": self._seen_session_start,
+            "most_recent_step": self.most_recent_step,
+            "most_recent_wall_time": self.most_recent_wall_time,
+            "graph": self._graph,
+            "graph_from_metagraph": self._graph_from_metagraph,
+            "meta_graph": self._meta_graph,
+            "tagged_metadata": dict(self._tagged_metadata),
+            "summary_metadata": {
+                tag: metadata.SerializeToString()
+                for (tag, metadata) in self.summary_metadata.items()
+            },
+            "tensors": tensors,
+        }
+
+    def _RestoreCheckpointState(self, state):
+        """Replaces all loaded state with that from `_CheckpointState`."""
+        self._Clear()
+        self._first_event_timestamp = state["first_event_timestamp"]
+        self._source_writer = state["source_writer"]
+        self.file_version = state["file_version"]
+        self._seen_session_start = state["seen_session_start"]
+        self.most_recent_step = state["most_recent_step"]
+        self.most_recent_wall_time = state["most_recent_wall_time"]
+        self._graph = state["graph"]
+        self._graph_from_metagraph = state["graph_from_metagraph"]
+        self._meta_graph = state["meta_graph"]
+        self._tagged_metadata = dict(state["tagged_metadata"])
+        for tag, metadata in state["summary_metadata"].items():
+            self._AddSummaryMetadata(
+                tag, summary_pb2.SummaryMetadata.FromString(metadata)
+            )
+        tensors_by_tag = {}
+        scalar_dtypes = {}
+        for tag, (size, dtype, bucket) in state["tensors"].items():
+            if dtype is not None:
+                tag_reservoir = reservoir.ScalarReservoir(size)
+                scalar_dtypes[tag] = dtype
+            else:
+                tag_reservoir = reservoir.Reservoir(size)
+                if bucket is not None:
+                    (items, num_items_seen, random_state) = bucket
+                    items = [
+                        _SerializedTensorEvent(wall_time, step, tensor)
+                        for (wall_time, step, tensor) in items
+                    ]
+                    bucket = (items, num_items_seen, random_state)
+            if bucket is not None:
+                tag_reservoir.SetState(_TENSOR_RESERVOIR_KEY, bucket)
+            tensors_by_tag[tag] = tag_reservoir
+        with self._tensors_by_tag_lock:
+            self.tensors_by_tag = tensors_by_tag
+            self._scalar_dtypes = scalar_dtypes
+
+    def _Clear(self):
+        """Discards all loaded data."""
+        self._first_event_timestamp = None
+        self._graph = None
+        self._meta_graph = None
+        self._tagged_metadata = {}
+        self.summary_metadata = {}
+        with self._tensors_by_tag_lock:
+            self.tensors_by_tag = {}
+            self._scalar_dtypes = {}
+            self._memory_usage = {}
+        with self._plugin_tag_lock:
+            self._plugin_to_tag_to_content = collections.defaultdict(dict)
+            self._metadata_index = collections.defaultdict(dict)
+
+    def BytesRead(self):
+        """Returns the number of bytes of events read from disk so far."""
+        return self._generator.BytesRead()
+
     def PluginAssets(self, plugin_name):
         """Return a list of all plugin assets for the given plugin.
 
@@ -325,6 +618,27 @@ class EventAccumulator:
         """
         return dict(self.summary_metadata)
 
+    def PluginTagToMetadata(self, plugin_name, data_class):
+        """Return summary metadata for the tags of a plugin and data class.
+
+        This is equivalent to filtering `AllSummaryMetadata`, but only
+        costs as much as the size of the result.
+
+        Args:
+          plugin_name: A string plugin name.
+          data_class: A `summary_pb2.DataClass` value.
+
+        Returns:
+          A dict `d` such that `d[tag]` is a `SummaryMetadata` proto for
+          each tag whose metadata has the given plugin name and data
+          class. Empty if there are no such tags.
+        """
+        with self._plugin_tag_lock:
+            tag_to_metadata = self._metadata_index.get(
+                (plugin_name, data_class)
+            )
+            return dict(tag_to_metadata) if tag_to_metadata else {}
+
     def _ProcessEvent(self, event):
         """Called whenever an event is loaded."""
         if self._first_event_timestamp is None:
@@ -421,14 +735,8 @@ class EventAccumulator:
                     # restarts. Hence, we must also ignore non-initial metadata in
                     # this logic.
                     if tag not in self.summary_metadata:
-                        self.summary_metadata[tag] = value.metadata
-                        plugin_data = value.metadata.plugin_data
-                        if plugin_data.plugin_name:
-                            with self._plugin_tag_lock:
-                                self._plugin_to_tag_to_content[
-                                    plugin_data.plugin_name
-                                ][tag] = plugin_data.content
-                        else:
+                        self._AddSummaryMetadata(tag, value.metadata)
+                        if not value.metadata.plugin_data.plugin_name:
                             logger.warning(
                                 (
                                     "This summary with tag %r is oddly not associated with a "
@@ -446,6 +754,19 @@ class EventAccumulator:
                         tag = value.node_name
                     self._ProcessTensor(tag, event.wall_time, event.step, datum)
 
+    def _AddSummaryMetadata(self, tag, metadata):
+        """Store the metadata for a tag and add it to the plugin indices."""
+        self.summary_metadata[tag] = metadata
+        plugin_data = metadata.plugin_data
+        with self._plugin_tag_lock:
+            if plugin_data.plugin_name:
+                self._plugin_to_tag_to_content[plugin_data.plugin_name][
+                    tag
+                ] = plugin_data.content
+            self._metadata_index[
+                (plugin_data.plugin_name, metadata.data_class)
+            ][tag] = metadata
+
     def Tags(self):
         """Return all tags found in the value stream.
 
@@ -529,7 +850,174 @@ class EventAccumulator:
         Returns:
           An array of `TensorEvent`s.
         """
-        return self.tensors_by_tag[tag].Items(_TENSOR_RESERVOIR_KEY)
+        tag_reservoir = self.tensors_by_tag[tag]
+        items = tag_reservoir.Items(_TENSOR_RESERVOIR_KEY)
+        if not isinstance(tag_reservoir, reservoir.ScalarReservoir):
+            return items
+        np_dtype = dtypes.as_dtype(self._scalar_dtypes[tag]).as_numpy_dtype
+        return [
+            TensorEvent(
+                wall_time=item.wall_time,
+                step=item.step,
+                tensor_proto=tensor_util.make_tensor_proto(
+                    np.asarray(item.value).astype(np_dtype)
+                ),
+            )
+            for item in items
+        ]
+
+    def TensorsVersion(self, tag):
+        """Return a token that changes whenever `Tensors(tag)` may change.
+
+        Args:
+          tag: A string tag associated with the events.
+
+        Raises:
+          KeyError: If the tag is not found.
+
+        Returns:
+          An `int`, unique among the tokens of all tags and runs in this
+          process.
+        """
+        return self.tensors_by_tag[tag].Version()
+
+    def ScalarColumns(self, tag):
+        """Given a scalar summary tag, return its points as arrays.
+
+        This is much cheaper than `Tensors` for tags whose points are
+        stored in a `reservoir.ScalarReservoir`, as it creates no
+        per-point objects.
+
+        Args:
+          tag: A string tag associated with the events.
+
+        Raises:
+          KeyError: If the tag is not found.
+          ValueError: If the tag's tensors do not each hold one value.
+
+        Returns:
+          A tuple `(steps, wall_times, values)` of 1-D NumPy arrays of
+          equal length, as for `ScalarColumnsFromEvents`.
+        """
+        tag_reservoir = self.tensors_by_tag[tag]
+        if isinstance(tag_reservoir, reservoir.ScalarReservoir):
+            return tag_reservoir.Columns(_TENSOR_RESERVOIR_KEY)
+        return ScalarColumnsFromEvents(
+            tag_reservoir.Items(_TENSOR_RESERVOIR_KEY)
+        )
+
+    def ScalarDtype(self, tag):
+        """Given a summary tag, return the dtype of its scalar values.
+
+        Args:
+          tag: A string tag associated with the events.
+
+        Raises:
+          KeyError: If the tag is not found.
+
+        Returns:
+          The `DataType` enum value of the tag's tensors if they are
+          stored in a `reservoir.ScalarReservoir`, whose float64 values
+          hold every value of this dtype exactly; otherwise `None`.
+        """
+        tag_reservoir = self.tensors_by_tag[tag]
+        if not isinstance(tag_reservoir, reservoir.ScalarReservoir):
+            return None
+        return self._scalar_dtypes[tag]
+
+    def MaxStepAndWallTime(self, tag):
+        """Given a summary tag, return the latest step and wall time.
+
+        Unlike `ScalarColumns`, this decodes no values, so it works for
+        tags of any data class.
+
+        Args:
+          tag: A string tag associated with the events.
+
+        Raises:
+          KeyError: If the tag is not found.
+
+        Returns:
+          A tuple `(max_step, max_wall_time)` of an `int` and a `float`,
+          or `(None, None)` if the tag has no points.
+        """
+        tag_reservoir = self.tensors_by_tag[tag]
+        if isinstance(tag_reservoir, reservoir.ScalarReservoir):
+            (steps, wall_times, _) = tag_reservoir.Columns(
+                _TENSOR_RESERVOIR_KEY
+            )
+            if not steps.size:
+                return (None, None)
+            return (int(steps.max()), float(wall_times.max()))
+        max_step = None
+        max_wall_time = None
+        for event in tag_reservoir.Items(_TENSOR_RESERVOIR_KEY):
+            if max_step is None or max_step < event.step:
+                max_step = event.step
+            if max_wall_time is None or max_wall_time < event.wall_time:
+                max_wall_time = event.wall_time
+        return (max_step, max_wall_time)
+
+    def MemoryUsage(self):
+        """Return the approximate memory used by the tensors of each tag.
+
+        Sizes are estimated from the serialized length of each retained
+        tensor, or a fixed size per point for tags in a
+        `reservoir.ScalarReservoir`, and are cached until the tag's
+        reservoir changes.
+
+        Returns:
+          A dict mapping each tag to an approximate size in bytes.
+        """
+        with self._tensors_by_tag_lock:
+            items = list(self.tensors_by_tag.items())
+        return {
+            tag: self._ReservoirMemoryUsage(tag, tag_reservoir)[1]
+            for (tag, tag_reservoir) in items
+        }
+
+    def DownsampleTensors(self, tag):
+        """Halve the number of tensors kept for a tag, down to one.
+
+        The evenly spaced half that remains includes the latest tensor,
+        and the tag's reservoir stays at the reduced size, so it keeps
+        sampling new data without growing back.
+
+        Args:
+          tag: A string tag associated with the events.
+
+        Raises:
+          KeyError: If the tag is not found.
+
+        Returns:
+          The approximate number of bytes freed.
+        """
+        tag_reservoir = self.tensors_by_tag[tag]
+        (num_items, num_bytes) = self._ReservoirMemoryUsage(tag, tag_reservoir)
+        if num_items <= 1:
+            return 0
+        tag_reservoir.Shrink(num_items // 2)
+        return num_bytes - self._ReservoirMemoryUsage(tag, tag_reservoir)[1]
+
+    def _ReservoirMemoryUsage(self, tag, tag_reservoir):
+        """Returns `(num_items, num_bytes)` for a tag's reservoir."""
+        version = tag_reservoir.Version()
+        cached = self._memory_usage.get(tag)
+        if cached is not None and cached[0] == version:
+            return cached[1:]
+        try:
+            if isinstance(tag_reservoir, reservoir.ScalarReservoir):
+                num_items = len(tag_reservoir.Columns(_TENSOR_RESERVOIR_KEY)[0])
+                num_bytes = num_items * _SCALAR_ITEM_BYTES
+            else:
+                events = tag_reservoir.Items(_TENSOR_RESERVOIR_KEY)
+                num_items = len(events)
+                num_bytes = sum(_TensorEventBytes(e) for e in events)
+        except KeyError:
+            # Every value so far was dropped; see `_ProcessTensor`.
+            (num_items, num_bytes) = (0, 0)
+        self._memory_usage[tag] = (version, num_items, num_bytes)
+        return (num_items, num_bytes)
 
     def _MaybePurgeOrphanedData(self, event):
         """Maybe purge orphaned data due to a TensorFlow crash.
@@ -604,12 +1092,93 @@ class EventAccumulator:
             self._Purge(event, by_tags=True)
 
     def _ProcessTensor(self, tag, wall_time, step, tensor):
-        tv = TensorEvent(wall_time=wall_time, step=step, tensor_proto=tensor)
         with self._tensors_by_tag_lock:
             if tag not in self.tensors_by_tag:
                 reservoir_size = self._GetTensorReservoirSize(tag)
-                self.tensors_by_tag[tag] = reservoir.Reservoir(reservoir_size)
-        self.tensors_by_tag[tag].AddItem(_TENSOR_RESERVOIR_KEY, tv)
+                if self._UseScalarReservoir(tag, tensor):
+                    self._scalar_dtypes[tag] = tensor.dtype
+                    tag_reservoir = reservoir.ScalarReservoir(reservoir_size)
+                else:
+                    tag_reservoir = reservoir.Reservoir(reservoir_size)
+                self.tensors_by_tag[tag] = tag_reservoir
+        tag_reservoir = self.tensors_by_tag[tag]
+        if isinstance(tag_reservoir, reservoir.ScalarReservoir):
+            value = _ScalarValue(tensor)
+            if value is None:
+                logger.warning(
+                    "Dropping non-scalar value at step %d for scalar tag %r",
+                    step,
+                    tag,
+                )
+                return
+            item = reservoir.ScalarItem(step, wall_time, value)
+            tag_reservoir.AddItem(_TENSOR_RESERVOIR_KEY, item)
+            return
+        # Serialize only the tensors that the reservoir keeps.
+        tag_reservoir.AddItem(
+            _TENSOR_RESERVOIR_KEY,
+            tensor,
+            lambda tensor: _SerializedTensorEvent(
+                wall_time, step, tensor.SerializeToString()
+            ),
+        )
+
+    def _ProcessValue(self, tag, wall_time, step, value, migrate):
+        """Takes a summary value of a known tag before it is migrated.
+
+        This is the `value_sink` of the event file loaders. The value
+        goes to its tag's reservoir with migration deferred, so values
+        that the reservoir only keeps until the next one arrives are
+        never migrated or serialized. Values that need the full path
+        through `_ProcessEvent` are left to it.
+
+        Args:
+          tag: The tag of the value.
+          wall_time: The wall time of the value's event.
+          step: The step of the value's event.
+          value: The `Summary.Value`, not yet migrated.
+          migrate: A callable that migrates a value and returns the result.
+
+        Returns:
+          Whether the value was taken.
+        """
+        tag_reservoir = self.tensors_by_tag.get(tag)
+        if (
+            tag_reservoir is None
+            # The event may purge this tag, which must happen first.
+            or (self.purge_orphaned_data and step < self.most_recent_step)
+            or value.WhichOneof("value") not in _DEFERRABLE_VALUE_TYPES
+            or (value.HasField("metadata") and tag not in self.summary_metadata)
+        ):
+            return False
+        if isinstance(tag_reservoir, reservoir.ScalarReservoir):
+            if value.HasField("simple_value"):
+                # What migrating to a float32 tensor would give.
+                tag_reservoir.AddItem(
+                    _TENSOR_RESERVOIR_KEY,
+                    reservoir.ScalarItem(step, wall_time, value.simple_value),
+                )
+            else:
+                self._ProcessTensor(tag, wall_time, step, migrate(value).tensor)
+            return True
+        tag_reservoir.AddItem(
+            _TENSOR_RESERVOIR_KEY,
+            value,
+            lambda value: _SerializedTensorEvent(
+                wall_time, step, migrate(value).tensor.SerializeToString()
+            ),
+        )
+        return True
+
+    def _UseScalarReservoir(self, tag, tensor):
+        """Whether to store points for a new tag in a `ScalarReservoir`."""
+        summary_metadata = self.summary_metadata.get(tag)
+        return (
+            summary_metadata is not None
+            and summary_metadata.data_class == summary_pb2.DATA_CLASS_SCALAR
+            and tensor.dtype in _SCALAR_RESERVOIR_DTYPES
+            and not tensor.tensor_shape.dim
+        )
 
     def _GetTensorReservoirSize(self, tag):
         default = self._size_guidance[TENSORS]
@@ -669,6 +1238,121 @@ class EventAccumulator:
             logger.warning(purge_msg)
 
 
+def ScalarColumnsFromEvents(events):
+    """Returns the points of a scalar time series as arrays.
+
+    Args:
+      events: A list of `TensorEvent`s whose tensors each hold one value.
+
+    Raises:
+      ValueError: If a tensor does not hold exactly one value.
+
+    Returns:
+      A tuple `(steps, wall_times, values)` of 1-D NumPy arrays of equal
+      length. Steps are int64 and wall times are float64. Values are
+      float64, except that integer values are kept as int64 or uint64
+      if any is too large for a float64 to hold exactly.
+    """
+    values = np.array(
+        [tensor_util.make_ndarray(e.tensor_proto).item() for e in events]
+    )
+    if not (
+        values.dtype.kind in "iu"
+        and (
+            values.max() > _MAX_EXACT_FLOAT64_INT
+            or values.min() < -_MAX_EXACT_FLOAT64_INT
+        )
+    ):
+        values = values.astype(np.float64)
+    return (
+        np.array([e.step for e in events], dtype=np.int64),
+        np.array([e.wall_time for e in events], dtype=np.float64),
+        values,
+    )
+
+
+def _ScalarValue(tensor):
+    """Returns the value of a single-element numeric `TensorProto`.
+
+    Returns `None` if the tensor does not have exactly one element.
+    """
+    # Fast paths for the encodings that scalar summaries normally use.
+    if not tensor.tensor_content and not tensor.tensor_shape.dim:
+        if tensor.dtype == types_pb2.DT_FLOAT and len(tensor.float_val) == 1:
+            return tensor.float_val[0]
+        if tensor.dtype == types_pb2.DT_DOUBLE and len(tensor.double_val) == 1:
+            return tensor.double_val[0]
+    array = tensor_util.make_ndarray(tensor)
+    if array.size != 1:
+        return None
+    return array.item()
+
+
+def _NumElements(tensor_shape):
+    """Computes the number of elements of a `TensorShapeProto`."""
+    result = 1
+    for dim in tensor_shape.dim:
+        result *= dim.size
+    return result
+
+
+def _ParseTensorShape(serialized_tensor):
+    """Parses only the shape of a serialized `TensorProto`.
+
+    Skips over the other fields, such as the tensor's contents, without
+    decoding them.
+
+    Returns:
+      A `TensorShapeProto`.
+    """
+    shape = tensor_shape_pb2.TensorShapeProto()
+    data = memoryview(serialized_tensor)
+    pos = 0
+    while pos < len(data):
+        (key, pos) = _ReadVarint(data, pos)
+        (field_number, wire_type) = (key >> 3, key & 7)
+        if wire_type == 0:
+            (_, pos) = _ReadVarint(data, pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 2:
+            (length, pos) = _ReadVarint(data, pos)
+            if field_number == _TENSOR_SHAPE_FIELD_NUMBER:
+                # Repeated occurrences of a message field are merged.
+                shape.MergeFromString(data[pos : pos + length].tobytes())
+            pos += length
+        elif wire_type == 5:
+            pos += 4
+        else:
+            # Groups are not used by `TensorProto`; parse it in full.
+            return tensor_pb2.TensorProto.FromString(
+                bytes(serialized_tensor)
+            ).tensor_shape
+    return shape
+
+
+def _ReadVarint(data, pos):
+    """Reads a base-128 varint, returning it and the next position."""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return (result, pos)
+        shift += 7
+
+
+def _TensorEventBytes(event):
+    """Approximates the memory used by a `TensorEvent` in a reservoir."""
+    if isinstance(event, _SerializedTensorEvent):
+        size = len(event.serialized_tensor)
+    else:
+        size = event.tensor_proto.ByteSize()
+    return size + _TENSOR_EVENT_OVERHEAD_BYTES
+
+
 def _GetPurgeMessage(
     most_recent_step,
     most_recent_wall_time,
@@ -692,17 +1376,29 @@ def _GetPurgeMessage(
 
 
 def _GeneratorFromPath(
-    path, event_file_active_filter=None, detect_file_replacement=None
+    path,
+    event_file_active_filter=None,
+    detect_file_replacement=None,
+    mmap_event_files=None,
+    value_sink=None,
 ):
     """Create an event generator for file or directory at given path string."""
     if not path:
         raise ValueError("path must be a valid string")
     if io_wrapper.IsSummaryEventsFile(path):
-        return event_file_loader.EventFileLoader(path, detect_file_replacement)
+        return event_file_loader.EventFileLoader(
+            path,
+            detect_file_replacement,
+            bool(mmap_event_files),
+            value_sink=value_sink,
+        )
     elif event_file_active_filter:
         loader_factory = (
             lambda path: event_file_loader.TimestampedEventFileLoader(
-                path, detect_file_replacement
+                path,
+                detect_file_replacement,
+                bool(mmap_event_files),
+                value_sink=value_sink,
             )
         )
         return directory_loader.DirectoryLoader(
@@ -713,7 +1409,10 @@ def _GeneratorFromPath(
         )
     else:
         loader_factory = lambda path: event_file_loader.EventFileLoader(
-            path, detect_file_replacement
+            path,
+            detect_file_replacement,
+            bool(mmap_event_files),
+            value_sink=value_sink,
         )
         return directory_watcher.DirectoryWatcher(
             path,
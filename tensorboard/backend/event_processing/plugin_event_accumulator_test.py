@@ -14,6 +14,7 @@
 # ==============================================================================
 
 
+import glob
 import os
 from unittest import mock
 
@@ -22,12 +23,17 @@ import tensorflow as tf
 
 from tensorboard import data_compat
 from tensorboard import dataclass_compat
+from tensorboard.backend.event_processing import ingestion_checkpoint
 from tensorboard.backend.event_processing import plugin_event_accumulator as ea
+from tensorboard.backend.event_processing import reservoir
 from tensorboard.compat.proto import config_pb2
 from tensorboard.compat.proto import event_pb2
 from tensorboard.compat.proto import graph_pb2
 from tensorboard.compat.proto import meta_graph_pb2
 from tensorboard.compat.proto import summary_pb2
+from tensorboard.compat.proto import tensor_pb2
+from tensorboard.compat.proto import tensor_shape_pb2
+from tensorboard.compat.proto import types_pb2
 from tensorboard.plugins.audio import metadata as audio_metadata
 from tensorboard.plugins.audio import summary as audio_summary
 from tensorboard.plugins.graph import metadata as graph_metadata
@@ -475,6 +481,239 @@ class MockingEventAccumulatorTest(EventAccumulatorTest):
             [scalar_metadata.PLUGIN_NAME, graph_metadata.PLUGIN_NAME],
         )
 
+    def _AddSimpleValue(self, gen, tag, step, value):
+        gen.AddEvent(
+            event_pb2.Event(
+                wall_time=step + 0.5,
+                step=step,
+                summary=summary_pb2.Summary(
+                    value=[
+                        summary_pb2.Summary.Value(tag=tag, simple_value=value)
+                    ]
+                ),
+            )
+        )
+
+    def testScalarTagsUseScalarReservoir(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        for step in range(5):
+            self._AddSimpleValue(gen, "loss", step, 1.0 / (step + 1))
+        gen.AddScalarTensor("untyped", wall_time=1, step=1, value=3)
+        acc.Reload()
+
+        self.assertIsInstance(
+            acc.tensors_by_tag["loss"], reservoir.ScalarReservoir
+        )
+        (steps, wall_times, values) = acc.ScalarColumns("loss")
+        self.assertAllEqual(steps, [0, 1, 2, 3, 4])
+        self.assertAllEqual(wall_times, [0.5, 1.5, 2.5, 3.5, 4.5])
+        self.assertAllClose(values, [1.0, 0.5, 1 / 3, 0.25, 0.2])
+        events = acc.Tensors("loss")
+        self.assertEqual([e.step for e in events], [0, 1, 2, 3, 4])
+        self.assertEqual(
+            events[1].tensor_proto.dtype, tf.float32.as_datatype_enum
+        )
+        self.assertEqual(tensor_util.make_ndarray(events[1].tensor_proto), 0.5)
+
+        # Tensors without scalar metadata keep their protos.
+        self.assertNotIsInstance(
+            acc.tensors_by_tag["untyped"], reservoir.ScalarReservoir
+        )
+        self.assertAllEqual(acc.ScalarColumns("untyped")[2], [3.0])
+
+    def testScalarReservoirDropsNonScalarValues(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        self._AddSimpleValue(gen, "loss", 1, 1.0)
+        gen.AddEvent(
+            event_pb2.Event(
+                step=2,
+                summary=summary_pb2.Summary(
+                    value=[
+                        summary_pb2.Summary.Value(
+                            tag="loss",
+                            tensor=tensor_util.make_tensor_proto([1.0, 2.0]),
+                        )
+                    ]
+                ),
+            )
+        )
+        with self.assertLogs(tb_logging.get_logger(), "WARNING"):
+            acc.Reload()
+        self.assertAllEqual(acc.ScalarColumns("loss")[0], [1])
+
+    def testMaxStepAndWallTime(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        for step in range(4):
+            self._AddSimpleValue(gen, "loss", step, float(step))
+        # Values that `ScalarColumns` cannot decode to one number.
+        gen.AddEvent(
+            event_pb2.Event(
+                wall_time=7.5,
+                step=7,
+                summary=summary_pb2.Summary(
+                    value=[
+                        summary_pb2.Summary.Value(
+                            tag="vector",
+                            tensor=tensor_util.make_tensor_proto([1.0, 2.0]),
+                        )
+                    ]
+                ),
+            )
+        )
+        acc.Reload()
+        self.assertEqual(acc.MaxStepAndWallTime("loss"), (3, 3.5))
+        self.assertEqual(acc.MaxStepAndWallTime("vector"), (7, 7.5))
+        with self.assertRaises(ValueError):
+            acc.ScalarColumns("vector")
+        with self.assertRaises(KeyError):
+            acc.MaxStepAndWallTime("missing")
+
+    def testScalarDtype(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        self._AddSimpleValue(gen, "loss", 1, 0.5)
+        for tag, value in (("count", np.int32(7)), ("bytes", np.int64(7))):
+            summary_value = summary_pb2.Summary.Value(
+                tag=tag, tensor=tensor_util.make_tensor_proto(value)
+            )
+            summary_value.metadata.data_class = summary_pb2.DATA_CLASS_SCALAR
+            gen.AddEvent(
+                event_pb2.Event(
+                    wall_time=1,
+                    step=1,
+                    summary=summary_pb2.Summary(value=[summary_value]),
+                )
+            )
+        acc.Reload()
+        self.assertEqual(acc.ScalarDtype("loss"), types_pb2.DT_FLOAT)
+        self.assertEqual(acc.ScalarDtype("count"), types_pb2.DT_INT32)
+        # A float64 cannot hold every int64 exactly.
+        self.assertIsNone(acc.ScalarDtype("bytes"))
+        with self.assertRaises(KeyError):
+            acc.ScalarDtype("missing")
+
+    def testScalarReservoirPurge(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        for step in (1, 2, 3, 2):
+            self._AddSimpleValue(gen, "loss", step, float(step))
+        acc.Reload()
+        self.assertEqual([e.step for e in acc.Tensors("loss")], [1, 2])
+
+    def testTensorsAreStoredSerialized(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        tensor = tensor_util.make_tensor_proto([[1.0, 2.0], [3.0, 4.0]])
+        gen.AddEvent(
+            event_pb2.Event(
+                wall_time=1.5,
+                step=7,
+                summary=summary_pb2.Summary(
+                    value=[summary_pb2.Summary.Value(tag="m", tensor=tensor)]
+                ),
+            )
+        )
+        acc.Reload()
+
+        (event,) = acc.Tensors("m")
+        self.assertEqual(event.serialized_tensor, tensor.SerializeToString())
+        self.assertEqual((event.wall_time, event.step), (1.5, 7))
+        self.assertProtoEquals(tensor, event.tensor_proto)
+        # Each read decodes a fresh proto, so callers cannot mutate the
+        # stored tensor.
+        event.tensor_proto.float_val.append(5.0)
+        self.assertProtoEquals(tensor, event.tensor_proto)
+        self.assertEqual(event, acc.Tensors("m")[0])
+
+    def testOnlyKeptTensorsAreSerialized(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen, size_guidance={ea.TENSORS: 1})
+        tensor = tensor_util.make_tensor_proto([1.0, 2.0])
+        with mock.patch.object(
+            ea,
+            "_SerializedTensorEvent",
+            wraps=ea._SerializedTensorEvent,
+        ) as mock_event:
+            for step in range(10):
+                acc._ProcessTensor("m", step + 0.5, step, tensor)
+            # The reservoir keeps only the last tensor, which is
+            # serialized once it is read.
+            mock_event.assert_not_called()
+            (event,) = acc.Tensors("m")
+        mock_event.assert_called_once()
+        self.assertEqual(event.step, 9)
+        self.assertProtoEquals(tensor, event.tensor_proto)
+
+    def testNumElements(self):
+        tensors = [
+            tensor_util.make_tensor_proto(3.0),
+            tensor_util.make_tensor_proto([b"a", b"bc", b"def"]),
+            tensor_util.make_tensor_proto(np.zeros([2, 0, 3])),
+            tensor_util.make_tensor_proto(np.ones([4, 5], dtype=np.int64)),
+        ]
+        for tensor in tensors:
+            expected = tensor_util.make_ndarray(tensor).size
+            event = ea.TensorEvent(wall_time=1.0, step=1, tensor_proto=tensor)
+            self.assertEqual(event.num_elements, expected)
+            event = ea._SerializedTensorEvent(
+                1.0, 1, tensor.SerializeToString()
+            )
+            self.assertEqual(event.num_elements, expected)
+        # A shape that appears more than once is merged, as in a full
+        # parse.
+        serialized = b"".join(
+            tensor_pb2.TensorProto(
+                tensor_shape=tensor_shape_pb2.TensorShapeProto(
+                    dim=[tensor_shape_pb2.TensorShapeProto.Dim(size=size)]
+                )
+            ).SerializeToString()
+            for size in (2, 7)
+        )
+        event = ea._SerializedTensorEvent(1.0, 1, serialized)
+        self.assertEqual(len(event.tensor_proto.tensor_shape.dim), 2)
+        self.assertEqual(event.num_elements, 2 * 7)
+
+    def testMemoryUsageAndDownsampleTensors(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        tensor = tensor_util.make_tensor_proto([1.0, 2.0, 3.0])
+        for step in range(10):
+            self._AddSimpleValue(gen, "loss", step, float(step))
+            gen.AddEvent(
+                event_pb2.Event(
+                    step=step,
+                    summary=summary_pb2.Summary(
+                        value=[
+                            summary_pb2.Summary.Value(tag="m", tensor=tensor)
+                        ]
+                    ),
+                )
+            )
+        acc.Reload()
+        tensor_bytes = (
+            len(tensor.SerializeToString()) + ea._TENSOR_EVENT_OVERHEAD_BYTES
+        )
+        self.assertEqual(
+            acc.MemoryUsage(),
+            {"loss": 10 * ea._SCALAR_ITEM_BYTES, "m": 10 * tensor_bytes},
+        )
+
+        self.assertEqual(acc.DownsampleTensors("m"), 5 * tensor_bytes)
+        self.assertEqual([e.step for e in acc.Tensors("m")], [0, 2, 4, 6, 9])
+        self.assertEqual(
+            acc.DownsampleTensors("loss"), 5 * ea._SCALAR_ITEM_BYTES
+        )
+        self.assertEqual(acc.MemoryUsage()["m"], 5 * tensor_bytes)
+        self.assertEqual(acc.DownsampleTensors("m"), 3 * tensor_bytes)
+        self.assertEqual(acc.DownsampleTensors("m"), 1 * tensor_bytes)
+        self.assertEqual(acc.DownsampleTensors("m"), 0)
+        self.assertEqual([e.step for e in acc.Tensors("m")], [9])
+        with self.assertRaises(KeyError):
+            acc.DownsampleTensors("missing")
+
     def testNewStyleAudioSummary(self):
         """Verify processing of tensorboard.plugins.audio.summary."""
         event_sink = _EventGenerator(self, zero_out_timestamps=True)
@@ -906,6 +1145,30 @@ class RealisticEventAccumulatorTest(EventAccumulatorTest):
             summary_metadata_1, acc.SummaryMetadata("you_are_it")
         )
 
+    def testPluginTagToMetadata(self):
+        logdir = self.get_temp_dir()
+        summary_metadata = summary_pb2.SummaryMetadata(
+            plugin_data=summary_pb2.SummaryMetadata.PluginData(
+                plugin_name="outlet"
+            ),
+            data_class=summary_pb2.DATA_CLASS_TENSOR,
+        )
+        self._writeMetadata(logdir, summary_metadata)
+        acc = ea.EventAccumulator(logdir)
+        acc.Reload()
+        tag_to_metadata = acc.PluginTagToMetadata(
+            "outlet", summary_pb2.DATA_CLASS_TENSOR
+        )
+        self.assertEqual(list(tag_to_metadata), ["you_are_it"])
+        self.assertProtoEquals(summary_metadata, tag_to_metadata["you_are_it"])
+        self.assertEqual(
+            acc.PluginTagToMetadata("outlet", summary_pb2.DATA_CLASS_SCALAR),
+            {},
+        )
+        self.assertEqual(
+            acc.PluginTagToMetadata("plug", summary_pb2.DATA_CLASS_TENSOR), {}
+        )
+
     def testPluginTagToContent_PluginsCannotJumpOnTheBandwagon(self):
         # If there are multiple `SummaryMetadata` for a given tag, and the
         # set of plugins in the `plugin_data` of second is different from
@@ -939,5 +1202,205 @@ class RealisticEventAccumulatorTest(EventAccumulatorTest):
         self.assertCountEqual(acc.ActivePlugins(), ["outlet"])
 
 
+class CheckpointTest(tf.test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self._logdir = os.path.join(self.get_temp_dir(), "run")
+        self._checkpoint_dir = os.path.join(self.get_temp_dir(), "checkpoints")
+        self._writer = test_util.FileWriter(self._logdir)
+
+    def tearDown(self):
+        self._writer.close()
+        super().tearDown()
+
+    def _WriteSteps(self, steps):
+        histogram_metadata = summary_pb2.SummaryMetadata(
+            plugin_data=summary_pb2.SummaryMetadata.PluginData(
+                plugin_name="histograms"
+            ),
+        )
+        for step in steps:
+            summary = summary_pb2.Summary(
+                value=[
+                    summary_pb2.Summary.Value(tag="loss", simple_value=step),
+                    summary_pb2.Summary.Value(
+                        tag="hist",
+                        metadata=histogram_metadata,
+                        tensor=tensor_util.make_tensor_proto([step, 2.0]),
+                    ),
+                ]
+            )
+            self._writer.add_event(
+                event_pb2.Event(wall_time=step, step=step, summary=summary)
+            )
+        self._writer.flush()
+
+    def _MakeAccumulator(self, **kwargs):
+        kwargs.setdefault("size_guidance", {ea.TENSORS: 10})
+        return ea.EventAccumulator(self._logdir, **kwargs)
+
+    def _CountProcessedEvents(self, accumulator):
+        return mock.patch.object(
+            accumulator, "_ProcessEvent", wraps=accumulator._ProcessEvent
+        )
+
+    def assertSameData(self, actual, expected):
+        self.assertEqual(actual.Tags(), expected.Tags())
+        self.assertEqual(
+            actual.AllSummaryMetadata(), expected.AllSummaryMetadata()
+        )
+        for tag in expected.Tags()[ea.TENSORS]:
+            self.assertEqual(actual.Tensors(tag), expected.Tensors(tag))
+        self.assertEqual(
+            actual.FirstEventTimestamp(), expected.FirstEventTimestamp()
+        )
+        self.assertEqual(actual.most_recent_step, expected.most_recent_step)
+
+    def _testResumesFromCheckpoint(self, **kwargs):
+        self._WriteSteps(range(100))
+        first = self._MakeAccumulator(
+            checkpoint_dir=self._checkpoint_dir, **kwargs
+        )
+        first.Reload()
+        self._WriteSteps(range(100, 150))
+
+        resumed = self._MakeAccumulator(
+            checkpoint_dir=self._checkpoint_dir, **kwargs
+        )
+        with self._CountProcessedEvents(resumed) as process_event:
+            resumed.Reload()
+        self.assertEqual(process_event.call_count, 50)
+        self.assertIsInstance(
+            resumed.tensors_by_tag["loss"], reservoir.ScalarReservoir
+        )
+        expected = self._MakeAccumulator(**kwargs).Reload()
+        self.assertSameData(resumed, expected)
+        self.assertEqual(resumed.BytesRead(), expected.BytesRead())
+
+    def testResumesFromCheckpoint(self):
+        self._testResumesFromCheckpoint()
+
+    def testResumesFromCheckpoint_multifile(self):
+        self._testResumesFromCheckpoint(
+            event_file_active_filter=lambda timestamp: True
+        )
+
+    def testIgnoresCheckpointOfRewrittenFile(self):
+        self._WriteSteps(range(10))
+        self._MakeAccumulator(checkpoint_dir=self._checkpoint_dir).Reload()
+        (path,) = glob.glob(os.path.join(self._logdir, "*tfevents*"))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        resumed = self._MakeAccumulator(checkpoint_dir=self._checkpoint_dir)
+        with self._CountProcessedEvents(resumed) as process_event:
+            resumed.Reload()
+        # The file version event, and the ten steps.
+        self.assertEqual(process_event.call_count, 11)
+        self.assertSameData(resumed, self._MakeAccumulator().Reload())
+
+    def testIgnoresCheckpointWithOtherSettings(self):
+        self._WriteSteps(range(10))
+        self._MakeAccumulator(checkpoint_dir=self._checkpoint_dir).Reload()
+
+        resumed = self._MakeAccumulator(
+            checkpoint_dir=self._checkpoint_dir, size_guidance={ea.TENSORS: 5}
+        )
+        with self._CountProcessedEvents(resumed) as process_event:
+            resumed.Reload()
+        self.assertEqual(process_event.call_count, 11)
+        self.assertLen(resumed.Tensors("hist"), 5)
+
+    def testWritesCheckpointOnlyAfterNewData(self):
+        self._WriteSteps(range(10))
+        accumulator = self._MakeAccumulator(checkpoint_dir=self._checkpoint_dir)
+        with mock.patch.object(
+            ingestion_checkpoint, "Write", wraps=ingestion_checkpoint.Write
+        ) as write:
+            accumulator.Reload()
+            self.assertEqual(write.call_count, 1)
+            accumulator.Reload()
+            self.assertEqual(write.call_count, 1)
+            # New data is only checkpointed once the interval has passed.
+            self._WriteSteps(range(10, 20))
+            accumulator.Reload()
+            self.assertEqual(write.call_count, 1)
+            accumulator._checkpoint_time -= ea._CHECKPOINT_INTERVAL_SECS
+            accumulator.Reload()
+            self.assertEqual(write.call_count, 2)
+
+
+class DeferredValueTest(tf.test.TestCase):
+    """Tests values that the loader hands over before migrating them."""
+
+    def setUp(self):
+        super().setUp()
+        self._logdir = os.path.join(self.get_temp_dir(), "run")
+
+    def _WriteSteps(self, steps):
+        histogram_metadata = summary_pb2.SummaryMetadata(
+            plugin_data=summary_pb2.SummaryMetadata.PluginData(
+                plugin_name="histograms"
+            ),
+        )
+        with test_util.FileWriter(self._logdir) as writer:
+            for i, step in enumerate(steps):
+                summary = summary_pb2.Summary(
+                    value=[
+                        summary_pb2.Summary.Value(
+                            tag="loss", simple_value=step
+                        ),
+                        summary_pb2.Summary.Value(
+                            tag="hist",
+                            metadata=histogram_metadata if i == 0 else None,
+                            tensor=tensor_util.make_tensor_proto([step, 2.0]),
+                        ),
+                    ]
+                )
+                writer.add_event(
+                    event_pb2.Event(wall_time=i, step=step, summary=summary)
+                )
+
+    def _Load(self, defer):
+        accumulator = ea.EventAccumulator(
+            self._logdir, size_guidance={ea.TENSORS: 10}
+        )
+        if not defer:
+            accumulator._ProcessValue = lambda *args: False
+            accumulator._generator = ea._GeneratorFromPath(
+                self._logdir, value_sink=accumulator._ProcessValue
+            )
+        return accumulator.Reload()
+
+    def assertSameData(self, actual, expected):
+        self.assertEqual(actual.Tags(), expected.Tags())
+        self.assertEqual(
+            actual.AllSummaryMetadata(), expected.AllSummaryMetadata()
+        )
+        for tag in expected.Tags()[ea.TENSORS]:
+            self.assertEqual(actual.Tensors(tag), expected.Tensors(tag))
+        self.assertEqual(actual.most_recent_step, expected.most_recent_step)
+
+    def testSameDataAsWithoutDeferral(self):
+        # Restart at step 300, so that the out-of-order steps are purged.
+        self._WriteSteps(list(range(500)) + list(range(300, 1000)))
+        self.assertSameData(self._Load(True), self._Load(False))
+
+    def testSkipsMigratingDiscardedValues(self):
+        self._WriteSteps(range(1000))
+        with mock.patch.object(
+            dataclass_compat,
+            "migrate_value",
+            wraps=dataclass_compat.migrate_value,
+        ) as migrate_value:
+            accumulator = self._Load(True)
+            self.assertLen(accumulator.Tensors("hist"), 10)
+        # Only the histograms that were sampled at some point were
+        # migrated, and scalars never needed to be.
+        self.assertGreater(migrate_value.call_count, 10)
+        self.assertLess(migrate_value.call_count, 100)
+        self.assertEqual([e.step for e in accumulator.Tensors("loss")][-1], 999)
+
+
 if __name__ == "__main__":
     tf.test.main()
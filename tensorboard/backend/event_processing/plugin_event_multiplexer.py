@@ -18,6 +18,7 @@
 import os
 import queue
 import threading
+import time
 
 from typing import Optional
 
@@ -26,6 +27,7 @@ from tensorboard.backend.event_processing import (
     plugin_event_accumulator as event_accumulator,
 )
 from tensorboard.backend.event_processing import io_wrapper
+from tensorboard.backend.event_processing import reload_pool
 from tensorboard.util import tb_logging
 
 
@@ -79,6 +81,11 @@ class EventMultiplexer:
         max_reload_threads=None,
         event_file_active_filter=None,
         detect_file_replacement=None,
+        mmap_event_files=None,
+        reload_workers=None,
+        reload_scheduler=None,
+        checkpoint_dir=None,
+        memory_budget_bytes=None,
     ):
         """Constructor for the `EventMultiplexer`.
 
@@ -103,11 +110,38 @@ class EventMultiplexer:
           detect_file_replacement: Optional boolean; if True, event file loading
             will try to detect when a file has been replaced with a new version
             that contains additional data, by monitoring the file size.
+          mmap_event_files: Optional boolean; if True, event files on the local
+            filesystem are read through a persistent memory mapping.
+          reload_workers: Optional string; either "thread" (the default) to
+            reload runs on up to `max_reload_threads` threads in this
+            process, or "process" to parse event files in up to
+            `max_reload_threads` worker processes, which send sampled data
+            back to this process after each reload.
+          reload_scheduler: Optional `reload_scheduler.ReloadScheduler`. If
+            passed, `Reload()` only reloads the runs that it says are due.
+          checkpoint_dir: Optional path of a local directory in which each
+            run keeps a checkpoint of its loaded data, so that it can resume
+            from there after a restart. See `event_accumulator.EventAccumulator`
+            for details.
+          memory_budget_bytes: Optional number of bytes that the sampled
+            data of all runs together may use. If passed, each `Reload()`
+            that leaves more than this loaded downsamples the tags that
+            were least recently queried through `Tensors` or
+            `ScalarColumns` until the data fits. Only supported with
+            thread reload workers.
+
+        Raises:
+          ValueError: If `reload_workers` is not recognized, or if
+            `memory_budget_bytes` is passed with process reload workers.
         """
         logger.info("Event Multiplexer initializing.")
         self._accumulators_mutex = threading.Lock()
         self._accumulators = {}
         self._paths = {}
+        # Logdir path -> `io_wrapper.IncrementalLogdirLister`, so that
+        # repeated calls to `AddRunsFromDirectory` only re-list the
+        # directories that changed.
+        self._logdir_listers = {}
         self._reload_called = False
         self._size_guidance = (
             size_guidance or event_accumulator.DEFAULT_SIZE_GUIDANCE
@@ -117,6 +151,27 @@ class EventMultiplexer:
         self._max_reload_threads = max_reload_threads or 1
         self._event_file_active_filter = event_file_active_filter
         self._detect_file_replacement = detect_file_replacement
+        self._mmap_event_files = mmap_event_files
+        self._reload_scheduler = reload_scheduler
+        self._checkpoint_dir = checkpoint_dir
+        reload_workers = reload_workers or "thread"
+        if reload_workers not in ("thread", "process"):
+            raise ValueError("unrecognized reload_workers: %s" % reload_workers)
+        if memory_budget_bytes is not None and reload_workers == "process":
+            # Mirrored reservoirs must track their workers' item for item.
+            raise ValueError(
+                "memory_budget_bytes is not supported with process reload "
+                "workers"
+            )
+        self._memory_budget_bytes = memory_budget_bytes
+        # `(run, tag)` -> time of the last query for that tag's tensors,
+        # recorded only when there is a memory budget to enforce.
+        self._query_times = {}
+        self._reload_pool = None
+        if reload_workers == "process":
+            self._reload_pool = reload_pool.ProcessReloadPool(
+                self._max_reload_threads, self._AccumulatorKwargs()
+            )
         if run_path_map is not None:
             logger.info(
                 "Event Multplexer doing initialization load for %s",
@@ -159,21 +214,46 @@ class EventMultiplexer:
                         path,
                     )
                 logger.info("Constructing EventAccumulator for %s", path)
-                accumulator = event_accumulator.EventAccumulator(
-                    path,
-                    size_guidance=self._size_guidance,
-                    tensor_size_guidance=self._tensor_size_guidance,
-                    purge_orphaned_data=self.purge_orphaned_data,
-                    event_file_active_filter=self._event_file_active_filter,
-                    detect_file_replacement=self._detect_file_replacement,
+                if self._reload_pool is not None:
+                    accumulator_class = reload_pool.MirroredEventAccumulator
+                else:
+                    accumulator_class = event_accumulator.EventAccumulator
+                accumulator = accumulator_class(
+                    path, **self._AccumulatorKwargs()
                 )
                 self._accumulators[name] = accumulator
                 self._paths[name] = path
         if accumulator:
             if self._reload_called:
-                accumulator.Reload()
+                if self._reload_pool is not None:
+                    self._DeleteAccumulators(
+                        self._reload_pool.Reload([(name, accumulator)])
+                    )
+                else:
+                    accumulator.Reload()
         return self
 
+    def _AccumulatorKwargs(self):
+        return dict(
+            size_guidance=self._size_guidance,
+            tensor_size_guidance=self._tensor_size_guidance,
+            purge_orphaned_data=self.purge_orphaned_data,
+            event_file_active_filter=self._event_file_active_filter,
+            detect_file_replacement=self._detect_file_replacement,
+            mmap_event_files=self._mmap_event_files,
+            checkpoint_dir=self._checkpoint_dir,
+        )
+
+    def _DeleteAccumulators(self, names):
+        with self._accumulators_mutex:
+            for name in names:
+                logger.warning("Deleting accumulator %r", name)
+                del self._accumulators[name]
+                for key in [k for k in list(self._query_times) if k[0] == name]:
+                    del self._query_times[key]
+                if self._reload_scheduler is not None:
+                    self._reload_scheduler.Forget(name)
+
     def AddRunsFromDirectory(self, path, name=None):
         """Load runs from a directory; recursively walks subdirectories.
 
@@ -203,7 +283,11 @@ class EventMultiplexer:
         """
         path = os.path.expanduser(path)
         logger.info("Starting AddRunsFromDirectory: %s", path)
-        for subdir in io_wrapper.GetLogdirSubdirectories(path):
+        lister = self._logdir_listers.get(path)
+        if lister is None:
+            lister = io_wrapper.IncrementalLogdirLister(path)
+            self._logdir_listers[path] = lister
+        for subdir in lister.Subdirectories():
             logger.info("Adding run from directory %s", subdir)
             rpath = os.path.relpath(subdir, path)
             subname = os.path.join(name, rpath) if name else rpath
@@ -211,14 +295,48 @@ class EventMultiplexer:
         logger.info("Done with AddRunsFromDirectory: %s", path)
         return self
 
-    def Reload(self):
-        """Call `Reload` on every `EventAccumulator`."""
+    def Reload(self, runs=None):
+        """Call `Reload` on every `EventAccumulator`.
+
+        Args:
+          runs: Optionally, a collection of run names; only the
+            accumulators of these runs are reloaded. Unknown names are
+            ignored. If not passed and this multiplexer has a reload
+            scheduler, only the runs that are due are reloaded.
+        """
         logger.info("Beginning EventMultiplexer.Reload()")
         self._reload_called = True
+        start_time = time.time()
         # Build a list so we're safe even if the list of accumulators is modified
         # even while we're reloading.
         with self._accumulators_mutex:
-            items = list(self._accumulators.items())
+            if runs is None and self._reload_scheduler is not None:
+                runs = self._reload_scheduler.DueRuns(
+                    self._accumulators, start_time
+                )
+                logger.info(
+                    "Reloading %d of %d runs that are due",
+                    len(runs),
+                    len(self._accumulators),
+                )
+            if runs is None:
+                items = list(self._accumulators.items())
+            else:
+                items = [
+                    (name, self._accumulators[name])
+                    for name in runs
+                    if name in self._accumulators
+                ]
+        if self._reload_pool is not None:
+            logger.info(
+                "Reloading runs in up to %d worker processes",
+                self._max_reload_threads,
+            )
+            names_to_delete = self._reload_pool.Reload(items)
+            self._UpdateReloadSchedule(items, names_to_delete, start_time)
+            self._DeleteAccumulators(names_to_delete)
+            logger.info("Finished with EventMultiplexer.Reload()")
+            return self
         items_queue = queue.Queue()
         for item in items:
             items_queue.put(item)
@@ -262,13 +380,124 @@ class EventMultiplexer:
             )
             Worker()
 
-        with self._accumulators_mutex:
-            for name in names_to_delete:
-                logger.warning("Deleting accumulator %r", name)
-                del self._accumulators[name]
+        self._UpdateReloadSchedule(items, names_to_delete, start_time)
+        self._DeleteAccumulators(names_to_delete)
+        self._EnforceMemoryBudget()
         logger.info("Finished with EventMultiplexer.Reload()")
         return self
 
+    def Close(self):
+        """Stops the worker processes that reload runs, if any.
+
+        The multiplexer must not be reloaded afterward.
+        """
+        if self._reload_pool is not None:
+            self._reload_pool.Close()
+
+    def _UpdateReloadSchedule(self, items, names_to_delete, start_time):
+        if self._reload_scheduler is None:
+            return
+        for name, accumulator in items:
+            if name not in names_to_delete:
+                self._reload_scheduler.Update(
+                    name, accumulator.BytesRead(), start_time
+                )
+
+    def ReloadSchedule(self):
+        """Returns the reload scheduler's state for each run.
+
+        Returns:
+          As `reload_scheduler.ReloadScheduler.Schedule`, or an empty dict
+          if this multiplexer reloads every run each time.
+        """
+        if self._reload_scheduler is None:
+            return {}
+        return self._reload_scheduler.Schedule()
+
+    def _RecordQuery(self, run, tag):
+        if self._memory_budget_bytes is not None:
+            self._query_times[(run, tag)] = time.time()
+
+    def _EnforceMemoryBudget(self):
+        """Downsamples the least recently queried tags to fit the budget.
+
+        Tags are ordered by when their run was last queried, and then by
+        when they were; tags never queried come first. Each pass over
+        them halves each tag's data in turn, stopping as soon as the
+        total fits, so that recently queried tags are only downsampled
+        once all others have been.
+        """
+        budget = self._memory_budget_bytes
+        if budget is None:
+            return
+        with self._accumulators_mutex:
+            items = list(self._accumulators.items())
+        usage = {run: accumulator.MemoryUsage() for run, accumulator in items}
+        total_before = sum(sum(tags.values()) for tags in usage.values())
+        if total_before <= budget:
+            return
+        query_times = dict(self._query_times)
+        run_query_times = {}
+        for (run, _), query_time in query_times.items():
+            run_query_times[run] = max(
+                query_time, run_query_times.get(run, query_time)
+            )
+        order = sorted(
+            (
+                (run_query_times.get(run, 0), query_times.get((run, tag), 0)),
+                run,
+                tag,
+                accumulator,
+            )
+            for run, accumulator in items
+            for tag in usage[run]
+        )
+        total = total_before
+        while total > budget:
+            freed_any = False
+            for _, run, tag, accumulator in order:
+                try:
+                    freed = accumulator.DownsampleTensors(tag)
+                except KeyError:
+                    continue  # The run was reset since it was measured.
+                total -= freed
+                freed_any = freed_any or freed > 0
+                if total <= budget:
+                    break
+            if not freed_any:
+                break
+        logger.warning(
+            "Downsampled least recently queried data from %d to %d bytes "
+            "to fit the memory budget of %d bytes",
+            total_before,
+            total,
+            budget,
+        )
+        if total > budget:
+            logger.warning(
+                "Over the memory budget with one point left per tag; only "
+                "new runs or tags can be loaded"
+            )
+
+    def MemoryUsage(self):
+        """Returns the approximate memory used by each run's data.
+
+        Only the sampled data of each tag is counted; see
+        `event_accumulator.EventAccumulator.MemoryUsage`.
+
+        Returns:
+          A dict mapping each run name to a dict with keys `"bytes"`, the
+          run's total in bytes, and `"tags"`, a dict mapping each tag to
+          its share.
+        """
+        with self._accumulators_mutex:
+            items = list(self._accumulators.items())
+        result = {}
+        for run, accumulator in items:
+            tags = accumulator.MemoryUsage()
+            result[run] = {"bytes": sum(tags.values()), "tags": tags}
+        return result
+
     def PluginAssets(self, plugin_name):
         """Get index of runs and assets for a given plugin.
 
@@ -406,6 +635,28 @@ class EventMultiplexer:
     def Tensors(self, run, tag):
         """Retrieve the tensor events associated with a run and tag.
 
+        Args:
+          run: A string name of the run for which values are retrieved.
+          tag: A string name of the tag for which values are retrieved.
+
+        Raises:
+          KeyError: If the run is not found, or the tag is not available for
+            the given run.
+
+        Returns:
+          An array of `event_accumulator.TensorEvent`s.
+        """
+        accumulator = self.GetAccumulator(run)
+        self._RecordQuery(run, tag)
+        return accumulator.Tensors(tag)
+
+    def PeekTensors(self, run, tag):
+        """Retrieve the tensor events of a run and tag, as for listing.
+
+        As `Tensors`, except that this does not count as a query of the
+        tag's data, so it does not keep the data from being the first to
+        be downsampled under a memory budget.
+
         Args:
           run: A string name of the run for which values are retrieved.
           tag: A string name of the tag for which values are retrieved.
@@ -420,6 +671,63 @@ class EventMultiplexer:
         accumulator = self.GetAccumulator(run)
         return accumulator.Tensors(tag)
 
+    def TensorsVersion(self, run, tag):
+        """Retrieve a token that changes whenever the tensor events may change.
+
+        Args:
+          run: A string name of the run for which values are retrieved.
+          tag: A string name of the tag for which values are retrieved.
+
+        Raises:
+          KeyError: If the run is not found, or the tag is not available for
+            the given run.
+
+        Returns:
+          An `int`; see `event_accumulator.EventAccumulator.TensorsVersion`.
+        """
+        accumulator = self.GetAccumulator(run)
+        return accumulator.TensorsVersion(tag)
+
+    def ScalarColumns(self, run, tag):
+        """Retrieve the points of a scalar time series as arrays.
+
+        Args:
+          run: A string name of the run for which values are retrieved.
+          tag: A string name of the tag for which values are retrieved.
+
+        Raises:
+          KeyError: If the run is not found, or the tag is not available for
+            the given run.
+
+        Returns:
+          A tuple `(steps, wall_times, values)` of 1-D NumPy arrays; see
+          `event_accumulator.EventAccumulator.ScalarColumns`.
+        """
+        accumulator = self.GetAccumulator(run)
+        self._RecordQuery(run, tag)
+        return accumulator.ScalarColumns(tag)
+
+    def MaxStepAndWallTime(self, run, tag):
+        """Retrieve the latest step and wall time of a time series.
+
+        Listing time series is not a query of their data, so this does
+        not count towards keeping the tag's data under a memory budget.
+
+        Args:
+          run: A string name of the run for which values are retrieved.
+          tag: A string name of the tag for which values are retrieved.
+
+        Raises:
+          KeyError: If the run is not found, or the tag is not available for
+            the given run.
+
+        Returns:
+          A tuple `(max_step, max_wall_time)`; see
+          `event_accumulator.EventAccumulator.MaxStepAndWallTime`.
+        """
+        accumulator = self.GetAccumulator(run)
+        return accumulator.MaxStepAndWallTime(tag)
+
     def PluginRunToTagToContent(self, plugin_name):
         """Returns a 2-layer dictionary of the form {run: {tag: content}}.
 
@@ -444,6 +752,32 @@ class EventMultiplexer:
             mapping[run] = tag_to_content
         return mapping
 
+    def PluginRunToTagToMetadata(self, plugin_name, data_class):
+        """Returns summary metadata for a plugin and data class.
+
+        Unlike filtering `AllSummaryMetadata`, this does not visit tags
+        for other plugins or data classes.
+
+        Args:
+          plugin_name: The name of the plugin for which to fetch metadata.
+          data_class: A `summary_pb2.DataClass` value.
+
+        Returns:
+          A nested dict `d` such that `d[run][tag]` is a `SummaryMetadata`
+          proto with the given plugin name and data class. Runs without
+          any such tags are omitted.
+        """
+        with self._accumulators_mutex:
+            items = list(self._accumulators.items())
+        mapping = {}
+        for run, accumulator in items:
+            tag_to_metadata = accumulator.PluginTagToMetadata(
+                plugin_name, data_class
+            )
+            if tag_to_metadata:
+                mapping[run] = tag_to_metadata
+        return mapping
+
     def ActivePlugins(self):
         """Return a set of plugins with summary data.
 
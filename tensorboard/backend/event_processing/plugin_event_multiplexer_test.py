@@ -18,6 +18,7 @@ import os
 import os.path
 import queue
 import shutil
+import time
 
 import tensorflow as tf
 
@@ -27,6 +28,7 @@ from tensorboard.backend.event_processing import (
 from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
 )
+from tensorboard.backend.event_processing import reload_scheduler
 from tensorboard.util import test_util
 
 
@@ -70,6 +72,9 @@ class _FakeAccumulator:
     def GetSourceWriter(self):
         return "%s_writer" % self._path
 
+    def BytesRead(self):
+        return 0
+
     def _TagHelper(self, tag_name, enum):
         if tag_name not in self.Tags()[enum]:
             raise KeyError
@@ -141,6 +146,25 @@ class EventMultiplexerTest(tf.test.TestCase):
         self.assertTrue(x.GetAccumulator("run1").reload_called)
         self.assertTrue(x.GetAccumulator("run2").reload_called)
 
+    def testReloadRuns(self):
+        x = event_multiplexer.EventMultiplexer(
+            {"run1": "path1", "run2": "path2"}
+        )
+        x.Reload(runs=["run2", "nonexistent"])
+        self.assertFalse(x.GetAccumulator("run1").reload_called)
+        self.assertTrue(x.GetAccumulator("run2").reload_called)
+
+    def testReloadWithScheduler(self):
+        scheduler = reload_scheduler.ReloadScheduler(5, 60)
+        x = event_multiplexer.EventMultiplexer(
+            {"run1": "path1", "run2": "path2"}, reload_scheduler=scheduler
+        )
+        scheduler.Update("run1", 0, time.time())
+        x.Reload()
+        self.assertFalse(x.GetAccumulator("run1").reload_called)
+        self.assertTrue(x.GetAccumulator("run2").reload_called)
+        self.assertCountEqual(["run1", "run2"], x.ReloadSchedule())
+
     def testGetSourceWriter(self):
         x = event_multiplexer.EventMultiplexer(
             {"run1": "path1", "run2": "path2"}
@@ -461,6 +485,94 @@ class EventMultiplexerWithRealAccumulatorTest(tf.test.TestCase):
         x.Reload()
         self.assertNotIn("run2", x.Runs().keys())
 
+    def testReloadWithWorkerProcesses(self):
+        x = event_multiplexer.EventMultiplexer(
+            max_reload_threads=2, reload_workers="process"
+        )
+        self.addCleanup(x.Close)
+        logdir = self.get_temp_dir()
+        for name in ("run1", "run2"):
+            with test_util.FileWriter(os.path.join(logdir, name)) as writer:
+                writer.add_test_summary("loss", simple_value=1.0, step=1)
+                writer.add_test_summary("loss", simple_value=0.5, step=2)
+        x.AddRunsFromDirectory(logdir)
+        x.Reload()
+        self.assertEqual([e.step for e in x.Tensors("run1", "loss")], [1, 2])
+        self.assertIn("scalars", x.ActivePlugins())
+
+        # Runs added after the first reload are loaded immediately.
+        with test_util.FileWriter(os.path.join(logdir, "run3")) as writer:
+            writer.add_test_summary("loss", step=3)
+        x.AddRun(os.path.join(logdir, "run3"), "run3")
+        self.assertEqual([e.step for e in x.Tensors("run3", "loss")], [3])
+
+        shutil.rmtree(os.path.join(logdir, "run2"))
+        x.Reload()
+        self.assertCountEqual(x.Runs().keys(), ["run1", "run3"])
+
+    def testCloseStopsWorkerProcesses(self):
+        x = event_multiplexer.EventMultiplexer(reload_workers="process")
+        self.addCleanup(x.Close)
+        logdir = self.get_temp_dir()
+        with test_util.FileWriter(os.path.join(logdir, "run1")) as writer:
+            writer.add_test_summary("loss", simple_value=1.0, step=1)
+        x.AddRunsFromDirectory(logdir)
+        x.Reload()
+        (process, _) = x._reload_pool._workers[0]
+        self.assertTrue(process.is_alive())
+        x.Close()
+        self.assertFalse(process.is_alive())
+        # Without worker processes, there is nothing to stop.
+        event_multiplexer.EventMultiplexer().Close()
+
+    def testMemoryBudget(self):
+        item_bytes = event_accumulator._SCALAR_ITEM_BYTES
+        x = event_multiplexer.EventMultiplexer(
+            size_guidance=event_accumulator.STORE_EVERYTHING_SIZE_GUIDANCE,
+            memory_budget_bytes=150 * item_bytes,
+        )
+        logdir = self.get_temp_dir()
+
+        def write(run, steps, suffix):
+            with test_util.FileWriter(
+                os.path.join(logdir, run), filename_suffix=suffix
+            ) as writer:
+                for step in steps:
+                    writer.add_test_summary("loss", step=step)
+
+        write("run1", range(100), ".a")
+        write("run2", range(100), ".a")
+        x.AddRunsFromDirectory(logdir)
+        with self.assertLogs(level="WARNING"):
+            x.Reload()
+        # Neither run was queried yet, so the first is downsampled.
+        usage = x.MemoryUsage()
+        self.assertEqual(usage["run1"]["bytes"], 50 * item_bytes)
+        self.assertEqual(usage["run1"]["tags"], {"loss": 50 * item_bytes})
+        self.assertEqual(usage["run2"]["bytes"], 100 * item_bytes)
+        steps = [e.step for e in x.Tensors("run1", "loss")]
+        self.assertLen(steps, 50)
+        self.assertEqual((steps[0], steps[-1]), (0, 99))
+
+        # Now the second run is the least recently queried.
+        write("run2", range(100, 200), ".b")
+        with self.assertLogs(level="WARNING"):
+            x.Reload()
+        usage = x.MemoryUsage()
+        self.assertEqual(usage["run1"]["bytes"], 50 * item_bytes)
+        self.assertEqual(usage["run2"]["bytes"], 100 * item_bytes)
+        self.assertEqual(x.Tensors("run2", "loss")[-1].step, 199)
+
+    def testMemoryBudgetWithWorkerProcesses(self):
+        with self.assertRaisesRegex(ValueError, "memory_budget_bytes"):
+            event_multiplexer.EventMultiplexer(
+                reload_workers="process", memory_budget_bytes=1
+            )
+
+    def testUnrecognizedReloadWorkers(self):
+        with self.assertRaisesRegex(ValueError, "reload_workers"):
+            event_multiplexer.EventMultiplexer(reload_workers="fiber")
+
     def _add3RunsToMultiplexer(self, logdir, multiplexer):
         """Creates and adds 3 runs to the multiplexer."""
         run1_dir = os.path.join(logdir, "run1")
@@ -0,0 +1,160 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for `EventMultiplexer.Reload` with threads and processes.
+
+Writes a logdir of runs containing scalar events, then loads it from
+scratch with a fresh multiplexer for each worker count, once with
+reload threads and once with reload worker processes. Times include
+starting the worker processes.
+
+Sample results on a cloud VM with a single core (Python 3.11, 8 runs of
+5000 events with 4 scalars each):
+
+    WORKERS  THREAD_SECS  PROCESS_SECS  THREAD_SPEEDUP  PROCESS_SPEEDUP
+          1      11.1268       12.3674          1.0000           0.8997
+          2       8.3145       15.2935          1.3382           0.7276
+          4       8.9121       25.5399          1.2485           0.4357
+          8       9.1961       43.2701          1.2099           0.2571
+
+With one core, worker processes cannot run concurrently, and each one
+pays for its own interpreter start-up and imports (about 4 seconds when
+TensorFlow is installed), so process reloading only loses here. Run this
+on a multi-core machine, with more data per run, to measure the speedup
+that workers give once parsing rather than start-up dominates.
+"""
+
+
+import os
+import tempfile
+import time
+
+from absl import app
+from absl import flags
+from absl import logging
+
+from tensorboard.backend.event_processing import (
+    plugin_event_multiplexer as event_multiplexer,
+)
+from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.summary.writer import record_writer
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("runs", 8, "Number of runs in the logdir.")
+flags.DEFINE_integer("events", 5000, "Number of events in each run.")
+flags.DEFINE_integer("tags", 4, "Number of scalar tags in each event.")
+
+
+def write_run(logdir, name, num_events, num_tags):
+    """Writes one run of scalar events under `logdir`."""
+    run_dir = os.path.join(logdir, name)
+    os.makedirs(run_dir)
+    filename = os.path.join(run_dir, "events.out.tfevents.0.benchmark")
+    with open(filename, "wb") as f:
+        writer = record_writer.RecordWriter(f)
+        writer.write(
+            event_pb2.Event(
+                wall_time=1.6e9, file_version="brain.Event:2"
+            ).SerializeToString()
+        )
+        for step in range(num_events):
+            event = event_pb2.Event(
+                step=step,
+                wall_time=1.6e9 + step,
+                summary=summary_pb2.Summary(
+                    value=[
+                        summary_pb2.Summary.Value(
+                            tag="tag%d" % i, simple_value=step * (i + 1)
+                        )
+                        for i in range(num_tags)
+                    ]
+                ),
+            )
+            writer.write(event.SerializeToString())
+
+
+def bench(logdir, reload_workers, num_workers):
+    """Loads `logdir` with a fresh multiplexer; returns elapsed seconds."""
+    multiplexer = event_multiplexer.EventMultiplexer(
+        max_reload_threads=num_workers, reload_workers=reload_workers
+    )
+    start_time = time.perf_counter()
+    multiplexer.AddRunsFromDirectory(logdir)
+    multiplexer.Reload()
+    elapsed = time.perf_counter() - start_time
+    multiplexer.Close()
+    return elapsed
+
+
+def _format_line(headers, fields):
+    """Format a line of a table.
+
+    Arguments:
+      headers: A list of strings that are used as the table headers.
+      fields: A list of the same length as `headers` where `fields[i]` is
+        the entry for `headers[i]` in this row. Elements can be of
+        arbitrary types. Pass `headers` to print the header row.
+
+    Returns:
+      A pretty string.
+    """
+    assert len(fields) == len(headers), (fields, headers)
+    fields = [
+        "%2.4f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+
+    headers = (
+        "WORKERS",
+        "THREAD_SECS",
+        "PROCESS_SECS",
+        "THREAD_SPEEDUP",
+        "PROCESS_SPEEDUP",
+    )
+    with tempfile.TemporaryDirectory() as logdir:
+        for i in range(FLAGS.runs):
+            write_run(logdir, "run%02d" % i, FLAGS.events, FLAGS.tags)
+        logger.info(_format_line(headers, headers))
+        baseline = None
+        for num_workers in [1, 2, 4, 8]:
+            thread_secs = bench(logdir, "thread", num_workers)
+            process_secs = bench(logdir, "process", num_workers)
+            if baseline is None:
+                baseline = thread_secs
+            fields = (
+                num_workers,
+                thread_secs,
+                process_secs,
+                baseline / thread_secs,
+                baseline / process_secs,
+            )
+            logger.info(_format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
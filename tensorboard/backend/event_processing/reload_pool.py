@@ -0,0 +1,501 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Reloads runs in a pool of worker processes.
+
+Parsing event files is CPU-bound and holds the GIL, so reloading runs on
+several threads does not scale past a single core. A `ProcessReloadPool`
+instead assigns each run to one of a fixed set of worker processes. The
+worker owns an ordinary `EventAccumulator` for each of its runs and does
+all file reading, proto parsing and reservoir sampling. After each
+reload it sends the parent only what changed: newly retained reservoir
+items (as serialized tensors), the positions of items that were evicted,
+and any new metadata. The parent applies these updates to a
+`MirroredEventAccumulator`, which serves reads exactly like an
+`EventAccumulator` but never touches the event files itself.
+"""
+
+import collections
+import dataclasses
+import multiprocessing
+import signal
+import threading
+
+from typing import Dict, List, Optional, Tuple
+
+from tensorboard.backend.event_processing import directory_watcher
+from tensorboard.backend.event_processing import (
+    plugin_event_accumulator as event_accumulator,
+)
+from tensorboard.backend.event_processing import reservoir
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.compat.proto import tensor_pb2
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+# Status codes for the per-run results sent back by a worker.
+_OK = "ok"
+_DELETED = "deleted"
+_ERROR = "error"
+
+
+@dataclasses.dataclass(frozen=True)
+class RunUpdate:
+    """Changes to a run's accumulated data since the previous update.
+
+    Attributes:
+      reset: If true, the receiver must discard all state for the run
+        before applying this update; the worker started over from an
+        empty accumulator.
+      first_event_timestamp: As `EventAccumulator.FirstEventTimestamp`,
+        or `None` if no event has been read yet.
+      source_writer: As `EventAccumulator.GetSourceWriter`.
+      file_version: As `EventAccumulator.file_version`.
+      most_recent_step: As `EventAccumulator.most_recent_step`.
+      most_recent_wall_time: As `EventAccumulator.most_recent_wall_time`.
+      bytes_read: As `EventAccumulator.BytesRead`.
+      graph: Serialized `GraphDef`, or `None` if unchanged.
+      meta_graph: Serialized `MetaGraphDef`, or `None` if unchanged.
+      tagged_metadata: Dict mapping tags to serialized `RunMetadata`
+        protos, for tags that are new or changed.
+      summary_metadata: Dict mapping tags to serialized
+        `SummaryMetadata` protos, for tags first seen since the previous
+        update.
+      tensors: Dict mapping tags whose reservoir changed to a pair
+        `(removed, added)`. `removed` lists the indices (into the
+        previously sent reservoir contents) of the items that were
+        evicted, and `added` lists `(wall_time, step, tensor)` triples,
+        with `tensor` a serialized `TensorProto`, that were appended.
+    """
+
+    reset: bool
+    first_event_timestamp: Optional[float]
+    source_writer: Optional[str]
+    file_version: Optional[float]
+    most_recent_step: int
+    most_recent_wall_time: float
+    bytes_read: int
+    graph: Optional[bytes]
+    meta_graph: Optional[bytes]
+    tagged_metadata: Dict[str, bytes]
+    summary_metadata: Dict[str, bytes]
+    tensors: Dict[str, Tuple[List[int], List[Tuple[float, int, bytes]]]]
+
+
+class MirroredEventAccumulator(event_accumulator.EventAccumulator):
+    """An `EventAccumulator` whose data is loaded by a worker process.
+
+    Reads behave as for an `EventAccumulator`. `Reload` is a no-op:
+    instead, the owning `ProcessReloadPool` calls `ApplyUpdate` with the
+    changes observed by the worker. Since the worker retains only the
+    sampled items for each tag, the mirrored reservoirs are unbounded
+    and simply track the worker's contents. As in `EventAccumulator`,
+    scalar time series are mirrored into `reservoir.ScalarReservoir`s.
+    """
+
+    def __init__(self, path, **kwargs):
+        super().__init__(path, **kwargs)
+        # Release any file handles that the generator holds: only the
+        # worker process reads the event files for this run.
+        self._generator = None
+        self._bytes_read = 0
+
+    def Reload(self):
+        """Does nothing; data arrives through `ApplyUpdate`."""
+        return self
+
+    def FirstEventTimestamp(self):
+        """Returns the timestamp in seconds of the first event.
+
+        Unlike `EventAccumulator.FirstEventTimestamp`, this never reads
+        from disk.
+
+        Raises:
+          ValueError: If the worker has not yet loaded any events.
+        """
+        if self._first_event_timestamp is None:
+            raise ValueError("No event timestamp could be found")
+        return self._first_event_timestamp
+
+    def GetSourceWriter(self) -> Optional[str]:
+        """Returns the name of the event writer, if known yet."""
+        return self._source_writer
+
+    def BytesRead(self):
+        """Returns the bytes read by the worker as of its last update."""
+        return self._bytes_read
+
+    def ApplyUpdate(self, update):
+        """Applies a `RunUpdate` produced by a reload worker."""
+        if update.reset:
+            self._Clear()
+        self._first_event_timestamp = update.first_event_timestamp
+        self._source_writer = update.source_writer
+        self.file_version = update.file_version
+        self.most_recent_step = update.most_recent_step
+        self.most_recent_wall_time = update.most_recent_wall_time
+        self._bytes_read = update.bytes_read
+        if update.graph is not None:
+            self._graph = update.graph
+        if update.meta_graph is not None:
+            self._meta_graph = update.meta_graph
+        self._tagged_metadata.update(update.tagged_metadata)
+
+        for tag, serialized in update.summary_metadata.items():
+            self._AddSummaryMetadata(
+                tag, summary_pb2.SummaryMetadata.FromString(serialized)
+            )
+
+        key = event_accumulator._TENSOR_RESERVOIR_KEY
+        for tag, (removed, added) in update.tensors.items():
+            with self._tensors_by_tag_lock:
+                tag_reservoir = self.tensors_by_tag.get(tag)
+                if tag_reservoir is None:
+                    first = (
+                        tensor_pb2.TensorProto.FromString(added[0][2])
+                        if added
+                        else None
+                    )
+                    if first is not None and self._UseScalarReservoir(
+                        tag, first
+                    ):
+                        self._scalar_dtypes[tag] = first.dtype
+                        tag_reservoir = reservoir.ScalarReservoir(0)
+                    else:
+                        tag_reservoir = reservoir.Reservoir(0)
+                    self.tensors_by_tag[tag] = tag_reservoir
+            if removed:
+                # Items are filtered in order, so count them off by index.
+                removed = frozenset(removed)
+                positions = iter(range(len(tag_reservoir.Items(key))))
+                tag_reservoir.FilterItems(
+                    lambda _: next(positions) not in removed, key
+                )
+            scalar = isinstance(tag_reservoir, reservoir.ScalarReservoir)
+            for wall_time, step, tensor in added:
+                if scalar:
+                    # The worker has already dropped any non-scalar values.
+                    value = event_accumulator._ScalarValue(
+                        tensor_pb2.TensorProto.FromString(tensor)
+                    )
+                    item = reservoir.ScalarItem(step, wall_time, value)
+                else:
+                    # Keep the tensor serialized, as the worker does.
+                    item = event_accumulator._SerializedTensorEvent(
+                        wall_time, step, tensor
+                    )
+                tag_reservoir.AddItem(key, item)
+
+
+class ProcessReloadPool:
+    """Reloads runs in a fixed set of worker processes.
+
+    Each run is pinned to one worker the first time that it is reloaded,
+    so that the worker can keep its accumulator (and open event files)
+    across reloads. New runs go to the worker with the fewest runs.
+
+    Workers are started lazily and restarted if they die; a restarted
+    worker reloads its runs from scratch.
+    """
+
+    def __init__(self, num_workers, accumulator_kwargs, mp_context=None):
+        """Creates a pool; no processes are started until `Reload`.
+
+        Args:
+          num_workers: Positive integer number of worker processes.
+          accumulator_kwargs: Keyword arguments for the `EventAccumulator`
+            constructor in the workers. Must be picklable.
+          mp_context: Optional `multiprocessing` context. Defaults to the
+            "spawn" context, since the parent is multithreaded and forking
+            it is not safe.
+        """
+        if num_workers < 1:
+            raise ValueError(
+                "num_workers must be positive, was %s" % num_workers
+            )
+        self._accumulator_kwargs = dict(accumulator_kwargs)
+        self._context = mp_context or multiprocessing.get_context("spawn")
+        self._workers = [None] * num_workers
+        self._assignments = {}
+        # Guards `_workers` and `_assignments`, and serializes reloads so
+        # that requests and responses on each pipe stay paired.
+        self._lock = threading.Lock()
+
+    def Reload(self, items):
+        """Reloads the given runs and applies the results.
+
+        Args:
+          items: A list of `(name, accumulator)` pairs, where each
+            `accumulator` is a `MirroredEventAccumulator`.
+
+        Returns:
+          A set of names of the runs whose directories have been deleted.
+        """
+        names_to_delete = set()
+        with self._lock:
+            batches = [[] for _ in self._workers]
+            for name, accumulator in items:
+                batches[self._Assign(name)].append((name, accumulator))
+            pending = []
+            for index, batch in enumerate(batches):
+                if not batch:
+                    continue
+                request = [(name, acc.path) for (name, acc) in batch]
+                try:
+                    self._Worker(index).send(request)
+                except (OSError, ValueError) as e:
+                    logger.error(
+                        "Unable to reach reload worker %d: %s", index, e
+                    )
+                    self._Stop(index)
+                    continue
+                pending.append((index, batch))
+            for index, batch in pending:
+                try:
+                    results = self._workers[index][1].recv()
+                except (OSError, EOFError) as e:
+                    logger.error(
+                        "Reload worker %d exited unexpectedly: %r", index, e
+                    )
+                    self._Stop(index)
+                    continue
+                for (name, accumulator), (status, payload) in zip(
+                    batch, results
+                ):
+                    if status == _OK:
+                        accumulator.ApplyUpdate(payload)
+                    elif status == _DELETED:
+                        del self._assignments[name]
+                        names_to_delete.add(name)
+                    else:
+                        logger.error(
+                            "Unable to reload accumulator %r: %s", name, payload
+                        )
+        return names_to_delete
+
+    def Close(self):
+        """Stops all worker processes."""
+        with self._lock:
+            for index in range(len(self._workers)):
+                self._Stop(index)
+
+    def _Assign(self, name):
+        index = self._assignments.get(name)
+        if index is None:
+            load = collections.Counter(self._assignments.values())
+            index = min(range(len(self._workers)), key=lambda i: load[i])
+            self._assignments[name] = index
+        return index
+
+    def _Worker(self, index):
+        """Returns the parent end of the pipe to a live worker."""
+        if self._workers[index] is None:
+            parent_conn, child_conn = self._context.Pipe()
+            process = self._context.Process(
+                target=_WorkerMain,
+                args=(child_conn, self._accumulator_kwargs),
+                name="Reloader %d" % index,
+            )
+            # Best-effort cleanup: daemonic children are terminated when
+            # the parent exits.
+            process.daemon = True
+            process.start()
+            child_conn.close()
+            self._workers[index] = (process, parent_conn)
+        return self._workers[index][1]
+
+    def _Stop(self, index):
+        worker = self._workers[index]
+        if worker is None:
+            return
+        self._workers[index] = None
+        process, conn = worker
+        try:
+            conn.send(None)
+        except (OSError, ValueError):
+            pass
+        conn.close()
+        process.join(timeout=1)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+
+class _WorkerAccumulator(event_accumulator.EventAccumulator):
+    """An `EventAccumulator` that records which tags changed."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty_tags = set()
+
+    def _ProcessTensor(self, tag, wall_time, step, tensor):
+        super()._ProcessTensor(tag, wall_time, step, tensor)
+        self.dirty_tags.add(tag)
+
+    def _ProcessValue(self, tag, wall_time, step, value, migrate):
+        taken = super()._ProcessValue(tag, wall_time, step, value, migrate)
+        if taken:
+            self.dirty_tags.add(tag)
+        return taken
+
+    def _RestoreCheckpointState(self, state):
+        super()._RestoreCheckpointState(state)
+        self.dirty_tags.update(self.tensors_by_tag)
+
+    def _UseScalarReservoir(self, tag, tensor):
+        # Diffing relies on reservoir items keeping their identity between
+        # reloads; the mirror in the parent still stores scalars compactly.
+        return False
+
+    def _Purge(self, event, by_tags):
+        super()._Purge(event, by_tags)
+        if by_tags:
+            self.dirty_tags.update(
+                value.tag
+                for value in event.summary.value
+                if value.tag in self.tensors_by_tag
+            )
+        else:
+            self.dirty_tags.update(self.tensors_by_tag)
+
+
+class _WorkerRun:
+    """Worker-side state for one run: the accumulator and what was sent."""
+
+    def __init__(self, path, accumulator_kwargs):
+        self.path = path
+        self._accumulator = _WorkerAccumulator(path, **accumulator_kwargs)
+        self._reset = True
+        self._sent_graph = None
+        self._sent_meta_graph = None
+        self._sent_tagged_metadata = {}
+        self._sent_summary_metadata = set()
+        self._sent_items = {}
+
+    def Reload(self):
+        """Reloads the run and returns a `RunUpdate` of what changed."""
+        acc = self._accumulator
+        acc.Reload()
+
+        graph = acc._graph if acc._graph is not self._sent_graph else None
+        self._sent_graph = acc._graph
+        meta_graph = acc._meta_graph
+        if meta_graph is self._sent_meta_graph:
+            meta_graph = None
+        self._sent_meta_graph = acc._meta_graph
+
+        tagged_metadata = {}
+        for tag, value in acc._tagged_metadata.items():
+            if self._sent_tagged_metadata.get(tag) is not value:
+                tagged_metadata[tag] = value
+                self._sent_tagged_metadata[tag] = value
+
+        summary_metadata = {}
+        for tag, metadata in acc.summary_metadata.items():
+            if tag not in self._sent_summary_metadata:
+                summary_metadata[tag] = metadata.SerializeToString()
+                self._sent_summary_metadata.add(tag)
+
+        tensors = {}
+        for tag in acc.dirty_tags:
+            items = acc.Tensors(tag)
+            removed, added = _Diff(self._sent_items.get(tag, ()), items)
+            if removed or added:
+                tensors[tag] = (
+                    removed,
+                    [(e.wall_time, e.step, _Serialized(e)) for e in added],
+                )
+            self._sent_items[tag] = items
+        acc.dirty_tags.clear()
+
+        update = RunUpdate(
+            reset=self._reset,
+            first_event_timestamp=acc._first_event_timestamp,
+            source_writer=acc._source_writer,
+            file_version=acc.file_version,
+            most_recent_step=acc.most_recent_step,
+            most_recent_wall_time=acc.most_recent_wall_time,
+            bytes_read=acc.BytesRead(),
+            graph=graph,
+            meta_graph=meta_graph,
+            tagged_metadata=tagged_metadata,
+            summary_metadata=summary_metadata,
+            tensors=tensors,
+        )
+        self._reset = False
+        return update
+
+
+def _Diff(previous, current):
+    """Computes how a reservoir's contents changed.
+
+    Reservoirs only ever drop items or append new ones, so `current`
+    consists of the surviving items of `previous`, in their original
+    order, followed by the newly added items.
+
+    Returns:
+      A pair `(removed, added)`: the indices into `previous` of the items
+      that no longer appear in `current`, and the new items of `current`.
+    """
+    positions = {id(item): i for (i, item) in enumerate(previous)}
+    kept = set()
+    added = []
+    for item in current:
+        i = positions.get(id(item))
+        if i is None:
+            added.append(item)
+        else:
+            kept.add(i)
+    removed = [i for i in range(len(previous)) if i not in kept]
+    return (removed, added)
+
+
+def _Serialized(tensor_event):
+    """Returns the serialized tensor of a `TensorEvent`."""
+    if isinstance(tensor_event, event_accumulator._SerializedTensorEvent):
+        return tensor_event.serialized_tensor
+    return tensor_event.tensor_proto.SerializeToString()
+
+
+def _WorkerMain(conn, accumulator_kwargs):
+    """Serves reload requests from the parent until told to stop."""
+    # Interrupts are delivered to the whole process group; let the parent
+    # decide when to shut its workers down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    runs = {}
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        results = []
+        for name, path in request:
+            run = runs.get(name)
+            if run is None or run.path != path:
+                run = _WorkerRun(path, accumulator_kwargs)
+                runs[name] = run
+            try:
+                results.append((_OK, run.Reload()))
+            except (OSError, IOError) as e:
+                results.append((_ERROR, str(e)))
+            except directory_watcher.DirectoryDeletedError:
+                del runs[name]
+                results.append((_DELETED, None))
+            except Exception as e:
+                results.append((_ERROR, "%s: %s" % (type(e).__name__, e)))
+        conn.send(results)
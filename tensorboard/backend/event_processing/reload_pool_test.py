@@ -0,0 +1,238 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for reload_pool."""
+
+
+import os
+import pickle
+import shutil
+
+import tensorflow as tf
+
+from tensorboard.backend.event_processing import (
+    plugin_event_accumulator as event_accumulator,
+)
+from tensorboard.backend.event_processing import reload_pool
+from tensorboard.compat.proto import event_pb2
+from tensorboard.util import test_util
+
+
+_SIZE_GUIDANCE = {event_accumulator.TENSORS: 5}
+
+
+def _Contents(accumulator):
+    """Returns the tensors of an accumulator as plain comparable data."""
+    return {
+        tag: [
+            (e.wall_time, e.step, e.tensor_proto.SerializeToString())
+            for e in accumulator.Tensors(tag)
+        ]
+        for tag in accumulator.Tags()[event_accumulator.TENSORS]
+    }
+
+
+def _SessionStart(wall_time, step):
+    return event_pb2.Event(
+        wall_time=wall_time,
+        step=step,
+        session_log=event_pb2.SessionLog(status=event_pb2.SessionLog.START),
+    )
+
+
+class DiffTest(tf.test.TestCase):
+    def testUnchanged(self):
+        items = [object(), object()]
+        self.assertEqual(reload_pool._Diff(items, list(items)), ([], []))
+
+    def testAppendAndEvict(self):
+        a, b, c, d, e = (object() for _ in range(5))
+        removed, added = reload_pool._Diff([a, b, c], [a, c, d, e])
+        self.assertEqual(removed, [1])
+        self.assertEqual(added, [d, e])
+
+    def testReplaceAll(self):
+        a, b, c = (object() for _ in range(3))
+        removed, added = reload_pool._Diff([a, b], [c])
+        self.assertEqual(removed, [0, 1])
+        self.assertEqual(added, [c])
+
+
+class MirrorTest(tf.test.TestCase):
+    """Runs the worker side in-process and checks that mirrors agree."""
+
+    def setUp(self):
+        super().setUp()
+        self.logdir = self.get_temp_dir()
+        self.kwargs = dict(size_guidance=_SIZE_GUIDANCE)
+        self.worker_run = reload_pool._WorkerRun(self.logdir, self.kwargs)
+        self.mirror = reload_pool.MirroredEventAccumulator(
+            self.logdir, **self.kwargs
+        )
+
+    def _Sync(self):
+        update = self.worker_run.Reload()
+        # Updates cross a process boundary, so they must survive pickling.
+        self.mirror.ApplyUpdate(pickle.loads(pickle.dumps(update)))
+        return update
+
+    def testTracksReservoirSampling(self):
+        with test_util.FileWriter(self.logdir) as writer:
+            for step in range(100):
+                writer.add_test_summary("a", simple_value=step, step=step)
+                if step % 10 == 0:
+                    writer.add_test_summary("b", simple_value=step, step=step)
+                if step % 7 == 0:
+                    writer.flush()
+                    self._Sync()
+        self._Sync()
+        expected = _Contents(self.worker_run._accumulator)
+        self.assertLen(expected["a"], 5)
+        self.assertEqual(expected, _Contents(self.mirror))
+        self.assertEqual(self.mirror.Tensors("a")[-1].step, 99)
+        self.assertEqual(
+            self.mirror.SummaryMetadata("a"),
+            self.worker_run._accumulator.SummaryMetadata("a"),
+        )
+        self.assertEqual(
+            self.mirror.PluginTagToContent("scalars").keys(), {"a", "b"}
+        )
+        self.assertIsNotNone(self.mirror.FirstEventTimestamp())
+        self.assertEqual(self.mirror.most_recent_step, 99)
+
+    def testUnchangedTagsAreNotResent(self):
+        with test_util.FileWriter(self.logdir) as writer:
+            writer.add_test_summary("a", step=1)
+            writer.add_test_summary("b", step=1)
+            writer.flush()
+            self.assertCountEqual(self._Sync().tensors, ["a", "b"])
+            writer.add_test_summary("b", step=2)
+            writer.flush()
+            update = self._Sync()
+        self.assertEqual(list(update.tensors), ["b"])
+        self.assertEqual(update.tensors["b"][0], [])
+        self.assertLen(update.tensors["b"][1], 1)
+        self.assertEqual(update.summary_metadata, {})
+
+    def testPurge(self):
+        with test_util.FileWriter(self.logdir) as writer:
+            writer.add_event(_SessionStart(wall_time=1, step=0))
+            for step in range(3):
+                writer.add_test_summary("a", step=step)
+            writer.flush()
+            self._Sync()
+            # A second session start at step 1 purges steps 1 and later.
+            writer.add_event(_SessionStart(wall_time=2, step=1))
+            writer.add_test_summary("a", step=1)
+        self._Sync()
+        self.assertEqual([e.step for e in self.mirror.Tensors("a")], [0, 1])
+        self.assertEqual(
+            _Contents(self.worker_run._accumulator), _Contents(self.mirror)
+        )
+
+    def testGraph(self):
+        with test_util.FileWriter(self.logdir) as writer:
+            writer.add_event(
+                event_pb2.Event(wall_time=1, graph_def=b"\x0a\x03\x0a\x01x")
+            )
+        self.assertEqual(self._Sync().graph, b"\x0a\x03\x0a\x01x")
+        self.assertEqual(self.mirror.SerializedGraph(), b"\x0a\x03\x0a\x01x")
+        self.assertIsNone(self._Sync().graph)
+        self.assertTrue(self.mirror.Tags()[event_accumulator.GRAPH])
+
+    def testResetDiscardsState(self):
+        with test_util.FileWriter(self.logdir) as writer:
+            writer.add_test_summary("a", step=1)
+        self._Sync()
+        self.worker_run = reload_pool._WorkerRun(self.logdir, self.kwargs)
+        shutil.rmtree(self.logdir)
+        os.mkdir(self.logdir)
+        with test_util.FileWriter(self.logdir) as writer:
+            writer.add_test_summary("b", step=1)
+        self.assertTrue(self._Sync().reset)
+        self.assertEqual(self.mirror.Tags()[event_accumulator.TENSORS], ["b"])
+
+    def testResumedWorkerSendsCheckpointedData(self):
+        self.kwargs["checkpoint_dir"] = os.path.join(
+            self.get_temp_dir(), "checkpoints"
+        )
+        self.worker_run = reload_pool._WorkerRun(self.logdir, self.kwargs)
+        with test_util.FileWriter(self.logdir) as writer:
+            for step in range(20):
+                writer.add_test_summary("a", simple_value=step, step=step)
+        self._Sync()
+        expected = _Contents(self.mirror)
+
+        self.worker_run = reload_pool._WorkerRun(self.logdir, self.kwargs)
+        self.mirror = reload_pool.MirroredEventAccumulator(
+            self.logdir, **self.kwargs
+        )
+        self._Sync()
+        self.assertEqual(_Contents(self.mirror), expected)
+        self.assertEqual(self.mirror.most_recent_step, 19)
+
+    def testNoEventsYet(self):
+        self._Sync()
+        with self.assertRaises(ValueError):
+            self.mirror.FirstEventTimestamp()
+        self.assertIsNone(self.mirror.GetSourceWriter())
+
+
+class ProcessReloadPoolTest(tf.test.TestCase):
+    def testReloadsInWorkerProcesses(self):
+        logdir = self.get_temp_dir()
+        kwargs = dict(size_guidance=_SIZE_GUIDANCE)
+        runs = {}
+        for name in ("run1", "run2", "run3"):
+            path = os.path.join(logdir, name)
+            with test_util.FileWriter(path) as writer:
+                for step in range(20):
+                    writer.add_test_summary(name, simple_value=step, step=step)
+            runs[name] = reload_pool.MirroredEventAccumulator(path, **kwargs)
+
+        pool = reload_pool.ProcessReloadPool(2, kwargs)
+        self.addCleanup(pool.Close)
+        self.assertEqual(pool.Reload(list(runs.items())), set())
+        for name, mirror in runs.items():
+            expected = event_accumulator.EventAccumulator(
+                mirror.path, **kwargs
+            ).Reload()
+            self.assertEqual(_Contents(expected), _Contents(mirror))
+        self.assertCountEqual(pool._assignments.values(), [0, 0, 1])
+
+        shutil.rmtree(runs["run2"].path)
+        self.assertEqual(pool.Reload(list(runs.items())), {"run2"})
+        self.assertNotIn("run2", pool._assignments)
+
+    def testRestartsDeadWorker(self):
+        path = self.get_temp_dir()
+        with test_util.FileWriter(path) as writer:
+            writer.add_test_summary("a", step=1)
+        mirror = reload_pool.MirroredEventAccumulator(path)
+        pool = reload_pool.ProcessReloadPool(1, {})
+        self.addCleanup(pool.Close)
+        pool.Reload([("run", mirror)])
+        process = pool._workers[0][0]
+        process.kill()
+        process.join()
+        # The reload that finds the worker dead loses its results...
+        pool.Reload([("run", mirror)])
+        # ...and the next one starts over in a new worker.
+        pool.Reload([("run", mirror)])
+        self.assertNotEqual(pool._workers[0][0].pid, process.pid)
+        self.assertEqual([e.step for e in mirror.Tensors("a")], [1])
+
+
+if __name__ == "__main__":
+    tf.test.main()
@@ -0,0 +1,139 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Per-run reload scheduling based on how fast each run is growing."""
+
+
+import threading
+
+
+# Weight of the latest measurement in each run's smoothed write rate.
+_RATE_SMOOTHING = 0.5
+
+
+class _RunSchedule:
+    """Mutable scheduling state for one run."""
+
+    __slots__ = (
+        "bytes_read",
+        "last_reload",
+        "interval",
+        "next_reload",
+        "bytes_per_second",
+    )
+
+    def __init__(self, interval):
+        self.bytes_read = 0
+        self.last_reload = None
+        self.interval = interval
+        self.next_reload = 0.0
+        self.bytes_per_second = 0.0
+
+
+class ReloadScheduler:
+    """Decides when each run should next be reloaded.
+
+    After each reload of a run, the scheduler compares the number of
+    bytes that the run has read with the number at its previous reload.
+    Runs that grew are reloaded again after `min_interval` seconds. Each
+    reload that finds no new data doubles the run's interval, up to
+    `max_interval` seconds, so finished runs cost little while live runs
+    stay fresh. Runs that the scheduler has not seen are due at once.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self, min_interval, max_interval):
+        """Constructs a `ReloadScheduler`.
+
+        Args:
+          min_interval: Seconds between reloads of a run that is growing.
+          max_interval: Upper bound on the seconds between reloads of any
+            run.
+
+        Raises:
+          ValueError: If the intervals are not positive and ordered.
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(
+                "Expected 0 < min_interval <= max_interval, got %r and %r"
+                % (min_interval, max_interval)
+            )
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._lock = threading.Lock()
+        self._runs = {}
+
+    def DueRuns(self, runs, now):
+        """Returns the runs among `runs` that are due at time `now`."""
+        with self._lock:
+            return [
+                run
+                for run in runs
+                if run not in self._runs or self._runs[run].next_reload <= now
+            ]
+
+    def Update(self, run, bytes_read, now):
+        """Records a reload of `run` that started at time `now`.
+
+        Args:
+          run: The name of the run.
+          bytes_read: The total number of bytes the run has read, as
+            returned by `EventAccumulator.BytesRead`.
+          now: The time at which the reload started, in seconds since
+            the epoch.
+        """
+        with self._lock:
+            schedule = self._runs.get(run)
+            if schedule is None:
+                schedule = _RunSchedule(self._min_interval)
+                self._runs[run] = schedule
+            gained = bytes_read - schedule.bytes_read
+            if schedule.last_reload is not None and now > schedule.last_reload:
+                rate = gained / (now - schedule.last_reload)
+                schedule.bytes_per_second += _RATE_SMOOTHING * (
+                    rate - schedule.bytes_per_second
+                )
+            if gained > 0:
+                schedule.interval = self._min_interval
+            else:
+                schedule.interval = min(
+                    schedule.interval * 2, self._max_interval
+                )
+            schedule.bytes_read = bytes_read
+            schedule.last_reload = now
+            schedule.next_reload = now + schedule.interval
+
+    def Forget(self, run):
+        """Drops the state for `run`, e.g. because it was deleted."""
+        with self._lock:
+            self._runs.pop(run, None)
+
+    def Schedule(self):
+        """Returns the state of each run, for debugging.
+
+        Returns:
+          A dict mapping run names to dicts with keys "next_reload" (a
+          time in seconds since the epoch), "interval" (seconds), and
+          "bytes_per_second" (a smoothed rate of growth).
+        """
+        with self._lock:
+            return {
+                run: {
+                    "next_reload": schedule.next_reload,
+                    "interval": schedule.interval,
+                    "bytes_per_second": schedule.bytes_per_second,
+                }
+                for (run, schedule) in self._runs.items()
+            }
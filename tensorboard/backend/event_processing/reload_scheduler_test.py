@@ -0,0 +1,69 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tensorboard.backend.event_processing.reload_scheduler`."""
+
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import reload_scheduler
+
+
+class ReloadSchedulerTest(tb_test.TestCase):
+    def test_invalid_intervals(self):
+        with self.assertRaises(ValueError):
+            reload_scheduler.ReloadScheduler(0, 10)
+        with self.assertRaises(ValueError):
+            reload_scheduler.ReloadScheduler(10, 5)
+
+    def test_new_runs_are_due(self):
+        scheduler = reload_scheduler.ReloadScheduler(5, 60)
+        self.assertEqual(["a", "b"], scheduler.DueRuns(["a", "b"], now=0))
+
+    def test_growing_run_stays_at_min_interval(self):
+        scheduler = reload_scheduler.ReloadScheduler(5, 60)
+        for i, now in enumerate([100, 105, 110]):
+            scheduler.Update("run", bytes_read=1000 * (i + 1), now=now)
+        self.assertEqual([], scheduler.DueRuns(["run"], now=114))
+        self.assertEqual(["run"], scheduler.DueRuns(["run"], now=115))
+        schedule = scheduler.Schedule()["run"]
+        self.assertEqual(5, schedule["interval"])
+        self.assertEqual(115, schedule["next_reload"])
+        # Smoothed from 200 bytes per second, twice.
+        self.assertEqual(150, schedule["bytes_per_second"])
+
+    def test_idle_run_backs_off_exponentially(self):
+        scheduler = reload_scheduler.ReloadScheduler(5, 60)
+        scheduler.Update("run", bytes_read=1000, now=0)
+        now = 0
+        intervals = []
+        for _ in range(6):
+            now = scheduler.Schedule()["run"]["next_reload"]
+            scheduler.Update("run", bytes_read=1000, now=now)
+            intervals.append(scheduler.Schedule()["run"]["interval"])
+        self.assertEqual([10, 20, 40, 60, 60, 60], intervals)
+        # New data brings the run back to the minimum interval.
+        scheduler.Update("run", bytes_read=1001, now=now + 60)
+        self.assertEqual(5, scheduler.Schedule()["run"]["interval"])
+
+    def test_forget(self):
+        scheduler = reload_scheduler.ReloadScheduler(5, 60)
+        scheduler.Update("run", bytes_read=0, now=0)
+        self.assertEqual([], scheduler.DueRuns(["run"], now=1))
+        scheduler.Forget("run")
+        self.assertEqual({}, scheduler.Schedule())
+        self.assertEqual(["run"], scheduler.DueRuns(["run"], now=1))
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -16,10 +16,18 @@
 """A key-value[] store that implements reservoir sampling on the values."""
 
 
+import array
 import collections
+import itertools
 import random
 import threading
 
+import numpy as np
+
+# Source of the values of `Reservoir.Version`, shared by all reservoirs
+# so that versions are never reused within a process.
+_versions = itertools.count()
+
 
 class Reservoir:
     """A map-to-arrays container, with deterministic Reservoir Sampling.
@@ -74,15 +82,17 @@ class Reservoir:
         if size < 0 or size != round(size):
             raise ValueError("size must be nonnegative integer, was %s" % size)
         self._buckets = collections.defaultdict(
-            lambda: _ReservoirBucket(
-                size, random.Random(seed), always_keep_last
-            )
+            lambda: self._MakeBucket(self.size, seed, always_keep_last)
         )
         # _mutex guards the keys - creating new keys, retrieving by key, etc
         # the internal items are guarded by the ReservoirBuckets' internal mutexes
         self._mutex = threading.Lock()
         self.size = size
         self.always_keep_last = always_keep_last
+        self._version = next(_versions)
+
+    def _MakeBucket(self, size, seed, always_keep_last):
+        return _ReservoirBucket(size, random.Random(seed), always_keep_last)
 
     def Keys(self):
         """Return all the keys in the reservoir.
@@ -93,6 +103,17 @@ class Reservoir:
         with self._mutex:
             return list(self._buckets.keys())
 
+    def Version(self):
+        """Return a token that changes whenever the items may change.
+
+        Versions are integers that are unique across all reservoirs in
+        this process, so a version also identifies its reservoir.
+
+        Returns:
+          An `int`.
+        """
+        return self._version
+
     def Items(self, key):
         """Return items associated with given key.
 
@@ -126,7 +147,10 @@ class Reservoir:
         old item with low probability.
 
         If f is provided, it will be applied to transform item (lazily, iff item is
-          going to be included in the reservoir).
+          going to be included in the reservoir). If always_keep_last is set,
+          f is only applied to the last item once it is read or a newer item
+          is added behind it, so items that the next item replaces are never
+          transformed.
 
         Args:
           key: The key to store the item under.
@@ -136,6 +160,46 @@ class Reservoir:
         with self._mutex:
             bucket = self._buckets[key]
         bucket.AddItem(item, f)
+        # Bump the version only once the change is visible, so that a
+        # reader never pairs the new version with the old items.
+        self._version = next(_versions)
+
+    def GetState(self, key):
+        """Return the items and sampling state of the bucket for `key`.
+
+        Together with `SetState`, this lets a reservoir be saved and
+        later resumed so that it samples exactly as if it had never
+        stopped.
+
+        Args:
+          key: The key whose bucket to return the state of.
+
+        Raises:
+          KeyError: If the key is not found in the reservoir.
+
+        Returns:
+          A tuple `(items, num_items_seen, random_state)` of plain Python
+          values. For a `ScalarReservoir`, `items` is a tuple of the raw
+          bytes of the steps, wall times and values columns.
+        """
+        with self._mutex:
+            if key not in self._buckets:
+                raise KeyError("Key %s was not found in Reservoir" % key)
+            bucket = self._buckets[key]
+        return bucket.GetState()
+
+    def SetState(self, key, state):
+        """Replace the bucket for `key` with one in a saved state.
+
+        Args:
+          key: The key whose bucket to replace.
+          state: A value returned by `GetState` on a reservoir of the
+            same class, size and `always_keep_last` setting.
+        """
+        with self._mutex:
+            bucket = self._buckets[key]
+        bucket.SetState(state)
+        self._version = next(_versions)
 
     def FilterItems(self, filterFn, key=None):
         """Filter items within a Reservoir, using a filtering function.
@@ -151,14 +215,90 @@ class Reservoir:
         with self._mutex:
             if key:
                 if key in self._buckets:
-                    return self._buckets[key].FilterItems(filterFn)
+                    num_removed = self._buckets[key].FilterItems(filterFn)
                 else:
-                    return 0
+                    num_removed = 0
             else:
-                return sum(
+                num_removed = sum(
                     bucket.FilterItems(filterFn)
                     for bucket in self._buckets.values()
                 )
+        if num_removed:
+            self._version = next(_versions)
+        return num_removed
+
+    def Shrink(self, size):
+        """Reduce the number of items kept for each key to at most `size`.
+
+        Keys that hold more items keep `size` of them, evenly spaced and
+        including the last, and sampling continues as though `size` had
+        been the reservoir's size all along. Buckets created later also
+        use the new size.
+
+        Args:
+          size: A positive integer, the new maximum number of items per
+            key.
+
+        Raises:
+          ValueError: If size is not a positive integer.
+
+        Returns:
+          The number of items removed.
+        """
+        if size <= 0 or size != round(size):
+            raise ValueError("size must be positive integer, was %s" % size)
+        with self._mutex:
+            self.size = size
+            num_removed = sum(
+                bucket.Shrink(size) for bucket in self._buckets.values()
+            )
+        if num_removed:
+            self._version = next(_versions)
+        return num_removed
+
+
+ScalarItem = collections.namedtuple(
+    "ScalarItem", ("step", "wall_time", "value")
+)
+
+
+class ScalarReservoir(Reservoir):
+    """A `Reservoir` of `ScalarItem`s, stored in compact parallel arrays.
+
+    Sampling behaves exactly as for a `Reservoir` with the same size and
+    seed, but each retained item costs 24 bytes (an int64 step and two
+    float64s) rather than a Python object. `Items` and `FilterItems`
+    materialize `ScalarItem` tuples on demand; `Columns` returns the
+    stored data as NumPy arrays without creating any per-item objects.
+
+    Values are stored as float64, so integer values of magnitude above
+    2**53 lose precision. The random number generator for each key is
+    only created once sampling starts, since its state alone is larger
+    than a thousand stored items.
+    """
+
+    def _MakeBucket(self, size, seed, always_keep_last):
+        return _ScalarReservoirBucket(size, _LazyRandom(seed), always_keep_last)
+
+    def Columns(self, key):
+        """Return the items associated with the given key as arrays.
+
+        Args:
+          key: The key for which we are finding associated items.
+
+        Raises:
+          KeyError: If the key is not found in the reservoir.
+
+        Returns:
+          A tuple `(steps, wall_times, values)` of 1-D NumPy arrays of
+          equal length, with dtypes int64, float64 and float64. The
+          arrays are copies and may be retained by the caller.
+        """
+        with self._mutex:
+            if key not in self._buckets:
+                raise KeyError("Key %s was not found in Reservoir" % key)
+            bucket = self._buckets[key]
+        return bucket.Columns()
 
 
 class _ReservoirBucket:
@@ -186,6 +326,10 @@ class _ReservoirBucket:
                 "_max_size must be nonnegative int, was %s" % _max_size
             )
         self.items = []
+        # With `always_keep_last`, an `(item, f)` pair for the last item,
+        # whose `f` is not applied until it is known to be needed. It
+        # follows `items` and counts towards the bucket's size.
+        self._deferred = None
         # This mutex protects the internal items, ensuring that calls to Items and
         # AddItem are thread-safe
         self._mutex = threading.Lock()
@@ -217,17 +361,46 @@ class _ReservoirBucket:
             the reservoir.
         """
         with self._mutex:
-            if len(self.items) < self._max_size or self._max_size == 0:
-                self.items.append(f(item))
+            size = len(self.items) + (self._deferred is not None)
+            if size < self._max_size or self._max_size == 0:
+                self._Append(item, f)
             else:
                 r = self._random.randint(0, self._num_items_seen)
                 if r < self._max_size:
-                    self.items.pop(r)
-                    self.items.append(f(item))
+                    if self._deferred is not None and r == len(self.items):
+                        # The deferred last item is the one evicted.
+                        self._deferred = None
+                    else:
+                        self._Materialize()
+                        self.items.pop(r)
+                    self._Append(item, f)
                 elif self.always_keep_last:
-                    self.items[-1] = f(item)
+                    if self._deferred is None:
+                        self.items.pop(len(self.items) - 1)
+                    self._deferred = (item, f)
             self._num_items_seen += 1
 
+    def _Append(self, item, f):
+        """Adds an item at the end, deferring `f` if it may be replaced.
+
+        Must be called with the mutex held.
+        """
+        if self.always_keep_last:
+            self._Materialize()
+            self._deferred = (item, f)
+        else:
+            self.items.append(f(item))
+
+    def _Materialize(self):
+        """Applies `f` to the deferred last item, if any.
+
+        Must be called with the mutex held.
+        """
+        if self._deferred is not None:
+            (item, f) = self._deferred
+            self._deferred = None
+            self.items.append(f(item))
+
     def FilterItems(self, filterFn):
         """Filter items in a ReservoirBucket, using a filtering function.
 
@@ -248,6 +421,7 @@ class _ReservoirBucket:
           The number of items removed from the bucket.
         """
         with self._mutex:
+            self._Materialize()
             size_before = len(self.items)
             self.items = list(filter(filterFn, self.items))
             size_diff = size_before - len(self.items)
@@ -261,7 +435,218 @@ class _ReservoirBucket:
             )
             return size_diff
 
+    def Shrink(self, max_size):
+        """Reduce the bucket's maximum size; see `Reservoir.Shrink`.
+
+        Returns:
+          The number of items removed from the bucket.
+        """
+        with self._mutex:
+            self._Materialize()
+            self._max_size = max_size
+            size_before = len(self.items)
+            if size_before <= max_size:
+                return 0
+            if max_size == 1:
+                indices = [size_before - 1]
+            else:
+                indices = [
+                    i * (size_before - 1) // (max_size - 1)
+                    for i in range(max_size)
+                ]
+            self._KeepIndices(indices)
+            # As in `FilterItems`, scale the number of items seen by the
+            # proportion of items kept.
+            self._num_items_seen = int(
+                round(self._num_items_seen * max_size / size_before)
+            )
+            return size_before - max_size
+
+    def _KeepIndices(self, indices):
+        self.items = [self.items[i] for i in indices]
+
     def Items(self):
         """Get all the items in the bucket."""
         with self._mutex:
+            self._Materialize()
             return list(self.items)
+
+    def GetState(self):
+        """Get the items and sampling state; see `Reservoir.GetState`."""
+        with self._mutex:
+            self._Materialize()
+            return (
+                self._ItemsState(),
+                self._num_items_seen,
+                self._random.getstate(),
+            )
+
+    def SetState(self, state):
+        """Restore a state returned by `GetState`."""
+        (items, num_items_seen, random_state) = state
+        with self._mutex:
+            self._SetItemsState(items)
+            self._deferred = None
+            self._num_items_seen = num_items_seen
+            self._random.setstate(random_state)
+
+    def _ItemsState(self):
+        return list(self.items)
+
+    def _SetItemsState(self, items):
+        self.items = list(items)
+
+
+class _LazyRandom:
+    """A `random.Random(seed)` that is only created when first used."""
+
+    def __init__(self, seed):
+        self._seed = seed
+        self._random = None
+
+    def randint(self, a, b):
+        if self._random is None:
+            self._random = random.Random(self._seed)
+        return self._random.randint(a, b)
+
+    def getstate(self):
+        """Returns `None` if the generator has not been created yet."""
+        if self._random is None:
+            return None
+        return self._random.getstate()
+
+    def setstate(self, state):
+        if state is None:
+            self._random = None
+        else:
+            self._random = random.Random(self._seed)
+            self._random.setstate(state)
+
+
+class _ScalarColumns:
+    """List-like storage of `ScalarItem`s in three `array.array`s.
+
+    Implements just the list operations that `_ReservoirBucket` uses to
+    maintain its `items`.
+    """
+
+    def __init__(self, steps=(), wall_times=(), values=()):
+        self.steps = array.array("q", steps)
+        self.wall_times = array.array("d", wall_times)
+        self.values = array.array("d", values)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __iter__(self):
+        return map(ScalarItem, self.steps, self.wall_times, self.values)
+
+    def append(self, item):
+        self.steps.append(item.step)
+        self.wall_times.append(item.wall_time)
+        self.values.append(item.value)
+
+    def pop(self, index):
+        item = self[index]
+        del self.steps[index]
+        del self.wall_times[index]
+        del self.values[index]
+        return item
+
+    def __getitem__(self, index):
+        return ScalarItem(
+            self.steps[index], self.wall_times[index], self.values[index]
+        )
+
+    def __setitem__(self, index, item):
+        self.steps[index] = item.step
+        self.wall_times[index] = item.wall_time
+        self.values[index] = item.value
+
+
+class _ScalarReservoirBucket(_ReservoirBucket):
+    """A `_ReservoirBucket` whose items are stored in `_ScalarColumns`."""
+
+    def __init__(self, _max_size, _random=None, always_keep_last=True):
+        super().__init__(_max_size, _random, always_keep_last)
+        self.items = _ScalarColumns()
+
+    def FilterItems(self, filterFn):
+        """Filter items in the bucket, using a filtering function.
+
+        See `_ReservoirBucket.FilterItems`; `filterFn` receives
+        `ScalarItem`s.
+        """
+        with self._mutex:
+            self._Materialize()
+            size_before = len(self.items)
+            keep = np.fromiter(
+                (bool(filterFn(item)) for item in self.items),
+                dtype=bool,
+                count=size_before,
+            )
+            self.items = _ScalarColumns(
+                *(
+                    _Column(column)[keep].tobytes()
+                    for column in (
+                        self.items.steps,
+                        self.items.wall_times,
+                        self.items.values,
+                    )
+                )
+            )
+            size_diff = size_before - len(self.items)
+
+            # Estimate a correction the number of items seen; see the
+            # superclass for details.
+            prop_remaining = (
+                len(self.items) / float(size_before) if size_before > 0 else 0
+            )
+            self._num_items_seen = int(
+                round(self._num_items_seen * prop_remaining)
+            )
+            return size_diff
+
+    def _KeepIndices(self, indices):
+        self.items = _ScalarColumns(
+            *(
+                _Column(column)[indices].tobytes()
+                for column in (
+                    self.items.steps,
+                    self.items.wall_times,
+                    self.items.values,
+                )
+            )
+        )
+
+    def _ItemsState(self):
+        return (
+            self.items.steps.tobytes(),
+            self.items.wall_times.tobytes(),
+            self.items.values.tobytes(),
+        )
+
+    def _SetItemsState(self, items):
+        columns = _ScalarColumns()
+        for column, data in zip(
+            (columns.steps, columns.wall_times, columns.values), items
+        ):
+            column.frombytes(data)
+        self.items = columns
+
+    def Columns(self):
+        """Get copies of the bucket's steps, wall times and values."""
+        with self._mutex:
+            self._Materialize()
+            return (
+                _Column(self.items.steps),
+                _Column(self.items.wall_times),
+                _Column(self.items.values),
+            )
+
+
+def _Column(data):
+    """Copy an `array.array` into a NumPy array of the same type."""
+    # Copy eagerly so that no buffer export outlives this call: an
+    # `array.array` cannot be resized while it is exported.
+    return np.frombuffer(data, dtype=np.dtype(data.typecode)).copy()
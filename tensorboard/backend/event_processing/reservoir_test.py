@@ -14,6 +14,7 @@
 # ==============================================================================
 
 
+import numpy as np
 import tensorflow as tf
 
 from tensorboard.backend.event_processing import reservoir
@@ -37,6 +38,19 @@ class ReservoirTest(tf.test.TestCase):
         self.assertEqual(r.Items("foo"), [4, 19])
         self.assertEqual(r.Items("bar"), [9])
 
+    def testVersion(self):
+        r = reservoir.Reservoir(42)
+        other = reservoir.Reservoir(42)
+        self.assertNotEqual(r.Version(), other.Version())
+        v0 = r.Version()
+        r.AddItem("foo", 4)
+        v1 = r.Version()
+        self.assertNotEqual(v1, v0)
+        self.assertEqual(r.FilterItems(lambda x: True), 0)
+        self.assertEqual(r.Version(), v1)
+        self.assertEqual(r.FilterItems(lambda x: False), 1)
+        self.assertNotIn(r.Version(), (v0, v1))
+
     def testExceptions(self):
         with self.assertRaises(ValueError):
             reservoir.Reservoir(-1)
@@ -90,6 +104,24 @@ class ReservoirTest(tf.test.TestCase):
             r2.AddItem("key", i)
         self.assertNotEqual(r1.Items(key), r2.Items(key))
 
+    def testSetStateResumesSampling(self):
+        expected = reservoir.Reservoir(10)
+        saved = reservoir.Reservoir(10)
+        for i in range(100):
+            expected.AddItem("key", i)
+            saved.AddItem("key", i)
+        restored = reservoir.Reservoir(10)
+        restored.SetState("key", saved.GetState("key"))
+        for i in range(100, 1000):
+            expected.AddItem("key", i)
+            restored.AddItem("key", i)
+        self.assertEqual(restored.Items("key"), expected.Items("key"))
+
+    def testGetStateMissingKey(self):
+        r = reservoir.Reservoir(10)
+        with self.assertRaises(KeyError):
+            r.GetState("missing key")
+
     def testFilterItemsByKey(self):
         r = reservoir.Reservoir(100, seed=0)
         for i in range(10):
@@ -107,6 +139,30 @@ class ReservoirTest(tf.test.TestCase):
         self.assertEqual(len(r.Items("key1")), 4)
         self.assertEqual(len(r.Items("key2")), 8)
 
+    def testShrink(self):
+        r = reservoir.Reservoir(0)
+        for i in range(10):
+            r.AddItem("key1", i)
+        for i in range(3):
+            r.AddItem("key2", i)
+        version = r.Version()
+        self.assertEqual(r.Shrink(4), 6)
+        self.assertNotEqual(r.Version(), version)
+        # Evenly spaced, including the last item.
+        self.assertEqual(r.Items("key1"), [0, 3, 6, 9])
+        self.assertEqual(r.Items("key2"), [0, 1, 2])
+        self.assertEqual(r.Shrink(1), 5)
+        self.assertEqual(r.Items("key1"), [9])
+        self.assertEqual(r.Items("key2"), [2])
+        # Later items are sampled at the new size.
+        for i in range(10, 20):
+            r.AddItem("key1", i)
+            r.AddItem("key3", i)
+        self.assertEqual(r.Items("key1"), [19])
+        self.assertEqual(r.Items("key3"), [19])
+        with self.assertRaises(ValueError):
+            r.Shrink(0)
+
 
 class ReservoirBucketTest(tf.test.TestCase):
     def testEmptyBucket(self):
@@ -216,15 +272,119 @@ class ReservoirBucketTest(tf.test.TestCase):
         self.assertEqual(incrementer.n, 100)
         self.assertEqual(b.Items(), [x * 2 for x in range(100)])
 
-        # This time, we will always keep the last item, meaning that the function
-        # should get invoked once for every item we add.
+        # This time, we will always keep the last item. Each item only holds
+        # the last place until the next one replaces it, so the function is
+        # only invoked for the last item once it is read.
         b = reservoir._ReservoirBucket(100, FakeRandom(), always_keep_last=True)
         incrementer = Incrementer()
 
         for i in range(1000):
             b.AddItem(i, incrementer.increment_and_double)
-        self.assertEqual(incrementer.n, 1000)
+        self.assertEqual(incrementer.n, 99)
         self.assertEqual(b.Items(), [x * 2 for x in range(99)] + [999 * 2])
+        self.assertEqual(incrementer.n, 100)
+        self.assertEqual(b.Items(), [x * 2 for x in range(99)] + [999 * 2])
+        self.assertEqual(incrementer.n, 100)
+
+    def testDeferredLastItemIsKeptWhenSampled(self):
+        class FakeRandom:
+            def __init__(self, values):
+                self._values = iter(values)
+
+            def randint(self, a, b):  # pylint:disable=unused-argument
+                return next(self._values)
+
+        calls = []
+
+        def record(x):
+            calls.append(x)
+            return x
+
+        # Items 2, 4 and 5 are replaced before they are ever used. Item 3
+        # survives because item 4 evicts item 0 rather than item 3.
+        b = reservoir._ReservoirBucket(3, FakeRandom([9, 0, 9, 2]))
+        for i in range(7):
+            b.AddItem(i, record)
+        self.assertEqual(calls, [0, 1, 3])
+        self.assertEqual(b.Items(), [1, 3, 6])
+        self.assertEqual(calls, [0, 1, 3, 6])
+
+
+class ScalarReservoirTest(tf.test.TestCase):
+    def _Item(self, i):
+        return reservoir.ScalarItem(step=i, wall_time=i + 0.5, value=i * 2.0)
+
+    def testMatchesReservoirSampling(self):
+        for always_keep_last in (True, False):
+            expected = reservoir.Reservoir(
+                10, always_keep_last=always_keep_last
+            )
+            actual = reservoir.ScalarReservoir(
+                10, always_keep_last=always_keep_last
+            )
+            for i in range(1000):
+                expected.AddItem("key", self._Item(i))
+                actual.AddItem("key", self._Item(i))
+            self.assertEqual(actual.Items("key"), expected.Items("key"))
+
+            self.assertEqual(
+                actual.FilterItems(lambda x: x.step < 500, "key"),
+                expected.FilterItems(lambda x: x.step < 500, "key"),
+            )
+            for i in range(1000, 1100):
+                expected.AddItem("key", self._Item(i))
+                actual.AddItem("key", self._Item(i))
+            self.assertEqual(actual.Items("key"), expected.Items("key"))
+
+    def testColumns(self):
+        r = reservoir.ScalarReservoir(0)
+        for i in range(5):
+            r.AddItem("key", self._Item(i))
+        (steps, wall_times, values) = r.Columns("key")
+        self.assertEqual(steps.dtype, np.int64)
+        self.assertEqual(wall_times.dtype, np.float64)
+        self.assertEqual(values.dtype, np.float64)
+        self.assertAllEqual(steps, [0, 1, 2, 3, 4])
+        self.assertAllEqual(wall_times, [0.5, 1.5, 2.5, 3.5, 4.5])
+        self.assertAllEqual(values, [0.0, 2.0, 4.0, 6.0, 8.0])
+        # The arrays are copies, so the reservoir can still grow.
+        r.AddItem("key", self._Item(5))
+        self.assertLen(r.Items("key"), 6)
+        self.assertLen(steps, 5)
+
+    def testSetStateResumesSampling(self):
+        for num_items in (5, 100):
+            expected = reservoir.ScalarReservoir(10)
+            saved = reservoir.ScalarReservoir(10)
+            for i in range(num_items):
+                expected.AddItem("key", self._Item(i))
+                saved.AddItem("key", self._Item(i))
+            restored = reservoir.ScalarReservoir(10)
+            restored.SetState("key", saved.GetState("key"))
+            self.assertEqual(restored.Items("key"), saved.Items("key"))
+            for i in range(num_items, 1000):
+                expected.AddItem("key", self._Item(i))
+                restored.AddItem("key", self._Item(i))
+            self.assertEqual(restored.Items("key"), expected.Items("key"))
+
+    def testShrinkMatchesReservoir(self):
+        expected = reservoir.Reservoir(100)
+        actual = reservoir.ScalarReservoir(100)
+        for i in range(1000):
+            expected.AddItem("key", self._Item(i))
+            actual.AddItem("key", self._Item(i))
+        self.assertEqual(actual.Shrink(10), expected.Shrink(10))
+        self.assertEqual(actual.Items("key"), expected.Items("key"))
+        for i in range(1000, 1100):
+            expected.AddItem("key", self._Item(i))
+            actual.AddItem("key", self._Item(i))
+        self.assertLen(actual.Items("key"), 10)
+        self.assertEqual(actual.Items("key"), expected.Items("key"))
+
+    def testColumnsMissingKey(self):
+        r = reservoir.ScalarReservoir(1)
+        with self.assertRaises(KeyError):
+            r.Columns("missing")
 
 
 class ReservoirBucketStatisticalDistributionTest(tf.test.TestCase):
@@ -15,18 +15,33 @@
 """TensorBoard HTTP utilities."""
 
 
+import collections
+import collections.abc
 import gzip
+import hashlib
 import io
 import json
 import re
 import struct
+import threading
 import time
 import wsgiref.handlers
+import zlib
 
 import werkzeug
 
 from tensorboard.backend import json_util
 
+# Faster codecs for compressing responses, used when installed.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 _DISALLOWED_CHAR_IN_DOMAIN = re.compile(r"\s")
 
 # TODO(stephanwlee): Refactor this to not use the module variable but
@@ -54,6 +69,12 @@ _ALLOWS_GZIP_PATTERN = re.compile(
     r"(?:^|,|\s)(?:(?:x-)?gzip|\*)(?!;q=0)(?:\s|,|$)"
 )
 
+_ALLOWS_BROTLI_PATTERN = re.compile(r"(?:^|,|\s)br(?!;q=0)(?:\s|,|$)")
+_ALLOWS_ZSTD_PATTERN = re.compile(r"(?:^|,|\s)zstd(?!;q=0)(?:\s|,|$)")
+
+# Maximum total size of the compressed bodies in `_compression_cache`.
+_COMPRESSION_CACHE_BYTES = 32 * 1024 * 1024
+
 _TEXTUAL_MIMETYPES = set(
     [
         "application/javascript",
@@ -91,19 +112,29 @@ def Respond(
     encoding="utf-8",
     csp_scripts_sha256s=None,
     headers=None,
+    etag=None,
 ):
     """Construct a werkzeug Response.
 
     Responses are transmitted to the browser with compression if: a) the browser
     supports it; b) it's sane to compress the content_type in question; and c)
     the content isn't already compressed, as indicated by the content_encoding
-    parameter.
+    parameter. If the zstandard or brotli modules are installed and the browser
+    accepts their encodings, they are preferred over gzip. Recently compressed
+    bodies are cached, so identical responses are only compressed once.
 
     Browser and proxy caching is completely disabled by default. If the expires
     parameter is greater than zero then the response will be able to be cached by
     the browser for that many seconds; however, proxies are still forbidden from
     caching so that developers can bypass the cache with Ctrl+Shift+R.
 
+    Successful responses to GET and HEAD requests carry an ETag, so that the
+    browser can revalidate its copy with If-None-Match. If the ETag matches, a
+    body-less 304 is sent instead, without compressing the content. The ETag
+    is computed from the content unless the etag parameter is given, in which
+    case the content isn't examined at all when the ETag matches; see also
+    ETagMatches.
+
     For textual content that isn't JSON, the encoding parameter is used as the
     transmission charset which is automatically appended to the Content-Type
     header. That is unless of course the content_type parameter contains a
@@ -118,10 +149,17 @@ def Respond(
     content_type parameter explicitly defines a charset parameter, in which case
     the serialized JSON bytes will use that instead of escape sequences.
 
+    The content MAY also be an iterator of byte or unicode strings, such as
+    one from json_util.IterDumps, in which case the body is streamed: pieces
+    are encoded, compressed and sent as the iterator produces them, without
+    a Content-Length header. Such content can't already be compressed, and
+    it gets an ETag only if the etag parameter is given.
+
     Args:
       request: A werkzeug Request object. Used mostly to check the
         Accept-Encoding header.
-      content: Payload data as byte string, unicode string, or maybe JSON.
+      content: Payload data as byte string, unicode string, maybe JSON, or
+        an iterator of byte or unicode strings.
       content_type: Media type and optionally an output charset.
       code: Numeric HTTP status code to use.
       expires: Second duration for browser caching.
@@ -134,15 +172,41 @@ def Respond(
       headers: Any additional headers to include on the response, as a
         list of key-value tuples: e.g., `[("Allow", "GET")]`. In case of
         conflict, these may be overridden with headers added by this function.
+      etag: Optional opaque string that identifies the content, such as a
+        version token from a data provider; it must not contain double
+        quotes. It is sent as a weak ETag. Only used when code is 200 and
+        the request method is GET or HEAD. If None, a strong ETag is
+        computed from the content, unless it is streamed.
 
     Returns:
       A werkzeug Response object (a WSGI application).
     """
 
+    streamed = isinstance(content, collections.abc.Iterator)
+    if streamed and content_encoding:
+        raise ValueError("Streamed content can't already be encoded")
     mimetype = _EXTRACT_MIMETYPE_PATTERN.search(content_type).group(0)
     charset_match = _EXTRACT_CHARSET_PATTERN.search(content_type)
     charset = charset_match.group(1) if charset_match else encoding
     textual = charset_match or mimetype in _TEXTUAL_MIMETYPES
+    accept_encoding = request.headers.get("Accept-Encoding", "")
+    gzip_accepted = _ALLOWS_GZIP_PATTERN.search(accept_encoding)
+    # Codec with which to compress uncompressed text data, if any.
+    codec = None
+    if textual and not content_encoding:
+        codec = next(
+            (c for c in _CODECS if c.accept_pattern.search(accept_encoding)),
+            None,
+        )
+    # Only successful responses to safe methods can be revalidated.
+    conditional = code == 200 and request.method in ("GET", "HEAD")
+    etag_header = None
+    if conditional and etag is not None:
+        # A caller's ETag doesn't depend on the content encoding, so it
+        # can only be a weak validator.
+        etag_header = 'W/"%s"' % etag
+        if ETagMatches(request, etag):
+            return _NotModified(etag_header, expires)
     if mimetype in _JSON_MIMETYPES and isinstance(
         content, (dict, list, set, tuple)
     ):
@@ -151,6 +215,9 @@ def Respond(
         )
 
     # Ensure correct output encoding, transcoding if necessary.
+    if streamed:
+        pieces = content
+        content = _EncodeStream(pieces, encoding, charset)
     if charset != encoding and isinstance(content, bytes):
         content = content.decode(encoding)
     if isinstance(content, str):
@@ -158,21 +225,31 @@ def Respond(
 
     if textual and not charset_match and mimetype not in _JSON_MIMETYPES:
         content_type += "; charset=" + charset
-    gzip_accepted = _ALLOWS_GZIP_PATTERN.search(
-        request.headers.get("Accept-Encoding", "")
-    )
-    # Automatically gzip uncompressed text data if accepted.
-    if textual and not content_encoding and gzip_accepted:
-        out = io.BytesIO()
-        # Set mtime to zero to make payload for a given input deterministic.
-        with gzip.GzipFile(
-            fileobj=out, mode="wb", compresslevel=3, mtime=0
-        ) as f:
-            f.write(content)
-        content = out.getvalue()
-        content_encoding = "gzip"
-
-    content_length = len(content)
+    if streamed:
+        # The content isn't known yet, so it can't be hashed or cached.
+        if codec is not None:
+            content = _CompressStream(codec, content)
+            content_encoding = codec.encoding
+    else:
+        if (conditional and etag is None) or codec is not None:
+            digest = hashlib.sha256(content).digest()
+        if conditional and etag is None:
+            etag = digest.hex()[:32]
+            # A strong ETag must differ between the encodings of the same
+            # content.
+            if codec is not None:
+                etag += "-" + codec.encoding
+            elif content_encoding == "gzip" and not gzip_accepted:
+                etag += "-identity"
+            etag_header = '"%s"' % etag
+            if ETagMatches(request, etag):
+                return _NotModified(etag_header, expires)
+        # Automatically compress uncompressed text data if accepted.
+        if codec is not None:
+            content = _compression_cache.Compress(codec, digest, content)
+            content_encoding = codec.encoding
+
+    content_length = None if streamed else len(content)
     direct_passthrough = False
     # Automatically streamwise-gunzip precompressed data if not accepted.
     if content_encoding == "gzip" and not gzip_accepted:
@@ -186,17 +263,14 @@ def Respond(
         direct_passthrough = True
 
     headers = list(headers or [])
-    headers.append(("Content-Length", str(content_length)))
+    if content_length is not None:
+        headers.append(("Content-Length", str(content_length)))
     headers.append(("X-Content-Type-Options", "nosniff"))
     if content_encoding:
         headers.append(("Content-Encoding", content_encoding))
-    if expires > 0:
-        e = wsgiref.handlers.format_date_time(time.time() + float(expires))
-        headers.append(("Expires", e))
-        headers.append(("Cache-Control", "private, max-age=%d" % expires))
-    else:
-        headers.append(("Expires", "0"))
-        headers.append(("Cache-Control", "no-cache, must-revalidate"))
+    if etag_header is not None:
+        headers.append(("ETag", etag_header))
+    headers.extend(_cache_headers(expires))
     if mimetype == _HTML_MIMETYPE:
         frags = (
             _CSP_SCRIPT_DOMAINS_WHITELIST
@@ -248,6 +322,8 @@ def Respond(
         headers.append(("Content-Security-Policy", csp_string))
 
     if request.method == "HEAD":
+        if streamed and hasattr(pieces, "close"):
+            pieces.close()
         content = None
 
     return werkzeug.wrappers.Response(
@@ -259,6 +335,192 @@ def Respond(
     )
 
 
+def ETagMatches(request, etag):
+    """Checks whether a request's If-None-Match header matches an ETag.
+
+    Handlers that can cheaply compute an ETag for their response (for
+    instance, from data provider version tokens) can use this to skip
+    building the response body: if it returns true, then
+    `Respond(request, "", content_type, etag=etag)` sends a 304.
+
+    Args:
+      request: A werkzeug Request object.
+      etag: An opaque ETag string, without quotes.
+
+    Returns:
+      Whether the client already has the representation with this ETag.
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    # If-None-Match uses the weak comparison function (RFC 7232, 3.2).
+    return werkzeug.http.parse_etags(header).contains_weak(etag)
+
+
+def _NotModified(etag_header, expires):
+    """Construct a 304 response for a matching conditional request."""
+    headers = [("ETag", etag_header)]
+    headers.extend(_cache_headers(expires))
+    return werkzeug.wrappers.Response(status=304, headers=headers)
+
+
+def _cache_headers(expires):
+    """Return the Expires and Cache-Control headers for a response."""
+    if expires > 0:
+        e = wsgiref.handlers.format_date_time(time.time() + float(expires))
+        return [
+            ("Expires", e),
+            ("Cache-Control", "private, max-age=%d" % expires),
+        ]
+    return [
+        ("Expires", "0"),
+        ("Cache-Control", "no-cache, must-revalidate"),
+    ]
+
+
+# `compressobj` makes an object with `compress` and `flush` methods, as
+# `zlib.compressobj` does, to compress a stream.
+_Codec = collections.namedtuple(
+    "_Codec", ("encoding", "accept_pattern", "compress", "compressobj")
+)
+
+
+def _gzip_compress(content):
+    # Set mtime to zero to make payload for a given input deterministic.
+    return gzip.compress(content, compresslevel=3, mtime=0)
+
+
+def _gzip_compressobj():
+    # A window of 16 + MAX_WBITS writes a gzip header (with mtime zero).
+    return zlib.compressobj(3, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def _brotli_compress(content):
+    return brotli.compress(content, quality=4)
+
+
+class _BrotliCompressObj:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=4)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.finish()
+
+
+def _zstd_compress(content):
+    # Compressor objects can't be shared between threads.
+    return zstandard.ZstdCompressor(level=3).compress(content)
+
+
+def _zstd_compressobj():
+    return zstandard.ZstdCompressor(level=3).compressobj()
+
+
+# Codecs for compressing textual responses, in order of preference.
+_CODECS = []
+if zstandard is not None:
+    _CODECS.append(
+        _Codec("zstd", _ALLOWS_ZSTD_PATTERN, _zstd_compress, _zstd_compressobj)
+    )
+if brotli is not None:
+    _CODECS.append(
+        _Codec(
+            "br", _ALLOWS_BROTLI_PATTERN, _brotli_compress, _BrotliCompressObj
+        )
+    )
+_CODECS.append(
+    _Codec("gzip", _ALLOWS_GZIP_PATTERN, _gzip_compress, _gzip_compressobj)
+)
+
+# Streamed content is sent in pieces of about this many bytes, so that
+# many small pieces don't each become a write.
+_STREAM_PIECE_BYTES = 64 * 1024
+
+
+def _EncodeStream(pieces, encoding, charset):
+    """Encodes streamed content, coalescing it into larger pieces."""
+    buf = []
+    size = 0
+    try:
+        for piece in pieces:
+            if charset != encoding and isinstance(piece, bytes):
+                piece = piece.decode(encoding)
+            if isinstance(piece, str):
+                piece = piece.encode(charset)
+            buf.append(piece)
+            size += len(piece)
+            if size >= _STREAM_PIECE_BYTES:
+                yield b"".join(buf)
+                buf = []
+                size = 0
+    finally:
+        if hasattr(pieces, "close"):
+            pieces.close()
+    if buf:
+        yield b"".join(buf)
+
+
+def _CompressStream(codec, pieces):
+    """Compresses streamed content with a codec."""
+    compressor = codec.compressobj()
+    try:
+        for piece in pieces:
+            compressed = compressor.compress(piece)
+            if compressed:
+                yield compressed
+    finally:
+        pieces.close()
+    yield compressor.flush()
+
+
+class _CompressionCache:
+    """A thread-safe LRU cache of compressed response bodies.
+
+    Entries are keyed by content encoding and SHA-256 digest of the
+    uncompressed content, and evicted once their total size exceeds a
+    limit in bytes.
+    """
+
+    def __init__(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def Compress(self, codec, digest, content):
+        """Compress `content`, whose SHA-256 digest is `digest`."""
+        key = (codec.encoding, digest)
+        with self._lock:
+            compressed = self._entries.get(key)
+            if compressed is not None:
+                self._entries.move_to_end(key)
+                return compressed
+        # Compress without holding the lock; racing threads may both
+        # compress the same content, which is harmless.
+        compressed = codec.compress(content)
+        if len(compressed) > self._max_bytes:
+            return compressed
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = compressed
+                self._size += len(compressed)
+            while self._size > self._max_bytes:
+                (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+        return compressed
+
+    def Clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_compression_cache = _CompressionCache(_COMPRESSION_CACHE_BYTES)
+
+
 def _create_csp_string(*csp_fragments):
     csp_string = " ".join([frag for frag in csp_fragments if frag])
     return csp_string if csp_string else "'none'"
@@ -0,0 +1,128 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for `http_util.Respond` on large scalar payloads.
+
+Builds a payload shaped like a `scalars_multirun` response and measures
+the CPU time that `Respond` spends per request for each content
+encoding, both with an empty compression cache (as for the first tab to
+request the data) and with a warm one (as for other tabs polling the
+same data). Encodings whose modules are not installed are skipped.
+
+Sample results on a cloud VM with a single core (Python 3.11, 50 runs of
+1000 points, a 2 MB JSON body, mean of 20 requests):
+
+    ENCODING  COLD_CPU_MS  WARM_CPU_MS  COMPRESSED_KB
+    identity     196.8524     233.7078           2010
+        gzip     257.7981     190.2380            761
+          br     286.5464     236.2041            569
+        zstd     254.5712     232.9391            629
+
+Serializing the JSON dominates every row, so the warm timings are close
+to the identity ones: a warm cache saves the compression time, about
+60 ms per request here, which is within the noise of this machine.
+"""
+
+
+import random
+import time
+
+from absl import app
+from absl import flags
+from absl import logging
+from werkzeug import test as wtest
+from werkzeug import wrappers
+
+from tensorboard.backend import http_util
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("runs", 50, "Number of runs in the payload.")
+flags.DEFINE_integer("points", 1000, "Number of points in each run.")
+flags.DEFINE_integer("repeats", 20, "Number of timed requests per row.")
+
+
+def make_payload(num_runs, num_points):
+    """Returns a `scalars_multirun`-style dict of random scalars."""
+    rng = random.Random(0)
+    payload = {}
+    for i in range(num_runs):
+        payload["run%03d" % i] = [
+            (1.6e9 + step * 10.0, step, rng.random())
+            for step in range(num_points)
+        ]
+    return payload
+
+
+def bench(payload, accept_encoding, repeats, clear_cache):
+    """Returns mean CPU milliseconds per request and the body size."""
+    environ = wtest.EnvironBuilder(
+        headers={"Accept-Encoding": accept_encoding}
+    ).get_environ()
+    total = 0.0
+    for _ in range(repeats):
+        if clear_cache:
+            http_util._compression_cache.Clear()
+        request = wrappers.Request(environ)
+        start_time = time.process_time()
+        response = http_util.Respond(request, payload, "application/json")
+        total += time.process_time() - start_time
+    return (total / repeats * 1000, int(response.headers["Content-Length"]))
+
+
+def _format_line(headers, fields):
+    """Format a line of a table.
+
+    Arguments:
+      headers: A list of strings that are used as the table headers.
+      fields: A list of the same length as `headers` where `fields[i]` is
+        the entry for `headers[i]` in this row. Elements can be of
+        arbitrary types. Pass `headers` to print the header row.
+
+    Returns:
+      A pretty string.
+    """
+    assert len(fields) == len(headers), (fields, headers)
+    fields = [
+        "%2.4f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+
+    payload = make_payload(FLAGS.runs, FLAGS.points)
+    encodings = ["identity"] + [
+        codec.encoding for codec in reversed(http_util._CODECS)
+    ]
+    headers = ("ENCODING", "COLD_CPU_MS", "WARM_CPU_MS", "COMPRESSED_KB")
+    logger.info(_format_line(headers, headers))
+    for encoding in encodings:
+        (cold_ms, size) = bench(payload, encoding, FLAGS.repeats, True)
+        (warm_ms, _) = bench(payload, encoding, FLAGS.repeats, False)
+        fields = (encoding, cold_ms, warm_ms, size // 1024)
+        logger.info(_format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
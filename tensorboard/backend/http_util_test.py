@@ -161,6 +161,66 @@ class RespondTest(tb_test.TestCase):
             r.response, [fall_of_hyperion_canto1_stanza1.encode("utf-8")]
         )
 
+    def testAcceptGzip_cachesCompressedBody(self):
+        e = wtest.EnvironBuilder(headers={"Accept-Encoding": "gzip"})
+        q = wrappers.Request(e.get_environ())
+        body = "hello hello hello world"
+        with mock.patch.object(
+            http_util, "_compression_cache", http_util._CompressionCache(1024)
+        ):
+            with mock.patch.object(
+                http_util.gzip, "compress", wraps=http_util.gzip.compress
+            ) as compress:
+                r1 = http_util.Respond(q, body, "text/plain")
+                r2 = http_util.Respond(q, body, "text/plain")
+                r3 = http_util.Respond(q, body + "!", "text/plain")
+        self.assertEqual(compress.call_count, 2)
+        self.assertEqual(r1.response, r2.response)
+        self.assertEqual(_gunzip(r2.response[0]), body.encode("utf-8"))
+        self.assertEqual(_gunzip(r3.response[0]), (body + "!").encode("utf-8"))
+
+    def testCompressionCache_evictsLeastRecentlyUsed(self):
+        codec = http_util._Codec(
+            "identity", None, lambda content: content, None
+        )
+        cache = http_util._CompressionCache(10)
+        cache.Compress(codec, b"a", b"aaaa")
+        cache.Compress(codec, b"b", b"bbbb")
+        cache.Compress(codec, b"a", b"aaaa")  # refreshes "a"
+        cache.Compress(codec, b"c", b"cccc")  # evicts "b"
+        self.assertEqual(
+            list(cache._entries),
+            [("identity", b"a"), ("identity", b"c")],
+        )
+        self.assertEqual(cache._size, 8)
+        cache.Compress(codec, b"d", b"d" * 11)  # too big to cache
+        self.assertEqual(cache._size, 8)
+
+    def testAcceptBrotli_prefersBrotli(self):
+        if http_util.brotli is None:
+            self.skipTest("brotli is not installed")
+        e = wtest.EnvironBuilder(headers={"Accept-Encoding": "gzip, br"})
+        q = wrappers.Request(e.get_environ())
+        r = http_util.Respond(q, "hello hello hello world", "text/plain")
+        self.assertEqual(r.headers.get("Content-Encoding"), "br")
+        self.assertEqual(
+            http_util.brotli.decompress(r.response[0]),
+            b"hello hello hello world",
+        )
+        self.assertTrue(r.headers.get("ETag").endswith('-br"'))
+
+    def testAcceptZstd_prefersZstd(self):
+        if http_util.zstandard is None:
+            self.skipTest("zstandard is not installed")
+        e = wtest.EnvironBuilder(headers={"Accept-Encoding": "gzip, br, zstd"})
+        q = wrappers.Request(e.get_environ())
+        r = http_util.Respond(q, "hello hello hello world", "text/plain")
+        self.assertEqual(r.headers.get("Content-Encoding"), "zstd")
+        self.assertEqual(
+            http_util.zstandard.ZstdDecompressor().decompress(r.response[0]),
+            b"hello hello hello world",
+        )
+
     def testAcceptGzip_alreadyCompressed_sendsPrecompressedResponse(self):
         gzip_text = _gzip(b"hello hello hello world")
         e = wtest.EnvironBuilder(
@@ -223,6 +283,122 @@ class RespondTest(tb_test.TestCase):
         self.assertEqual(r.headers.get("Allow"), "POST")
         self.assertEqual(r.headers.get("Content-Length"), str(len(body)))
 
+    def testETag_notModified(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        r = http_util.Respond(q, "hello", "text/plain")
+        etag = r.headers.get("ETag")
+        self.assertTrue(etag.startswith('"'), etag)
+
+        e = wtest.EnvironBuilder(headers={"If-None-Match": etag})
+        q = wrappers.Request(e.get_environ())
+        r = http_util.Respond(q, "hello", "text/plain", expires=60)
+        self.assertEqual(r.status_code, 304)
+        self.assertEqual(r.get_data(), b"")
+        self.assertEqual(r.headers.get("ETag"), etag)
+        self.assertEqual(r.headers.get("Cache-Control"), "private, max-age=60")
+
+        r = http_util.Respond(q, "goodbye", "text/plain")
+        self.assertEqual(r.status_code, 200)
+        self.assertNotEqual(r.headers.get("ETag"), etag)
+
+    def testETag_differsWhenGzipped(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        identity_etag = http_util.Respond(q, "hello", "text/plain").headers.get(
+            "ETag"
+        )
+        e = wtest.EnvironBuilder(headers={"Accept-Encoding": "gzip"})
+        q = wrappers.Request(e.get_environ())
+        r = http_util.Respond(q, "hello", "text/plain")
+        self.assertEqual(r.headers.get("Content-Encoding"), "gzip")
+        self.assertNotEqual(r.headers.get("ETag"), identity_etag)
+
+    def testETag_givenByCaller(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        r = http_util.Respond(q, "hello", "text/plain", etag="v1")
+        self.assertEqual(r.headers.get("ETag"), 'W/"v1"')
+
+        e = wtest.EnvironBuilder(headers={"If-None-Match": 'W/"v1"'})
+        q = wrappers.Request(e.get_environ())
+        self.assertTrue(http_util.ETagMatches(q, "v1"))
+        self.assertFalse(http_util.ETagMatches(q, "v2"))
+        content = mock.MagicMock()
+        r = http_util.Respond(q, content, "application/json", etag="v1")
+        self.assertEqual(r.status_code, 304)
+        content.assert_not_called()
+
+    def testETag_onlyForSuccessfulGets(self):
+        e = wtest.EnvironBuilder(method="POST")
+        q = wrappers.Request(e.get_environ())
+        r = http_util.Respond(q, "hello", "text/plain")
+        self.assertIsNone(r.headers.get("ETag"))
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        r = http_util.Respond(q, "oops", "text/plain", code=500)
+        self.assertIsNone(r.headers.get("ETag"))
+
+    def testStreamedContent(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        pieces = ["[", "1, ", b"2", "]"]
+        r = http_util.Respond(q, iter(pieces), "application/json")
+        self.assertEqual(r.get_data(), b"[1, 2]")
+        self.assertIsNone(r.headers.get("Content-Length"))
+        self.assertIsNone(r.headers.get("ETag"))
+
+    def testStreamedContent_coalescesPieces(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        pieces = ["line %d\n" % i for i in range(20000)]
+        r = http_util.Respond(q, iter(pieces), "text/plain")
+        chunks = list(r.response)
+        self.assertLess(len(chunks), 10)
+        self.assertEqual(b"".join(chunks), "".join(pieces).encode("utf-8"))
+
+    def testStreamedContent_compressesIncrementally(self):
+        pieces = ["line %d\n" % i for i in range(20000)]
+        body = "".join(pieces).encode("utf-8")
+        decompress = {
+            "gzip": _gunzip,
+            "br": http_util.brotli and http_util.brotli.decompress,
+            "zstd": http_util.zstandard
+            and (
+                lambda data: http_util.zstandard.ZstdDecompressor()
+                .decompressobj()
+                .decompress(data)
+            ),
+        }
+        for encoding in ("gzip", "br", "zstd"):
+            if decompress[encoding] is None:
+                continue
+            e = wtest.EnvironBuilder(headers={"Accept-Encoding": encoding})
+            q = wrappers.Request(e.get_environ())
+            r = http_util.Respond(q, iter(pieces), "text/plain", etag="v1")
+            self.assertEqual(r.headers.get("Content-Encoding"), encoding)
+            self.assertEqual(r.headers.get("ETag"), 'W/"v1"')
+            data = b"".join(r.response)
+            self.assertEqual(decompress[encoding](data), body)
+
+    def testStreamedContent_headRequestClosesContent(self):
+        closed = []
+
+        def content():
+            try:
+                yield "hello"
+            finally:
+                closed.append(True)
+
+        builder = wtest.EnvironBuilder(method="HEAD")
+        q = wrappers.Request(builder.get_environ())
+        pieces = content()
+        next(pieces)  # start the generator, so that closing it runs `finally`
+        r = http_util.Respond(q, pieces, "text/plain")
+        self.assertEqual(r.get_data(), b"")
+        self.assertEqual(closed, [True])
+
+    def testStreamedContent_cannotBePrecompressed(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        with self.assertRaises(ValueError):
+            http_util.Respond(
+                q, iter([b""]), "text/plain", content_encoding="gzip"
+            )
+
     def testCsp(self):
         q = wrappers.Request(wtest.EnvironBuilder().get_environ())
         r = http_util.Respond(
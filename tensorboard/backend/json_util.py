@@ -25,6 +25,7 @@ keyword argument overrides this.
 
 
 import collections
+import json
 import math
 
 
@@ -70,3 +71,66 @@ def Cleanse(obj, encoding="utf-8"):
         )
     else:
         return obj
+
+
+class Chunked:
+    """A JSON array whose elements `IterDumps` produces a chunk at a time.
+
+    Attributes:
+      chunks: An iterable of lists, whose concatenation is the elements
+        of the array. It is iterated once, while serializing.
+    """
+
+    __slots__ = ("chunks",)
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+
+def IterDumps(obj, encoding="utf-8", ensure_ascii=True):
+    """Serializes a Python object as JSON text, in pieces.
+
+    The text is the same as `json.dumps(Cleanse(obj, encoding))`, except
+    that `obj` may also contain `Chunked` arrays, whose chunks are only
+    read and serialized as the pieces are consumed. This lets a large
+    response be written out without building all of its values first.
+
+    Args:
+      obj: Python data structure, which may contain `Chunked` values.
+      encoding: Charset used to decode byte strings.
+      ensure_ascii: As for `json.dumps`.
+
+    Yields:
+      `str` pieces of the JSON text.
+    """
+    if isinstance(obj, Chunked):
+        separator = "["
+        for chunk in obj.chunks:
+            if chunk:
+                text = json.dumps(
+                    Cleanse(chunk, encoding), ensure_ascii=ensure_ascii
+                )
+                yield separator + text[1:-1]
+                separator = ", "
+        yield "[]" if separator == "[" else "]"
+    elif isinstance(obj, dict):
+        separator = "{"
+        for key, value in obj.items():
+            key = Cleanse(key, encoding)
+            if not isinstance(key, str):
+                key = json.dumps(key)  # as `json.dumps` converts keys
+            yield separator + json.dumps(key, ensure_ascii=ensure_ascii) + ": "
+            yield from IterDumps(value, encoding, ensure_ascii)
+            separator = ", "
+        yield "{}" if separator == "{" else "}"
+    elif isinstance(obj, (list, tuple, set)):
+        if isinstance(obj, set):
+            obj = sorted(obj)
+        separator = "["
+        for value in obj:
+            yield separator
+            yield from IterDumps(value, encoding, ensure_ascii)
+            separator = ", "
+        yield "[]" if separator == "[" else "]"
+    else:
+        yield json.dumps(Cleanse(obj, encoding), ensure_ascii=ensure_ascii)
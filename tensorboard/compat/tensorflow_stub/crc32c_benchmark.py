@@ -0,0 +1,118 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for the CRC-32C implementation in the TensorFlow stub.
+
+Compares `pywrap_tensorflow.crc32c` against the byte-at-a-time loop that
+it replaced, over payload sizes ranging from a TFRecord header to a large
+image summary. Throughput is reported in MB/s (best of three).
+
+Sample results on a cloud VM (Python 3.11, NumPy 2.4):
+
+        SIZE  LEGACY_MBPS  CURRENT_MBPS  SPEEDUP
+           8       2.6819        4.1537   1.5488
+          64       4.7784        8.8674   1.8557
+         512       4.8042       10.9280   2.2747
+        4096       5.3471       14.8837   2.7835
+       65536       4.7635       84.6860  17.7782
+     1048576       3.5530      177.2015  49.8745
+    16777216       4.5108      169.6108  37.6013
+
+Payloads below `pywrap_tensorflow._BULK_THRESHOLD` use pure-Python
+slicing-by-8; larger ones are checksummed in vectorized lanes with NumPy.
+"""
+
+
+import array
+import os
+import time
+
+from absl import app
+from absl import logging
+
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+
+def legacy_crc32c(data):
+    """The original byte-at-a-time CRC-32C, kept as a baseline."""
+    crc = pywrap_tensorflow.CRC_INIT ^ 0xFFFFFFFF
+    for b in array.array("B", data):
+        table_index = (crc ^ b) & 0xFF
+        crc = (pywrap_tensorflow.CRC_TABLE[table_index] ^ (crc >> 8)) & (
+            0xFFFFFFFF
+        )
+    return crc ^ 0xFFFFFFFF
+
+
+def bench(fn, data, total_bytes):
+    """Returns the throughput of `fn(data)` in MB/s.
+
+    Calls `fn` enough times to process about `total_bytes` bytes.
+    """
+    repeats = max(1, total_bytes // len(data))
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        fn(data)
+    elapsed = time.perf_counter() - start_time
+    return repeats * len(data) / elapsed / 1e6
+
+
+def _format_line(headers, fields):
+    """Format a line of a table.
+
+    Arguments:
+      headers: A list of strings that are used as the table headers.
+      fields: A list of the same length as `headers` where `fields[i]` is
+        the entry for `headers[i]` in this row. Elements can be of
+        arbitrary types. Pass `headers` to print the header row.
+
+    Returns:
+      A pretty string.
+    """
+    assert len(fields) == len(headers), (fields, headers)
+    fields = [
+        "%2.4f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+
+    sizes = [8, 64, 512, 4096, 65536, 1 << 20, 1 << 24]
+    headers = ("SIZE", "LEGACY_MBPS", "CURRENT_MBPS", "SPEEDUP")
+    logger.info(_format_line(headers, headers))
+    for size in sizes:
+        data = os.urandom(size)
+        if legacy_crc32c(data) != pywrap_tensorflow.crc32c(data):
+            raise AssertionError("checksum mismatch at size %d" % size)
+        # The legacy loop is slow enough that a few MB gives stable numbers.
+        legacy = max(bench(legacy_crc32c, data, 1 << 21) for _ in range(3))
+        current = max(
+            bench(pywrap_tensorflow.crc32c, data, 1 << 25) for _ in range(3)
+        )
+        fields = (size, legacy, current, current / legacy)
+        logger.info(_format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -20,13 +20,16 @@ TensorBoard.  This allows running TensorBoard without depending on
 TensorFlow for file operations.
 """
 
+import collections
 import dataclasses
 import glob as py_glob
 import io
+import itertools
 import os
 import os.path
 import sys
 import tempfile
+import threading
 
 try:
     import botocore.exceptions
@@ -55,6 +58,9 @@ from tensorboard.compat.tensorflow_stub import compat, errors
 # A somewhat conservative default chosen here.
 _DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
 
+# Maximum number of idle local file handles kept open for reuse by readers.
+_MAX_POOLED_FILE_HANDLES = 256
+
 
 # Registry of filesystems by prefix.
 #
@@ -95,9 +101,70 @@ class StatData:
     length: int
 
 
+class _FileHandlePool:
+    """A bounded LRU pool of open file handles for sequential readers.
+
+    Each reader is identified by an integer key that the file system hands
+    out in its continuation token. Between reads, the reader's handle sits
+    in the pool along with its current position; a reader takes it out for
+    the duration of a read (so that it cannot be evicted mid-read) and puts
+    it back afterward. When the pool is full, the least recently used
+    handles are closed, and their readers transparently reopen the file on
+    their next read. Readers should release their handles when done, as
+    `GFile.close` does.
+    """
+
+    def __init__(self, capacity):
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        # Map from key to `(file, position)`, least recently used first.
+        self._handles = collections.OrderedDict()
+        self._next_key = itertools.count()
+
+    def new_key(self):
+        return next(self._next_key)
+
+    def take(self, key):
+        """Removes and returns the `(file, position)` for `key`, or None."""
+        with self._lock:
+            return self._handles.pop(key, None)
+
+    def give(self, key, f, position):
+        """Adds a handle to the pool, evicting old ones if needed."""
+        evicted = []
+        with self._lock:
+            self._handles[key] = (f, position)
+            while len(self._handles) > self._capacity:
+                (_, (old, _)) = self._handles.popitem(last=False)
+                evicted.append(old)
+        for old in evicted:
+            old.close()
+
+    def release(self, key):
+        entry = self.take(key)
+        if entry is not None:
+            entry[0].close()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._handles)
+
+
+def _is_open_at_path(f, filename):
+    """Whether an open file is still the file at `filename`."""
+    try:
+        path_stat = os.stat(filename)
+    except OSError:
+        return False
+    return os.path.samestat(os.fstat(f.fileno()), path_stat)
+
+
 class LocalFileSystem:
     """Provides local fileystem access."""
 
+    def __init__(self):
+        self._handle_pool = _FileHandlePool(_MAX_POOLED_FILE_HANDLES)
+
     def exists(self, filename):
         """Determines whether a path exists or not."""
         return os.path.exists(compat.as_bytes(filename))
@@ -126,24 +193,59 @@ class LocalFileSystem:
             is an opaque value that can be passed to the next invocation of
             `read(...) ' in order to continue from the last read position.
         """
-        mode = "rb" if binary_mode else "r"
-        encoding = None if binary_mode else "utf8"
-        if not exists(filename):
-            raise errors.NotFoundError(
-                None, None, "Not Found: " + compat.as_text(filename)
-            )
         offset = None
+        key = None
         if continue_from is not None:
             offset = continue_from.get("opaque_offset", None)
-        with io.open(filename, mode, encoding=encoding) as f:
-            if offset is not None:
+            key = continue_from.get("handle_key", None)
+        if key is None:
+            key = self._handle_pool.new_key()
+        # Reuse this reader's open handle if it is still pooled, so that
+        # reading a file in chunks costs one open() rather than one per chunk.
+        entry = self._handle_pool.take(key)
+        if entry is not None and not _is_open_at_path(entry[0], filename):
+            # The file was deleted or replaced since the last read, which
+            # must then fail or read the new file, as it would by path.
+            entry[0].close()
+            entry = None
+        if entry is not None:
+            (f, position) = entry
+        else:
+            f = self._open_for_read(filename, binary_mode)
+            position = None
+        try:
+            if offset is not None and offset != position:
                 f.seek(offset)
             data = f.read(size)
             # The new offset may not be `offset + len(data)`, due to decoding
             # and newline translation.
             # So, just measure it in whatever terms the underlying stream uses.
-            continuation_token = {"opaque_offset": f.tell()}
-            return (data, continuation_token)
+            position = f.tell()
+        except BaseException:
+            f.close()
+            raise
+        self._handle_pool.give(key, f, position)
+        continuation_token = {"opaque_offset": position, "handle_key": key}
+        return (data, continuation_token)
+
+    def release(self, continue_from):
+        """Closes any file handle held for a sequence of `read` calls.
+
+        Args:
+            continue_from: A continuation token returned from `read(...)`.
+        """
+        key = continue_from.get("handle_key", None)
+        if key is not None:
+            self._handle_pool.release(key)
+
+    def _open_for_read(self, filename, binary_mode):
+        mode = "rb" if binary_mode else "r"
+        encoding = None if binary_mode else "utf8"
+        if not exists(filename):
+            raise errors.NotFoundError(
+                None, None, "Not Found: " + compat.as_text(filename)
+            )
+        return io.open(filename, mode, encoding=encoding)
 
     def write(self, filename, file_content, binary_mode=False):
         """Writes string file contents to a file, overwriting any existing
@@ -830,6 +932,8 @@ class GFile:
 
     def close(self):
         self.flush()
+        if self.continuation_token is not None and hasattr(self.fs, "release"):
+            self.fs.release(self.continuation_token)
         if self.write_temp is not None:
             self.write_temp.close()
             self.write_temp = None
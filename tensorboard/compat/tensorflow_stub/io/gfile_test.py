@@ -16,6 +16,7 @@
 
 import io
 import os
+from unittest import mock
 
 from tensorboard import test as tb_test
 from tensorboard.compat.tensorflow_stub import errors
@@ -230,6 +231,113 @@ class GFileTest(tb_test.TestCase):
             ckpt_read = f.read()
             self.assertEqual(ckpt_b_content, ckpt_read)
 
+    def testReadInChunksOpensFileOnce(self):
+        temp_dir = self.get_temp_dir()
+        self._CreateDeepDirectoryStructure(temp_dir)
+        ckpt_path = os.path.join(temp_dir, "model.ckpt")
+        ckpt_content = bytes(range(256)) * 40
+        with open(ckpt_path, "wb") as f:
+            f.write(ckpt_content)
+        with mock.patch.object(
+            io, "open", wraps=io.open
+        ) as mock_open, mock.patch.object(
+            os.path, "exists", wraps=os.path.exists
+        ) as mock_exists:
+            with gfile.GFile(ckpt_path, "rb") as f:
+                f.buff_chunk_size = 16  # Force one filesystem read per chunk
+                chunks = []
+                while True:
+                    chunk = f.read(7)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            self.assertEqual(ckpt_content, b"".join(chunks))
+            self.assertEqual(mock_open.call_count, 1)
+            self.assertEqual(mock_exists.call_count, 1)
+
+    def testReadSeesAppendedData(self):
+        temp_dir = self.get_temp_dir()
+        self._CreateDeepDirectoryStructure(temp_dir)
+        ckpt_path = os.path.join(temp_dir, "model.ckpt")
+        with open(ckpt_path, "wb") as f:
+            f.write(b"foo")
+        with gfile.GFile(ckpt_path, "rb") as f:
+            self.assertEqual(b"foo", f.read(10))
+            self.assertEqual(b"", f.read(10))
+            with open(ckpt_path, "ab") as g:
+                g.write(b"bar")
+            self.assertEqual(b"bar", f.read(10))
+
+    def testCloseReleasesFileHandle(self):
+        temp_dir = self.get_temp_dir()
+        self._CreateDeepDirectoryStructure(temp_dir)
+        ckpt_path = os.path.join(temp_dir, "model.ckpt")
+        with open(ckpt_path, "wb") as f:
+            f.write(b"asdfasdfasdffoobarbuzz")
+        pool = gfile.get_filesystem(ckpt_path)._handle_pool
+        pooled = len(pool)
+        f = gfile.GFile(ckpt_path, "rb")
+        f.buff_chunk_size = 4
+        f.read(6)
+        self.assertEqual(len(pool), pooled + 1)
+        f.close()
+        self.assertEqual(len(pool), pooled)
+
+    def testReadDetectsReplacedFile(self):
+        temp_dir = self.get_temp_dir()
+        self._CreateDeepDirectoryStructure(temp_dir)
+        ckpt_path = os.path.join(temp_dir, "model.ckpt")
+        with open(ckpt_path, "wb") as f:
+            f.write(b"foobar")
+        fs = gfile.get_filesystem(ckpt_path)
+        (data, token) = fs.read(ckpt_path, binary_mode=True, size=3)
+        self.assertEqual(b"foo", data)
+        new_path = os.path.join(temp_dir, "model.ckpt.new")
+        with open(new_path, "wb") as f:
+            f.write(b"bazquux")
+        os.replace(new_path, ckpt_path)
+        (data, token) = fs.read(
+            ckpt_path, binary_mode=True, size=3, continue_from=token
+        )
+        self.assertEqual(b"quu", data)
+        os.remove(ckpt_path)
+        with self.assertRaises(errors.NotFoundError):
+            fs.read(ckpt_path, binary_mode=True, size=3, continue_from=token)
+
+    def testReadReopensEvictedFileHandles(self):
+        temp_dir = self.get_temp_dir()
+        self._CreateDeepDirectoryStructure(temp_dir)
+        paths = [
+            os.path.join(temp_dir, name)
+            for name in (
+                "a.tfevents.1",
+                "bar/b.tfevents.1",
+                "quuz/e.tfevents.1",
+            )
+        ]
+        contents = []
+        for i, path in enumerate(paths):
+            content = ("file %d: " % i).encode() + bytes(range(200))
+            contents.append(content)
+            with open(path, "wb") as f:
+                f.write(content)
+        pool = gfile.get_filesystem(paths[0])._handle_pool
+        with mock.patch.object(pool, "_capacity", 2):
+            readers = [gfile.GFile(path, "rb") for path in paths]
+            for reader in readers:
+                reader.buff_chunk_size = 8
+            chunks = [[] for _ in readers]
+            # Interleave reads so that each reader's handle gets evicted by
+            # the time it reads again.
+            for _ in range(30):
+                for reader, reader_chunks in zip(readers, chunks):
+                    reader_chunks.append(reader.read(9))
+                self.assertLessEqual(len(pool), 2)
+            for reader in readers:
+                reader.close()
+        for content, reader_chunks in zip(contents, chunks):
+            self.assertEqual(content, b"".join(reader_chunks))
+
     def testWrite(self):
         temp_dir = self.get_temp_dir()
         self._CreateDeepDirectoryStructure(temp_dir)
@@ -15,8 +15,11 @@
 """A wrapper for TensorFlow SWIG-generated bindings."""
 
 
-import array
+import functools
 import struct
+import zlib
+
+import numpy as np
 
 from . import errors
 from .io import gfile
@@ -120,6 +123,158 @@ CRC_INIT = 0
 _MASK = 0xFFFFFFFF
 
 
+def _slicing_tables(table, count):
+    """Derive slicing-by-N tables from the single-byte CRC table.
+
+    `tables[k][b]` is the CRC contribution of byte `b` followed by `k`
+    zero bytes, so that `count` bytes can be folded in with `count`
+    independent lookups instead of `count` dependent ones.
+    """
+    tables = [tuple(table)]
+    for _ in range(count - 1):
+        prev = tables[-1]
+        tables.append(tuple((x >> 8) ^ table[x & 0xFF] for x in prev))
+    return tuple(tables)
+
+
+_SLICING_TABLES = _slicing_tables(CRC_TABLE, 8)
+_NP_SLICING_TABLES = tuple(
+    np.array(t, dtype=np.uint32) for t in _SLICING_TABLES
+)
+_NP_BASIS = np.left_shift(np.uint32(1), np.arange(32, dtype=np.uint32))
+
+
+# Inputs at least this long are checksummed with NumPy (see `_crc_bulk`);
+# below it, the per-call overhead of NumPy outweighs its throughput.
+_BULK_THRESHOLD = 4096
+
+# Lane length for `_crc_bulk`, in bytes. Must be a power of two and a
+# multiple of 8.
+_BULK_LANE_BYTES = 64
+
+
+def _as_bytes(data):
+    """Returns a flat, byte-indexed `memoryview` over `data`."""
+    try:
+        return memoryview(data).cast("B")
+    except TypeError:
+        # Not a contiguous buffer (e.g., a generator of ints).
+        return memoryview(bytes(bytearray(data)))
+
+
+def _crc_sliced(crc, buf):
+    """Updates a raw (pre-inverted) CRC-32C state with slicing-by-8."""
+    t0, t1, t2, t3, t4, t5, t6, t7 = _SLICING_TABLES
+    end = len(buf) - len(buf) % 8
+    for lo, hi in struct.iter_unpack("<II", buf[:end]):
+        lo ^= crc
+        crc = (
+            t7[lo & 0xFF]
+            ^ t6[(lo >> 8) & 0xFF]
+            ^ t5[(lo >> 16) & 0xFF]
+            ^ t4[lo >> 24]
+            ^ t3[hi & 0xFF]
+            ^ t2[(hi >> 8) & 0xFF]
+            ^ t1[(hi >> 16) & 0xFF]
+            ^ t0[hi >> 24]
+        )
+    for b in buf[end:]:
+        crc = t0[(crc ^ b) & 0xFF] ^ (crc >> 8)
+    return crc
+
+
+def _linear_tables(images):
+    """Lookup tables for a linear map on 32-bit CRC states.
+
+    Args:
+      images: `np.uint32` array of shape `[32]`, where `images[i]` is the
+        image of the state `1 << i`.
+
+    Returns:
+      `np.uint32` array of shape `[4, 256]` such that the map applied to
+      `x` is the XOR of `tables[j][(x >> 8 * j) & 0xFF]` over `j`.
+    """
+    tables = np.zeros((4, 256), dtype=np.uint32)
+    for j in range(4):
+        for bit in range(8):
+            size = 1 << bit
+            tables[j, size : 2 * size] = tables[j, :size] ^ images[8 * j + bit]
+    return tables
+
+
+def _apply_linear(tables, x):
+    return (
+        tables[0][x & 0xFF]
+        ^ tables[1][(x >> 8) & 0xFF]
+        ^ tables[2][(x >> 16) & 0xFF]
+        ^ tables[3][x >> 24]
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _zeros_operator(log2_length):
+    """Tables for the map "feed `2 ** log2_length` zero bytes" on states.
+
+    Feeding zero bytes into a raw CRC-32C state is linear over GF(2), so
+    it is fully described by the images of the 32 basis states. Doubling
+    the length composes the map with itself.
+    """
+    if log2_length == 0:
+        table = _NP_SLICING_TABLES[0]
+        images = table[_NP_BASIS & 0xFF] ^ (_NP_BASIS >> 8)
+    else:
+        half = _zeros_operator(log2_length - 1)
+        images = _apply_linear(half, _apply_linear(half, _NP_BASIS))
+    return _linear_tables(images)
+
+
+def _crc_bulk(crc, buf):
+    """Updates a raw (pre-inverted) CRC-32C state using NumPy.
+
+    The input is split into equal-length lanes whose CRCs are computed
+    side by side with vectorized slicing-by-8, then folded together
+    pairwise: `crc(a + b) == shift(crc(a), len(b)) ^ crc(b)` for raw
+    states with a zero initial value, where `shift` feeds zero bytes.
+    The incoming state is folded into the first four data bytes, and the
+    data is left-padded with zeros (which a zero state ignores) so that
+    it divides into whole lanes.
+    """
+    lane = _BULK_LANE_BYTES
+    n = len(buf)
+    lanes = -(-n // lane)
+    data = np.zeros(lanes * lane, dtype=np.uint8)
+    pad = len(data) - n
+    data[pad:] = np.frombuffer(buf, dtype=np.uint8)
+    data[pad : pad + 4] ^= np.frombuffer(struct.pack("<I", crc), np.uint8)
+
+    words = data.view("<u4").reshape(lanes, lane // 4)
+    t0, t1, t2, t3, t4, t5, t6, t7 = _NP_SLICING_TABLES
+    state = np.zeros(lanes, dtype=np.uint32)
+    for i in range(0, lane // 4, 2):
+        lo = state ^ words[:, i]
+        hi = words[:, i + 1]
+        state = (
+            t7[lo & 0xFF]
+            ^ t6[(lo >> 8) & 0xFF]
+            ^ t5[(lo >> 16) & 0xFF]
+            ^ t4[lo >> 24]
+            ^ t3[hi & 0xFF]
+            ^ t2[(hi >> 8) & 0xFF]
+            ^ t1[(hi >> 16) & 0xFF]
+            ^ t0[hi >> 24]
+        )
+
+    log2_length = lane.bit_length() - 1
+    while len(state) > 1:
+        if len(state) % 2:
+            # A leading all-zero lane has a zero CRC and shifts nothing.
+            state = np.concatenate([np.zeros(1, dtype=np.uint32), state])
+        shift = _zeros_operator(log2_length)
+        state = _apply_linear(shift, state[0::2]) ^ state[1::2]
+        log2_length += 1
+    return int(state[0])
+
+
 def crc_update(crc, data):
     """Update CRC-32C checksum with data.
 
@@ -129,16 +284,12 @@ def crc_update(crc, data):
     Returns:
       32-bit updated CRC-32C as long.
     """
-
-    if type(data) != array.array or data.itemsize != 1:
-        buf = array.array("B", data)
-    else:
-        buf = data
-
+    buf = _as_bytes(data)
     crc ^= _MASK
-    for b in buf:
-        table_index = (crc ^ b) & 0xFF
-        crc = (CRC_TABLE[table_index] ^ (crc >> 8)) & _MASK
+    if len(buf) >= _BULK_THRESHOLD:
+        crc = _crc_bulk(crc, buf)
+    else:
+        crc = _crc_sliced(crc, buf)
     return crc ^ _MASK
 
 
@@ -165,6 +316,32 @@ def crc32c(data):
     return crc_finalize(crc_update(CRC_INIT, data))
 
 
+# Size of the reads that `PyRecordReader_New` issues against the underlying
+# file. Records are parsed out of this block in place, so a single read
+# typically covers many small records.
+_READ_BLOCK_SIZE = 1024 * 1024
+
+# TFRecord framing: a little-endian uint64 length and its masked CRC,
+# then the payload, then the masked CRC of the payload.
+_HEADER = struct.Struct("<QI")
+_FOOTER = struct.Struct("<I")
+
+# `zlib` window bits for the streams of each supported `compression_type`
+# of record files. Their records are framed as usual inside the stream.
+COMPRESSION_WBITS = {
+    "GZIP": 16 + zlib.MAX_WBITS,
+    "ZLIB": zlib.MAX_WBITS,
+}
+
+# Suffixes of the names of compressed event files, by `compression_type`.
+# TensorBoard's writers name the files that they compress this way, and
+# its readers detect compressed files by these suffixes.
+COMPRESSION_SUFFIXES = {
+    "GZIP": ".gz",
+    "ZLIB": ".zlib",
+}
+
+
 class PyRecordReader_New:
     def __init__(
         self, filename=None, start_offset=0, compression_type=None, status=None
@@ -183,10 +360,15 @@ class PyRecordReader_New:
             raise errors.UnimplementedError(
                 None, None, "start offset not supported by compat reader"
             )
-        if compression_type:
-            # TODO: Handle gzip and zlib compressed files
+        if isinstance(compression_type, bytes):
+            compression_type = compression_type.decode("ascii")
+        if compression_type and compression_type not in COMPRESSION_WBITS:
             raise errors.UnimplementedError(
-                None, None, "compression not supported by compat reader"
+                None,
+                None,
+                "compression type {!r} not supported by compat reader".format(
+                    compression_type
+                ),
             )
         self.filename = filename
         self.start_offset = start_offset
@@ -194,88 +376,126 @@ class PyRecordReader_New:
         self.status = status
         self.curr_event = None
         self.file_handle = gfile.GFile(self.filename, "rb")
-        # Maintain a buffer of partially read records, so we can recover from
-        # truncated records upon a retry.
-        self._buffer = b""
+        # Data read from the file but not yet consumed starts at
+        # `self._buffer[self._buffer_pos]`. A partially read record stays
+        # in the buffer, so we can recover from truncated records upon a
+        # retry.
+        self._buffer = bytearray()
         self._buffer_pos = 0
+        # For compressed files, the decompressor of the current stream.
+        # It keeps its state across reads at the end of a file that is
+        # still being written, so we can tail compressed files.
+        self._decompressor = None
+        if compression_type:
+            self._decompressor = self._new_decompressor()
 
     def GetNext(self):
-        # Each new read should start at the beginning of any partial record.
-        self._buffer_pos = 0
-        # Read the header
+        # Each new read starts at the beginning of any partial record.
         self.curr_event = None
-        header_str = self._read(8)
-        if not header_str:
+        available = self._fill(_HEADER.size)
+        if not available:
             # Hit EOF so raise and exit
             raise errors.OutOfRangeError(None, None, "No more events to read")
-        if len(header_str) < 8:
+        if available < 8:
             raise self._truncation_error("header")
-        header = struct.unpack("<Q", header_str)
-
-        # Read the crc32, which is 4 bytes, and check it against
-        # the crc32 of the header
-        crc_header_str = self._read(4)
-        if len(crc_header_str) < 4:
+        if available < _HEADER.size:
             raise self._truncation_error("header crc")
-        crc_header = struct.unpack("<I", crc_header_str)
-        header_crc_calc = masked_crc32c(header_str)
-        if header_crc_calc != crc_header[0]:
-            raise errors.DataLossError(
-                None, None, "{} failed header crc32 check".format(self.filename)
-            )
+
+        start = self._buffer_pos
+        with memoryview(self._buffer) as view:
+            (header_len, crc_header) = _HEADER.unpack_from(view, start)
+            if masked_crc32c(view[start : start + 8]) != crc_header:
+                raise errors.DataLossError(
+                    None,
+                    None,
+                    "{} failed header crc32 check".format(self.filename),
+                )
 
         # The length of the header tells us how many bytes the Event
-        # string takes
-        header_len = int(header[0])
-        event_str = self._read(header_len)
-        if len(event_str) < header_len:
+        # string takes, and it is followed by a 4-byte crc32 of the Event
+        # string, which we check for integrity.
+        data_end = _HEADER.size + header_len
+        available = self._fill(data_end + _FOOTER.size)
+        if available < data_end:
             raise self._truncation_error("data")
-
-        event_crc_calc = masked_crc32c(event_str)
-
-        # The next 4 bytes contain the crc32 of the Event string,
-        # which we check for integrity.
-        crc_event_str = self._read(4)
-        if len(crc_event_str) < 4:
+        if available < data_end + _FOOTER.size:
             raise self._truncation_error("data crc")
-        crc_event = struct.unpack("<I", crc_event_str)
-        if event_crc_calc != crc_event[0]:
-            raise errors.DataLossError(
-                None,
-                None,
-                "{} failed event crc32 check".format(self.filename),
-            )
-
-        # Set the current event to be read later by record() call
-        self.curr_event = event_str
-        # Clear the buffered partial record since we're done reading it.
-        self._buffer = b""
-
-    def _read(self, n):
-        """Read up to n bytes from the underlying file, with buffering.
 
-        Reads are satisfied from a buffer of previous data read starting at
-        `self._buffer_pos` until the buffer is exhausted, and then from the
-        actual underlying file. Any new data is added to the buffer, and
-        `self._buffer_pos` is advanced to the point in the buffer past all
-        data returned as part of this read.
+        start = self._buffer_pos
+        with memoryview(self._buffer) as view, view[
+            start + _HEADER.size : start + data_end
+        ] as event:
+            (crc_event,) = _FOOTER.unpack_from(view, start + data_end)
+            if masked_crc32c(event) != crc_event:
+                raise errors.DataLossError(
+                    None,
+                    None,
+                    "{} failed event crc32 check".format(self.filename),
+                )
+            # Set the current event to be read later by record() call. This
+            # is the only copy of the payload; the buffer is reused.
+            self.curr_event = event.tobytes()
+        self._buffer_pos = start + data_end + _FOOTER.size
+
+    def _fill(self, n):
+        """Buffer up to `n` unconsumed bytes, reading whole blocks.
+
+        Reads from the underlying file only if fewer than `n` bytes are
+        already buffered past `self._buffer_pos`. Before reading, consumed
+        data is dropped from the front of the buffer so that it does not
+        grow without bound.
 
         Args:
-          n: non-negative number of bytes to read
+          n: non-negative number of bytes wanted
 
         Returns:
-          bytestring of data read, up to n bytes
+          The number of unconsumed bytes now buffered, which is less than
+          `n` only if the end of the file was reached.
         """
-        result = self._buffer[self._buffer_pos : self._buffer_pos + n]
-        self._buffer_pos += len(result)
-        n -= len(result)
-        if n > 0:
-            new_data = self.file_handle.read(n)
-            result += new_data
+        available = len(self._buffer) - self._buffer_pos
+        if available >= n:
+            return available
+        del self._buffer[: self._buffer_pos]
+        self._buffer_pos = 0
+        while available < n:
+            new_data = self._read_block(max(_READ_BLOCK_SIZE, n - available))
+            if new_data is None:
+                break
             self._buffer += new_data
-            self._buffer_pos += len(new_data)
+            available += len(new_data)
+        return available
+
+    def _read_block(self, size):
+        """Reads a block of up to `size` bytes from the file.
+
+        Returns:
+          The record data in the block, which for a compressed file is
+          its decompressed contents and may be empty; or `None` at the
+          end of the file.
+        """
+        data = self.file_handle.read(size)
+        if not data:
+            return None
+        if self._decompressor is None:
+            return data
+        try:
+            result = self._decompressor.decompress(data)
+            # A file may hold several concatenated streams.
+            while self._decompressor.eof and self._decompressor.unused_data:
+                data = self._decompressor.unused_data
+                self._decompressor = self._new_decompressor()
+                result += self._decompressor.decompress(data)
+        except zlib.error as e:
+            raise errors.DataLossError(
+                None,
+                None,
+                "{} failed to decompress: {}".format(self.filename, e),
+            )
         return result
 
+    def _new_decompressor(self):
+        return zlib.decompressobj(COMPRESSION_WBITS[self.compression_type])
+
     def _truncation_error(self, section):
         return errors.DataLossError(
             None,
@@ -285,3 +505,7 @@ class PyRecordReader_New:
 
     def record(self):
         return self.curr_event
+
+    def close(self):
+        """Closes the file, releasing any handle that reading it holds."""
+        self.file_handle.close()
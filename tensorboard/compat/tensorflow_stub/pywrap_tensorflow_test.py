@@ -0,0 +1,248 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+import array
+import os
+import random
+import struct
+import zlib
+from unittest import mock
+
+import numpy as np
+
+from tensorboard import test as tb_test
+from tensorboard.compat.tensorflow_stub import errors
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
+from tensorboard.compat.tensorflow_stub.io import gfile
+
+
+def _bytewise_crc_update(crc, data):
+    crc ^= 0xFFFFFFFF
+    for b in bytearray(data):
+        crc = pywrap_tensorflow.CRC_TABLE[(crc ^ b) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _frame(data):
+    header = struct.pack("<Q", len(data))
+    return b"".join(
+        [
+            header,
+            struct.pack("<I", pywrap_tensorflow.masked_crc32c(header)),
+            data,
+            struct.pack("<I", pywrap_tensorflow.masked_crc32c(data)),
+        ]
+    )
+
+
+class Crc32cTest(tb_test.TestCase):
+    def _random_bytes(self, n):
+        rng = random.Random(n)
+        return bytes(rng.getrandbits(8) for _ in range(n))
+
+    def testKnownValues(self):
+        # Check values from RFC 3720, section B.4.
+        self.assertEqual(pywrap_tensorflow.crc32c(b""), 0)
+        self.assertEqual(pywrap_tensorflow.crc32c(b"\x00" * 32), 0x8A9136AA)
+        self.assertEqual(pywrap_tensorflow.crc32c(b"\xff" * 32), 0x62A8AB43)
+        self.assertEqual(pywrap_tensorflow.crc32c(bytes(range(32))), 0x46DD794E)
+        self.assertEqual(pywrap_tensorflow.crc32c(b"123456789"), 0xE3069283)
+
+    def testMaskedCrc(self):
+        self.assertEqual(
+            pywrap_tensorflow.masked_crc32c(b"123456789"), 0xC78AB0E5
+        )
+
+    def testMatchesBytewiseAcrossSizes(self):
+        threshold = pywrap_tensorflow._BULK_THRESHOLD
+        lane = pywrap_tensorflow._BULK_LANE_BYTES
+        sizes = [0, 1, 3, 4, 7, 8, 9, 63, 64, 65, 1000]
+        sizes += [threshold - 1, threshold, threshold + 1]
+        sizes += [threshold + lane, threshold + 3 * lane + 5, 100003]
+        for size in sizes:
+            data = self._random_bytes(size)
+            for crc in (0, 0xDEADBEEF):
+                with self.subTest(size=size, crc=crc):
+                    self.assertEqual(
+                        pywrap_tensorflow.crc_update(crc, data),
+                        _bytewise_crc_update(crc, data),
+                    )
+
+    def testIncrementalUpdate(self):
+        data = self._random_bytes(20000)
+        crc = pywrap_tensorflow.CRC_INIT
+        for start in range(0, len(data), 6000):
+            crc = pywrap_tensorflow.crc_update(crc, data[start : start + 6000])
+        self.assertEqual(
+            pywrap_tensorflow.crc_finalize(crc),
+            pywrap_tensorflow.crc32c(data),
+        )
+
+    def testAcceptsVariousInputTypes(self):
+        data = self._random_bytes(5000)
+        expected = pywrap_tensorflow.crc32c(data)
+        inputs = [
+            bytearray(data),
+            memoryview(data),
+            array.array("B", data),
+            np.frombuffer(data, dtype=np.uint8),
+            list(data),
+            (b for b in data),
+        ]
+        for value in inputs:
+            with self.subTest(type=type(value).__name__):
+                self.assertEqual(pywrap_tensorflow.crc32c(value), expected)
+
+
+class PyRecordReaderTest(tb_test.TestCase):
+    def _write(self, filename, data, mode="wb"):
+        with open(filename, mode) as f:
+            f.write(data)
+
+    def _read_all(self, reader):
+        records = []
+        while True:
+            try:
+                reader.GetNext()
+            except errors.OutOfRangeError:
+                return records
+            records.append(reader.record())
+
+    def testReadsRecordsAcrossBlockBoundaries(self):
+        filename = os.path.join(self.get_temp_dir(), "events")
+        records = [b"x" * (i % 37) + str(i).encode() for i in range(500)]
+        self._write(filename, b"".join(_frame(r) for r in records))
+        # Small blocks force records to straddle block boundaries, and
+        # some records to be larger than a block.
+        with mock.patch.object(pywrap_tensorflow, "_READ_BLOCK_SIZE", 29):
+            reader = pywrap_tensorflow.PyRecordReader_New(filename)
+            self.assertEqual(self._read_all(reader), records)
+
+    def testCloseReleasesFileHandle(self):
+        filename = os.path.join(self.get_temp_dir(), "events")
+        self._write(filename, _frame(b"hello"))
+        pool = gfile.get_filesystem(filename)._handle_pool
+        pooled = len(pool)
+        reader = pywrap_tensorflow.PyRecordReader_New(filename)
+        self.assertEqual(self._read_all(reader), [b"hello"])
+        self.assertEqual(len(pool), pooled + 1)
+        reader.close()
+        self.assertEqual(len(pool), pooled)
+
+    def testRecordIsBytes(self):
+        filename = os.path.join(self.get_temp_dir(), "events")
+        self._write(filename, _frame(b"hello"))
+        reader = pywrap_tensorflow.PyRecordReader_New(filename)
+        reader.GetNext()
+        self.assertIsInstance(reader.record(), bytes)
+        self.assertEqual(reader.record(), b"hello")
+
+    def testRecoversFromTruncatedRecords(self):
+        filename = os.path.join(self.get_temp_dir(), "events")
+        framed = _frame(b"first") + _frame(b"second payload")
+        cases = [
+            (5, "header"),
+            (10, "header crc"),
+            (20, "data"),
+            (28, "data crc"),
+        ]
+        for cut, section in cases:
+            with self.subTest(section=section):
+                first_len = len(_frame(b"first"))
+                self._write(filename, framed[: first_len + cut])
+                reader = pywrap_tensorflow.PyRecordReader_New(filename)
+                reader.GetNext()
+                self.assertEqual(reader.record(), b"first")
+                with self.assertRaisesRegex(
+                    errors.DataLossError, "in %s$" % section
+                ):
+                    reader.GetNext()
+                self.assertIsNone(reader.record())
+                # Completing the record lets a retry pick it up.
+                self._write(filename, framed[first_len + cut :], mode="ab")
+                reader.GetNext()
+                self.assertEqual(reader.record(), b"second payload")
+                with self.assertRaises(errors.OutOfRangeError):
+                    reader.GetNext()
+
+    def testCorruptPayload(self):
+        filename = os.path.join(self.get_temp_dir(), "events")
+        framed = bytearray(_frame(b"payload"))
+        framed[14] ^= 0xFF
+        self._write(filename, bytes(framed))
+        reader = pywrap_tensorflow.PyRecordReader_New(filename)
+        with self.assertRaisesRegex(errors.DataLossError, "event crc32"):
+            reader.GetNext()
+
+    def testReadsCompressedRecords(self):
+        records = [b"x" * (i % 37) + str(i).encode() for i in range(500)]
+        data = b"".join(_frame(r) for r in records)
+        wbits = {"GZIP": 16 + zlib.MAX_WBITS, "ZLIB": zlib.MAX_WBITS}
+        for compression_type, bits in wbits.items():
+            with self.subTest(compression_type=compression_type):
+                filename = os.path.join(self.get_temp_dir(), compression_type)
+                # Two concatenated streams are read as one.
+                half = len(data) // 2
+                compressed = b""
+                for part in (data[:half], data[half:]):
+                    c = zlib.compressobj(wbits=bits)
+                    compressed += c.compress(part) + c.flush()
+                self._write(filename, compressed)
+                with mock.patch.object(
+                    pywrap_tensorflow, "_READ_BLOCK_SIZE", 29
+                ):
+                    reader = pywrap_tensorflow.PyRecordReader_New(
+                        filename, compression_type=compression_type
+                    )
+                    self.assertEqual(self._read_all(reader), records)
+
+    def testTailsGrowingCompressedFile(self):
+        filename = os.path.join(self.get_temp_dir(), "events.gz")
+        c = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        self._write(filename, c.compress(_frame(b"first")))
+        self._write(filename, c.flush(zlib.Z_SYNC_FLUSH), mode="ab")
+        reader = pywrap_tensorflow.PyRecordReader_New(
+            filename, compression_type=b"GZIP"
+        )
+        self.assertEqual(self._read_all(reader), [b"first"])
+        second = _frame(b"second")
+        self._write(filename, c.compress(second[:10]), mode="ab")
+        self._write(filename, c.flush(zlib.Z_SYNC_FLUSH), mode="ab")
+        with self.assertRaisesRegex(errors.DataLossError, "header crc"):
+            reader.GetNext()
+        self._write(filename, c.compress(second[10:]) + c.flush(), mode="ab")
+        self.assertEqual(self._read_all(reader), [b"second"])
+
+    def testCorruptCompressedData(self):
+        filename = os.path.join(self.get_temp_dir(), "events.zlib")
+        self._write(filename, b"not zlib data")
+        reader = pywrap_tensorflow.PyRecordReader_New(
+            filename, compression_type="ZLIB"
+        )
+        with self.assertRaisesRegex(errors.DataLossError, "decompress"):
+            reader.GetNext()
+
+    def testUnsupportedCompressionType(self):
+        filename = os.path.join(self.get_temp_dir(), "events")
+        self._write(filename, b"")
+        with self.assertRaisesRegex(errors.UnimplementedError, "SNAPPY"):
+            pywrap_tensorflow.PyRecordReader_New(
+                filename, compression_type="SNAPPY"
+            )
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -0,0 +1,190 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for the TFRecord reader in the TensorFlow stub.
+
+Writes event files of small scalar events and reads them back with
+`pywrap_tensorflow.PyRecordReader_New` and with the reader it replaced,
+which issued separate small reads per record section and grew its buffer
+by concatenation. Throughput is reported in records per second and MB/s
+(best of three).
+
+Sample results on a cloud VM (Python 3.11):
+
+    RECORDS   LEGACY_RPS  CURRENT_RPS  LEGACY_MBPS  CURRENT_MBPS  SPEEDUP
+       1000   90704.4616  102526.9300       3.8885        4.3953   1.1303
+      10000   72791.2231   84979.1118       3.1291        3.6530   1.1674
+     100000   83678.4020  106979.5133       3.6680        4.6894   1.2785
+
+Both readers verify the same two CRC-32C checksums per record, which now
+account for about two thirds of the remaining per-record cost.
+"""
+
+
+import os
+import struct
+import tempfile
+import time
+
+from absl import app
+from absl import logging
+
+from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.compat.tensorflow_stub import errors
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
+from tensorboard.compat.tensorflow_stub.io import gfile
+from tensorboard.summary.writer import record_writer
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+
+class LegacyRecordReader:
+    """The original stub record reader, kept as a baseline."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.curr_event = None
+        self.file_handle = gfile.GFile(filename, "rb")
+        self._buffer = b""
+        self._buffer_pos = 0
+
+    def GetNext(self):
+        self._buffer_pos = 0
+        self.curr_event = None
+        header_str = self._read(8)
+        if not header_str:
+            raise errors.OutOfRangeError(None, None, "No more events to read")
+        header = struct.unpack("<Q", header_str)
+        crc_header = struct.unpack("<I", self._read(4))
+        if pywrap_tensorflow.masked_crc32c(header_str) != crc_header[0]:
+            raise errors.DataLossError(None, None, "header crc32")
+        event_str = self._read(int(header[0]))
+        event_crc_calc = pywrap_tensorflow.masked_crc32c(event_str)
+        crc_event = struct.unpack("<I", self._read(4))
+        if event_crc_calc != crc_event[0]:
+            raise errors.DataLossError(None, None, "event crc32")
+        self.curr_event = event_str
+        self._buffer = b""
+
+    def _read(self, n):
+        result = self._buffer[self._buffer_pos : self._buffer_pos + n]
+        self._buffer_pos += len(result)
+        n -= len(result)
+        if n > 0:
+            new_data = self.file_handle.read(n)
+            result += new_data
+            self._buffer += new_data
+            self._buffer_pos += len(new_data)
+        return result
+
+    def record(self):
+        return self.curr_event
+
+
+def write_scalar_events(filename, count):
+    """Writes `count` single-value scalar events to `filename`."""
+    with open(filename, "wb") as f:
+        writer = record_writer.RecordWriter(f)
+        for step in range(count):
+            event = event_pb2.Event(
+                step=step,
+                wall_time=1.6e9 + step,
+                summary=summary_pb2.Summary(
+                    value=[
+                        summary_pb2.Summary.Value(
+                            tag="loss", simple_value=1.0 / (step + 1)
+                        )
+                    ]
+                ),
+            )
+            writer.write(event.SerializeToString())
+
+
+def bench(reader_fn, filename):
+    """Reads all records from `filename`; returns `(count, seconds)`."""
+    start_time = time.perf_counter()
+    reader = reader_fn(filename)
+    count = 0
+    while True:
+        try:
+            reader.GetNext()
+        except errors.OutOfRangeError:
+            break
+        count += 1
+    return (count, time.perf_counter() - start_time)
+
+
+def _format_line(headers, fields):
+    """Format a line of a table.
+
+    Arguments:
+      headers: A list of strings that are used as the table headers.
+      fields: A list of the same length as `headers` where `fields[i]` is
+        the entry for `headers[i]` in this row. Elements can be of
+        arbitrary types. Pass `headers` to print the header row.
+
+    Returns:
+      A pretty string.
+    """
+    assert len(fields) == len(headers), (fields, headers)
+    fields = [
+        "%2.4f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+
+    headers = (
+        "RECORDS",
+        "LEGACY_RPS",
+        "CURRENT_RPS",
+        "LEGACY_MBPS",
+        "CURRENT_MBPS",
+        "SPEEDUP",
+    )
+    logger.info(_format_line(headers, headers))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for count in [1000, 10000, 100000]:
+            filename = os.path.join(tmpdir, "events.%d" % count)
+            write_scalar_events(filename, count)
+            size_mb = os.path.getsize(filename) / 1e6
+            legacy = min(
+                bench(LegacyRecordReader, filename)[1] for _ in range(3)
+            )
+            current = min(
+                bench(pywrap_tensorflow.PyRecordReader_New, filename)[1]
+                for _ in range(3)
+            )
+            fields = (
+                count,
+                count / legacy,
+                count / current,
+                size_mb / legacy,
+                size_mb / current,
+                legacy / current,
+            )
+            logger.info(_format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -18,6 +18,7 @@ import collections
 import contextlib
 
 import grpc
+import numpy as np
 
 from tensorboard.util import tensor_util
 from tensorboard.util import timing
@@ -122,15 +123,9 @@ class GrpcDataProvider(provider.DataProvider):
         downsample=None,
         run_tag_filter=None,
     ):
-        with timing.log_latency("build request"):
-            req = data_provider_pb2.ReadScalarsRequest()
-            req.experiment_id = experiment_id
-            req.plugin_filter.plugin_name = plugin_name
-            _populate_rtf(run_tag_filter, req.run_tag_filter)
-            req.downsample.num_points = downsample
-        with timing.log_latency("_stub.ReadScalars"):
-            with _translate_grpc_error():
-                res = self._stub.ReadScalars(req)
+        res = self._read_scalars(
+            experiment_id, plugin_name, downsample, run_tag_filter
+        )
         with timing.log_latency("build result"):
             result = {}
             for run_entry in res.runs:
@@ -149,6 +144,33 @@ class GrpcDataProvider(provider.DataProvider):
                         series.append(point)
             return result
 
+    @timing.log_latency
+    def stream_scalars(
+        self,
+        ctx,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        res = self._read_scalars(
+            experiment_id, plugin_name, downsample, run_tag_filter
+        )
+        return _scalar_batches(res)
+
+    def _read_scalars(self, experiment_id, plugin_name, downsample, rtf):
+        """Issues a `ReadScalars` RPC and returns its response."""
+        with timing.log_latency("build request"):
+            req = data_provider_pb2.ReadScalarsRequest()
+            req.experiment_id = experiment_id
+            req.plugin_filter.plugin_name = plugin_name
+            _populate_rtf(rtf, req.run_tag_filter)
+            req.downsample.num_points = downsample
+        with timing.log_latency("_stub.ReadScalars"):
+            with _translate_grpc_error():
+                return self._stub.ReadScalars(req)
+
     @timing.log_latency
     def read_last_scalars(
         self,
@@ -225,15 +247,9 @@ class GrpcDataProvider(provider.DataProvider):
         downsample=None,
         run_tag_filter=None,
     ):
-        with timing.log_latency("build request"):
-            req = data_provider_pb2.ReadTensorsRequest()
-            req.experiment_id = experiment_id
-            req.plugin_filter.plugin_name = plugin_name
-            _populate_rtf(run_tag_filter, req.run_tag_filter)
-            req.downsample.num_points = downsample
-        with timing.log_latency("_stub.ReadTensors"):
-            with _translate_grpc_error():
-                res = self._stub.ReadTensors(req)
+        res = self._read_tensors(
+            experiment_id, plugin_name, downsample, run_tag_filter
+        )
         with timing.log_latency("build result"):
             result = {}
             for run_entry in res.runs:
@@ -252,6 +268,33 @@ class GrpcDataProvider(provider.DataProvider):
                         series.append(point)
             return result
 
+    @timing.log_latency
+    def stream_tensors(
+        self,
+        ctx,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        res = self._read_tensors(
+            experiment_id, plugin_name, downsample, run_tag_filter
+        )
+        return _tensor_batches(res)
+
+    def _read_tensors(self, experiment_id, plugin_name, downsample, rtf):
+        """Issues a `ReadTensors` RPC and returns its response."""
+        with timing.log_latency("build request"):
+            req = data_provider_pb2.ReadTensorsRequest()
+            req.experiment_id = experiment_id
+            req.plugin_filter.plugin_name = plugin_name
+            _populate_rtf(rtf, req.run_tag_filter)
+            req.downsample.num_points = downsample
+        with timing.log_latency("_stub.ReadTensors"):
+            with _translate_grpc_error():
+                return self._stub.ReadTensors(req)
+
     @timing.log_latency
     def list_blob_sequences(
         self, ctx, experiment_id, plugin_name, run_tag_filter=None
@@ -363,3 +406,31 @@ def _populate_rtf(run_tag_filter, rtf_proto):
 def _timestamp_proto_to_float(ts):
     """Converts `timestamp_pb2.Timestamp` to float seconds since epoch."""
     return ts.ToNanoseconds() / 1e9
+
+
+def _scalar_batches(res):
+    """Yields a `provider.ScalarBatch` per time series in a response."""
+    for run_entry in res.runs:
+        for tag_entry in run_entry.tags:
+            d = tag_entry.data
+            yield provider.ScalarBatch(
+                run=run_entry.run_name,
+                tag=tag_entry.tag_name,
+                step=np.array(d.step, dtype=np.int64),
+                wall_time=np.array(d.wall_time, dtype=np.float64),
+                value=np.array(d.value, dtype=np.float64),
+            )
+
+
+def _tensor_batches(res):
+    """Yields a `provider.TensorBatch` per time series in a response."""
+    for run_entry in res.runs:
+        for tag_entry in run_entry.tags:
+            d = tag_entry.data
+            yield provider.TensorBatch(
+                run=run_entry.run_name,
+                tag=tag_entry.tag_name,
+                step=np.array(d.step, dtype=np.int64),
+                wall_time=np.array(d.wall_time, dtype=np.float64),
+                numpy=[tensor_util.make_ndarray(v) for v in d.value],
+            )
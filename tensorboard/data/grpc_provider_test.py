@@ -230,6 +230,41 @@ class GrpcDataProviderTest(tb_test.TestCase):
         req.downsample.num_points = 4
         self.stub.ReadScalars.assert_called_once_with(req)
 
+    def test_stream_scalars(self):
+        res = data_provider_pb2.ReadScalarsResponse()
+        run = res.runs.add(run_name="test")
+        tag = run.tags.add(tag_name="accuracy")
+        tag.data.step.extend([0, 1, 2, 4])
+        tag.data.wall_time.extend([1234.0, 1235.0, 1236.0, 1237.0])
+        tag.data.value.extend([0.25, 0.50, 0.75, 1.00])
+        self.stub.ReadScalars.return_value = res
+
+        actual = self.provider.stream_scalars(
+            self.ctx,
+            experiment_id="123",
+            plugin_name="scalars",
+            run_tag_filter=provider.RunTagFilter(runs=["test", "nope"]),
+            downsample=4,
+        )
+        # The RPC is issued before iterating, so errors surface early.
+        req = data_provider_pb2.ReadScalarsRequest()
+        req.experiment_id = "123"
+        req.plugin_filter.plugin_name = "scalars"
+        req.run_tag_filter.runs.names.extend(["nope", "test"])  # sorted
+        req.downsample.num_points = 4
+        self.stub.ReadScalars.assert_called_once_with(req)
+
+        expected = [
+            provider.ScalarBatch(
+                run="test",
+                tag="accuracy",
+                step=np.array([0, 1, 2, 4]),
+                wall_time=np.array([1234.0, 1235.0, 1236.0, 1237.0]),
+                value=np.array([0.25, 0.50, 0.75, 1.00]),
+            )
+        ]
+        self.assertEqual(list(actual), expected)
+
     def test_read_last_scalars(self):
         tag1 = data_provider_pb2.ReadScalarsResponse.TagEntry(
             tag_name="tag1",
@@ -393,6 +428,39 @@ class GrpcDataProviderTest(tb_test.TestCase):
         req.downsample.num_points = 3
         self.stub.ReadTensors.assert_called_once_with(req)
 
+    def test_stream_tensors(self):
+        res = data_provider_pb2.ReadTensorsResponse()
+        run = res.runs.add(run_name="test")
+        tag = run.tags.add(tag_name="weights")
+        tag.data.step.extend([0, 1])
+        tag.data.wall_time.extend([1234.0, 1235.0])
+        tag.data.value.append(tensor_util.make_tensor_proto([0.0, 42.0]))
+        tag.data.value.append(tensor_util.make_tensor_proto([[1.0]]))
+        self.stub.ReadTensors.return_value = res
+
+        actual = self.provider.stream_tensors(
+            self.ctx,
+            experiment_id="123",
+            plugin_name="histograms",
+            downsample=3,
+        )
+        expected = [
+            provider.TensorBatch(
+                run="test",
+                tag="weights",
+                step=np.array([0, 1]),
+                wall_time=np.array([1234.0, 1235.0]),
+                numpy=[np.array([0.0, 42.0]), np.array([[1.0]])],
+            )
+        ]
+        self.assertEqual(list(actual), expected)
+
+        req = data_provider_pb2.ReadTensorsRequest()
+        req.experiment_id = "123"
+        req.plugin_filter.plugin_name = "histograms"
+        req.downsample.num_points = 3
+        self.stub.ReadTensors.assert_called_once_with(req)
+
     def test_list_blob_sequences(self):
         res = data_provider_pb2.ListBlobSequencesResponse()
         run1 = res.runs.add(run_name="train")
@@ -166,6 +166,42 @@ class DataProvider(metaclass=abc.ABCMeta):
         """
         return None
 
+    def read_version_tokens(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        run_tag_filter=None,
+    ):
+        """Read tokens that identify the current data of time series.
+
+        A time series's token changes whenever the result of reading it
+        (with any data class and sampling parameters) may change, so
+        clients can use tokens to avoid re-reading unchanged data: for
+        instance, to build HTTP ETags.
+
+        This operation is optional.
+
+        Args:
+          ctx: A TensorBoard `RequestContext` value.
+          experiment_id: ID of enclosing experiment.
+          plugin_name: String name of the TensorBoard plugin that created
+            the data to be queried. Required.
+          run_tag_filter: Optional `RunTagFilter` value. If omitted, all
+            runs and tags will be included.
+
+        Returns:
+          A nested map `d` such that `d[run][tag]` is a `str` token for
+          each time series that has data, or `None` if this operation is
+          not supported by this data provider. Tokens contain only ASCII
+          letters, digits, `.` and `-`.
+
+        Raises:
+          tensorboard.errors.PublicError: See `DataProvider` class docstring.
+        """
+        return None
+
     @abc.abstractmethod
     def list_runs(self, ctx=None, *, experiment_id):
         """List all runs within an experiment.
@@ -354,6 +390,123 @@ class DataProvider(metaclass=abc.ABCMeta):
         """
         pass
 
+    def stream_scalars(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        """Read values from scalar time series, one time series at a time.
+
+        This is like `read_scalars`, but each time series is given as a
+        `ScalarBatch` of NumPy arrays rather than as a list of
+        `ScalarDatum` values, so that reading many points does not take a
+        Python object per point, and callers can write out each time
+        series before the next one is read.
+
+        This default implementation calls `read_scalars`. Subclasses should
+        override it to build the arrays directly.
+
+        Args:
+          ctx: A TensorBoard `RequestContext` value.
+          experiment_id: ID of enclosing experiment.
+          plugin_name: String name of the TensorBoard plugin that created
+            the data to be queried. Required.
+          downsample: Integer number of steps to which to downsample the
+            results, as for `read_scalars`. Required.
+          run_tag_filter: Optional `RunTagFilter` value, as for
+            `read_scalars`.
+
+        Returns:
+          An iterator of `ScalarBatch` values, one for each run-tag
+          combination that actually exists, in no particular order.
+
+        Raises:
+          tensorboard.errors.PublicError: See `DataProvider` class docstring.
+            Errors are raised by this call rather than while iterating.
+        """
+        result = self.read_scalars(
+            ctx,
+            experiment_id=experiment_id,
+            plugin_name=plugin_name,
+            downsample=downsample,
+            run_tag_filter=run_tag_filter,
+        )
+        return (
+            ScalarBatch(
+                run=run,
+                tag=tag,
+                step=np.array([d.step for d in data], dtype=np.int64),
+                wall_time=np.array(
+                    [d.wall_time for d in data], dtype=np.float64
+                ),
+                value=np.array([d.value for d in data], dtype=np.float64),
+            )
+            for (run, tag_to_data) in result.items()
+            for (tag, data) in tag_to_data.items()
+        )
+
+    def stream_tensors(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        """Read values from tensor time series, one time series at a time.
+
+        This is like `read_tensors`, but each time series is given as a
+        `TensorBatch`. See `stream_scalars`.
+
+        This default implementation calls `read_tensors`. Subclasses should
+        override it to build the batches directly.
+
+        Args:
+          ctx: A TensorBoard `RequestContext` value.
+          experiment_id: ID of enclosing experiment.
+          plugin_name: String name of the TensorBoard plugin that created
+            the data to be queried. Required.
+          downsample: Integer number of steps to which to downsample the
+            results, as for `read_tensors`. Required.
+          run_tag_filter: Optional `RunTagFilter` value, as for
+            `read_tensors`.
+
+        Returns:
+          An iterator of `TensorBatch` values, one for each run-tag
+          combination that actually exists, in no particular order.
+
+        Raises:
+          tensorboard.errors.PublicError: See `DataProvider` class docstring.
+            Errors are raised by this call rather than while iterating.
+        """
+        result = self.read_tensors(
+            ctx,
+            experiment_id=experiment_id,
+            plugin_name=plugin_name,
+            downsample=downsample,
+            run_tag_filter=run_tag_filter,
+        )
+        if result is None:
+            return None
+        return (
+            TensorBatch(
+                run=run,
+                tag=tag,
+                step=np.array([d.step for d in data], dtype=np.int64),
+                wall_time=np.array(
+                    [d.wall_time for d in data], dtype=np.float64
+                ),
+                numpy=[d.numpy for d in data],
+            )
+            for (run, tag_to_data) in result.items()
+            for (tag, data) in tag_to_data.items()
+        )
+
     def list_blob_sequences(
         self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
     ):
@@ -1099,6 +1252,156 @@ class TensorDatum:
         )
 
 
+class ScalarBatch:
+    """The data of a scalar time series for a run and tag, as arrays.
+
+    Attributes:
+      run: The run name, as a `str`.
+      tag: The tag name, as a `str`.
+      step: A 1-D `numpy.ndarray` of `int64` steps, sorted.
+      wall_time: A 1-D `numpy.ndarray` of `float64` wall times, as
+        seconds since epoch, parallel to `step`.
+      value: A 1-D `numpy.ndarray` of `float64` scalar values, parallel
+        to `step`. Integer values too large for a `float64` to hold
+        exactly may instead be given as `int64` or `uint64`.
+    """
+
+    __slots__ = ("_run", "_tag", "_step", "_wall_time", "_value")
+
+    def __init__(self, run, tag, step, wall_time, value):
+        self._run = run
+        self._tag = tag
+        self._step = step
+        self._wall_time = wall_time
+        self._value = value
+
+    @property
+    def run(self):
+        return self._run
+
+    @property
+    def tag(self):
+        return self._tag
+
+    @property
+    def step(self):
+        return self._step
+
+    @property
+    def wall_time(self):
+        return self._wall_time
+
+    @property
+    def value(self):
+        return self._value
+
+    def __len__(self):
+        return len(self._step)
+
+    def __eq__(self, other):
+        if not isinstance(other, ScalarBatch):
+            return False
+        if self._run != other._run or self._tag != other._tag:
+            return False
+        if not np.array_equal(self._step, other._step):
+            return False
+        if not np.array_equal(self._wall_time, other._wall_time):
+            return False
+        if not np.array_equal(self._value, other._value, equal_nan=True):
+            return False
+        return True
+
+    # Unhashable type: numpy arrays are mutable.
+    __hash__ = None
+
+    def __repr__(self):
+        return "ScalarBatch(%s)" % ", ".join(
+            (
+                "run=%r" % (self._run,),
+                "tag=%r" % (self._tag,),
+                "step=%r" % (self._step,),
+                "wall_time=%r" % (self._wall_time,),
+                "value=%r" % (self._value,),
+            )
+        )
+
+
+class TensorBatch:
+    """The data of a tensor time series for a run and tag.
+
+    Attributes:
+      run: The run name, as a `str`.
+      tag: The tag name, as a `str`.
+      step: A 1-D `numpy.ndarray` of `int64` steps, sorted.
+      wall_time: A 1-D `numpy.ndarray` of `float64` wall times, as
+        seconds since epoch, parallel to `step`.
+      numpy: A list of `numpy.ndarray` values with the tensor contents
+        of each datum, parallel to `step`. Tensors at different steps
+        may differ in dtype and shape.
+    """
+
+    __slots__ = ("_run", "_tag", "_step", "_wall_time", "_numpy")
+
+    def __init__(self, run, tag, step, wall_time, numpy):
+        self._run = run
+        self._tag = tag
+        self._step = step
+        self._wall_time = wall_time
+        self._numpy = numpy
+
+    @property
+    def run(self):
+        return self._run
+
+    @property
+    def tag(self):
+        return self._tag
+
+    @property
+    def step(self):
+        return self._step
+
+    @property
+    def wall_time(self):
+        return self._wall_time
+
+    @property
+    def numpy(self):
+        return self._numpy
+
+    def __len__(self):
+        return len(self._step)
+
+    def __eq__(self, other):
+        if not isinstance(other, TensorBatch):
+            return False
+        if self._run != other._run or self._tag != other._tag:
+            return False
+        if not np.array_equal(self._step, other._step):
+            return False
+        if not np.array_equal(self._wall_time, other._wall_time):
+            return False
+        if len(self._numpy) != len(other._numpy):
+            return False
+        return all(
+            np.array_equal(x, y) for (x, y) in zip(self._numpy, other._numpy)
+        )
+
+    # Unhashable type: numpy arrays are mutable.
+    __hash__ = None
+
+    def __repr__(self):
+        return "TensorBatch(%s)" % ", ".join(
+            (
+                "run=%r" % (self._run,),
+                "tag=%r" % (self._tag,),
+                "step=%r" % (self._step,),
+                "wall_time=%r" % (self._wall_time,),
+                "numpy=%r" % (self._numpy,),
+            )
+        )
+
+
 class BlobSequenceTimeSeries(_TimeSeries):
     """Metadata about a blob sequence time series for a particular run and tag.
 
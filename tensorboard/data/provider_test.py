@@ -26,6 +26,102 @@ class DataProviderTest(tb_test.TestCase):
         with self.assertRaisesRegex(TypeError, "abstract class"):
             provider.DataProvider()
 
+    def test_default_stream_scalars(self):
+        batches = _ListProvider().stream_scalars(
+            experiment_id="123", plugin_name="scalars", downsample=10
+        )
+        self.assertEqual(
+            list(batches),
+            [
+                provider.ScalarBatch(
+                    run="train",
+                    tag="loss",
+                    step=np.array([0, 5]),
+                    wall_time=np.array([1.0, 2.0]),
+                    value=np.array([0.5, 0.25]),
+                ),
+                provider.ScalarBatch(
+                    run="train",
+                    tag="empty",
+                    step=np.array([], dtype=np.int64),
+                    wall_time=np.array([]),
+                    value=np.array([]),
+                ),
+            ],
+        )
+
+    def test_default_stream_tensors(self):
+        batches = _ListProvider().stream_tensors(
+            experiment_id="123", plugin_name="histograms", downsample=10
+        )
+        self.assertEqual(
+            list(batches),
+            [
+                provider.TensorBatch(
+                    run="train",
+                    tag="weights",
+                    step=np.array([3]),
+                    wall_time=np.array([4.0]),
+                    numpy=[np.array([1, 2])],
+                )
+            ],
+        )
+
+
+class _ListProvider(provider.DataProvider):
+    """Provider that only implements the required list and read methods."""
+
+    def list_runs(self, ctx=None, *, experiment_id):
+        return []
+
+    def list_scalars(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        return {}
+
+    def read_scalars(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        return {
+            "train": {
+                "loss": [
+                    provider.ScalarDatum(step=0, wall_time=1.0, value=0.5),
+                    provider.ScalarDatum(step=5, wall_time=2.0, value=0.25),
+                ],
+                "empty": [],
+            }
+        }
+
+    def read_last_scalars(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        return {}
+
+    def read_tensors(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        return {
+            "train": {
+                "weights": [
+                    provider.TensorDatum(
+                        step=3, wall_time=4.0, numpy=np.array([1, 2])
+                    )
+                ]
+            }
+        }
+
 
 class ExperimentMetadataTest(tb_test.TestCase):
     def test_defaults(self):
@@ -262,6 +358,66 @@ class TensorDatumTest(tb_test.TestCase):
             hash(x)
 
 
+class ScalarBatchTest(tb_test.TestCase):
+    def _batch(self, tag="loss", value=(0.5, 0.25)):
+        return provider.ScalarBatch(
+            run="train",
+            tag=tag,
+            step=np.array([1, 2]),
+            wall_time=np.array([3.0, 4.0]),
+            value=np.array(value),
+        )
+
+    def test_repr(self):
+        repr_ = repr(self._batch())
+        self.assertIn("'train'", repr_)
+        self.assertIn("'loss'", repr_)
+        self.assertIn(repr(np.array([3.0, 4.0])), repr_)
+
+    def test_len(self):
+        self.assertLen(self._batch(), 2)
+
+    def test_eq(self):
+        self.assertEqual(self._batch(), self._batch())
+        nan = float("nan")
+        self.assertEqual(
+            self._batch(value=(nan, 1)), self._batch(value=(nan, 1))
+        )
+        self.assertNotEqual(self._batch(), self._batch(tag="acc"))
+        self.assertNotEqual(self._batch(), self._batch(value=(0.5, 0.5)))
+        self.assertNotEqual(self._batch(), object())
+
+    def test_hash(self):
+        with self.assertRaisesRegex(TypeError, "unhashable type"):
+            hash(self._batch())
+
+
+class TensorBatchTest(tb_test.TestCase):
+    def _batch(self, numpy=((1.0,), (2.0, 3.0))):
+        return provider.TensorBatch(
+            run="train",
+            tag="weights",
+            step=np.array([1, 2]),
+            wall_time=np.array([3.0, 4.0]),
+            numpy=[np.array(x) for x in numpy],
+        )
+
+    def test_repr(self):
+        repr_ = repr(self._batch())
+        self.assertIn("'weights'", repr_)
+        self.assertIn(repr(np.array([2.0, 3.0])), repr_)
+
+    def test_eq(self):
+        self.assertEqual(self._batch(), self._batch())
+        self.assertNotEqual(self._batch(), self._batch(numpy=((1.0,), (2.0,))))
+        self.assertNotEqual(self._batch(), self._batch(numpy=((1.0,),)))
+        self.assertNotEqual(self._batch(), object())
+
+    def test_hash(self):
+        with self.assertRaisesRegex(TypeError, "unhashable type"):
+            hash(self._batch())
+
+
 class BlobSequenceTimeSeriesTest(tb_test.TestCase):
     def _blob_sequence_time_series(
         self,
@@ -65,6 +65,20 @@ def migrate_event(event, initial_metadata):
     return (event,)
 
 
+def migrate_value(value, initial_metadata):
+    """Migrate a summary value, as `migrate_event` does for each value.
+
+    Args:
+      value: A `Summary.Value`, whose ownership the caller transfers to
+        this method as for `migrate_event`.
+      initial_metadata: As for `migrate_event`.
+
+    Returns:
+      A sequence of `Summary.Value`s to use instead of `value`.
+    """
+    return _migrate_value(value, initial_metadata)
+
+
 def _migrate_graph_event(old_event):
     result = event_pb2.Event()
     result.wall_time = old_event.wall_time
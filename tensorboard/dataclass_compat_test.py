@@ -405,5 +405,28 @@ class MigrateEventTest(tf.test.TestCase):
                 self.assertEqual(new_value.metadata.plugin_data.content, b"1")
 
 
+class MigrateValueTest(tf.test.TestCase):
+    """Tests for `migrate_value`."""
+
+    def test_uses_initial_metadata(self):
+        (first, later) = [
+            summary_pb2.Summary.FromString(
+                scalar_summary.pb("foo", x).SerializeToString()
+            ).value[0]
+            for x in (0.125, 0.25)
+        ]
+        later.ClearField("metadata")
+        initial_metadata = {}
+
+        (migrated,) = dataclass_compat.migrate_value(first, initial_metadata)
+        self.assertEqual(
+            migrated.metadata.data_class, summary_pb2.DATA_CLASS_SCALAR
+        )
+        self.assertIn(first.tag, initial_metadata)
+        (migrated,) = dataclass_compat.migrate_value(later, initial_metadata)
+        self.assertIs(migrated, later)
+        self.assertFalse(migrated.HasField("metadata"))
+
+
 if __name__ == "__main__":
     tf.test.main()
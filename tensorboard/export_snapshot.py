@@ -0,0 +1,74 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""The `tensorboard export_snapshot` subcommand.
+
+Usage:
+
+    tensorboard export_snapshot --logdir LOGDIR --output_dir OUTPUT_DIR
+
+Writes a columnar snapshot of every run under `LOGDIR` to `OUTPUT_DIR`,
+which `tensorboard --logdir OUTPUT_DIR` then serves without parsing
+event files. See `tensorboard.backend.event_processing.columnar_snapshot`
+for the layout.
+"""
+
+
+import sys
+
+from tensorboard import program
+from tensorboard.backend.event_processing import columnar_snapshot
+
+
+class ExportSnapshotSubcommand(program.TensorBoardSubcommand):
+    """Writes a columnar snapshot of a logdir."""
+
+    def name(self):
+        return "export_snapshot"
+
+    def define_flags(self, parser):
+        parser.add_argument(
+            "--logdir",
+            metavar="PATH",
+            type=str,
+            required=True,
+            help="Directory of runs to export.",
+        )
+        parser.add_argument(
+            "--output_dir",
+            metavar="PATH",
+            type=str,
+            required=True,
+            help="Directory to write the snapshot to; must be empty or "
+            "not exist yet.",
+        )
+
+    def run(self, flags):
+        try:
+            columnar_snapshot.Export(flags.logdir, flags.output_dir)
+        except ValueError as e:
+            print("Error: %s" % e, file=sys.stderr)
+            return 1
+        print("Wrote snapshot of %s to %s" % (flags.logdir, flags.output_dir))
+        return 0
+
+    def help(self):
+        return "write a columnar snapshot of a logdir"
+
+    def description(self):
+        return (
+            "Writes the time series of every run in a logdir as NumPy "
+            "column arrays, which TensorBoard and offline analysis can "
+            "memory-map instead of parsing event files."
+        )
@@ -0,0 +1,70 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the `export_snapshot` subcommand."""
+
+
+import io
+import os
+from unittest import mock
+
+from tensorboard import export_snapshot
+from tensorboard import program
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import columnar_snapshot
+from tensorboard.plugins.core import core_plugin
+from tensorboard.util import test_util
+
+
+class ExportSnapshotTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.logdir = os.path.join(self.get_temp_dir(), "logdir")
+        self.output_dir = os.path.join(self.get_temp_dir(), "snapshot")
+        with test_util.FileWriter(os.path.join(self.logdir, "run")) as writer:
+            writer.add_test_summary("loss", simple_value=1.0, step=3)
+
+    def _run(self, *args):
+        tb = program.TensorBoard(
+            plugins=[core_plugin.CorePluginLoader],
+            subcommands=[export_snapshot.ExportSnapshotSubcommand()],
+        )
+        tb.configure(("tb", "export_snapshot") + args)
+        with mock.patch("sys.stdout", io.StringIO()):
+            with mock.patch("sys.stderr", io.StringIO()) as stderr:
+                exit_code = tb.main()
+        return (exit_code, stderr.getvalue())
+
+    def testExport(self):
+        (exit_code, _) = self._run(
+            "--logdir", self.logdir, "--output_dir", self.output_dir
+        )
+        self.assertEqual(exit_code, 0)
+        snapshot = columnar_snapshot.SnapshotMultiplexer(self.output_dir)
+        (steps, _, values) = snapshot.ScalarColumns("run", "loss")
+        self.assertEqual(list(steps), [3])
+        self.assertEqual(list(values), [1.0])
+
+    def testNonEmptyOutputDirectory(self):
+        os.makedirs(self.output_dir)
+        open(os.path.join(self.output_dir, "x"), "w").close()
+        (exit_code, stderr) = self._run(
+            "--logdir", self.logdir, "--output_dir", self.output_dir
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertIn("not empty", stderr)
+
+
+if __name__ == "__main__":
+    tb_test.main()
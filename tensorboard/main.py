@@ -25,6 +25,7 @@ import sys
 
 from absl import app
 from tensorboard import default
+from tensorboard import export_snapshot
 from tensorboard import main_lib
 from tensorboard import program
 from tensorboard.plugins import base_plugin
@@ -36,7 +37,10 @@ logger = tb_logging.get_logger()
 def run_main():
     """Initializes flags and calls main()."""
     main_lib.global_init()
-    tensorboard = program.TensorBoard(plugins=default.get_plugins())
+    tensorboard = program.TensorBoard(
+        plugins=default.get_plugins(),
+        subcommands=[export_snapshot.ExportSnapshotSubcommand()],
+    )
     try:
         app.run(tensorboard.main, flags_parser=tensorboard.configure)
     except base_plugin.FlagsError as e:
@@ -73,6 +73,7 @@ class CorePlugin(base_plugin.TBPlugin):
         self._path_prefix = context.flags.path_prefix if context.flags else None
         self._assets_zip_provider = context.assets_zip_provider
         self._data_provider = context.data_provider
+        self._multiplexer = context.multiplexer
         self._include_debug_info = bool(include_debug_info)
 
     def is_active(self):
@@ -84,10 +85,12 @@ class CorePlugin(base_plugin.TBPlugin):
             "/audio": self._redirect_to_index,
             "/data/environment": self._serve_environment,
             "/data/logdir": self._serve_logdir,
+            "/data/memory_usage": self._serve_memory_usage,
             "/data/runs": self._serve_runs,
             "/data/experiments": self._serve_experiments,
             "/data/experiment_runs": self._serve_experiment_runs,
             "/data/notifications": self._serve_notifications,
+            "/data/reload_schedule": self._serve_reload_schedule,
             "/data/window_properties": self._serve_window_properties,
             "/events": self._redirect_to_index,
             "/favicon.ico": self._send_404_without_logging,
@@ -243,6 +246,29 @@ class CorePlugin(base_plugin.TBPlugin):
             request, {"window_title": self._window_title}, "application/json"
         )
 
+    @wrappers.Request.application
+    def _serve_reload_schedule(self, request):
+        """Serve a JSON object mapping run names to their reload schedule.
+
+        This is a debugging aid for `--reload_max_interval`; it is empty
+        unless that flag is in effect.
+        """
+        # Only `plugin_event_multiplexer.EventMultiplexer` schedules reloads.
+        reload_schedule = getattr(self._multiplexer, "ReloadSchedule", None)
+        schedule = reload_schedule() if reload_schedule is not None else {}
+        return http_util.Respond(request, schedule, "application/json")
+
+    @wrappers.Request.application
+    def _serve_memory_usage(self, request):
+        """Serve a JSON object mapping run names to their memory usage.
+
+        This is an operator aid for `--memory_budget_mb`; see
+        `plugin_event_multiplexer.EventMultiplexer.MemoryUsage`.
+        """
+        memory_usage = getattr(self._multiplexer, "MemoryUsage", None)
+        usage = memory_usage() if memory_usage is not None else {}
+        return http_util.Respond(request, usage, "application/json")
+
     @wrappers.Request.application
     def _serve_runs(self, request):
         """Serve a JSON array of run names, ordered by run started time.
@@ -571,6 +597,38 @@ load just once at startup. Must be non-negative. (default: %(default)s)\
 """,
         )
 
+        parser.add_argument(
+            "--reload_max_interval",
+            metavar="SECONDS",
+            type=_nonnegative_float,
+            default=0.0,
+            help="""\
+[experimental] If greater than --reload_interval, runs whose event files
+stopped growing are reloaded less and less often: each reload that finds
+no new data doubles the time until the next, up to this many seconds.
+Runs that are being written to are still reloaded every
+--reload_interval seconds. The current schedule is served at
+/data/reload_schedule. (default: %(default)s, which disables this)\
+""",
+        )
+
+        parser.add_argument(
+            "--memory_budget_mb",
+            metavar="MB",
+            type=_nonnegative_float,
+            default=0.0,
+            help="""\
+[experimental] The approximate memory, in megabytes, that the sampled data
+of all runs together may use. After each reload that leaves more than this
+loaded, the tags that were least recently viewed are downsampled, halving the
+points they keep, until the data fits; these tags then keep sampling new data
+at their reduced size. Each run's usage is served at /data/memory_usage. It
+only affects the Python-only load path (that is, when --load_fast is not in
+effect), and is not supported with --reload_workers=process. (default:
+%(default)s, which disables the budget)\
+""",
+        )
+
         parser.add_argument(
             "--reload_task",
             metavar="TYPE",
@@ -586,6 +644,39 @@ reload finishes, and requires --load_interval=0. (default: %(default)s)\
 """,
         )
 
+        parser.add_argument(
+            "--reload_trigger",
+            metavar="TYPE",
+            type=str,
+            default="interval",
+            choices=["interval", "filesystem"],
+            help="""\
+[experimental] What makes the backend load more data. With "interval",
+every run is reloaded each --reload_interval seconds. With "filesystem",
+runs in local logdirs are reloaded as soon as inotify reports that their
+event files changed, and every run is still reloaded each
+--reload_interval seconds to catch changes that inotify cannot see, such
+as writes by other hosts to a network file system. Falls back to
+"interval" where inotify is unavailable. (default: %(default)s)\
+""",
+        )
+
+        parser.add_argument(
+            "--reload_workers",
+            metavar="TYPE",
+            type=str,
+            default="thread",
+            choices=["thread", "process"],
+            help="""\
+[experimental] The kind of workers used to reload runs in parallel. With
+"thread", up to --max_reload_threads threads reload runs in the TensorBoard
+process; since event parsing holds the Python GIL, this rarely uses more than
+one CPU core. With "process", up to --max_reload_threads worker processes
+parse event files and send already-sampled data back to TensorBoard. Not
+relevant for db read-only mode. (default: %(default)s)\
+""",
+        )
+
         parser.add_argument(
             "--reload_multifile",
             metavar="BOOL",
@@ -670,6 +761,38 @@ are first written to a temporary file, then swapped into the final location.
 
 This option is currently incompatible with --load_fast=true, and if passed will
 disable fast-loading mode. (default: false)\
+""",
+        )
+
+        parser.add_argument(
+            "--mmap_event_files",
+            metavar="BOOL",
+            # Custom str-to-bool converter since regular bool() doesn't work.
+            type=lambda v: {"true": True, "false": False}.get(v.lower(), v),
+            choices=[True, False],
+            default=None,
+            help="""\
+[experimental] If true, event files on the local filesystem are read through
+a persistent memory mapping that is extended as the files grow, rather than
+through repeated buffered reads. This can make the initial load of large local
+logdirs considerably faster. It only affects the Python-only load path (that
+is, when --load_fast is not in effect). (default: false)\
+""",
+        )
+
+        parser.add_argument(
+            "--ingestion_checkpoint_dir",
+            metavar="PATH",
+            type=str,
+            default="",
+            help="""\
+[experimental] A local directory in which to keep a checkpoint of the data
+loaded for each run: its sampled values, summary metadata and how far into
+each event file it has read. After a restart, runs resume from their
+checkpoints and only read data written since, unless the event files were
+rewritten or TensorBoard was started with different sampling settings. It only
+affects the Python-only load path (that is, when --load_fast is not in
+effect). (default: %(default)s, which disables checkpoints)\
 """,
         )
 
@@ -715,6 +838,12 @@ disable fast-loading mode. (default: false)\
                 "--detect_file_replacement=true"
             )
 
+        if flags.memory_budget_mb and flags.reload_workers == "process":
+            raise FlagsError(
+                "--memory_budget_mb is not supported with "
+                "--reload_workers=process"
+            )
+
         flags.path_prefix = flags.path_prefix.rstrip("/")
         if flags.path_prefix and not flags.path_prefix.startswith("/"):
             raise FlagsError(
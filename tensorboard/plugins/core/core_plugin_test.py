@@ -33,6 +33,7 @@ from tensorboard.backend.event_processing import data_provider
 from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
 )
+from tensorboard.backend.event_processing import reload_scheduler
 from tensorboard.data import provider
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.core import core_plugin
@@ -57,7 +58,9 @@ class FakeFlags:
         load_fast="auto",
         logdir="",
         logdir_spec="",
+        memory_budget_mb=0.0,
         path_prefix="",
+        reload_workers="thread",
         reuse_port=False,
         version_tb=False,
     ):
@@ -71,7 +74,9 @@ class FakeFlags:
         self.load_fast = load_fast
         self.logdir = logdir
         self.logdir_spec = logdir_spec
+        self.memory_budget_mb = memory_budget_mb
         self.path_prefix = path_prefix
+        self.reload_workers = reload_workers
         self.reuse_port = reuse_port
         self.version_tb = version_tb
 
@@ -110,6 +115,18 @@ class CorePluginFlagsTest(tf.test.TestCase):
                 FakeFlags(inspect=False, event_file="/tmp/event.out")
             )
 
+    def testMemoryBudget_notSupportedWithWorkerProcesses(self):
+        loader = core_plugin.CorePluginLoader()
+        loader.fix_flags(FakeFlags(logdir="/tmp", memory_budget_mb=100))
+        with self.assertRaisesRegex(ValueError, "--memory_budget_mb"):
+            loader.fix_flags(
+                FakeFlags(
+                    logdir="/tmp",
+                    memory_budget_mb=100,
+                    reload_workers="process",
+                )
+            )
+
     def testPathPrefix_stripsTrailingSlashes(self):
         loader = core_plugin.CorePluginLoader()
         for path_prefix in ("/hello", "/hello/", "/hello//", "/hello///"):
@@ -317,6 +334,64 @@ class CorePluginTest(tf.test.TestCase):
         run_json = self._get_json(self.server, "/data/runs")
         self.assertEqual(run_json, ["run1"])
 
+    def testReloadSchedule_withoutMultiplexer(self):
+        self.assertEqual(
+            {}, self._get_json(self.server, "/data/reload_schedule")
+        )
+
+    def testReloadSchedule(self):
+        scheduler = reload_scheduler.ReloadScheduler(5, 60)
+        multiplexer = event_multiplexer.EventMultiplexer(
+            reload_scheduler=scheduler
+        )
+        logdir = self.get_temp_dir()
+        with test_util.FileWriter(os.path.join(logdir, "run1")) as writer:
+            writer.add_test_summary("foo")
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        provider = data_provider.MultiplexerDataProvider(multiplexer, logdir)
+        context = base_plugin.TBContext(
+            assets_zip_provider=get_test_assets_zip_provider(),
+            logdir=logdir,
+            data_provider=provider,
+            multiplexer=multiplexer,
+        )
+        plugin = core_plugin.CorePlugin(context)
+        app = application.TensorBoardWSGI([plugin])
+        server = werkzeug_test.Client(app, wrappers.Response)
+
+        schedule = self._get_json(server, "/data/reload_schedule")
+        self.assertEqual(["run1"], list(schedule))
+        self.assertEqual(5, schedule["run1"]["interval"])
+        self.assertIn("next_reload", schedule["run1"])
+        self.assertIn("bytes_per_second", schedule["run1"])
+
+    def testMemoryUsage_withoutMultiplexer(self):
+        self.assertEqual({}, self._get_json(self.server, "/data/memory_usage"))
+
+    def testMemoryUsage(self):
+        multiplexer = event_multiplexer.EventMultiplexer()
+        logdir = self.get_temp_dir()
+        with test_util.FileWriter(os.path.join(logdir, "run1")) as writer:
+            writer.add_test_summary("foo")
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        provider = data_provider.MultiplexerDataProvider(multiplexer, logdir)
+        context = base_plugin.TBContext(
+            assets_zip_provider=get_test_assets_zip_provider(),
+            logdir=logdir,
+            data_provider=provider,
+            multiplexer=multiplexer,
+        )
+        plugin = core_plugin.CorePlugin(context)
+        app = application.TensorBoardWSGI([plugin])
+        server = werkzeug_test.Client(app, wrappers.Response)
+
+        usage = self._get_json(server, "/data/memory_usage")
+        self.assertEqual(multiplexer.MemoryUsage(), usage)
+        self.assertEqual(["foo"], list(usage["run1"]["tags"]))
+        self.assertGreater(usage["run1"]["bytes"], 0)
+
     def testRunsAppendOnly(self):
         """Test that new runs appear after old ones in /data/runs."""
         fake_wall_times = {
@@ -0,0 +1,155 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for `summary_v2.histogram_pb`.
+
+Buckets normally distributed data of several sizes with the previous
+one-hot implementation, with `histogram_pb`, and with
+`histogram_pb_from_chunks` over 1M-element chunks. Reports the mean
+time per call and the peak memory allocated by the call, as measured by
+`tracemalloc` (which sees NumPy's allocations).
+
+Sample results on a cloud VM with a single core (Python 3.11, NumPy
+2.4, float32 data, 30 buckets, mean of 5 calls):
+
+           N  LEGACY_MS  LEGACY_MB     PB_MS     PB_MB  CHUNKS_MS  CHUNKS_MB
+        1000     0.3082     0.2033    0.5124    0.0266     0.4330     0.0353
+       10000     1.3805     0.8332    0.9157    0.2515     0.8635     0.3323
+      100000    15.1289     7.1332    2.1736    2.5015     2.1009     3.3022
+     1000000   133.2214    70.1332   20.9881   25.0015    19.3176    33.0022
+    10000000  1325.6397   700.1332  213.2041  105.1671   207.6748    38.0594
+
+`PB_MB` is dominated by the `float64` copy of the input, which a flat
+`float64` input does not need; `CHUNKS_MB` is bounded by the chunk size.
+"""
+
+
+import time
+import tracemalloc
+
+from absl import app
+from absl import flags
+from absl import logging
+import numpy as np
+
+from tensorboard.plugins.histogram import summary_v2
+from tensorboard.util import tb_logging
+from tensorboard.util import tensor_util
+
+
+logger = tb_logging.get_logger()
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("buckets", 30, "Number of histogram buckets.")
+flags.DEFINE_integer("chunk_size", 1 << 20, "Elements per chunk.")
+flags.DEFINE_integer("repeats", 5, "Number of timed calls per row.")
+
+
+def legacy_bucket_counts(data, bucket_count):
+    """The one-hot bucket counting that `_count_buckets` replaces."""
+    data = np.array(data).flatten().astype(float)
+    min_ = np.min(data)
+    max_ = np.max(data)
+    bucket_width = (max_ - min_) / bucket_count
+    offsets = data - min_
+    bucket_indices = np.floor(offsets / bucket_width).astype(int)
+    clamped_indices = np.minimum(bucket_indices, bucket_count - 1)
+    one_hots = np.array([clamped_indices]).transpose() == np.arange(
+        0, bucket_count
+    )
+    return np.sum(one_hots, axis=0)
+
+
+def bench(fn, repeats):
+    """Returns the mean milliseconds per call and peak MB allocated."""
+    total = 0.0
+    peak = 0
+    for _ in range(repeats):
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        fn()
+        total += time.perf_counter() - start_time
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return (total / repeats * 1000, peak / 1e6)
+
+
+def _format_line(headers, fields):
+    """Format a line of a table.
+
+    Arguments:
+      headers: A list of strings that are used as the table headers.
+      fields: A list of the same length as `headers` where `fields[i]` is
+        the entry for `headers[i]` in this row. Elements can be of
+        arbitrary types. Pass `headers` to print the header row.
+
+    Returns:
+      A pretty string.
+    """
+    assert len(fields) == len(headers), (fields, headers)
+    fields = [
+        "%2.4f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+
+    headers = (
+        "N",
+        "LEGACY_MS",
+        "LEGACY_MB",
+        "PB_MS",
+        "PB_MB",
+        "CHUNKS_MS",
+        "CHUNKS_MB",
+    )
+    logger.info(_format_line(headers, headers))
+    rng = np.random.default_rng(0)
+    for n in [1000, 10000, 100000, 1000000, 10000000]:
+        data = rng.normal(size=n).astype(np.float32)
+        chunks = [
+            data[i : i + FLAGS.chunk_size]
+            for i in range(0, n, FLAGS.chunk_size)
+        ]
+        pb = summary_v2.histogram_pb("h", data, buckets=FLAGS.buckets)
+        counts = tensor_util.make_ndarray(pb.value[0].tensor)[:, 2]
+        expected = legacy_bucket_counts(data, FLAGS.buckets)
+        assert (counts == expected).all(), (counts, expected)
+
+        (legacy_ms, legacy_mb) = bench(
+            lambda: legacy_bucket_counts(data, FLAGS.buckets), FLAGS.repeats
+        )
+        (pb_ms, pb_mb) = bench(
+            lambda: summary_v2.histogram_pb("h", data, buckets=FLAGS.buckets),
+            FLAGS.repeats,
+        )
+        (chunks_ms, chunks_mb) = bench(
+            lambda: summary_v2.histogram_pb_from_chunks(
+                "h", chunks, buckets=FLAGS.buckets
+            ),
+            FLAGS.repeats,
+        )
+        fields = (n, legacy_ms, legacy_mb, pb_ms, pb_mb, chunks_ms, chunks_mb)
+        logger.info(_format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -38,6 +38,7 @@ from tensorboard.plugins.histogram import summary_v2
 # Export V3 versions.
 histogram = summary_v2.histogram
 histogram_pb = summary_v2.histogram_pb
+histogram_pb_from_chunks = summary_v2.histogram_pb_from_chunks
 
 
 def _buckets(data, bucket_count=None):
@@ -199,17 +200,9 @@ def pb(name, data, bucket_count=None, display_name=None, description=None):
             buckets = np.array([[center - 0.5, center + 0.5, float(data.size)]])
         else:
             bucket_width = range_ / bucket_count
-            offsets = data - min_
-            bucket_indices = np.floor(offsets / bucket_width).astype(int)
-            clamped_indices = np.minimum(bucket_indices, bucket_count - 1)
-            one_hots = np.array([clamped_indices]).transpose() == np.arange(
-                0, bucket_count
-            )  # broadcast
-            assert one_hots.shape == (data.size, bucket_count), (
-                one_hots.shape,
-                (data.size, bucket_count),
+            bucket_counts = summary_v2._count_buckets(
+                [data], min_, bucket_width, bucket_count
             )
-            bucket_counts = np.sum(one_hots, axis=0)
             edges = np.linspace(min_, max_, bucket_count + 1)
             left_edges = edges[:-1]
             right_edges = edges[1:]
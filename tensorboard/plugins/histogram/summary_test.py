@@ -18,6 +18,7 @@
 
 import glob
 import os
+from unittest import mock
 
 import numpy as np
 import tensorflow as tf
@@ -26,6 +27,7 @@ from tensorboard.compat import tf2
 from tensorboard.compat.proto import summary_pb2
 from tensorboard.plugins.histogram import metadata
 from tensorboard.plugins.histogram import summary
+from tensorboard.plugins.histogram import summary_v2
 from tensorboard.util import tensor_util
 
 
@@ -212,6 +214,51 @@ class SummaryV2PbTest(SummaryBaseTest, tf.test.TestCase):
         buckets = tensor_util.make_ndarray(pb.value[0].tensor)
         np.testing.assert_array_equal(buckets, np.array([]).reshape((0, 3)))
 
+    def test_counts_match_one_hot_bucketing(self):
+        data = np.append(self.gaussian, 5.0)
+        bucket_count = 7
+        # Assign points to buckets in several blocks.
+        with mock.patch.object(summary_v2, "_COUNT_BLOCK_SIZE", 16):
+            pb = self.histogram("normal", data=data, buckets=bucket_count)
+        buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+        # The one-hot formulation that this replaced.
+        bucket_width = (data.max() - data.min()) / bucket_count
+        indices = np.floor((data - data.min()) / bucket_width).astype(int)
+        clamped_indices = np.minimum(indices, bucket_count - 1)
+        one_hots = clamped_indices[:, np.newaxis] == np.arange(bucket_count)
+        np.testing.assert_array_equal(buckets[:, 2], one_hots.sum(axis=0))
+
+    def test_nan_input(self):
+        pb = self.histogram("nan", data=[1.0, np.nan, 2.0], buckets=3)
+        buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+        self.assertTrue(np.isnan(buckets[:, :2]).all())
+        np.testing.assert_array_equal(buckets[:, 2], [0, 0, 0])
+
+
+class SummaryV2PbFromChunksTest(SummaryV2PbTest):
+    def histogram(self, *args, **kwargs):
+        # Split the data into uneven chunks, including an empty one.
+        if len(args) > 1:
+            (tag, data) = args
+            args = (tag,)
+        else:
+            data = kwargs.pop("data")
+        flat = np.array(data).flatten()
+        chunks = [flat[:3], flat[3:3], flat[3:]]
+        return summary.histogram_pb_from_chunks(*args, chunks=chunks, **kwargs)
+
+    def test_identical_to_histogram_pb(self):
+        data = np.random.normal(size=[1000]) * 1e3
+        chunks = np.array_split(data, 7)
+        with mock.patch.object(summary_v2, "_COUNT_BLOCK_SIZE", 64):
+            actual = summary.histogram_pb_from_chunks("h", chunks, buckets=13)
+        expected = summary.histogram_pb("h", data, buckets=13)
+        self.assertEqual(actual, expected)
+
+    def test_rejects_iterator(self):
+        with self.assertRaisesRegex(TypeError, "re-iterable"):
+            summary.histogram_pb_from_chunks("h", iter([[1.0], [2.0]]))
+
 
 class SummaryV3OpTest(SummaryBaseTest, tf.test.TestCase):
     def setUp(self):
@@ -38,6 +38,11 @@ from tensorboard.util import tensor_util
 DEFAULT_BUCKET_COUNT = 30
 
 
+# Number of elements that `_count_buckets` assigns to buckets at once.
+# This bounds its scratch memory regardless of the size of the data.
+_COUNT_BLOCK_SIZE = 1 << 20
+
+
 def histogram_pb(tag, data, buckets=None, description=None):
     """Create a histogram summary protobuf.
 
@@ -57,33 +62,82 @@ def histogram_pb(tag, data, buckets=None, description=None):
     Returns:
       A `summary_pb2.Summary` protobuf object.
     """
+    data = np.asarray(data, dtype=float).reshape(-1)
+    return _histogram_pb(tag, [data], buckets, description)
+
+
+def histogram_pb_from_chunks(tag, chunks, buckets=None, description=None):
+    """Create a histogram summary protobuf from data given in chunks.
+
+    The result is identical to that of `histogram_pb` on the concatenation
+    of the flattened chunks, but only one chunk needs to be in memory at a
+    time, so this can summarize data too large to hold at once (say, a
+    list of slices of a memory-mapped array). The bucket edges depend on
+    the extent of all the data, so `chunks` is iterated twice.
+
+    Arguments:
+      tag: String tag for the summary.
+      chunks: A re-iterable collection, such as a list, of `np.array`s or
+        array-like forms of any shape. Must have type castable to `float`.
+      buckets: Optional positive `int`, as for `histogram_pb`.
+      description: Optional long-form description for this summary, as a
+        `str`. Markdown is supported. Defaults to empty.
+
+    Returns:
+      A `summary_pb2.Summary` protobuf object.
+
+    Raises:
+      TypeError: If `chunks` is an iterator, which can only be iterated
+        once.
+    """
+    if iter(chunks) is chunks:
+        raise TypeError(
+            "chunks must be re-iterable, not an iterator: %r" % (chunks,)
+        )
+    chunks = _FloatChunks(chunks)
+    return _histogram_pb(tag, chunks, buckets, description)
+
+
+class _FloatChunks:
+    """Re-iterable view of chunks of data as flat `float` arrays."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield np.asarray(chunk, dtype=float).reshape(-1)
+
+
+def _histogram_pb(tag, chunks, buckets, description):
+    """Implementation of `histogram_pb` over chunks of flat `float` arrays."""
     bucket_count = DEFAULT_BUCKET_COUNT if buckets is None else buckets
-    data = np.array(data).flatten().astype(float)
-    if bucket_count == 0 or data.size == 0:
+    size = 0
+    mins = []
+    maxs = []
+    if bucket_count != 0:
+        for chunk in chunks:
+            if chunk.size:
+                size += chunk.size
+                mins.append(np.min(chunk))
+                maxs.append(np.max(chunk))
+    if bucket_count == 0 or size == 0:
         histogram_buckets = np.zeros((bucket_count, 3))
     else:
-        min_ = np.min(data)
-        max_ = np.max(data)
+        min_ = np.min(mins)
+        max_ = np.max(maxs)
         range_ = max_ - min_
         if range_ == 0:
             left_edges = right_edges = np.array([min_] * bucket_count)
-            bucket_counts = np.array([0] * (bucket_count - 1) + [data.size])
+            bucket_counts = np.array([0] * (bucket_count - 1) + [size])
             histogram_buckets = np.array(
                 [left_edges, right_edges, bucket_counts]
             ).transpose()
         else:
             bucket_width = range_ / bucket_count
-            offsets = data - min_
-            bucket_indices = np.floor(offsets / bucket_width).astype(int)
-            clamped_indices = np.minimum(bucket_indices, bucket_count - 1)
-            one_hots = np.array([clamped_indices]).transpose() == np.arange(
-                0, bucket_count
-            )  # broadcast
-            assert one_hots.shape == (data.size, bucket_count), (
-                one_hots.shape,
-                (data.size, bucket_count),
+            bucket_counts = _count_buckets(
+                chunks, min_, bucket_width, bucket_count
             )
-            bucket_counts = np.sum(one_hots, axis=0)
             edges = np.linspace(min_, max_, bucket_count + 1)
             left_edges = edges[:-1]
             right_edges = edges[1:]
@@ -100,6 +154,34 @@ def histogram_pb(tag, data, buckets=None, description=None):
     return summary
 
 
+def _count_buckets(chunks, min_, bucket_width, bucket_count):
+    """Counts the points in each of a run of equal-width buckets.
+
+    Point `x` falls in bucket `floor((x - min_) / bucket_width)`, clamped
+    to the last bucket. This takes time linear in the number of points
+    and scratch memory bounded by `_COUNT_BLOCK_SIZE`.
+
+    Arguments:
+      chunks: An iterable of flat `float` arrays.
+      min_: The left edge of the first bucket.
+      bucket_width: The width of each bucket; must be positive.
+      bucket_count: The number of buckets; must be positive.
+
+    Returns:
+      An `int64` array of shape `[bucket_count]`.
+    """
+    counts = np.zeros(bucket_count, dtype=np.int64)
+    for chunk in chunks:
+        for start in range(0, chunk.size, _COUNT_BLOCK_SIZE):
+            block = chunk[start : start + _COUNT_BLOCK_SIZE]
+            indices = np.floor((block - min_) / bucket_width).astype(int)
+            np.minimum(indices, bucket_count - 1, out=indices)
+            # NaNs cast to negative indices, and are in no bucket.
+            indices = indices[indices >= 0]
+            counts += np.bincount(indices, minlength=bucket_count)
+    return counts
+
+
 # This is the TPU compatible V3 histogram implementation as of 2021-12-01.
 def histogram(name, data, step=None, buckets=None, description=None):
     """Write a histogram summary.
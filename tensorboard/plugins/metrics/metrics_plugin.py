@@ -24,6 +24,7 @@ from werkzeug import wrappers
 from tensorboard import errors
 from tensorboard import plugin_util
 from tensorboard.backend import http_util
+from tensorboard.backend import json_util
 from tensorboard.data import provider
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.histogram import metadata as histogram_metadata
@@ -48,6 +49,9 @@ _SINGLE_RUN_PLUGINS = frozenset(
 
 _SAMPLED_PLUGINS = frozenset([image_metadata.PLUGIN_NAME])
 
+# Streamed responses convert this many points at a time to text.
+_STREAM_CHUNK_SIZE = 4096
+
 
 def _get_tag_description_info(mapping):
     """Gets maps from tags to descriptions, and descriptions to runs.
@@ -390,22 +394,30 @@ class MetricsPlugin(base_plugin.TBPlugin):
                 "Unable to parse 'requests' as JSON"
             )
 
-        response = self._time_series_impl(ctx, experiment, series_requests)
-        return http_util.Respond(request, response, "application/json")
+        response = self._time_series_impl(
+            ctx, experiment, series_requests, stream=True
+        )
+        return http_util.Respond(
+            request, json_util.IterDumps(response), "application/json"
+        )
 
-    def _time_series_impl(self, ctx, experiment, series_requests):
+    def _time_series_impl(self, ctx, experiment, series_requests, stream=False):
         """Constructs a list of responses from a list of series requests.
 
         Args:
             ctx: A `tensorboard.context.RequestContext` value.
             experiment: string ID of the request's experiment.
             series_requests: a list of `TimeSeriesRequest` dicts (see http_api.md).
+            stream: If true, the data of scalar and histogram series are
+              read as batches of arrays and given as `json_util.Chunked`
+              values, to be converted a chunk at a time by
+              `json_util.IterDumps`, rather than as lists.
 
         Returns:
             A list of `TimeSeriesResponse` dicts (see http_api.md).
         """
         responses = [
-            self._get_time_series(ctx, experiment, request)
+            self._get_time_series(ctx, experiment, request, stream)
             for request in series_requests
         ]
         return responses
@@ -447,13 +459,14 @@ class MetricsPlugin(base_plugin.TBPlugin):
 
         return None
 
-    def _get_time_series(self, ctx, experiment, series_request):
+    def _get_time_series(self, ctx, experiment, series_request, stream=False):
         """Returns time series data for a given tag, plugin.
 
         Args:
             ctx: A `tensorboard.context.RequestContext` value.
             experiment: string ID of the request's experiment.
             series_request: a `TimeSeriesRequest` (see http_api.md).
+            stream: As for `_time_series_impl`.
 
         Returns:
             A `TimeSeriesResponse` dict (see http_api.md).
@@ -471,14 +484,24 @@ class MetricsPlugin(base_plugin.TBPlugin):
         runs = [run] if run else None
         run_to_series = None
         if plugin == scalar_metadata.PLUGIN_NAME:
-            run_to_series = self._get_run_to_scalar_series(
-                ctx, experiment, tag, runs
-            )
+            if stream:
+                run_to_series = self._stream_run_to_scalar_series(
+                    ctx, experiment, tag, runs
+                )
+            else:
+                run_to_series = self._get_run_to_scalar_series(
+                    ctx, experiment, tag, runs
+                )
 
         if plugin == histogram_metadata.PLUGIN_NAME:
-            run_to_series = self._get_run_to_histogram_series(
-                ctx, experiment, tag, runs
-            )
+            if stream:
+                run_to_series = self._stream_run_to_histogram_series(
+                    ctx, experiment, tag, runs
+                )
+            else:
+                run_to_series = self._get_run_to_histogram_series(
+                    ctx, experiment, tag, runs
+                )
 
         if plugin == image_metadata.PLUGIN_NAME:
             run_to_series = self._get_run_to_image_series(
@@ -524,6 +547,21 @@ class MetricsPlugin(base_plugin.TBPlugin):
 
         return run_to_series
 
+    def _stream_run_to_scalar_series(self, ctx, experiment, tag, runs):
+        """Like `_get_run_to_scalar_series`, with `json_util.Chunked` values."""
+        batches = self._data_provider.stream_scalars(
+            ctx,
+            experiment_id=experiment,
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+            downsample=self._plugin_downsampling["scalars"],
+            run_tag_filter=provider.RunTagFilter(runs=runs, tags=[tag]),
+        )
+        return {
+            batch.run: json_util.Chunked(_scalar_step_data(batch))
+            for batch in batches
+            if batch.tag == tag
+        }
+
     def _format_histogram_datum_bins(self, datum):
         """Formats a histogram datum's bins for client consumption.
 
@@ -573,6 +611,21 @@ class MetricsPlugin(base_plugin.TBPlugin):
 
         return run_to_series
 
+    def _stream_run_to_histogram_series(self, ctx, experiment, tag, runs):
+        """Like `_get_run_to_histogram_series`, with `json_util.Chunked` values."""
+        batches = self._data_provider.stream_tensors(
+            ctx,
+            experiment_id=experiment,
+            plugin_name=histogram_metadata.PLUGIN_NAME,
+            downsample=self._plugin_downsampling["histograms"],
+            run_tag_filter=provider.RunTagFilter(runs=runs, tags=[tag]),
+        )
+        return {
+            batch.run: json_util.Chunked(_histogram_step_data(batch))
+            for batch in batches
+            if batch.tag == tag
+        }
+
     def _get_run_to_image_series(self, ctx, experiment, tag, sample, runs):
         """Builds a run-to-image-series dict for client consumption.
 
@@ -636,3 +689,38 @@ class MetricsPlugin(base_plugin.TBPlugin):
             image_type, _DEFAULT_IMAGE_MIMETYPE
         )
         return (data, content_type)
+
+
+def _scalar_step_data(batch):
+    """Yields lists of `ScalarStepDatum`s (see http_api.md) of a batch."""
+    for start in range(0, len(batch), _STREAM_CHUNK_SIZE):
+        stop = start + _STREAM_CHUNK_SIZE
+        yield [
+            {"wallTime": wall_time, "step": step, "value": value}
+            for (wall_time, step, value) in zip(
+                batch.wall_time[start:stop].tolist(),
+                batch.step[start:stop].tolist(),
+                batch.value[start:stop].tolist(),
+            )
+        ]
+
+
+def _histogram_step_data(batch):
+    """Yields lists of `HistogramStepDatum`s (see http_api.md) of a batch."""
+    for start in range(0, len(batch), _STREAM_CHUNK_SIZE):
+        stop = start + _STREAM_CHUNK_SIZE
+        yield [
+            {
+                "wallTime": wall_time,
+                "step": step,
+                "bins": [
+                    {"min": x[0], "max": x[1], "count": x[2]}
+                    for x in numpy.tolist()
+                ],
+            }
+            for (wall_time, step, numpy) in zip(
+                batch.wall_time[start:stop].tolist(),
+                batch.step[start:stop].tolist(),
+                batch.numpy[start:stop],
+            )
+        ]
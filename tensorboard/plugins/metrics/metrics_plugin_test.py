@@ -17,12 +17,18 @@
 
 import argparse
 import collections.abc
+import json
 import os.path
+from unittest import mock
 
 import tensorflow.compat.v1 as tf1
 import tensorflow.compat.v2 as tf
+from werkzeug import test as werkzeug_test
+from werkzeug import wrappers
 
 from tensorboard import context
+from tensorboard.backend import application
+from tensorboard.backend import json_util
 from tensorboard.backend.event_processing import data_provider
 from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
@@ -453,6 +459,35 @@ class MetricsPluginTest(tf.test.TestCase):
             clean_response,
         )
 
+    def test_time_series_route_streams_response(self):
+        self._write_scalar_data("run1", "scalars/tagA", [0, 100, -200])
+        self._write_scalar_data("run2", "scalars/tagA", [1])
+        self._write_histogram_data("run1", "histograms/tagA", [0, 10, 20])
+        self._multiplexer.Reload()
+
+        requests = [
+            {"plugin": "scalars", "tag": "scalars/tagA"},
+            {"plugin": "histograms", "tag": "histograms/tagA", "run": "run1"},
+            {"plugin": "scalars", "tag": "nothing-matches"},
+        ]
+        expected = self._plugin._time_series_impl(
+            context.RequestContext(), "", requests
+        )
+        server = werkzeug_test.Client(
+            application.TensorBoardWSGI([self._plugin]), wrappers.Response
+        )
+        with mock.patch.object(metrics_plugin, "_STREAM_CHUNK_SIZE", 2):
+            response = server.post(
+                "/data/plugin/timeseries/timeSeries",
+                data={"requests": json.dumps(requests)},
+            )
+        self.assertEqual(200, response.status_code)
+        self.assertIsNone(response.headers.get("Content-Length"))
+        self.assertEqual(
+            json.dumps(json_util.Cleanse(expected)),
+            response.get_data().decode("utf-8"),
+        )
+
     def test_time_series_unmatching_request(self):
         self._write_scalar_data("run1", "scalars/tagA", [0, 100, -200])
 
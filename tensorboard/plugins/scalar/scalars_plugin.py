@@ -28,12 +28,16 @@ from werkzeug import wrappers
 from tensorboard import errors
 from tensorboard import plugin_util
 from tensorboard.backend import http_util
+from tensorboard.backend import json_util
 from tensorboard.data import provider
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.scalar import metadata
 
 _DEFAULT_DOWNSAMPLING = 1000  # scalars per time series
 
+# Streamed responses convert this many points at a time to text.
+_STREAM_CHUNK_SIZE = 4096
+
 
 class OutputFormat:
     """An enum used to list the valid output formats for API calls."""
@@ -122,6 +126,47 @@ class ScalarsPlugin(base_plugin.TBPlugin):
         else:
             return (values, "application/json")
 
+    def scalars_stream_impl(self, ctx, tag, run, experiment, output_format):
+        """Like `scalars_impl`, but the body is an iterator of text.
+
+        The data is read before this returns, but only converted to text
+        a chunk at a time as the body is consumed.
+        """
+        batches = self._data_provider.stream_scalars(
+            ctx,
+            experiment_id=experiment,
+            plugin_name=metadata.PLUGIN_NAME,
+            downsample=self._downsample_to,
+            run_tag_filter=provider.RunTagFilter(runs=[run], tags=[tag]),
+        )
+        batch = next(
+            (b for b in batches if b.run == run and b.tag == tag), None
+        )
+        if batch is None:
+            raise errors.NotFoundError(
+                "No scalar data for run=%r, tag=%r" % (run, tag)
+            )
+        if output_format == OutputFormat.CSV:
+            return (_csv_pieces(_scalar_rows(batch)), "text/csv")
+        else:
+            body = json_util.Chunked(_scalar_rows(batch))
+            return (json_util.IterDumps(body), "application/json")
+
+    def scalars_etag(self, ctx, tag, run, experiment, output_format):
+        """ETag for the result of `scalars_impl`, or `None` if unknown."""
+        tokens = self._data_provider.read_version_tokens(
+            ctx,
+            experiment_id=experiment,
+            plugin_name=metadata.PLUGIN_NAME,
+            run_tag_filter=provider.RunTagFilter(runs=[run], tags=[tag]),
+        )
+        token = (tokens or {}).get(run, {}).get(tag)
+        if token is None:
+            return None
+        if output_format != OutputFormat.CSV:
+            output_format = OutputFormat.JSON
+        return "%s.%s.%d" % (token, output_format, self._downsample_to)
+
     def scalars_multirun_impl(self, ctx, tag, runs, experiment):
         """Result of the form `(body, mime_type)`."""
         all_scalars = self._data_provider.read_scalars(
@@ -137,6 +182,21 @@ class ScalarsPlugin(base_plugin.TBPlugin):
         }
         return (body, "application/json")
 
+    def scalars_multirun_stream_impl(self, ctx, tag, runs, experiment):
+        """Like `scalars_multirun_impl`, but the body is an iterator."""
+        batches = self._data_provider.stream_scalars(
+            ctx,
+            experiment_id=experiment,
+            plugin_name=metadata.PLUGIN_NAME,
+            downsample=self._downsample_to,
+            run_tag_filter=provider.RunTagFilter(runs=runs, tags=[tag]),
+        )
+        body = {
+            batch.run: json_util.Chunked(_scalar_rows(batch))
+            for batch in batches
+        }
+        return (json_util.IterDumps(body), "application/json")
+
     @wrappers.Request.application
     def tags_route(self, request):
         ctx = plugin_util.context(request.environ)
@@ -158,10 +218,21 @@ class ScalarsPlugin(base_plugin.TBPlugin):
         ctx = plugin_util.context(request.environ)
         experiment = plugin_util.experiment_id(request.environ)
         output_format = request.args.get("format")
-        (body, mime_type) = self.scalars_impl(
+        etag = self.scalars_etag(ctx, tag, run, experiment, output_format)
+        if etag is not None and http_util.ETagMatches(request, etag):
+            # Skip reading the data: the client already has it.
+            return http_util.Respond(request, b"", "text/plain", etag=etag)
+        if etag is None:
+            # Without a version token, only a buffered body gets an ETag
+            # (from its content) and a cached compressed encoding.
+            (body, mime_type) = self.scalars_impl(
+                ctx, tag, run, experiment, output_format
+            )
+            return http_util.Respond(request, body, mime_type)
+        (body, mime_type) = self.scalars_stream_impl(
             ctx, tag, run, experiment, output_format
         )
-        return http_util.Respond(request, body, mime_type)
+        return http_util.Respond(request, body, mime_type, etag=etag)
 
     @wrappers.Request.application
     def scalars_multirun_route(self, request):
@@ -178,7 +249,33 @@ class ScalarsPlugin(base_plugin.TBPlugin):
 
         ctx = plugin_util.context(request.environ)
         experiment = plugin_util.experiment_id(request.environ)
-        (body, mime_type) = self.scalars_multirun_impl(
+        (body, mime_type) = self.scalars_multirun_stream_impl(
             ctx, tag, runs, experiment
         )
         return http_util.Respond(request, body, mime_type)
+
+
+def _scalar_rows(batch):
+    """Yields lists of `[wall_time, step, value]` rows of a `ScalarBatch`."""
+    for start in range(0, len(batch), _STREAM_CHUNK_SIZE):
+        stop = start + _STREAM_CHUNK_SIZE
+        yield list(
+            zip(
+                batch.wall_time[start:stop].tolist(),
+                batch.step[start:stop].tolist(),
+                batch.value[start:stop].tolist(),
+            )
+        )
+
+
+def _csv_pieces(chunks):
+    """Yields CSV text for chunks of `[wall_time, step, value]` rows."""
+    string_io = io.StringIO()
+    writer = csv.writer(string_io)
+    writer.writerow(["Wall time", "Step", "Value"])
+    for rows in chunks:
+        writer.writerows(rows)
+        yield string_io.getvalue()
+        string_io.seek(0)
+        string_io.truncate()
+    yield string_io.getvalue()
@@ -20,11 +20,13 @@ import csv
 import io
 import json
 import os.path
+from unittest import mock
 
 import tensorflow as tf
 from werkzeug import test as werkzeug_test
 from werkzeug import wrappers
 
+from tensorboard import context
 from tensorboard.backend import application
 from tensorboard.backend.event_processing import data_provider
 from tensorboard.backend.event_processing import (
@@ -180,6 +182,94 @@ class ScalarsPluginTest(tf.test.TestCase):
         self.assertEqual("application/json", response.headers["Content-Type"])
         self.assertEqual(self._STEPS, len(json.loads(response.get_data())))
 
+    def test_scalars_conditional_get(self):
+        server = self.load_server([self._RUN_WITH_SCALARS])
+        query_string = {
+            "run": self._RUN_WITH_SCALARS,
+            "tag": "%s/scalar_summary" % self._SCALAR_TAG,
+        }
+        response = server.get(
+            "/data/plugin/scalars/scalars", query_string=query_string
+        )
+        self.assertEqual(200, response.status_code)
+        etag = response.headers["ETag"]
+        self.assertTrue(etag.startswith('W/"'), etag)
+
+        response = server.get(
+            "/data/plugin/scalars/scalars",
+            query_string=query_string,
+            headers={"If-None-Match": etag},
+        )
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.get_data())
+        self.assertEqual(etag, response.headers["ETag"])
+
+        # The CSV representation has its own ETag.
+        response = server.get(
+            "/data/plugin/scalars/scalars",
+            query_string=dict(query_string, format="csv"),
+            headers={"If-None-Match": etag},
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.headers["ETag"])
+
+    def test_scalars_without_version_tokens(self):
+        # Data providers without version tokens, like the gRPC one, get a
+        # buffered response with an ETag derived from its content.
+        plugin = self.load_plugin([self._RUN_WITH_SCALARS])
+        app = application.TensorBoardWSGI([plugin])
+        server = werkzeug_test.Client(app, wrappers.Response)
+        query_string = {
+            "run": self._RUN_WITH_SCALARS,
+            "tag": "%s/scalar_summary" % self._SCALAR_TAG,
+        }
+        with mock.patch.object(
+            plugin._data_provider, "read_version_tokens", return_value={}
+        ), mock.patch.object(
+            plugin, "scalars_stream_impl", wraps=plugin.scalars_stream_impl
+        ) as mock_stream:
+            response = server.get(
+                "/data/plugin/scalars/scalars", query_string=query_string
+            )
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(self._STEPS, len(json.loads(response.get_data())))
+            etag = response.headers["ETag"]
+            self.assertFalse(etag.startswith('W/"'), etag)
+
+            response = server.get(
+                "/data/plugin/scalars/scalars",
+                query_string=query_string,
+                headers={"If-None-Match": etag},
+            )
+            self.assertEqual(304, response.status_code)
+        mock_stream.assert_not_called()
+
+    def test_scalars_streamed_in_chunks(self):
+        plugin = self.load_plugin(
+            [self._RUN_WITH_SCALARS, self._RUN_WITH_LEGACY_SCALARS]
+        )
+        ctx = context.RequestContext()
+        tag = "%s/scalar_summary" % self._SCALAR_TAG
+        with mock.patch.object(scalars_plugin, "_STREAM_CHUNK_SIZE", 2):
+            for output_format in ("json", "csv"):
+                (expected, _) = plugin.scalars_impl(
+                    ctx, tag, self._RUN_WITH_SCALARS, "123", output_format
+                )
+                if output_format == "json":
+                    expected = json.dumps(expected)
+                (actual, _) = plugin.scalars_stream_impl(
+                    ctx, tag, self._RUN_WITH_SCALARS, "123", output_format
+                )
+                self.assertEqual("".join(actual), expected)
+            runs = [self._RUN_WITH_SCALARS, self._RUN_WITH_LEGACY_SCALARS]
+            (expected, _) = plugin.scalars_multirun_impl(ctx, tag, runs, "123")
+            (actual, _) = plugin.scalars_multirun_stream_impl(
+                ctx, tag, runs, "123"
+            )
+            self.assertEqual(
+                json.loads("".join(actual)), json.loads(json.dumps(expected))
+            )
+
     def test_scalars_with_scalars_unspecified_run(self):
         server = self.load_server([self._RUN_WITH_SCALARS])
         response = server.get(
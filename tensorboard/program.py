@@ -50,6 +50,7 @@ from werkzeug import serving
 from tensorboard import manager
 from tensorboard import version
 from tensorboard.backend import application
+from tensorboard.backend.event_processing import columnar_snapshot
 from tensorboard.backend.event_processing import data_ingester as local_ingester
 from tensorboard.backend.event_processing import event_file_inspector as efi
 from tensorboard.data import server_ingester
@@ -449,6 +450,7 @@ class TensorBoard:
 
         ingester = local_ingester.LocalDataIngester(flags)
         ingester.start()
+        atexit.register(ingester.stop)
         return ingester
 
     def _make_data_provider(self):
@@ -500,6 +502,12 @@ def _should_use_data_server(flags):
             "path."
         )
         return False
+    if columnar_snapshot.IsSnapshot(os.path.expanduser(flags.logdir)):
+        logger.info(
+            "Note: columnar snapshots are not supported with --load_fast "
+            "behavior; falling back to slower Python-only load path."
+        )
+        return False
     return True
 
 
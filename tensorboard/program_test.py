@@ -17,11 +17,13 @@
 
 import argparse
 import io
+import os
 import sys
 from unittest import mock
 
 from tensorboard import program
 from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import columnar_snapshot
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.core import core_plugin
 
@@ -98,6 +100,12 @@ class TensorBoardTest(tb_test.TestCase):
         self.assertTrue(f(logdir="gs://logs"))
         self.assertFalse(f(logdir="notgs://logs"))
         self.assertFalse(f(logdir="foo", detect_file_replacement=True))
+        snapshot = self.get_temp_dir()
+        self.assertTrue(f(logdir=snapshot))
+        manifest_path = os.path.join(snapshot, columnar_snapshot.MANIFEST_NAME)
+        with open(manifest_path, "w") as manifest:
+            manifest.write("{}")
+        self.assertFalse(f(logdir=snapshot))
 
 
 class WerkzeugServerTest(tb_test.TestCase):
@@ -16,11 +16,14 @@
 
 from tensorboard.compat.proto import event_pb2
 from tensorboard.compat.proto import summary_pb2
+from tensorboard.compat.proto import types_pb2
 from tensorboard.summary.writer import event_file_writer
 from tensorboard.util import tensor_util
 
 import abc
 
+import numpy as np
+
 
 class Output(abc.ABC):
     """Interface for emitting tensor-formatted summary data.
@@ -64,6 +67,47 @@ class Output(abc.ABC):
         """
         pass
 
+    def emit_scalars(
+        self,
+        *,
+        plugin_name,
+        data,
+        step,
+        wall_time,
+        tag_metadata=None,
+        descriptions=None,
+    ):
+        """Emits scalar data points for several tags at one step.
+
+        The default implementation calls `emit_scalar` once per tag;
+        implementations may override this to emit the points together.
+
+        Args:
+          plugin_name: string name to uniquely identify the type of time series
+            (historically associated with a TensorBoard plugin).
+          data: dict mapping each string tag to the `np.float32` scalar value
+            of its data point.
+          step: `np.int64` scalar step value for these data points.
+          wall_time: `float` seconds since the Unix epoch, representing the
+            real-world timestamp for these data points.
+          tag_metadata: optional bytes containing metadata for each of these
+            time series, as for `emit_scalar`.
+          descriptions: optional dict mapping tags to string descriptions of
+            their time series, as for `emit_scalar`. Tags need not be present.
+        """
+        if descriptions is None:
+            descriptions = {}
+        for tag, value in data.items():
+            self.emit_scalar(
+                plugin_name=plugin_name,
+                tag=tag,
+                data=value,
+                step=step,
+                wall_time=wall_time,
+                tag_metadata=tag_metadata,
+                description=descriptions.get(tag),
+            )
+
     @abc.abstractmethod
     def flush(self):
         """Flushes any data that has been buffered."""
@@ -85,6 +129,9 @@ class DirectoryOutput(Output):
     def __init__(self, path):
         """Creates a `DirectoryOutput` for the given path."""
         self._ev_writer = event_file_writer.EventFileWriter(path)
+        # `(plugin_name, tag)` pairs whose summary metadata has already
+        # been written.
+        self._tags_with_metadata = set()
 
     def emit_scalar(
         self,
@@ -98,19 +145,51 @@ class DirectoryOutput(Output):
         description=None,
     ):
         """See `Output`."""
-        # TODO(#4581): cache summary metadata to emit only once.
-        summary_metadata = summary_pb2.SummaryMetadata(
-            plugin_data=summary_pb2.SummaryMetadata.PluginData(
-                plugin_name=plugin_name, content=tag_metadata
-            ),
-            summary_description=description,
-            data_class=summary_pb2.DataClass.DATA_CLASS_SCALAR,
+        self.emit_scalars(
+            plugin_name=plugin_name,
+            data={tag: data},
+            step=step,
+            wall_time=wall_time,
+            tag_metadata=tag_metadata,
+            descriptions={tag: description},
         )
-        tensor_proto = tensor_util.make_tensor_proto(data)
+
+    def emit_scalars(
+        self,
+        *,
+        plugin_name,
+        data,
+        step,
+        wall_time,
+        tag_metadata=None,
+        descriptions=None,
+    ):
+        """See `Output`.
+
+        Writes all the data points as values of a single event. Summary
+        metadata is written only with the first value for each tag, since
+        readers only use the first.
+        """
+        if not data:
+            return
+        if descriptions is None:
+            descriptions = {}
         event = event_pb2.Event(wall_time=wall_time, step=step)
-        event.summary.value.add(
-            tag=tag, tensor=tensor_proto, metadata=summary_metadata
-        )
+        values = event.summary.value
+        for tag, value in data.items():
+            summary_value = values.add(tag=tag)
+            _set_scalar_tensor(summary_value.tensor, value)
+            if (plugin_name, tag) not in self._tags_with_metadata:
+                self._tags_with_metadata.add((plugin_name, tag))
+                summary_value.metadata.CopyFrom(
+                    summary_pb2.SummaryMetadata(
+                        plugin_data=summary_pb2.SummaryMetadata.PluginData(
+                            plugin_name=plugin_name, content=tag_metadata
+                        ),
+                        summary_description=descriptions.get(tag),
+                        data_class=summary_pb2.DataClass.DATA_CLASS_SCALAR,
+                    )
+                )
         self._ev_writer.add_event(event)
 
     def flush(self):
@@ -122,3 +201,16 @@ class DirectoryOutput(Output):
         # No need to call flush first since EventFileWriter already
         # will do this for us when we call close().
         self._ev_writer.close()
+
+
+def _set_scalar_tensor(tensor_proto, data):
+    """Sets an empty `TensorProto` to `make_tensor_proto(data)`.
+
+    Fills in `np.float32` scalars directly, which is several times faster.
+    """
+    if type(data) is np.float32:
+        tensor_proto.dtype = types_pb2.DT_FLOAT
+        tensor_proto.tensor_shape.SetInParent()
+        tensor_proto.float_val.append(data)
+    else:
+        tensor_proto.CopyFrom(tensor_util.make_tensor_proto(data))
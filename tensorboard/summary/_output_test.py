@@ -94,6 +94,137 @@ class DirectoryOutputTest(tb_test.TestCase):
         self.assertEqual(summary.metadata.plugin_data.content, b"meta")
         self.assertEqual(summary.metadata.summary_description, "desc")
 
+    def test_emit_scalar_writes_metadata_once(self):
+        logdir = self.get_temp_dir()
+        output = output_lib.DirectoryOutput(logdir)
+        for step in range(2):
+            output.emit_scalar(
+                plugin_name="plugin",
+                tag="tag",
+                data=np.float32(step),
+                step=np.int64(step),
+                wall_time=0.0,
+                description="desc",
+            )
+        output.close()
+        events = _test_util.read_tfevents(logdir)
+        self.assertLen(events, 3)
+        self.assertEqual(
+            events[1].summary.value[0].metadata.summary_description, "desc"
+        )
+        self.assertFalse(events[2].summary.value[0].HasField("metadata"))
+        self.assertEqual(
+            tensor_util.make_ndarray(events[2].summary.value[0].tensor),
+            np.array(1.0),
+        )
+
+    def test_emit_scalar_writes_metadata_once_per_plugin(self):
+        logdir = self.get_temp_dir()
+        output = output_lib.DirectoryOutput(logdir)
+        for plugin_name in ("plugin", "other_plugin"):
+            output.emit_scalar(
+                plugin_name=plugin_name,
+                tag="tag",
+                data=np.float32(1.0),
+                step=np.int64(1),
+                wall_time=0.0,
+            )
+        output.emit_scalars(
+            plugin_name="third_plugin",
+            data={"tag": np.float32(2.0)},
+            step=np.int64(2),
+            wall_time=0.0,
+        )
+        output.close()
+        events = _test_util.read_tfevents(logdir)
+        self.assertEqual(
+            [
+                e.summary.value[0].metadata.plugin_data.plugin_name
+                for e in events[1:]
+            ],
+            ["plugin", "other_plugin", "third_plugin"],
+        )
+
+    def test_emit_scalars(self):
+        logdir = self.get_temp_dir()
+        output = output_lib.DirectoryOutput(logdir)
+        output.emit_scalars(
+            plugin_name="plugin",
+            data={"a": np.float32(1.0), "b": np.float32(2.0)},
+            step=np.int64(12),
+            wall_time=123.456,
+            tag_metadata=b"meta",
+            descriptions={"b": "desc"},
+        )
+        output.emit_scalars(
+            plugin_name="plugin",
+            data={"b": np.float32(3.0), "c": np.float32(4.0)},
+            step=np.int64(13),
+            wall_time=124.0,
+        )
+        output.emit_scalars(
+            plugin_name="plugin", data={}, step=np.int64(14), wall_time=125.0
+        )
+        output.close()
+        events = _test_util.read_tfevents(logdir)
+        self.assertLen(events, 3)
+        event = events[1]
+        self.assertEqual(event.step, 12)
+        self.assertEqual(event.wall_time, 123.456)
+        (a, b) = event.summary.value
+        self.assertEqual(a.tag, "a")
+        # Values are encoded exactly as `make_tensor_proto` would.
+        self.assertEqual(a.tensor, tensor_util.make_tensor_proto(np.float32(1)))
+        self.assertEqual(a.metadata.data_class, summary_pb2.DATA_CLASS_SCALAR)
+        self.assertEqual(a.metadata.plugin_data.plugin_name, "plugin")
+        self.assertEqual(a.metadata.plugin_data.content, b"meta")
+        self.assertEqual(a.metadata.summary_description, "")
+        self.assertEqual(b.metadata.summary_description, "desc")
+        event = events[2]
+        self.assertEqual(event.step, 13)
+        (b, c) = event.summary.value
+        self.assertEqual(tensor_util.make_ndarray(b.tensor), np.array(3.0))
+        self.assertFalse(b.HasField("metadata"))
+        self.assertEqual(c.metadata.plugin_data.plugin_name, "plugin")
+
+
+class OutputTest(tb_test.TestCase):
+    def test_default_emit_scalars(self):
+        class ListOutput(output_lib.Output):
+            def __init__(self):
+                self.calls = []
+
+            def emit_scalar(self, **kwargs):
+                self.calls.append(kwargs)
+
+            def flush(self):
+                pass
+
+            def close(self):
+                pass
+
+        output = ListOutput()
+        output.emit_scalars(
+            plugin_name="plugin",
+            data={"a": np.float32(1.0), "b": np.float32(2.0)},
+            step=np.int64(12),
+            wall_time=123.456,
+            descriptions={"b": "desc"},
+        )
+        common = dict(
+            plugin_name="plugin",
+            step=np.int64(12),
+            wall_time=123.456,
+            tag_metadata=None,
+        )
+        self.assertEqual(
+            output.calls,
+            [
+                dict(common, tag="a", data=np.float32(1.0), description=None),
+                dict(common, tag="b", data=np.float32(2.0), description="desc"),
+            ],
+        )
+
 
 if __name__ == "__main__":
     tb_test.main()
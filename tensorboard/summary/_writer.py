@@ -96,6 +96,41 @@ class Writer:
             description=description,
         )
 
+    def add_scalars(self, data, step, *, wall_time=None, descriptions=None):
+        """Adds scalar summaries for several tags at one step.
+
+        This is equivalent to calling `add_scalar` for each tag, but writes
+        all the data points together, which is considerably cheaper when
+        logging many tags per step.
+
+        Args:
+          data: dict mapping each string tag to the numeric scalar value of
+            its data point. Accepts any values that can be converted to
+            `np.float32` scalars.
+          step: integer step value for these data points. Accepts any value
+            that can be converted to a `np.int64` scalar.
+          wall_time: optional `float` seconds since the Unix epoch, representing
+            the real-world timestamp for these data points. Defaults to None
+            in which case the current time will be used.
+          descriptions: optional dict mapping tags to string descriptions of
+            their entire time series, as for `add_scalar`. Tags need not be
+            present.
+        """
+        self._check_not_closed()
+        validated_data = {
+            tag: _validate_scalar_shape(np.float32(value), "data[%r]" % tag)
+            for (tag, value) in data.items()
+        }
+        validated_step = _validate_scalar_shape(np.int64(step), "step")
+        wall_time = wall_time if wall_time is not None else time.time()
+        self._output.emit_scalars(
+            plugin_name=scalars_metadata.PLUGIN_NAME,
+            data=validated_data,
+            step=validated_step,
+            wall_time=wall_time,
+            descriptions=descriptions,
+        )
+
 
 def _validate_scalar_shape(ndarray, name):
     if ndarray.ndim != 0:
@@ -164,5 +164,83 @@ class WriterAddScalarTest(tb_test.TestCase):
             w.add_scalar("unused", 0.0, 0)
 
 
+class WriterAddScalarsTest(tb_test.TestCase):
+    def test_real_directory(self):
+        logdir = self.get_temp_dir()
+        w = writer_lib.Writer(logdir)
+        w.add_scalars(
+            {"foo": 42.0, "bar": 7},
+            12,
+            wall_time=123.456,
+            descriptions={"foo": "fooful"},
+        )
+        w.add_scalars({"foo": 43.0, "bar": 8}, 13, wall_time=124.0)
+        w.close()
+        events = _test_util.read_tfevents(logdir)
+        self.assertLen(events, 3)
+        event = events[1]
+        self.assertEqual(event.step, 12)
+        self.assertEqual(event.wall_time, 123.456)
+        (foo, bar) = event.summary.value
+        self.assertEqual(foo.tag, "foo")
+        self.assertEqual(tensor_util.make_ndarray(foo.tensor), np.array(42.0))
+        self.assertEqual(foo.metadata.data_class, summary_pb2.DATA_CLASS_SCALAR)
+        self.assertEqual(foo.metadata.plugin_data.plugin_name, "scalars")
+        self.assertEqual(foo.metadata.summary_description, "fooful")
+        self.assertEqual(bar.tag, "bar")
+        self.assertEqual(tensor_util.make_ndarray(bar.tensor), np.array(7.0))
+        self.assertEqual(bar.metadata.plugin_data.plugin_name, "scalars")
+        self.assertEqual(bar.metadata.summary_description, "")
+        event = events[2]
+        self.assertEqual(event.step, 13)
+        self.assertEqual([v.tag for v in event.summary.value], ["foo", "bar"])
+        for value in event.summary.value:
+            self.assertFalse(value.HasField("metadata"))
+
+    def test_basic(self):
+        output = mock.create_autospec(output_lib.Output)
+        w = writer_lib.Writer(output)
+        w.add_scalars({"foo": 42.0, "bar": np.float64(1.5)}, 12)
+        output.emit_scalars.assert_called_once_with(
+            plugin_name="scalars",
+            data={"foo": np.float32(42.0), "bar": np.float32(1.5)},
+            step=np.int64(12),
+            wall_time=mock.ANY,
+            descriptions=None,
+        )
+        _, kwargs = output.emit_scalars.call_args
+        self.assertEqual(np.float32, type(kwargs["data"]["bar"]))
+        self.assertEqual(np.int64, type(kwargs["step"]))
+
+    def test_validates_data_shape(self):
+        output = mock.create_autospec(output_lib.Output)
+        w = writer_lib.Writer(output)
+        with self.assertRaisesRegex(ValueError, "scalar.*data.*bar"):
+            w.add_scalars({"foo": 1.0, "bar": np.float32([1.0])}, 12)
+        output.emit_scalars.assert_not_called()
+
+    def test_validates_step_shape(self):
+        output = mock.create_autospec(output_lib.Output)
+        w = writer_lib.Writer(output)
+        with self.assertRaisesRegex(ValueError, "scalar.*step"):
+            w.add_scalars({"foo": 42.0}, np.int64([12]))
+
+    def test_default_wall_time(self):
+        output = mock.create_autospec(output_lib.Output)
+        w = writer_lib.Writer(output)
+        with mock.patch.object(time, "time") as mock_time:
+            mock_time.return_value = 12345.678
+            w.add_scalars({"foo": 42.0}, 12)
+        _, kwargs = output.emit_scalars.call_args
+        self.assertEqual(12345.678, kwargs["wall_time"])
+
+    def test_after_close(self):
+        output = mock.create_autospec(output_lib.Output)
+        w = writer_lib.Writer(output)
+        w.close()
+        with self.assertRaisesRegex(RuntimeError, "already closed"):
+            w.add_scalars({"unused": 0.0}, 0)
+
+
 if __name__ == "__main__":
     tb_test.main()
@@ -16,16 +16,24 @@
 
 
 import os
-import queue
 import socket
 import threading
 import time
 
 from tensorboard.compat import tf
 from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.tensorflow_stub.pywrap_tensorflow import (
+    COMPRESSION_SUFFIXES,
+)
+from tensorboard.summary.writer.record_writer import CompressedWriter
 from tensorboard.summary.writer.record_writer import RecordWriter
 
 
+# Default bound on the total size of the serialized events waiting to be
+# written, past which `add_event` blocks.
+_DEFAULT_MAX_QUEUE_BYTES = 8 * 1024 * 1024
+
+
 class AtomicCounter:
     def __init__(self, initial_value):
         self._value = initial_value
@@ -52,7 +60,14 @@ class EventFileWriter:
     """
 
     def __init__(
-        self, logdir, max_queue_size=10, flush_secs=120, filename_suffix=""
+        self,
+        logdir,
+        max_queue_size=10,
+        flush_secs=120,
+        filename_suffix="",
+        *,
+        max_queue_bytes=_DEFAULT_MAX_QUEUE_BYTES,
+        compression_type=None,
     ):
         """Creates a `EventFileWriter` and an event file to write to.
 
@@ -64,10 +79,24 @@ class EventFileWriter:
 
         Args:
           logdir: A string. Directory where event file will be written.
-          max_queue_size: Integer. Size of the queue for pending events and summaries.
+          max_queue_size: Deprecated and ignored; the pending events are
+            bounded by `max_queue_bytes` instead.
           flush_secs: Number. How often, in seconds, to flush the
             pending events and summaries to disk.
+          max_queue_bytes: Integer. Total size in bytes of the serialized
+            events that may be pending before `add_event` blocks.
+          compression_type: Optional "GZIP" or "ZLIB" to compress the event
+            file, whose name then ends in ".gz" or ".zlib". Every flush ends
+            the compressed data so far at a byte boundary, so TensorBoard
+            can read the file while it is being written.
+
+        Raises:
+          ValueError: If the compression type is not supported.
         """
+        if compression_type and compression_type not in COMPRESSION_SUFFIXES:
+            raise ValueError(
+                "Unsupported compression type: %r" % (compression_type,)
+            )
         self._logdir = logdir
         tf.io.gfile.makedirs(logdir)
         self._file_name = (
@@ -83,9 +112,16 @@ class EventFileWriter:
             )
             + filename_suffix
         )  # noqa E128
+        if compression_type:
+            self._file_name += COMPRESSION_SUFFIXES[compression_type]
         self._general_file_writer = tf.io.gfile.GFile(self._file_name, "wb")
+        file_writer = self._general_file_writer
+        if compression_type:
+            file_writer = CompressedWriter(file_writer, compression_type)
         self._async_writer = _AsyncWriter(
-            RecordWriter(self._general_file_writer), max_queue_size, flush_secs
+            RecordWriter(file_writer),
+            max_queue_bytes=max_queue_bytes,
+            flush_secs=flush_secs,
         )
 
         # Initialize an event instance.
@@ -116,6 +152,15 @@ class EventFileWriter:
             )
         self._async_writer.write(event.SerializeToString())
 
+    def add_serialized_event(self, bytestring):
+        """Adds an already serialized event to the event file.
+
+        Args:
+          bytestring: An `Event` protocol buffer serialized to `bytes`. It
+            is written as is, without being parsed.
+        """
+        self._async_writer.write(bytestring)
+
     def flush(self):
         """Flushes the event file to disk.
 
@@ -137,7 +182,12 @@ class EventFileWriter:
 class _AsyncWriter:
     """Writes bytes to a file."""
 
-    def __init__(self, record_writer, max_queue_size=20, flush_secs=120):
+    def __init__(
+        self,
+        record_writer,
+        max_queue_bytes=_DEFAULT_MAX_QUEUE_BYTES,
+        flush_secs=120,
+    ):
         """Writes bytes to a file asynchronously. An instance of this class
         holds a queue to keep the incoming data temporarily. Data passed to the
         `write` function will be put to the queue and the function returns
@@ -147,15 +197,23 @@ class _AsyncWriter:
         then write the combined result to the disk. So we use an async approach
         to improve performance.
 
+        Each time the thread wakes up, it takes everything in the queue and
+        writes it with a single call, so bursts of small writes cost one
+        file write rather than one each.
+
         Args:
-            record_writer: A RecordWriter instance
-            max_queue_size: Integer. Size of the queue for pending bytestrings.
+            record_writer: A RecordWriter instance, or any object with
+                `write`, `flush` and `close` methods, in which case the
+                bytestrings are written to it unframed.
+            max_queue_bytes: Integer. Total size in bytes of the pending
+                bytestrings past which `write` blocks. A bytestring larger
+                than this is enqueued once the queue is empty.
             flush_secs: Number. How often, in seconds, to flush the
                 pending bytestrings to disk.
         """
         self._writer = record_writer
         self._closed = False
-        self._byte_queue = queue.Queue(max_queue_size)
+        self._byte_queue = _ByteQueue(max_queue_bytes)
         self._worker = _AsyncWriterThread(
             self._byte_queue, self._writer, flush_secs
         )
@@ -212,6 +270,84 @@ class _AsyncWriter:
             raise exception
 
 
+class _ByteQueue:
+    """A queue of bytestrings, bounded by their total size.
+
+    Unlike `queue.Queue`, the consumer takes everything pending at once,
+    so that it can write it as one batch. Like `queue.Queue`, `join`
+    waits until every item put has been marked done.
+    """
+
+    def __init__(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._cv = threading.Condition()
+        self._items = []
+        self._bytes = 0
+        # Number of items put but not yet marked done.
+        self._unfinished = 0
+        self._closed = False
+
+    def put(self, item):
+        """Enqueues a bytestring, blocking while the queue is too full."""
+        with self._cv:
+            while self._items and self._bytes + len(item) > self._max_bytes:
+                self._cv.wait()
+            self._items.append(item)
+            self._bytes += len(item)
+            self._unfinished += 1
+            self._cv.notify_all()
+
+    def get_all(self, timeout):
+        """Dequeues all pending bytestrings.
+
+        Args:
+          timeout: How long, in seconds, to wait for a bytestring if none
+            is pending.
+
+        Returns:
+          A possibly empty list of bytestrings, which is empty only if
+          the timeout expired or the queue was closed.
+        """
+        with self._cv:
+            if timeout > 0:
+                self._cv.wait_for(lambda: self._items or self._closed, timeout)
+            items = self._items
+            self._items = []
+            self._bytes = 0
+            self._cv.notify_all()
+            return items
+
+    def task_done(self, count):
+        """Marks `count` dequeued bytestrings as processed."""
+        with self._cv:
+            self._unfinished -= count
+            if not self._unfinished:
+                self._cv.notify_all()
+
+    def join(self):
+        """Blocks until every bytestring put has been marked processed."""
+        with self._cv:
+            self._cv.wait_for(lambda: not self._unfinished)
+
+    def close(self):
+        """Wakes the consumer, which stops once the queue is drained."""
+        with self._cv:
+            self._closed = True
+            self._cv.notify_all()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def abandon(self):
+        """Drops all pending bytestrings, unblocking `put` and `join`."""
+        with self._cv:
+            self._items = []
+            self._bytes = 0
+            self._unfinished = 0
+            self._cv.notify_all()
+
+
 class _AsyncWriterThread(threading.Thread):
     """Thread that processes asynchronous writes for _AsyncWriter."""
 
@@ -219,7 +355,7 @@ class _AsyncWriterThread(threading.Thread):
         """Creates an _AsyncWriterThread.
 
         Args:
-          queue: A Queue from which to dequeue data.
+          queue: A _ByteQueue from which to dequeue data.
           record_writer: An instance of record_writer writer.
           flush_secs: How often, in seconds, to flush the
             pending file to disk.
@@ -233,10 +369,9 @@ class _AsyncWriterThread(threading.Thread):
         # The first data will be flushed immediately.
         self._next_flush_time = 0
         self._has_pending_data = False
-        self._shutdown_signal = object()
 
     def stop(self):
-        self._queue.put(self._shutdown_signal)
+        self._queue.close()
         self.join()
 
     def run(self):
@@ -244,41 +379,28 @@ class _AsyncWriterThread(threading.Thread):
             self._run()
         except Exception as ex:
             self.exception = ex
-            try:
-                # In case there's a thread blocked on putting an item into the
-                # queue or a thread blocked on flushing, pop all items from the
-                # queue to let the foreground thread proceed.
-                while True:
-                    self._queue.get(False)
-                    self._queue.task_done()
-            except queue.Empty:
-                pass
+            # In case there's a thread blocked on putting an item into the
+            # queue or a thread blocked on flushing, drop all items from the
+            # queue to let the foreground thread proceed.
+            self._queue.abandon()
             raise
 
     def _run(self):
-        # Here wait on the queue until an data appears, or till the next
-        # time to flush the writer, whichever is earlier. If we have an
-        # data, write it. If not, an empty queue exception will be raised
-        # and we can proceed to flush the writer.
+        # Here wait on the queue until data appears, or till the next time
+        # to flush the writer, whichever is earlier. If we have data, write
+        # all of it at once. If not, we can proceed to flush the writer.
         while True:
             now = time.time()
             queue_wait_duration = self._next_flush_time - now
-            data = None
-            try:
-                if queue_wait_duration > 0:
-                    data = self._queue.get(True, queue_wait_duration)
-                else:
-                    data = self._queue.get(False)
-
-                if data is self._shutdown_signal:
-                    return
-                self._record_writer.write(data)
-                self._has_pending_data = True
-            except queue.Empty:
-                pass
-            finally:
-                if data:
-                    self._queue.task_done()
+            batch = self._queue.get_all(queue_wait_duration)
+            if batch:
+                try:
+                    self._write(batch)
+                    self._has_pending_data = True
+                finally:
+                    self._queue.task_done(len(batch))
+            elif self._queue.closed:
+                return
 
             now = time.time()
             if now > self._next_flush_time:
@@ -290,3 +412,10 @@ class _AsyncWriterThread(threading.Thread):
                     self._has_pending_data = False
                 # Do it again in flush_secs.
                 self._next_flush_time = now + self._flush_secs
+
+    def _write(self, batch):
+        """Writes a list of bytestrings with a single write call."""
+        if isinstance(self._record_writer, RecordWriter):
+            self._record_writer.write_records(batch)
+        else:
+            self._record_writer.write(b"".join(batch))
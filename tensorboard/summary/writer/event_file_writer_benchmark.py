@@ -0,0 +1,101 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for `EventFileWriter` under bursts of small events.
+
+Adds bursts of small scalar events to an `EventFileWriter` (as a training
+step logging many summaries at once would) and flushes after each
+burst. Reports the time the producer spends in `add_event`, the time to
+the end of the flush, and the resulting throughput.
+
+Sample results on a cloud VM with a single core (Python 3.11, local
+disk, 10 bursts of 10000 events of about 30 bytes each, best of 2 runs):
+
+    WRITER      ADD_MS  FLUSH_MS  EVENTS_PER_S
+    per-record  2445.0    2447.3         40861
+    batched      555.6    1053.3         94942
+
+`per-record` is the previous implementation, which queued at most 10
+events and had the writer thread frame and write one record at a time,
+so the producer spent almost the whole burst blocked in `add_event`.
+It was measured with this benchmark at the parent commit.
+"""
+
+
+import tempfile
+import time
+
+from absl import app
+from absl import flags
+from absl import logging
+
+from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.summary.writer import event_file_writer
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("burst_size", 10000, "Number of events per burst.")
+flags.DEFINE_integer("bursts", 10, "Number of bursts.")
+
+
+def _events(step, count):
+    """Returns `count` small scalar events at the given step."""
+    return [
+        event_pb2.Event(
+            step=step,
+            wall_time=1234.5,
+            summary=summary_pb2.Summary(
+                value=[
+                    summary_pb2.Summary.Value(
+                        tag="scalar_%d" % i, simple_value=float(i)
+                    )
+                ]
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+
+    bursts = [_events(step, FLAGS.burst_size) for step in range(FLAGS.bursts)]
+    with tempfile.TemporaryDirectory() as logdir:
+        writer = event_file_writer.EventFileWriter(logdir)
+        add_secs = 0.0
+        total_secs = 0.0
+        for events in bursts:
+            start_time = time.perf_counter()
+            for event in events:
+                writer.add_event(event)
+            add_secs += time.perf_counter() - start_time
+            writer.flush()
+            total_secs += time.perf_counter() - start_time
+        writer.close()
+
+    count = FLAGS.burst_size * FLAGS.bursts
+    logger.info("ADD_MS  FLUSH_MS  EVENTS_PER_S")
+    logger.info(
+        "%6.1f  %8.1f  %12d"
+        % (add_secs * 1000, total_secs * 1000, count / total_secs)
+    )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -52,6 +52,18 @@ class EventFileWriterTest(tb_test.TestCase):
         r.GetNext()
         self.assertEqual(fakeevent.SerializeToString(), r.record())
 
+    def test_add_serialized_event(self):
+        logdir = self.get_temp_dir()
+        w = EventFileWriter(logdir)
+        event = event_pb2.Event(step=3, wall_time=1.5)
+        w.add_serialized_event(event.SerializeToString())
+        w.close()
+        event_files = sorted(glob.glob(os.path.join(logdir, "*")))
+        r = PyRecordReader_New(event_files[0])
+        r.GetNext()  # meta data, so skip
+        r.GetNext()
+        self.assertEqual(event.SerializeToString(), r.record())
+
     def test_setting_filename_suffix_works(self):
         logdir = self.get_temp_dir()
 
@@ -60,6 +72,28 @@ class EventFileWriterTest(tb_test.TestCase):
         event_files = sorted(glob.glob(os.path.join(logdir, "*")))
         self.assertEqual(event_files[0].split(".")[-1], "event_horizon")
 
+    def test_compressed_event_file_roundtrip(self):
+        logdir = self.get_temp_dir()
+        w = EventFileWriter(
+            logdir, filename_suffix=".v2", compression_type="GZIP"
+        )
+        event = event_pb2.Event(step=3, wall_time=1.5)
+        w.add_event(event)
+        w.flush()
+        event_files = sorted(glob.glob(os.path.join(logdir, "*")))
+        self.assertEqual(len(event_files), 1)
+        self.assertTrue(event_files[0].endswith(".v2.gz"))
+        # Flushed events can be read while the file is still open.
+        r = PyRecordReader_New(event_files[0], compression_type="GZIP")
+        r.GetNext()  # meta data, so skip
+        r.GetNext()
+        self.assertEqual(event.SerializeToString(), r.record())
+        w.close()
+
+    def test_unsupported_compression_type(self):
+        with self.assertRaisesRegex(ValueError, "SNAPPY"):
+            EventFileWriter(self.get_temp_dir(), compression_type="SNAPPY")
+
     def test_async_writer_without_write(self):
         logdir = self.get_temp_dir()
         w = EventFileWriter(logdir)
@@ -102,7 +136,7 @@ class AsyncWriterTest(tb_test.TestCase):
         filename = os.path.join(
             self.get_temp_dir(), "async_writer_write_one_slot_queue"
         )
-        w = _AsyncWriter(open(filename, "wb"), max_queue_size=1)
+        w = _AsyncWriter(open(filename, "wb"), max_queue_bytes=1)
         bytes_to_write = b"hello world"
         repeat = 10  # faster
         for i in range(repeat):
@@ -139,7 +173,7 @@ class AsyncWriterTest(tb_test.TestCase):
 
     def test_exception_in_background_thread_while_waiting_to_put(self):
         record_writer_mock = MagicMock()
-        w = _AsyncWriter(record_writer_mock, max_queue_size=10)
+        w = _AsyncWriter(record_writer_mock, max_queue_bytes=10 * 64)
 
         cv = threading.Condition()
         writing_can_proceed: bool = False
@@ -178,6 +212,46 @@ class AsyncWriterTest(tb_test.TestCase):
         thread.join(timeout=10)
         self.assertFalse(thread.is_alive())
 
+    def test_writes_pending_data_in_one_batch(self):
+        record_writer_mock = MagicMock()
+        first_write_started = threading.Event()
+        first_write_can_finish = threading.Event()
+
+        def on_write(data):
+            if not first_write_started.is_set():
+                first_write_started.set()
+                first_write_can_finish.wait()
+
+        record_writer_mock.write.side_effect = on_write
+        w = _AsyncWriter(record_writer_mock, max_queue_bytes=3 * 64)
+        w.write(b"a" * 64)
+        first_write_started.wait()
+        # The writer thread is busy, so these are all pending at once.
+        w.write(b"b" * 64)
+        w.write(b"c" * 64)
+        w.write(b"d" * 64)
+
+        blocked_write_done = threading.Event()
+
+        def blocked_write():
+            w.write(b"e" * 64)
+            blocked_write_done.set()
+
+        thread = threading.Thread(target=blocked_write, daemon=True)
+        thread.start()
+        # The queue holds its maximum of three writes, so this one blocks.
+        self.assertFalse(blocked_write_done.wait(0.5))
+        first_write_can_finish.set()
+        thread.join(timeout=10)
+        self.assertTrue(blocked_write_done.is_set())
+        w.close()
+        written = [
+            args[0] for (args, _) in record_writer_mock.write.call_args_list
+        ]
+        self.assertEqual(
+            written, [b"a" * 64, b"b" * 64 + b"c" * 64 + b"d" * 64, b"e" * 64]
+        )
+
 
 if __name__ == "__main__":
     tb_test.main()
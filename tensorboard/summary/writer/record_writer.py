@@ -13,8 +13,17 @@
 # limitations under the License.
 # ==============================================================================
 
+import functools
 import struct
+import zlib
 from tensorboard.compat.tensorflow_stub.pywrap_tensorflow import masked_crc32c
+from tensorboard.compat.tensorflow_stub.pywrap_tensorflow import (
+    COMPRESSION_WBITS,
+)
+
+
+_LENGTH = struct.Struct("<Q")
+_CRC = struct.Struct("<I")
 
 
 class RecordWriter:
@@ -34,15 +43,87 @@ class RecordWriter:
     # byte      data[length]
     # uint32    masked crc of data
     def write(self, data):
-        header = struct.pack("<Q", len(data))
-        header_crc = struct.pack("<I", masked_crc32c(header))
-        footer_crc = struct.pack("<I", masked_crc32c(data))
-        self._writer.write(header + header_crc + data + footer_crc)
+        self.write_records([data])
+
+    def write_records(self, records):
+        """Writes several records with a single write to the file.
+
+        Args:
+        records: A list of `bytes` objects, one per record.
+        """
+        buf = bytearray()
+        for data in records:
+            buf += _header(len(data))
+            buf += data
+            buf += _CRC.pack(masked_crc32c(data))
+        self._writer.write(bytes(buf))
+
+    def flush(self):
+        self._writer.flush()
+
+    def close(self):
+        self._writer.close()
+
+    @property
+    def closed(self):
+        return self._writer.closed
+
+
+@functools.lru_cache(maxsize=4096)
+def _header(length):
+    """Returns the length and length checksum that start a record."""
+    header = _LENGTH.pack(length)
+    return header + _CRC.pack(masked_crc32c(header))
+
+
+class CompressedWriter:
+    """Compresses the data written to a file-like object.
+
+    `flush` ends the compressed data at a byte boundary (with
+    `Z_SYNC_FLUSH`), so that readers can decompress every record flushed
+    so far while the file is still being written.
+    """
+
+    def __init__(self, writer, compression_type):
+        """Wraps a file in a compressor.
+
+        Args:
+        writer: A file-like object that implements `write`, `flush` and `close`.
+        compression_type: "GZIP" or "ZLIB", as for `tf.io.TFRecordOptions`.
+
+        Raises:
+        ValueError: If the compression type is not supported.
+        """
+        if compression_type not in COMPRESSION_WBITS:
+            raise ValueError(
+                "Unsupported compression type: %r" % (compression_type,)
+            )
+        self._writer = writer
+        self._compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION,
+            zlib.DEFLATED,
+            COMPRESSION_WBITS[compression_type],
+        )
+        # Whether data has been written since the last flush. Flushing
+        # writes a few bytes even if not.
+        self._dirty = False
+
+    def write(self, data):
+        compressed = self._compressor.compress(data)
+        if compressed:
+            self._writer.write(compressed)
+        self._dirty = True
 
     def flush(self):
+        if self._dirty:
+            self._writer.write(self._compressor.flush(zlib.Z_SYNC_FLUSH))
+            self._dirty = False
         self._writer.flush()
 
     def close(self):
+        if self._compressor is not None:
+            self._writer.write(self._compressor.flush())
+            self._compressor = None
         self._writer.close()
 
     @property
@@ -18,6 +18,10 @@
 
 import io
 import os
+import zlib
+from unittest import mock
+
+from tensorboard.summary.writer.record_writer import CompressedWriter
 from tensorboard.summary.writer.record_writer import RecordWriter
 from tensorboard.compat.tensorflow_stub import errors
 from tensorboard.compat.tensorflow_stub.pywrap_tensorflow import (
@@ -90,6 +94,70 @@ class RecordWriterTest(tb_test.TestCase):
             len(Bytes_io.getvalue()), (8 + 4 + byte_len + 4)
         )  # uint64+uint32+data+uint32
 
+    def test_write_records(self):
+        records = [b"", b"x" * 64, b"hello world"]
+        one_by_one = io.BytesIO()
+        w = RecordWriter(one_by_one)
+        for record in records:
+            w.write(record)
+        batched = io.BytesIO()
+        batched.write = mock.Mock(wraps=batched.write)
+        w = RecordWriter(batched)
+        w.write_records(records)
+        batched.write.assert_called_once()
+        self.assertEqual(batched.getvalue(), one_by_one.getvalue())
+
+    def test_compressed_writer_roundtrip(self):
+        chunks_to_write = [
+            "hello world{}".format(i).encode() for i in range(10)
+        ]
+        for compression_type in ("GZIP", "ZLIB"):
+            with self.subTest(compression_type=compression_type):
+                filename = os.path.join(self.get_temp_dir(), compression_type)
+                f = CompressedWriter(open(filename, "wb"), compression_type)
+                w = RecordWriter(f)
+                r = PyRecordReader_New(
+                    filename, compression_type=compression_type
+                )
+                # Each flushed record can be read before the file is closed.
+                for bytes in chunks_to_write:
+                    w.write(bytes)
+                    w.flush()
+                    r.GetNext()
+                    self.assertEqual(r.record(), bytes)
+                w.close()
+                self.assertTrue(f.closed)
+                with self.assertRaises(errors.OutOfRangeError):
+                    r.GetNext()
+
+    def test_compressed_writer_flush_without_write(self):
+        buf = io.BytesIO()
+        w = CompressedWriter(buf, "ZLIB")
+        w.write(b"x" * 64)
+        w.flush()
+        size = len(buf.getvalue())
+        w.flush()
+        self.assertEqual(len(buf.getvalue()), size)
+        w.close()
+
+    def test_compressed_writer_output_is_a_complete_stream(self):
+        buf = io.BytesIO()
+        buf.close = mock.Mock()
+        w = CompressedWriter(buf, "GZIP")
+        w.write(b"hello")
+        w.flush()
+        w.write(b" world")
+        w.close()
+        buf.close.assert_called_once()
+        self.assertEqual(
+            zlib.decompress(buf.getvalue(), 16 + zlib.MAX_WBITS),
+            b"hello world",
+        )
+
+    def test_compressed_writer_unsupported_type(self):
+        with self.assertRaisesRegex(ValueError, "SNAPPY"):
+            CompressedWriter(io.BytesIO(), "SNAPPY")
+
 
 if __name__ == "__main__":
     tb_test.main()
@@ -0,0 +1,306 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Writes events from several processes to a single event file.
+
+When several worker processes on a host each open an `EventFileWriter`,
+the logdir fills up with one small event file per worker, and
+TensorBoard has to discover and read each of them. Instead, one process
+can own a `SharedEventFileWriter`, and hand each worker a client from
+`connect()` when starting it:
+
+    writer = SharedEventFileWriter(logdir)
+    workers = [
+        multiprocessing.Process(target=train, args=(writer.connect(),))
+        for _ in range(num_workers)
+    ]
+    ...
+
+Each client sends its serialized events over a pipe to the owning
+process, which writes the events of all clients to a single event file
+in the order in which they arrive. Events from different workers at the
+same tag and step are not merged, so workers should write distinct tags
+(such as tags prefixed by the worker's rank).
+"""
+
+
+import multiprocessing
+from multiprocessing import connection as mp_connection
+import threading
+
+from tensorboard.compat.proto import event_pb2
+from tensorboard.summary.writer import event_file_writer
+
+
+# Each message on a client's pipe is one of these bytes, followed (for
+# `_EVENT`) by a serialized `Event`. The owner answers `_FLUSH` with
+# `_FLUSH` once it has flushed everything that the client sent before.
+_EVENT = b"e"
+_FLUSH = b"f"
+_CLOSE = b"c"
+
+
+class SharedEventFileWriter:
+    """Writes events from this and other processes to one event file.
+
+    Events can be added through `add_event` in the owning process, and
+    through `EventFileWriterClient`s from `connect()` in any process.
+    """
+
+    def __init__(self, logdir, flush_secs=120, filename_suffix="", **kwargs):
+        """Creates a `SharedEventFileWriter` and the event file it writes.
+
+        Args:
+          logdir: A string. Directory where the event file will be written.
+          flush_secs: Number. How often, in seconds, to flush the pending
+            events to disk.
+          filename_suffix: A string. Suffix of the event file name.
+          **kwargs: Passed to `EventFileWriter`.
+        """
+        self._writer = event_file_writer.EventFileWriter(
+            logdir,
+            flush_secs=flush_secs,
+            filename_suffix=filename_suffix,
+            **kwargs,
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+        # Owner ends of the pipes of connected clients.
+        self._connections = set()
+        (self._wakeup_reader, self._wakeup_writer) = multiprocessing.Pipe(
+            duplex=False
+        )
+        self._receiver = _ReceiverThread(self)
+        self._receiver.start()
+
+    def get_logdir(self):
+        """Returns the directory where the event file will be written."""
+        return self._writer.get_logdir()
+
+    def connect(self):
+        """Creates a client through which another process can add events.
+
+        The client must be passed to the other process when starting it
+        (say, as an argument of `multiprocessing.Process`), since its pipe
+        cannot be sent to an already running process.
+
+        Returns:
+          An `EventFileWriterClient`.
+        """
+        with self._lock:
+            self._check_open()
+            (owner_end, client_end) = multiprocessing.Pipe()
+            self._connections.add(owner_end)
+            self._wake_receiver()
+        return EventFileWriterClient(self.get_logdir(), client_end)
+
+    def add_event(self, event):
+        """Adds an event to the event file.
+
+        Args:
+          event: An `Event` protocol buffer.
+        """
+        self._check_open()
+        self._writer.add_event(event)
+
+    def flush(self):
+        """Flushes the events added in this process to disk.
+
+        Events from clients are flushed by their own `flush` methods.
+        """
+        self._check_open()
+        self._writer.flush()
+
+    def close(self):
+        """Writes the events that clients have sent, then closes the file.
+
+        Clients can no longer add events once this has been called.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake_receiver()
+        self._receiver.join()
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+        self._writer.close()
+        if self._receiver.exception is not None:
+            raise self._receiver.exception
+
+    def _check_open(self):
+        exception = self._receiver.exception
+        if exception is not None:
+            raise exception
+        if self._closed:
+            raise IOError("Writer is closed")
+
+    def _wake_receiver(self):
+        """Makes the receiver thread rescan the connections."""
+        self._wakeup_writer.send_bytes(b"")
+
+
+class _ReceiverThread(threading.Thread):
+    """Thread that writes events received from the clients of a writer."""
+
+    def __init__(self, shared_writer):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.exception = None
+        self._shared_writer = shared_writer
+
+    def run(self):
+        try:
+            self._run()
+        except Exception as ex:
+            self.exception = ex
+            # Break the pipes so that clients raise instead of blocking.
+            with self._shared_writer._lock:
+                for conn in self._shared_writer._connections:
+                    conn.close()
+                self._shared_writer._connections.clear()
+            raise
+
+    def _run(self):
+        shared_writer = self._shared_writer
+        wakeup = shared_writer._wakeup_reader
+        while True:
+            with shared_writer._lock:
+                connections = list(shared_writer._connections)
+                closing = shared_writer._closed
+            if closing:
+                # Write whatever the clients sent before the writer closed.
+                for conn in connections:
+                    while conn.poll():
+                        if not self._receive(conn):
+                            break
+                    self._disconnect(conn)
+                return
+            for conn in mp_connection.wait(connections + [wakeup]):
+                if conn is wakeup:
+                    wakeup.recv_bytes()
+                else:
+                    self._receive(conn)
+
+    def _receive(self, conn):
+        """Handles one message from a client.
+
+        Returns:
+          Whether the client is still connected.
+        """
+        try:
+            message = conn.recv_bytes()
+        except EOFError:
+            # The client closed its pipe or its process exited.
+            self._disconnect(conn)
+            return False
+        kind = message[:1]
+        if kind == _EVENT:
+            self._shared_writer._writer.add_serialized_event(message[1:])
+        elif kind == _FLUSH:
+            self._shared_writer._writer.flush()
+            conn.send_bytes(_FLUSH)
+        elif kind == _CLOSE:
+            self._disconnect(conn)
+            return False
+        else:
+            raise ValueError("Unexpected message from client: %r" % kind)
+        return True
+
+    def _disconnect(self, conn):
+        with self._shared_writer._lock:
+            self._shared_writer._connections.discard(conn)
+        conn.close()
+
+
+class EventFileWriterClient:
+    """Adds events to the event file of a `SharedEventFileWriter`.
+
+    Clients are created by `SharedEventFileWriter.connect`, and are used
+    like an `EventFileWriter` in the process that they are passed to.
+    """
+
+    def __init__(self, logdir, conn):
+        """Creates a client; use `SharedEventFileWriter.connect` instead.
+
+        Args:
+          logdir: The directory of the shared writer's event file.
+          conn: The client end of a `multiprocessing.Pipe` whose other end
+            the shared writer reads.
+        """
+        self._logdir = logdir
+        self._conn = conn
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __getstate__(self):
+        return (self._logdir, self._conn, self._closed)
+
+    def __setstate__(self, state):
+        (self._logdir, self._conn, self._closed) = state
+        self._lock = threading.Lock()
+
+    def get_logdir(self):
+        """Returns the directory where the event file will be written."""
+        return self._logdir
+
+    def add_event(self, event):
+        """Sends an event to be added to the event file.
+
+        Args:
+          event: An `Event` protocol buffer.
+        """
+        if not isinstance(event, event_pb2.Event):
+            raise TypeError(
+                "Expected an event_pb2.Event proto, "
+                " but got %s" % type(event)
+            )
+        message = _EVENT + event.SerializeToString()
+        with self._lock:
+            self._send(message)
+
+    def flush(self):
+        """Blocks until the events sent by this client are on disk."""
+        with self._lock:
+            self._send(_FLUSH)
+            try:
+                self._conn.recv_bytes()
+            except EOFError:
+                raise IOError("Shared event file writer is closed")
+
+    def close(self):
+        """Disconnects from the shared writer, which writes all the events
+        sent so far.
+
+        The event file is closed by the shared writer's `close` method.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._conn.send_bytes(_CLOSE)
+            except OSError:
+                # The shared writer has already closed this pipe.
+                pass
+            self._conn.close()
+
+    def _send(self, message):
+        """Sends a message to the shared writer; requires `_lock`."""
+        if self._closed:
+            raise IOError("Writer is closed")
+        try:
+            self._conn.send_bytes(message)
+        except OSError as e:
+            raise IOError("Shared event file writer is closed") from e
@@ -0,0 +1,145 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+# """Tests for SharedEventFileWriter"""
+
+
+import glob
+import multiprocessing
+import os
+
+from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.proto.summary_pb2 import Summary
+from tensorboard.compat.tensorflow_stub import errors
+from tensorboard.compat.tensorflow_stub.pywrap_tensorflow import (
+    PyRecordReader_New,
+)
+from tensorboard.summary.writer.shared_event_file_writer import (
+    SharedEventFileWriter,
+)
+from tensorboard import test as tb_test
+
+
+def _event(tag, step):
+    summary = Summary(value=[Summary.Value(tag=tag, simple_value=step)])
+    return event_pb2.Event(step=step, summary=summary)
+
+
+def _write_events(client, tag, count):
+    """Target of the worker processes."""
+    for step in range(count):
+        client.add_event(_event(tag, step))
+    client.flush()
+    client.close()
+
+
+def _read_events(logdir):
+    event_files = glob.glob(os.path.join(logdir, "*"))
+    assert len(event_files) == 1, event_files
+    r = PyRecordReader_New(event_files[0])
+    events = []
+    while True:
+        try:
+            r.GetNext()
+        except errors.OutOfRangeError:
+            return events
+        events.append(event_pb2.Event.FromString(r.record()))
+
+
+class SharedEventFileWriterTest(tb_test.TestCase):
+    def test_writes_events_from_processes(self):
+        logdir = self.get_temp_dir()
+        w = SharedEventFileWriter(logdir)
+        # Spawned processes receive their clients pickled.
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(
+                target=_write_events,
+                args=(w.connect(), "worker_%d" % i, 50),
+            )
+            for i in range(3)
+        ]
+        for p in processes:
+            p.start()
+        w.add_event(_event("owner", 0))
+        for p in processes:
+            p.join()
+            self.assertEqual(p.exitcode, 0)
+        w.close()
+
+        events = _read_events(logdir)
+        self.assertEqual(events[0].file_version, "brain.Event:2")
+        steps_by_tag = {}
+        for event in events[1:]:
+            tag = event.summary.value[0].tag
+            steps_by_tag.setdefault(tag, []).append(event.step)
+        self.assertEqual(
+            steps_by_tag,
+            {
+                "owner": [0],
+                "worker_0": list(range(50)),
+                "worker_1": list(range(50)),
+                "worker_2": list(range(50)),
+            },
+        )
+
+    def test_client_flush(self):
+        logdir = self.get_temp_dir()
+        w = SharedEventFileWriter(logdir)
+        client = w.connect()
+        self.assertEqual(client.get_logdir(), logdir)
+        client.add_event(_event("tag", 7))
+        client.flush()
+        events = _read_events(logdir)
+        self.assertEqual([e.step for e in events[1:]], [7])
+        client.close()
+        w.close()
+
+    def test_close_writes_events_of_open_clients(self):
+        logdir = self.get_temp_dir()
+        w = SharedEventFileWriter(logdir)
+        client = w.connect()
+        for step in range(10):
+            client.add_event(_event("tag", step))
+        w.close()
+        events = _read_events(logdir)
+        self.assertEqual([e.step for e in events[1:]], list(range(10)))
+        with self.assertRaisesRegex(IOError, "closed"):
+            client.add_event(_event("tag", 10))
+        client.close()
+
+    def test_after_close(self):
+        w = SharedEventFileWriter(self.get_temp_dir())
+        client = w.connect()
+        client.close()
+        with self.assertRaisesRegex(IOError, "closed"):
+            client.add_event(_event("tag", 0))
+        w.close()
+        with self.assertRaisesRegex(IOError, "closed"):
+            w.add_event(_event("tag", 0))
+        with self.assertRaisesRegex(IOError, "closed"):
+            w.connect()
+
+    def test_rejects_non_events(self):
+        w = SharedEventFileWriter(self.get_temp_dir())
+        client = w.connect()
+        with self.assertRaises(TypeError):
+            client.add_event(Summary())
+        client.close()
+        w.close()
+
+
+if __name__ == "__main__":
+    tb_test.main()